@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 import csv
 from datetime import date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping
 import sys
 import re
 
@@ -16,175 +16,43 @@ if str(SRC_DIR) not in sys.path:
 
 # --- RESZTA IMPORTÓW ---
 
+from contextlib import asynccontextmanager
+import logging
+
 from fastapi import FastAPI, Query, HTTPException
 from fastapi.responses import HTMLResponse
 
 from am_nasa.api import convert_calendar_date, info_from_jd
+from am_nasa.ephemeris_nasa import startup_check
+from am_nasa.rejestr_kalendarzy import CALENDARS
 
 # Ścieżka do AMJD_EVENT_INDEX.csv
 DATA_DIR = ROOT / "data" / "amjd"
 EVENT_INDEX_PATH = DATA_DIR / "AMJD_EVENT_INDEX.csv"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # zimny start efemeryd (skala czasu z pakietu, bez sieci) mierzony raz, przy starcie
+    app.state.startup_check = startup_check()
+    logging.getLogger(__name__).info("startup_check: %s", app.state.startup_check)
+    yield
+
+
 app = FastAPI(
     title="AM-NASA v6",
     description="Silnik AM ↔ JD ↔ NASA + interfejs użytkownika",
     version="0.5.0",
+    lifespan=lifespan,
 )
 
 # ====== MAPY MIESIĘCY – TEKST → NUMER ======
+# Jedno źródło: rejestr systemów kalendarzowych (to samo, czego używa konwertuj).
 
-MONTHS: Dict[str, Dict[str, int]] = {
-    # Gregoriański – klasyczne miesiące po angielsku / skróty
-    "gregorian": {
-        "january": 1,
-        "february": 2,
-        "march": 3,
-        "april": 4,
-        "may": 5,
-        "june": 6,
-        "july": 7,
-        "august": 8,
-        "september": 9,
-        "october": 10,
-        "november": 11,
-        "december": 12,
-        "jan": 1,
-        "feb": 2,
-        "mar": 3,
-        "apr": 4,
-        "jun": 6,
-        "jul": 7,
-        "aug": 8,
-        "sep": 9,
-        "sept": 9,
-        "oct": 10,
-        "nov": 11,
-        "dec": 12,
-    },
-
-    # placeholder – nadpiszemy niżej gregoriańskimi
-    "julian": {},
-    "auc": {},
-
-    # Hebrajski – Twój case „14 Nisan 3790”
-    "hebrew": {
-        "nisan": 1,
-        "nissan": 1,
-        "iyyar": 2,
-        "iyar": 2,
-        "sivan": 3,
-        "tammuz": 4,
-        "av": 5,
-        "elul": 6,
-        "tishri": 7,
-        "tishrei": 7,
-        "cheshvan": 8,
-        "marcheshvan": 8,
-        "kislev": 9,
-        "tevet": 10,
-        "shevat": 11,
-        "adar": 12,
-        "adar1": 12,
-        "adar2": 13,
-    },
-
-    # Islamski (Hijri)
-    "islamic": {
-        "muharram": 1,
-        "safar": 2,
-        "rabi al-awwal": 3,
-        "rabi al awwal": 3,
-        "rabi i": 3,
-        "rabi al-thani": 4,
-        "rabi al thani": 4,
-        "rabi ii": 4,
-        "jumada al-awwal": 5,
-        "jumada al awwal": 5,
-        "jumada i": 5,
-        "jumada al-thani": 6,
-        "jumada al thani": 6,
-        "jumada ii": 6,
-        "rajab": 7,
-        "shaban": 8,
-        "sha'ban": 8,
-        "ramadan": 9,
-        "shawwal": 10,
-        "dhu al-qadah": 11,
-        "dhu al hijjah": 12,
-        "dhu al-hijjah": 12,
-    },
-
-    # Perski (Solar Hijri)
-    "persian": {
-        "farvardin": 1,
-        "ordibehesht": 2,
-        "khordad": 3,
-        "tir": 4,
-        "mordad": 5,
-        "shahrivar": 6,
-        "mehr": 7,
-        "aban": 8,
-        "azar": 9,
-        "dey": 10,
-        "bahman": 11,
-        "esfand": 12,
-    },
-
-    # Francuski rewolucyjny
-    "french_rev": {
-        "vendemiaire": 1,
-        "brumaire": 2,
-        "frimaire": 3,
-        "nivose": 4,
-        "pluviose": 5,
-        "ventose": 6,
-        "germinal": 7,
-        "floreal": 8,
-        "prairial": 9,
-        "messidor": 10,
-        "thermidor": 11,
-        "fructidor": 12,
-    },
-
-    # Koptyjski
-    "coptic": {
-        "thout": 1,
-        "paopi": 2,
-        "hathor": 3,
-        "koiak": 4,
-        "tobi": 5,
-        "meshir": 6,
-        "pamenot": 7,
-        "parmouti": 8,
-        "pashons": 9,
-        "paoni": 10,
-        "epip": 11,
-        "mesori": 12,
-        "nasie": 13,
-    },
-
-    # Etiopski
-    "ethiopian": {
-        "meskerem": 1,
-        "tikimt": 2,
-        "hidar": 3,
-        "tahsas": 4,
-        "tir": 5,
-        "yekatit": 6,
-        "megabit": 7,
-        "miyazya": 8,
-        "genbot": 9,
-        "sene": 10,
-        "hamle": 11,
-        "nehase": 12,
-        "pagume": 13,
-    },
+MONTHS: Dict[str, Mapping[str, int]] = {
+    name: cal.month_names for name, cal in CALENDARS.items()
 }
 
-# Julian / AUC używają tych samych nazw miesięcy co gregoriański.
-for _sys in ("julian", "auc"):
-    MONTHS[_sys] = MONTHS["gregorian"]
-
 
 def _normalize_iso_like(text: str) -> Optional[str]:
     """
@@ -285,6 +153,13 @@ async def index() -> str:
     )
 
     kind_options = "\n".join(f'<option value="{k}">{k}</option>' for k in kinds)
+
+    # systemy kalendarzowe z rejestru + surowy JD (osobny endpoint /from-jd)
+    system_options = "\n".join(
+        f'<option value="{name}">{cal.label or name}</option>'
+        for name, cal in CALENDARS.items()
+    )
+    system_options += '\n<option value="jd">julian_day (JD)</option>'
     status_options = "\n".join(f'<option value="{s}">{s}</option>' for s in statuses)
 
     html = f"""<!DOCTYPE html>
@@ -333,19 +208,7 @@ async def index() -> str:
         <label>
           System:
           <select name="system">
-            <option value="gregorian">gregorian</option>
-            <option value="julian">julian</option>
-            <option value="jd">julian_day (JD)</option>
-            <option value="am">am (Anno Mundi)</option>
-            <option value="hebrew">hebrew</option>
-            <option value="islamic">islamic</option>
-            <option value="persian">persian</option>
-            <option value="french_rev">french_rev</option>
-            <option value="coptic">coptic</option>
-            <option value="ethiopian">ethiopian</option>
-            <option value="chinese">chinese</option>
-            <option value="hindu">hindu</option>
-            <option value="maya">maya</option>
+            {system_options}
           </select>
           <small>Przykłady: "2025-10-09", "14 nisan 3790", "5 rajab 1447".</small>
         </label>
@@ -513,6 +376,9 @@ async def convert(
     system: str = Query("gregorian"),
     date_str: str = Query(..., alias="date"),
     lon: float = Query(0.0),
+    engine: str = Query("skyfield"),
+    scale: str = Query("TT"),
+    tier: Optional[str] = Query(None),
 ) -> Dict[str, Any]:
     """
     /convert – przyjmuje system kalendarza + datę tekstową (z nazwą miesiąca)
@@ -535,7 +401,7 @@ async def convert(
         ) from exc
 
     try:
-        result = convert_calendar_date(system=system, year=y, month=m, day=d, lon=lon)
+        result = convert_calendar_date(system=system, year=y, month=m, day=d, lon=lon, engine=engine, scale=scale, tier=tier)
     except Exception as exc:  # noqa: BLE001
         raise HTTPException(
             status_code=400,
@@ -548,15 +414,27 @@ async def convert(
     return result
 
 
+@app.get("/startup-check")
+async def get_startup_check() -> Dict[str, Any]:
+    """
+    Raport zimnego startu: czasy skali czasu, indeksu kerneli, pierwszego zapytania.
+    """
+    report = getattr(app.state, "startup_check", None)
+    return report if report is not None else startup_check()
+
+
 @app.get("/from-jd")
 async def from_jd(
     jd: float = Query(...),
     lon: float = Query(0.0),
+    engine: str = Query("skyfield"),
+    scale: str = Query("TT"),
+    tier: Optional[str] = Query(None),
 ) -> Dict[str, Any]:
     """
     /from-jd – bierze czysty JD i zwraca info_from_jd().
     """
-    return info_from_jd(jd=jd, lon=lon)
+    return info_from_jd(jd=jd, lon=lon, engine=engine, scale=scale, tier=tier)
 
 
 @app.get("/events")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 import csv
+import logging
 from datetime import date
 from typing import Optional, List, Dict, Any
 
@@ -9,16 +11,28 @@ from fastapi import FastAPI, Query, HTTPException
 from fastapi.responses import HTMLResponse
 
 from am_nasa.api import convert_calendar_date, info_from_jd
+from am_nasa.ephemeris_nasa import startup_check
+from am_nasa.rejestr_kalendarzy import CALENDARS
 
 # Ścieżka do AMJD_EVENT_INDEX.csv
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "data" / "amjd"
 EVENT_INDEX_PATH = DATA_DIR / "AMJD_EVENT_INDEX.csv"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # zimny start efemeryd (skala czasu z pakietu, bez sieci) mierzony raz, przy starcie
+    app.state.startup_check = startup_check()
+    logging.getLogger(__name__).info("startup_check: %s", app.state.startup_check)
+    yield
+
+
 app = FastAPI(
     title="AM-NASA v6 – user API",
     description="Prostsza, codzienna wersja API nad silnikiem AM-NASA",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -35,6 +49,12 @@ async def index() -> str:
     """
     Proste UI HTML – formularz do konwersji daty i linki do endpointów.
     """
+    # tylko systemy z miesiącami/dniami – formularz podaje datę YYYY-MM-DD
+    system_options = "\n".join(
+        f'            <option value="{name}">{name}</option>'
+        for name, cal in CALENDARS.items()
+        if cal.whole_days
+    )
     return """
 <!DOCTYPE html>
 <html lang="pl">
@@ -70,9 +90,7 @@ async def index() -> str:
         <label>
           System kalendarza:
           <select name="system">
-            <option value="gregorian">gregorian</option>
-            <option value="julian">julian</option>
-            <option value="hebrew">hebrew</option>
+{system_options}
           </select>
         </label>
         <label>
@@ -148,14 +166,17 @@ async def index() -> str:
   </script>
 </body>
 </html>
-    """
+    """.replace("{system_options}", system_options)
 
 
 @app.get("/convert")
 async def convert(
-    system: str = Query("gregorian", description="System: gregorian/julian/hebrew/..."),
+    system: str = Query("gregorian", description="System z rejestru: gregorian/julian/islamic/..."),
     date_str: str = Query(..., alias="date", description="Data w formacie YYYY-MM-DD"),
     lon: float = Query(0.0, description="Długość geograficzna w stopniach (+E)"),
+    engine: str = Query("skyfield", description="Silnik Słońce/Księżyc: skyfield (pełne JPL), jplephem (bez skyfield) albo chebyshev (cache)"),
+    scale: str = Query("TT", description="Skala czasu daty/JD: TT albo UT (przesunięcie o ΔT)"),
+    tier: Optional[str] = Query(None, description="Tier dokładności: fast / cached / jpl / jpl-geometric (nadpisuje engine)"),
 ) -> Dict[str, Any]:
     """
     Prosty endpoint:
@@ -169,21 +190,35 @@ async def convert(
     except Exception:
         raise HTTPException(status_code=400, detail=f"Nieprawidłowa data: {date_str!r}")
 
-    result = convert_calendar_date(system=system, year=y, month=m, day=d, lon=lon)
+    result = convert_calendar_date(system=system, year=y, month=m, day=d, lon=lon, engine=engine, scale=scale, tier=tier)
     return result
 
 
+@app.get("/startup-check")
+async def get_startup_check() -> Dict[str, Any]:
+    """
+    GET /startup-check
+
+    Raport zimnego startu: czasy skali czasu, indeksu kerneli, pierwszego zapytania.
+    """
+    report = getattr(app.state, "startup_check", None)
+    return report if report is not None else startup_check()
+
+
 @app.get("/from-jd")
 async def from_jd(
     jd: float = Query(..., description="Julian Day (JD)"),
     lon: float = Query(0.0, description="Długość geograficzna w stopniach (+E)"),
+    engine: str = Query("skyfield", description="Silnik Słońce/Księżyc: skyfield (pełne JPL), jplephem (bez skyfield) albo chebyshev (cache)"),
+    scale: str = Query("TT", description="Skala czasu daty/JD: TT albo UT (przesunięcie o ΔT)"),
+    tier: Optional[str] = Query(None, description="Tier dokładności: fast / cached / jpl / jpl-geometric (nadpisuje engine)"),
 ) -> Dict[str, Any]:
     """
     GET /from-jd?jd=2460958.5&lon=19.9
 
     Zwraca strukturę info_from_jd (data cywilna, AM, Księżyc, geometria).
     """
-    result = info_from_jd(jd=jd, lon=lon)
+    result = info_from_jd(jd=jd, lon=lon, engine=engine, scale=scale, tier=tier)
     return result
 
 
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.tablice_kalendarzy import TABLES_DIR, YEAR_MAX, YEAR_MIN, build_calendar_tables
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Buduje tablice kalendarzy (data/calendar_tables).")
+    parser.add_argument("out_dir", nargs="?", type=Path, default=TABLES_DIR)
+    parser.add_argument(
+        "--chinese",
+        nargs=2,
+        type=int,
+        metavar=("OD", "DO"),
+        help="przelicz też tablicę chińską dla lat gregoriańskich OD…DO (wymaga efemeryd JPL)",
+    )
+    parser.add_argument(
+        "--hindu",
+        nargs=2,
+        type=int,
+        metavar=("OD", "DO"),
+        help="przelicz też tablice sankranti/tithi dla lat gregoriańskich OD…DO (wymaga efemeryd JPL)",
+    )
+    parser.add_argument(
+        "--ephemeris",
+        type=Path,
+        help="plik .bsp zamiast domyślnego z data/ephemeris (musi pokrywać zakres lat)",
+    )
+    args = parser.parse_args()
+
+    paths = build_calendar_tables(args.out_dir)
+    print(f"[INFO] Tablice lat {YEAR_MIN}…{YEAR_MAX} dla {len(paths)} systemów")
+    for system, path in paths.items():
+        print(f"  {system:<12} {path} ({path.stat().st_size} B)")
+
+    eph = None
+    if args.ephemeris and (args.chinese or args.hindu):
+        from skyfield.api import load
+
+        eph = load(str(args.ephemeris))
+
+    if args.chinese:
+        from am_nasa.kalendarz_chinski import build_chinese_table, save_chinese_table
+
+        start, end = args.chinese
+        path = save_chinese_table(build_chinese_table(start, end, eph), args.out_dir / "chinese.npy")
+        print(f"  {'chinese':<12} {path} ({path.stat().st_size} B), lata {start}…{end}")
+
+    if args.hindu:
+        from am_nasa.kalendarz_hinduski import build_hindu_tables, save_hindu_tables
+
+        start, end = args.hindu
+        for path in save_hindu_tables(build_hindu_tables(start, end, eph), args.out_dir):
+            print(f"  {path.stem:<12} {path} ({path.stat().st_size} B), lata {start}…{end}")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
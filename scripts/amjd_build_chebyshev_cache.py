@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.ephemeris_chebyshev import (
+    BLOCK_DAYS,
+    CHEBYSHEV_CACHE_FILE,
+    N_COEF,
+    ChebyshevEphemeris,
+    apparent_sun_moon_xyz,
+    fit_sun_moon_blocks,
+    save_chebyshev_cache,
+)
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Buduje cache Czebyszewa Słońce/Księżyc z efemeryd JPL.")
+    parser.add_argument("start", type=int, help="pierwszy rok gregoriański")
+    parser.add_argument("end", type=int, help="ostatni rok gregoriański (włącznie)")
+    parser.add_argument("--out", type=Path, default=CHEBYSHEV_CACHE_FILE)
+    parser.add_argument("--block-days", type=float, default=BLOCK_DAYS)
+    parser.add_argument("--n-coef", type=int, default=N_COEF)
+    parser.add_argument(
+        "--ephemeris",
+        type=Path,
+        help="plik .bsp zamiast domyślnego z data/ephemeris (musi pokrywać zakres lat)",
+    )
+    args = parser.parse_args()
+
+    eph = None
+    if args.ephemeris:
+        from skyfield.api import load
+
+        eph = load(str(args.ephemeris))
+
+    table = fit_sun_moon_blocks(
+        jd_from_gregorian(args.start, 1, 1),
+        jd_from_gregorian(args.end + 1, 1, 1),
+        block_days=args.block_days,
+        n_coef=args.n_coef,
+        positions=lambda jd: apparent_sun_moon_xyz(jd, eph),
+    )
+    path = save_chebyshev_cache(table, args.out)
+    print(f"[INFO] {path} ({path.stat().st_size} B), lata {args.start}…{args.end}")
+    print(json.dumps(ChebyshevEphemeris(table).accuracy_report(), indent=2))
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
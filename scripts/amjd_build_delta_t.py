@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.delta_t import (
+    DELTA_T_FILE,
+    STEP_YEARS,
+    YEAR_MAX,
+    YEAR_MIN,
+    DeltaTSpline,
+    build_delta_t_table,
+    delta_t_model,
+    save_delta_t_table,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Buduje splajn ΔT (Espenak–Meeus + IERS z data/timescale/iers.npz)."
+    )
+    parser.add_argument("--year-min", type=float, default=YEAR_MIN)
+    parser.add_argument("--year-max", type=float, default=YEAR_MAX)
+    parser.add_argument("--step", type=float, default=STEP_YEARS, help="odstęp węzłów [lata]")
+    parser.add_argument("--out", type=Path, default=DELTA_T_FILE)
+    args = parser.parse_args()
+
+    import numpy as np
+
+    table = build_delta_t_table(args.year_min, args.year_max, args.step)
+    path = save_delta_t_table(table, args.out)
+
+    # kontrola: splajn vs pełny model w połowach przedziałów
+    years = table[:, 0] + args.step / 2.0
+    err = np.abs(DeltaTSpline(table).at_year(years) - delta_t_model(years))
+    print(f"[INFO] {path}: {len(table)} przedziałów, max |splajn − model| = {err.max():.3f} s")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.lunation_index import LUNATION_INDEX_FILE, build_lunation_index, save_lunation_index
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Buduje indeks faz Księżyca (nów, kwadry, pełnia) z efemeryd JPL w data/ephemeris."
+    )
+    parser.add_argument("--jd-start", type=float, default=None, help="domyślnie: początek pokrycia kerneli")
+    parser.add_argument("--jd-end", type=float, default=None, help="domyślnie: koniec pokrycia kerneli")
+    parser.add_argument("--engine", default="jplephem", help="silnik ephemeris_nasa (domyślnie jplephem)")
+    parser.add_argument("--out", type=Path, default=LUNATION_INDEX_FILE)
+    args = parser.parse_args()
+
+    table = build_lunation_index(args.jd_start, args.jd_end, args.engine)
+    path = save_lunation_index(table, args.out)
+    print(f"[INFO] {path}: {len(table)} faz, JD {table[0, 0]:.5f} … {table[-1, 0]:.5f}")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.solar_terms import SOLAR_TERMS_FILE, build_solar_terms_table, save_solar_terms_table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Buduje tablicę 24 wyrazów słonecznych (równonoce, przesilenia) z efemeryd JPL w data/ephemeris."
+    )
+    parser.add_argument("--jd-start", type=float, default=None, help="domyślnie: początek pokrycia kernela")
+    parser.add_argument("--jd-end", type=float, default=None, help="domyślnie: koniec pokrycia kernela")
+    parser.add_argument("--out", type=Path, default=SOLAR_TERMS_FILE)
+    args = parser.parse_args()
+
+    table = build_solar_terms_table(args.jd_start, args.jd_end)
+    path = save_solar_terms_table(table, args.out)
+    print(f"[INFO] {path}: {len(table)} wyrazów, JD {table[0, 0]:.5f} … {table[-1, 0]:.5f}")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.ephemeris_nasa import TIMESCALE_FILE, build_timescale_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Zapisuje tablice ΔT / sekund przestępnych do pakietu (src/am_nasa/data/timescale)."
+    )
+    parser.add_argument(
+        "finals",
+        nargs="?",
+        type=Path,
+        help="lokalny finals2000A.all z IERS (bez niego: dane wbudowane w skyfield)",
+    )
+    parser.add_argument("--out", type=Path, default=TIMESCALE_FILE)
+    args = parser.parse_args()
+
+    path = build_timescale_file(args.finals, args.out)
+    print(f"[INFO] {path} ({path.stat().st_size} B), źródło: {args.finals or 'skyfield builtin'}")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# --- HACK NA ŚCIEŻKĘ: dodajemy src/ żeby działał import am_nasa ---
+ROOT = Path(__file__).resolve().parents[1]   # .../AM-NASA-v6/
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from am_nasa.ephemeris_kernels import subset_kernel
+from am_nasa.ephemeris_nasa import EPHEMERIS_DIR
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Wycina z pełnego .bsp tylko segmenty Słońce/Księżyc/Ziemia na zakres lat."
+    )
+    parser.add_argument("source", type=Path, help="pełny kernel, np. de442.bsp")
+    parser.add_argument("start", type=int, help="pierwszy rok gregoriański")
+    parser.add_argument("end", type=int, help="ostatni rok gregoriański (włącznie)")
+    parser.add_argument(
+        "--out",
+        type=Path,
+        help="plik wynikowy (domyślnie data/ephemeris/<źródło>_<OD>_<DO>.bsp)",
+    )
+    args = parser.parse_args()
+
+    out = args.out or EPHEMERIS_DIR / f"{args.source.stem}_{args.start}_{args.end}.bsp"
+    # kernel konwersji daje N + 0.5; północ UT dnia N to JD N − 0.5
+    coverage = subset_kernel(
+        args.source,
+        out,
+        jd_from_gregorian(args.start, 1, 1) - 1.0,
+        jd_from_gregorian(args.end + 1, 1, 1) - 1.0,
+    )
+    print(f"[INFO] {out} ({out.stat().st_size} B, źródło {args.source.stat().st_size} B)")
+    print(f"  JD {coverage.start_jd}…{coverage.end_jd}, segmenty {coverage.segments}")
+    print("[DONE]")
+
+
+if __name__ == "__main__":
+    main()
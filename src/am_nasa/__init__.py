@@ -1,28 +1,52 @@
-from .am_core import AM_EPOCH_JD, am_from_jd, jd_from_am
-from .astro_sync import sync_am_to_jd_physical, sync_jd_to_am_physical
-from .konwersja_wielosystemowa import konwertuj
-from .faza_ksiezyca import moon_phase, moon_phase_value
+from .am_core import AM_EPOCH_JD, am_from_jd, jd_from_am, am_from_jd_array, jd_from_am_array
+from .astro_sync import (
+    sync_am_to_jd_physical,
+    sync_jd_to_am_physical,
+    sync_am_to_jd_physical_array,
+    sync_jd_to_am_physical_array,
+)
+from .konwersja_wielosystemowa import konwertuj, konwertuj_batch, kalendarz_z_jd, kalendarz_z_jd_batch
+from .faza_ksiezyca import moon_phase, moon_phase_value, moon_phase_array, moon_phase_value_array
 from .planetary_positions import (
     sun_ecliptic_longitude,
     moon_ecliptic_longitude,
     elongacja_slonca_ksiezyca,
     jasnosc_ksiezyca,
+    sun_moon_positions_array,
+    PLANETS,
+    planet_positions_array,
+    planets_positions_array,
 )
+from .lunar_theory import moon_position_array
 from .geo_time import local_time_from_jd, local_date_string
 
 __all__ = [
     "AM_EPOCH_JD",
     "am_from_jd",
     "jd_from_am",
+    "am_from_jd_array",
+    "jd_from_am_array",
     "sync_am_to_jd_physical",
     "sync_jd_to_am_physical",
+    "sync_am_to_jd_physical_array",
+    "sync_jd_to_am_physical_array",
     "konwertuj",
+    "konwertuj_batch",
+    "kalendarz_z_jd",
+    "kalendarz_z_jd_batch",
     "moon_phase",
     "moon_phase_value",
+    "moon_phase_array",
+    "moon_phase_value_array",
     "sun_ecliptic_longitude",
     "moon_ecliptic_longitude",
     "elongacja_slonca_ksiezyca",
     "jasnosc_ksiezyca",
+    "sun_moon_positions_array",
+    "PLANETS",
+    "planet_positions_array",
+    "planets_positions_array",
+    "moon_position_array",
     "local_time_from_jd",
     "local_date_string",
 ]
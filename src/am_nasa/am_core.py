@@ -2,6 +2,12 @@ from __future__ import annotations
 
 # am_core.py — rdzeń AM ↔ JD bez żadnych korekt, deterministyczny
 
+import functools
+import math
+from typing import Any, Callable, Tuple
+
+import numpy as np
+
 # >>> KLUCZOWA STAŁA <<<
 # Empirycznie zweryfikowana na Twoich testach współczesnych dat:
 # 2025-10-09: JD=2460958.5 i AM=739288.5 => JD − AM = 1_721_670.0
@@ -23,3 +29,174 @@ def jd_from_am(am: float, _year: float | int | None = None) -> float:
 
 def jd_am_roundtrip(am: float) -> float:
     return am_from_jd(jd_from_am(am))
+
+
+# ===== WERSJE TABLICOWE (NumPy / pandas) =====
+
+def _unwrap_array(values: Any) -> Tuple[np.ndarray, Callable[[np.ndarray], Any]]:
+    """Zwraca (ndarray, rewrap) – pandas.Series wraca jako Series z tym samym indeksem.
+
+    pandas nie jest importowany: Series rozpoznajemy po `to_numpy` + `index`.
+    """
+    if hasattr(values, "to_numpy") and hasattr(values, "index"):
+        index, name, cls = values.index, getattr(values, "name", None), type(values)
+        return values.to_numpy(), lambda arr: cls(arr, index=index, name=name)
+    return np.asarray(values), lambda arr: arr
+
+
+def am_from_jd_array(jd: Any, out: np.ndarray | None = None) -> Any:
+    """
+    Wektorowa wersja am_from_jd: ndarray/Series JD -> AM, bez pętli Pythona.
+
+    Zachowuje kształt i dtype wejścia (float32 zostaje float32), wynik jest
+    bitowo identyczny z wersją skalarną. `out` pozwala liczyć w miejscu
+    (np. `am_from_jd_array(a, out=a)`).
+    """
+    arr, rewrap = _unwrap_array(jd)
+    res = np.subtract(arr, AM_EPOCH_JD, out=out)
+    return res if out is not None else rewrap(res)
+
+
+def jd_from_am_array(am: Any, out: np.ndarray | None = None) -> Any:
+    """
+    Wektorowa wersja jd_from_am: ndarray/Series AM -> JD.
+    Te same zasady co am_from_jd_array (dtype, kształt, bufor `out`).
+    """
+    arr, rewrap = _unwrap_array(am)
+    res = np.add(arr, AM_EPOCH_JD, out=out)
+    return res if out is not None else rewrap(res)
+
+
+# ===== JD DWUCZĘŚCIOWY (dzień całkowity + ułamek) =====
+#
+# float64 przy JD≈2.4e6 ma rozdzielczość ~4.7e-10 d (~40 µs), a każde dodanie
+# ułamka UT dokłada błąd zaokrąglenia. Para (int, float) trzyma ułamek
+# z pełną precyzją float64 (~1e-16 d) bez kosztu Decimal.
+
+@functools.total_ordering
+class JulianDay:
+    """
+    JD (lub AM) jako para: całkowity dzień + ułamek dnia w [0, 1).
+
+    Arytmetyka z liczbami zwraca JulianDay, więc am_from_jd / jd_from_am
+    działają na nim bez zmian (AM_EPOCH_JD jest całkowite).
+    Różnica dwóch JulianDay to zwykły float (w dniach).
+    """
+
+    __slots__ = ("day", "frac")
+
+    def __init__(self, day: int, frac: float = 0.0) -> None:
+        carry = math.floor(frac)
+        frac = float(frac - carry)
+        if frac >= 1.0:  # -1e-20 -> 1.0 po zaokrągleniu
+            carry += 1
+            frac -= 1.0
+        self.day = int(day) + int(carry)
+        self.frac = frac
+
+    @classmethod
+    def from_float(cls, jd: float) -> "JulianDay":
+        day = math.floor(jd)
+        return cls(day, jd - day)
+
+    def __float__(self) -> float:
+        return self.day + self.frac
+
+    def __add__(self, other: Any) -> "JulianDay":
+        if isinstance(other, JulianDay):
+            return JulianDay(self.day + other.day, self.frac + other.frac)
+        whole = math.floor(other)
+        return JulianDay(self.day + int(whole), self.frac + (other - whole))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, JulianDay):
+            return (self.day - other.day) + (self.frac - other.frac)
+        return self + (-other)
+
+    def __rsub__(self, other: Any) -> float:
+        return (other - self.day) - self.frac
+
+    def _key(self) -> Tuple[int, float]:
+        return self.day, self.frac
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, JulianDay):
+            return self._key() == other._key()
+        if isinstance(other, (int, float)):
+            return float(self) == other
+        return NotImplemented
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, JulianDay):
+            return self._key() < other._key()
+        if isinstance(other, (int, float)):
+            return float(self) < other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # jak float: JulianDay równy liczbie musi mieć jej hash
+        return hash(float(self))
+
+    def __repr__(self) -> str:
+        return f"JulianDay({self.day}, {self.frac!r})"
+
+
+class JulianDayArray:
+    """
+    Wsadowa forma JulianDay: dwie równoległe tablice `day` (int64) i `frac` (float64).
+
+    Pasuje 1:1 do konstruktora skyfield `ts.tt_jd(jd, fraction)`.
+    """
+
+    __slots__ = ("day", "frac")
+
+    def __init__(self, day: Any, frac: Any = 0.0) -> None:
+        frac = np.asarray(frac, dtype=np.float64)
+        carry = np.floor(frac)
+        frac = frac - carry
+        wrap = frac >= 1.0
+        carry = carry + wrap
+        frac = np.where(wrap, frac - 1.0, frac)
+        day = np.asarray(day, dtype=np.int64) + carry.astype(np.int64)
+        self.day, self.frac = np.broadcast_arrays(day, frac)
+
+    @classmethod
+    def from_float(cls, jd: Any) -> "JulianDayArray":
+        jd = np.asarray(jd, dtype=np.float64)
+        day = np.floor(jd)
+        return cls(day, jd - day)
+
+    def to_float(self) -> np.ndarray:
+        return self.day + self.frac
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.day.shape
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def __getitem__(self, idx: Any) -> Any:
+        day, frac = self.day[idx], self.frac[idx]
+        if np.ndim(day) == 0:
+            return JulianDay(int(day), float(frac))
+        return JulianDayArray(day, frac)
+
+    def __add__(self, other: Any) -> "JulianDayArray":
+        if isinstance(other, (JulianDay, JulianDayArray)):
+            return JulianDayArray(self.day + other.day, self.frac + other.frac)
+        other = np.asarray(other, dtype=np.float64)
+        whole = np.floor(other)
+        return JulianDayArray(self.day + whole.astype(np.int64), self.frac + (other - whole))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> Any:
+        if isinstance(other, (JulianDay, JulianDayArray)):
+            return (self.day - other.day) + (self.frac - other.frac)
+        return self + np.negative(other)
+
+    def __repr__(self) -> str:
+        return f"JulianDayArray(day={self.day!r}, frac={self.frac!r})"
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 from typing import Dict, Any
 
-from .konwersja_wielosystemowa import konwertuj
+from .konwersja_wielosystemowa import gregorian_from_jd, konwertuj
 from .am_core import am_from_jd
 from .geo_time import local_time_from_jd, local_date_string
-from .ephemeris_nasa import sun_moon_state_from_jd, moon_phase_name_from_nasa
+from .ephemeris_nasa import engine_for_tier, sun_moon_state_from_jd
 from .eclipses import solar_eclipse_visibility, lunar_eclipse_visibility
+from .lunation_index import lunation_state
 
 
 def convert_calendar_date(
@@ -15,8 +16,23 @@ def convert_calendar_date(
     month: int,
     day: float,
     lon: float = 0.0,
+    engine: str = "skyfield",
+    scale: str = "TT",
+    tier: str | None = None,
 ) -> Dict[str, Any]:
-    """High-level: data w dowolnym kalendarzu -> JD, AM + info astro (NASA)."""
+    """High-level: data w dowolnym kalendarzu -> JD, AM + info astro (NASA).
+
+    `engine`: "skyfield" (pełne JPL), "jplephem" (to samo wprost z .bsp)
+    albo "chebyshev" (szybki cache wielomianów).
+    `tier`: zamiast silnika poziom dokładności – "fast" / "cached" / "jpl" /
+    "jpl-geometric" (budżety błędów: ephemeris_nasa.TIER_ERROR_BUDGET).
+    `scale`: w jakiej skali jest data/JD – "TT" (domyślnie) albo "UT"
+    (efemerydy dostają wtedy JD + ΔT).
+    Nazwa fazy, wiek Księżyca i numer lunacji – z indeksu faz JPL
+    (lunation_index), niezależnie od silnika.
+    """
+    if tier is not None:
+        engine = engine_for_tier(tier)
 
     payload = {
         "system": system.lower(),
@@ -25,15 +41,17 @@ def convert_calendar_date(
         "day": day,
     }
 
-    base = konwertuj(payload)
-    jd = float(base["JD"])
+    # JD dwuczęściowy – efemerydy dostają ułamek dnia bez strat precyzji
+    base = konwertuj(payload, precise=True)
+    jd_precise = base["JD"]
+    jd = float(jd_precise)
     am = float(base["AM"])
 
     jd_local, local_hours = local_time_from_jd(jd, lon)
     local_dt_str = local_date_string(jd, lon)
 
-    nasa_state = sun_moon_state_from_jd(jd)
-    phase_name = moon_phase_name_from_nasa(jd)
+    nasa_state = sun_moon_state_from_jd(jd_precise, engine, scale)
+    lunation = lunation_state(jd_precise, scale)
 
     return {
         "input": {
@@ -42,6 +60,9 @@ def convert_calendar_date(
             "month": month,
             "day": day,
             "lon": lon,
+            "engine": engine,
+            "tier": tier,
+            "scale": scale,
         },
         "time": {
             "JD": jd,
@@ -50,7 +71,9 @@ def convert_calendar_date(
             "local_datetime": local_dt_str,
         },
         "moon": {
-            "phase_name": phase_name,
+            "phase_name": lunation["phase_name"],
+            "age_days": lunation["age_days"],
+            "lunation": lunation["lunation"],
             "phase_angle_deg": nasa_state["phase_angle_deg"],
             "illumination": nasa_state["illumination"],
         },
@@ -64,24 +87,38 @@ def convert_calendar_date(
 
 def info_from_jd(
     jd: float,
-    year: int,
+    year: int | None = None,
     lon: float = 0.0,
+    engine: str = "skyfield",
+    scale: str = "TT",
+    tier: str | None = None,
 ) -> Dict[str, Any]:
-    """JD -> AM + info astro na bazie NASA (bez kalendarza wejściowego)."""
+    """JD -> AM + info astro na bazie NASA (bez kalendarza wejściowego).
+
+    `engine` / `tier` / `scale` jak w convert_calendar_date. Bez `year` –
+    rok gregoriański daty z JD.
+    """
+    if tier is not None:
+        engine = engine_for_tier(tier)
+    if year is None:
+        year = int(gregorian_from_jd(jd)[0])
 
     am = am_from_jd(jd, year)
 
     jd_local, local_hours = local_time_from_jd(jd, lon)
     local_dt_str = local_date_string(jd, lon)
 
-    nasa_state = sun_moon_state_from_jd(jd)
-    phase_name = moon_phase_name_from_nasa(jd)
+    nasa_state = sun_moon_state_from_jd(jd, engine, scale)
+    lunation = lunation_state(jd, scale)
 
     return {
         "input": {
             "JD": jd,
             "year": year,
             "lon": lon,
+            "engine": engine,
+            "tier": tier,
+            "scale": scale,
         },
         "time": {
             "JD": jd,
@@ -90,7 +127,9 @@ def info_from_jd(
             "local_datetime": local_dt_str,
         },
         "moon": {
-            "phase_name": phase_name,
+            "phase_name": lunation["phase_name"],
+            "age_days": lunation["age_days"],
+            "lunation": lunation["lunation"],
             "phase_angle_deg": nasa_state["phase_angle_deg"],
             "illumination": nasa_state["illumination"],
         },
@@ -108,13 +147,15 @@ def eclipse_visibility(
     lat_deg: float,
     lon_deg: float,
     elevation_m: float = 0.0,
+    scale: str = "TT",
+    tier: str = "jpl",
 ) -> Dict[str, Any]:
     """Wrapper pod API: widoczność zaćmienia Słońca/Księżyca dla lokalizacji."""
 
     eclipse_type = eclipse_type.lower()
     if eclipse_type == "solar":
-        return solar_eclipse_visibility(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+        return solar_eclipse_visibility(jd, lat_deg, lon_deg, elevation_m=elevation_m, scale=scale, tier=tier)
     elif eclipse_type == "lunar":
-        return lunar_eclipse_visibility(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+        return lunar_eclipse_visibility(jd, lat_deg, lon_deg, elevation_m=elevation_m, scale=scale, tier=tier)
     else:
         raise ValueError(f"Nieznany typ zaćmienia: {eclipse_type}")
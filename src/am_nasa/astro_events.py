@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+# astro_events.py — wektorowe szukanie zdarzeń Słońce/Księżyc na efemerydach JPL.
+#
+# Nowie i granice tithi (λ☾ − λ☉ = k·krok) oraz momenty, w których Słońce
+# osiąga zadaną długość ekliptyczną (wyrazy słoneczne, równonoce, przesilenia,
+# sankranti). Wszystkie zdarzenia
+# z przedziału liczone są naraz: przybliżenie średnim ruchem + kilka kroków
+# Newtona, każdy krok = jedno wektorowe wywołanie skyfield. Długość Słońca
+# ma lepszy zalążek – analityczny szereg sun_ecliptic_longitude (pozorny,
+# < 40″), więc na JPL wystarczają _SOLAR_NEWTON_STEPS kroki.
+#
+# Długości są pozorne, geocentryczne, względem ekliptyki i równonocy daty.
+# Czasy wychodzą w TT (JD); na UT zamienia je delta_t.tt_to_ut (jeden model ΔT
+# dla całego pakietu).
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from .ephemeris_nasa import _load_ephemeris, _load_timescale
+from .planetary_positions import sun_ecliptic_longitude_array
+
+SYNODIC_MONTH = 29.530588861
+TROPICAL_YEAR = 365.242189
+
+# Meeus, rozdz. 47/49: średni nów k = 0 (6.01.2000) i średnia długość Słońca
+_NEW_MOON_EPOCH = 2451550.09766
+_SUN_L0 = 280.46646
+_SUN_RATE = 360.0 / TROPICAL_YEAR
+
+_NEWTON_STEPS = 4
+_SOLAR_NEWTON_STEPS = 2
+_SEED_STEPS = 3  # iteracje zalążka analitycznego (średni ruch jako pochodna)
+_NEWTON_H = 1e-3  # krok pochodnej numerycznej [dni]
+
+
+def _wrap180(deg):
+    return (np.asarray(deg) + 180.0) % 360.0 - 180.0
+
+
+def sun_moon_longitudes(jd_tt, eph=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Pozorne długości ekliptyczne (daty) Słońca i Księżyca [deg] dla tablicy JD (TT).
+
+    `eph` – opcjonalnie inny kernel skyfield niż domyślny z ephemeris_nasa.
+    """
+    if eph is None:
+        eph, _ = _load_ephemeris()
+    t = _load_timescale().tt_jd(np.asarray(jd_tt, dtype=np.float64))
+    earth = eph["earth"].at(t)
+    _, lam_sun, _ = earth.observe(eph["sun"]).apparent().ecliptic_latlon(epoch="date")
+    _, lam_moon, _ = earth.observe(eph["moon"]).apparent().ecliptic_latlon(epoch="date")
+    return lam_sun.degrees, lam_moon.degrees
+
+
+def apparent_sun_longitude_analytic(jd_tt) -> np.ndarray:
+    """Pozorna długość Słońca [deg] z szeregu Meeusa: aberracja + nutacja (Meeus 25.8)."""
+    jd_tt = np.asarray(jd_tt, dtype=np.float64)
+    omega = np.radians(125.04 - 1934.136 * (jd_tt - 2451545.0) / 36525.0)
+    return (sun_ecliptic_longitude_array(jd_tt) - 0.00569 - 0.00478 * np.sin(omega)) % 360.0
+
+
+def _newton(residual: Callable[[np.ndarray], np.ndarray], t: np.ndarray, steps: int = _NEWTON_STEPS) -> np.ndarray:
+    """Wektorowy Newton dla residual(t) [deg] = 0; t i t + h liczone jednym wywołaniem."""
+    t = np.asarray(t, dtype=np.float64)
+    for _ in range(steps):
+        f = residual(np.concatenate([t, t + _NEWTON_H]))
+        f0, f1 = f[: t.size], f[t.size:]
+        t = t - f0 * _NEWTON_H / (f1 - f0)
+    return t
+
+
+def lunar_elongation_times(
+    jd_start: float,
+    jd_end: float,
+    step_deg: float = 12.0,
+    eph=None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Momenty (JD TT), gdy elongacja λ☾ − λ☉ = wielokrotność step_deg.
+
+    Zwraca (jd_tt, elongacja [deg] w 0…360). step_deg=12 -> granice tithi,
+    180 -> nowie i pełnie, 360 -> same nowie.
+    """
+    def mean_elongation(jd):
+        return 360.0 * (jd - _NEW_MOON_EPOCH) / SYNODIC_MONTH
+
+    k = np.arange(np.floor(mean_elongation(jd_start) / step_deg) - 1,
+                  np.ceil(mean_elongation(jd_end) / step_deg) + 2)
+    target = k * step_deg
+
+    def residual(t):
+        lam_sun, lam_moon = sun_moon_longitudes(t, eph)
+        return _wrap180(lam_moon - lam_sun - np.concatenate([target, target]))
+
+    t = _newton(residual, _NEW_MOON_EPOCH + SYNODIC_MONTH * target / 360.0)
+    keep = (t >= jd_start) & (t < jd_end)
+    return t[keep], target[keep] % 360.0
+
+
+def new_moons(jd_start: float, jd_end: float, eph=None) -> np.ndarray:
+    """Momenty nowiu (JD TT) w przedziale [jd_start, jd_end)."""
+    return lunar_elongation_times(jd_start, jd_end, 360.0, eph)[0]
+
+
+def solar_longitude_times(
+    jd_start: float,
+    jd_end: float,
+    step_deg: float = 15.0,
+    eph=None,
+    sidereal: bool = False,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Momenty (JD TT), gdy pozorna długość Słońca = wielokrotność step_deg.
+
+    Zwraca (jd_tt, długość [deg] w 0…360). step_deg=15 -> 24 wyrazy słoneczne,
+    30 -> zhongqi / znaki, 90 -> równonoce i przesilenia. sidereal=True liczy
+    długość syderyczną (minus ajanamsa Lahiri) – sankranti.
+    """
+    def mean_lon(jd):
+        lon = _SUN_L0 + _SUN_RATE * (jd - 2451545.0)
+        return lon - ayanamsa_lahiri(jd) if sidereal else lon
+
+    k = np.arange(np.floor(mean_lon(jd_start) / step_deg) - 1, np.ceil(mean_lon(jd_end) / step_deg) + 2)
+    target = k * step_deg
+
+    def residual(t):
+        lam_sun, _ = sun_moon_longitudes(t, eph)
+        if sidereal:
+            lam_sun = lam_sun - ayanamsa_lahiri(t)
+        return _wrap180(lam_sun - np.concatenate([target, target]))
+
+    seed = 2451545.0 + (target - _SUN_L0) / _SUN_RATE
+    if sidereal:
+        seed = seed + ayanamsa_lahiri(seed) / _SUN_RATE
+    t = _newton(residual, solar_longitude_seed(seed, target, sidereal), _SOLAR_NEWTON_STEPS)
+    keep = (t >= jd_start) & (t < jd_end)
+    return t[keep], target[keep] % 360.0
+
+
+def solar_longitude_seed(seed, target, sidereal: bool = False) -> np.ndarray:
+    """Poprawia zalążek (JD TT) do pozornej długości `target` [deg] na szeregu analitycznym."""
+    seed = np.asarray(seed, dtype=np.float64)
+    for _ in range(_SEED_STEPS):
+        lam = apparent_sun_longitude_analytic(seed)
+        if sidereal:
+            lam = lam - ayanamsa_lahiri(seed)
+        seed = seed - _wrap180(lam - target) / _SUN_RATE
+    return seed
+
+
+def ayanamsa_lahiri(jd_tt):
+    """Ajanamsa Lahiri (Chitrapaksha) [deg]: 23°51′25.532″ w J2000 + precesja ogólna IAU 2006."""
+    t = (np.asarray(jd_tt, dtype=np.float64) - 2451545.0) / 36525.0
+    return 23.857092 + (5028.796195 * t + 1.1054348 * t * t) / 3600.0
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from .am_core import AM_EPOCH_JD
+from typing import Any
+
+import numpy as np
+
+from .am_core import AM_EPOCH_JD, am_from_jd_array, jd_from_am_array
 
 
 def sync_am_to_jd_physical(am_day: float, _year: float | int | None = None) -> float:
@@ -16,3 +20,17 @@ def sync_jd_to_am_physical(jd: float, _year: float | int | None = None) -> float
     JD -> AM, odwrotność sync_am_to_jd_physical.
     """
     return jd - AM_EPOCH_JD
+
+
+def sync_am_to_jd_physical_array(am_days: Any, out: np.ndarray | None = None) -> Any:
+    """
+    Wektorowa wersja sync_am_to_jd_physical (ndarray/Series, opcjonalny bufor `out`).
+    """
+    return jd_from_am_array(am_days, out=out)
+
+
+def sync_jd_to_am_physical_array(jd: Any, out: np.ndarray | None = None) -> Any:
+    """
+    Wektorowa wersja sync_jd_to_am_physical (ndarray/Series, opcjonalny bufor `out`).
+    """
+    return am_from_jd_array(jd, out=out)
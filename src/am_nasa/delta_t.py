@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+# delta_t.py — ΔT = TT − UT jako prekomputowany spline kubiczny, skala UT ↔ TT.
+#
+# Model (sekundy):
+#   * do 1973 – wielomiany Espenak–Meeus (NASA 2006; przed −500 i po 2150
+#     długookresowa parabola Morrison–Stephenson −20 + 32·u²),
+#   * 1973…koniec danych IERS – tabela dzienna ΔT z data/timescale/iers.npz
+#     (ta sama, z której budujemy Timescale skyfield),
+#   * dalej – prognoza Espenak–Meeus, do 2050 przesunięta tak, żeby stykała
+#     się z ostatnią wartością IERS (różnica wygasa liniowo).
+#
+# Model próbkujemy co STEP_YEARS lat na [YEAR_MIN, YEAR_MAX] i zapisujemy
+# naturalny spline kubiczny jako .npy (float64, kształt (n, 5)). Wiersz =
+# przedział: [rok węzła, a, b, c, d], ΔT = a + b·s + c·s² + d·s³, s = rok − węzeł.
+# Lookup: indeks przedziału wprost z roku (węzły równoodległe) + Horner –
+# O(1) na element, całe tablice naraz. Poza tablicą – parabola długookresowa.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .am_core import JulianDay, JulianDayArray
+
+DELTA_T_FILE = Path(__file__).resolve().parent / "data" / "timescale" / "delta_t_spline.npy"
+IERS_FILE = Path(__file__).resolve().parent / "data" / "timescale" / "iers.npz"
+
+YEAR_MIN = -2000
+YEAR_MAX = 3000
+STEP_YEARS = 1.0
+
+SCALES = ("UT", "TT")
+
+_J2000 = 2451545.0
+_JULIAN_YEAR = 365.25
+_SECONDS_PER_DAY = 86400.0
+_FORECAST_END = 2050.0  # do tego roku prognoza dociąga do ostatniego IERS
+
+
+def _check_scale(scale: str) -> None:
+    if scale not in SCALES:
+        raise ValueError(f"Nieznana skala czasu: {scale!r} (dostępne: {', '.join(SCALES)})")
+
+
+def _jd_float(jd) -> np.ndarray:
+    if isinstance(jd, (JulianDay, JulianDayArray)):
+        return np.asarray(jd.day + jd.frac, dtype=np.float64)
+    return np.asarray(jd, dtype=np.float64)
+
+
+def decimal_year(jd) -> np.ndarray:
+    """JD -> rok dziesiętny (lata juliańskie od J2000) – argument modeli ΔT."""
+    return 2000.0 + (_jd_float(jd) - _J2000) / _JULIAN_YEAR
+
+
+def _long_term(year) -> np.ndarray:
+    u = (np.asarray(year, dtype=np.float64) - 1820.0) / 100.0
+    return -20.0 + 32.0 * u * u
+
+
+def espenak_meeus(year) -> np.ndarray:
+    """ΔT [s] z wielomianów Espenak–Meeus (NASA, 2006) dla roku dziesiętnego."""
+    y = np.asarray(year, dtype=np.float64)
+    t = y - 2000.0
+    pieces = [
+        (y < -500, _long_term(y)),
+        (y < 500, np.polyval(
+            [0.0090316521, 0.022174192, -0.1798452, -5.952053, 33.78311, -1014.41, 10583.6], y / 100.0)),
+        (y < 1600, np.polyval(
+            [0.0083572073, -0.005050998, -0.8503463, 0.319781, 71.23472, -556.01, 1574.2], (y - 1000.0) / 100.0)),
+        (y < 1700, np.polyval([1.0 / 7129, -0.01532, -0.9808, 120.0], y - 1600.0)),
+        (y < 1800, np.polyval([-1.0 / 1174000, 0.00013336, -0.0059285, 0.1603, 8.83], y - 1700.0)),
+        (y < 1860, np.polyval(
+            [0.000000000875, -0.0000001699, 0.0000121272, -0.00037436, 0.0041116, 0.0068612, -0.332447, 13.72],
+            y - 1800.0)),
+        (y < 1900, np.polyval([1.0 / 233174, -0.0004473624, 0.01680668, -0.251754, 0.5737, 7.62], y - 1860.0)),
+        (y < 1920, np.polyval([-0.000197, 0.0061966, -0.0598939, 1.494119, -2.79], y - 1900.0)),
+        (y < 1941, np.polyval([0.0020936, -0.076100, 0.84493, 21.20], y - 1920.0)),
+        (y < 1961, np.polyval([1.0 / 2547, -1.0 / 233, 0.407, 29.07], y - 1950.0)),
+        (y < 1986, np.polyval([-1.0 / 718, -1.0 / 260, 1.067, 45.45], y - 1975.0)),
+        (y < 2005, np.polyval([0.00002373599, 0.000651814, 0.0017275, -0.060374, 0.3345, 63.86], t)),
+        (y < 2050, np.polyval([0.005589, 0.32217, 62.92], t)),
+        (y < 2150, _long_term(y) - 0.5628 * (2150.0 - y)),
+    ]
+    return np.select([cond for cond, _ in pieces], [value for _, value in pieces], _long_term(y))
+
+
+def _iers_daily(path: Path = IERS_FILE):
+    """(JD TT, ΔT [s]) dzienne z pliku skali czasu; bez pliku – dane skyfield."""
+    if Path(path).exists():
+        with np.load(path) as arrays:
+            arrays = dict(arrays)
+    else:
+        from skyfield.iokit import load_bundled_npy
+
+        arrays = dict(load_bundled_npy("iers.npz"))
+    tt = arrays["tt_jd_minus_arange"] + np.arange(len(arrays["tt_jd_minus_arange"]))
+    return tt, arrays["delta_t_1e7"] / 1e7
+
+
+def delta_t_model(year, iers_path: Path = IERS_FILE) -> np.ndarray:
+    """ΔT [s] z pełnego modelu (wolne – tylko do budowy tablicy i testów)."""
+    year = np.asarray(year, dtype=np.float64)
+    tt, daily = _iers_daily(iers_path)
+    iers_years = decimal_year(tt)
+    first, last = iers_years[0], iers_years[-1]
+
+    out = espenak_meeus(year)
+    inside = (year >= first) & (year <= last)
+    out = np.where(inside, np.interp(year, iers_years, daily), out)
+    # prognoza po końcu IERS: przesunięcie o skok na styku, wygasające do 2050
+    gap = daily[-1] - espenak_meeus(last)
+    fade = np.clip((_FORECAST_END - year) / (_FORECAST_END - last), 0.0, 1.0)
+    return np.where(year > last, out + gap * fade, out)
+
+
+def _natural_spline(values: np.ndarray, step: float) -> np.ndarray:
+    """Współczynniki (n − 1, 4) naturalnego splajnu kubicznego na węzłach równoodległych."""
+    n = len(values)
+    rhs = 6.0 / step**2 * (values[:-2] - 2.0 * values[1:-1] + values[2:])
+    # układ trójdiagonalny [1 4 1] dla drugich pochodnych (algorytm Thomasa)
+    diag = np.full(n - 2, 4.0)
+    for i in range(1, n - 2):
+        w = 1.0 / diag[i - 1]
+        diag[i] -= w
+        rhs[i] -= w * rhs[i - 1]
+    second = np.zeros(n)
+    second[n - 2] = rhs[-1] / diag[-1]
+    for i in range(n - 4, -1, -1):
+        second[i + 1] = (rhs[i] - second[i + 2]) / diag[i]
+
+    m0, m1 = second[:-1], second[1:]
+    a = values[:-1]
+    b = (values[1:] - values[:-1]) / step - step * (2.0 * m0 + m1) / 6.0
+    c = m0 / 2.0
+    d = (m1 - m0) / (6.0 * step)
+    return np.column_stack([a, b, c, d])
+
+
+def build_delta_t_table(
+    year_min: float = YEAR_MIN,
+    year_max: float = YEAR_MAX,
+    step: float = STEP_YEARS,
+    iers_path: Path = IERS_FILE,
+) -> np.ndarray:
+    """Tablica splajnu (n, 5): [rok węzła, a, b, c, d] z delta_t_model."""
+    knots = np.arange(year_min, year_max + step / 2.0, step, dtype=np.float64)
+    coef = _natural_spline(delta_t_model(knots, iers_path), step)
+    return np.column_stack([knots[:-1], coef])
+
+
+def save_delta_t_table(table: np.ndarray, path: Path = DELTA_T_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, table)
+    return path
+
+
+class DeltaTSpline:
+    """Ewaluator splajnu ΔT (tablica z build_delta_t_table)."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data)
+        self.knots = data[:, 0]
+        self.coef = np.ascontiguousarray(data[:, 1:].T)  # (4, n) – wiersze a, b, c, d
+        self.year_min = float(self.knots[0])
+        self.step = float(self.knots[1] - self.knots[0])
+        self.year_max = self.year_min + self.step * len(self.knots)
+
+    def at_year(self, year) -> np.ndarray:
+        year = np.asarray(year, dtype=np.float64)
+        pos = (year - self.year_min) / self.step
+        idx = np.clip(np.floor(pos).astype(np.int64), 0, len(self.knots) - 1)
+        s = (pos - idx) * self.step
+        a, b, c, d = self.coef[:, idx]
+        value = a + s * (b + s * (c + s * d))
+        outside = (year < self.year_min) | (year > self.year_max)
+        if np.any(outside):
+            value = np.where(outside, _long_term(year), value)
+        return value
+
+    def __call__(self, jd) -> np.ndarray:
+        """ΔT [s] dla JD (float, tablica, JulianDay / JulianDayArray)."""
+        return self.at_year(decimal_year(jd))
+
+
+@lru_cache(maxsize=1)
+def get_delta_t_spline(path: Optional[Path] = None) -> DeltaTSpline:
+    """Splajn z pliku (mmap); bez pliku – budowany w pamięci z danych pakietu."""
+    path = Path(path) if path is not None else DELTA_T_FILE
+    if path.exists():
+        return DeltaTSpline(np.load(path, mmap_mode="r"))
+    return DeltaTSpline(build_delta_t_table())
+
+
+def delta_t(jd):
+    """ΔT = TT − UT [s]; skalar dla skalara, tablica dla tablicy."""
+    value = get_delta_t_spline()(jd)
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def ut_to_tt(jd):
+    """JD (UT) -> JD (TT). JulianDay / JulianDayArray zostają dwuczęściowe."""
+    return _shift(jd, get_delta_t_spline()(jd) / _SECONDS_PER_DAY)
+
+
+def tt_to_ut(jd):
+    """JD (TT) -> JD (UT): ΔT liczony w chwili UT (dwie iteracje punktu stałego)."""
+    spline = get_delta_t_spline()
+    jd_tt = _jd_float(jd)
+    shift = spline(jd_tt) / _SECONDS_PER_DAY
+    for _ in range(2):
+        shift = spline(jd_tt - shift) / _SECONDS_PER_DAY
+    return _shift(jd, -shift)
+
+
+def _shift(jd, days):
+    if isinstance(jd, JulianDay):
+        return jd + float(days)
+    if isinstance(jd, JulianDayArray):
+        return jd + days
+    value = _jd_float(jd) + days
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def to_tt(jd, scale: str = "TT"):
+    """JD w skali `scale` ("UT" | "TT") -> JD (TT), tego samego typu co wejście."""
+    _check_scale(scale)
+    return ut_to_tt(jd) if scale == "UT" else jd
@@ -1,41 +1,85 @@
 from __future__ import annotations
 
+import math
 from typing import Dict, Any
 
 from skyfield.api import wgs84
 
-from .ephemeris_nasa import _load_ephemeris, sun_moon_state_from_jd
+from .am_core import JulianDay
+from .delta_t import to_tt
+from .ephemeris_nasa import SKY_STATE_CACHE, _to_time, engine_for_tier, get_ephemeris_index, sun_moon_state_from_jd
 
+# promienie fizyczne do promieni kątowych tarcz (IAU 2015 / IAU 2009)
+_SUN_RADIUS_KM = 695700.0
+_MOON_RADIUS_KM = 1737.4
 
-def _sun_moon_altaz(
-    jd: float,
+_NO_ALTAZ = dict.fromkeys(("sun_alt_deg", "sun_az_deg", "moon_alt_deg", "moon_az_deg"))
+
+
+def _local_altaz(jd, lat_deg, lon_deg, elevation_m, tier: str, candidate: bool) -> Dict[str, Any]:
+    """Wysokości/azymuty (zawsze pełne JPL). Przy tańszym tierze – tylko dla kandydatów.
+
+    Geometria globalna z tieru "fast"/"cached"/"jpl-geometric" odsiewa daty bez
+    zaćmienia; dla nich pola alt/az są None, a topocentryczne JPL nie jest liczone.
+    """
+    if tier != "jpl" and not candidate:
+        return dict(_NO_ALTAZ)
+    return _sun_moon_altaz(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+
+
+def _topocentric_sky(
+    jd: float | JulianDay,
     lat_deg: float,
     lon_deg: float,
     elevation_m: float = 0.0,
 ) -> Dict[str, float]:
-    """Zwraca wysokości i azymuty Słońca i Księżyca dla danej lokalizacji i JD."""
-    eph, ts = _load_ephemeris()
-    t = ts.tt_jd(jd)
+    """Jedna obserwacja topocentryczna Słońca i Księżyca (wspólny cache stanów nieba).
 
-    earth = eph["earth"]
-    topos = wgs84.latlon(lat_deg, lon_deg, elevation_m=elevation_m)
-    location = earth + topos
+    Z niej korzystają zarówno wysokości/azymuty, jak i procent zakrycia tarczy.
+    """
 
-    sun_app = location.at(t).observe(eph["sun"]).apparent()
-    moon_app = location.at(t).observe(eph["moon"]).apparent()
+    def compute() -> Dict[str, float]:
+        eph, t = _to_time(jd)
 
-    alt_sun, az_sun, _ = sun_app.altaz()
-    alt_moon, az_moon, _ = moon_app.altaz()
+        earth = eph["earth"]
+        topos = wgs84.latlon(lat_deg, lon_deg, elevation_m=elevation_m)
+        location = earth + topos
 
-    return {
-        "sun_alt_deg": alt_sun.degrees,
-        "sun_az_deg": az_sun.degrees,
-        "moon_alt_deg": alt_moon.degrees,
-        "moon_az_deg": az_moon.degrees,
-    }
+        observer = location.at(t)
+        sun_app = observer.observe(eph["sun"]).apparent()
+        moon_app = observer.observe(eph["moon"]).apparent()
+
+        alt_sun, az_sun, _ = sun_app.altaz()
+        alt_moon, az_moon, _ = moon_app.altaz()
+
+        return {
+            "sun_alt_deg": alt_sun.degrees,
+            "sun_az_deg": az_sun.degrees,
+            "moon_alt_deg": alt_moon.degrees,
+            "moon_az_deg": az_moon.degrees,
+            # separacja kątowa środków tarcz i promienie kątowe (radiany)
+            "center_sep_rad": sun_app.separation_from(moon_app).radians,
+            "sun_radius_rad": math.asin(_SUN_RADIUS_KM / sun_app.distance().km),
+            "moon_radius_rad": math.asin(_MOON_RADIUS_KM / moon_app.distance().km),
+        }
+
+    key = ("topo", float(lat_deg), float(lon_deg), float(elevation_m))
+    SKY_STATE_CACHE.bind("topo", get_ephemeris_index())
+    return SKY_STATE_CACHE.get_or_compute(key, jd, compute)
 
 
-def _solar_disk_coverage_fraction(jd: float, lat_deg: float, lon_deg: float, elevation_m: float = 0.0) -> float:
+def _sun_moon_altaz(
+    jd: float | JulianDay,
+    lat_deg: float,
+    lon_deg: float,
+    elevation_m: float = 0.0,
+) -> Dict[str, float]:
+    """Zwraca wysokości i azymuty Słońca i Księżyca dla danej lokalizacji i JD."""
+    sky = _topocentric_sky(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+    return {key: sky[key] for key in ("sun_alt_deg", "sun_az_deg", "moon_alt_deg", "moon_az_deg")}
+
+
+def _solar_disk_coverage_fraction(jd: float | JulianDay, lat_deg: float, lon_deg: float, elevation_m: float = 0.0) -> float:
     """Przybliżony procent zakrycia tarczy Słońca (0–1) dla danej lokalizacji i JD.
 
     Liczymy:
@@ -43,25 +87,10 @@ def _solar_disk_coverage_fraction(jd: float, lat_deg: float, lon_deg: float, ele
     - separację kątową ich środków,
     - pole części wspólnej dwóch kół / pole koła Słońca.
     """
-    import math
-
-    eph, ts = _load_ephemeris()
-    t = ts.tt_jd(jd)
-
-    earth = eph["earth"]
-    topos = wgs84.latlon(lat_deg, lon_deg, elevation_m=elevation_m)
-    location = earth + topos
-
-    sun_app = location.at(t).observe(eph["sun"]).apparent()
-    moon_app = location.at(t).observe(eph["moon"]).apparent()
-
-    # separacja kątowa środków tarcz
-    center_sep_deg = sun_app.separation_from(moon_app).degrees
-    center_sep = math.radians(center_sep_deg)
-
-    # promienie kątowe (radiany)
-    sun_radius = sun_app.angular_radius().radians
-    moon_radius = moon_app.angular_radius().radians
+    sky = _topocentric_sky(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+    center_sep = sky["center_sep_rad"]
+    sun_radius = sky["sun_radius_rad"]
+    moon_radius = sky["moon_radius_rad"]
 
     # jeśli bardzo daleko od siebie -> brak zakrycia
     if center_sep >= sun_radius + moon_radius:
@@ -118,23 +147,28 @@ def classify_solar_eclipse_from_state(state: Dict[str, Any]) -> str | None:
 
 
 def solar_eclipse_visibility(
-    jd: float,
+    jd: float | JulianDay,
     lat_deg: float,
     lon_deg: float,
     elevation_m: float = 0.0,
+    scale: str = "TT",
+    tier: str = "jpl",
 ) -> Dict[str, Any]:
     """Czy zaćmienie Słońca jest widoczne z danej lokalizacji o podanym JD?
 
     Zakładamy, że JD to czas maksymalnego zaćmienia (np. z NASA/GSFC).
+    `scale`: "TT" (TD z katalogów NASA) albo "UT" (np. JD_UT z danych AMJD).
+    `tier`: dokładność geometrii globalnej (ephemeris_nasa.TIERS).
     """
 
-    state = sun_moon_state_from_jd(jd)
-    altaz = _sun_moon_altaz(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+    jd_input, jd = jd, to_tt(jd, scale)
+    state = sun_moon_state_from_jd(jd, engine_for_tier(tier))
 
     global_class = classify_solar_eclipse_from_state(state)
+    altaz = _local_altaz(jd, lat_deg, lon_deg, elevation_m, tier, global_class is not None)
 
-    sun_up = altaz["sun_alt_deg"] > 0.0
-    moon_up = altaz["moon_alt_deg"] > 0.0
+    sun_up = altaz["sun_alt_deg"] is not None and altaz["sun_alt_deg"] > 0.0
+    moon_up = altaz["moon_alt_deg"] is not None and altaz["moon_alt_deg"] > 0.0
 
     # lokalny procent zakrycia
     coverage_frac = 0.0
@@ -144,7 +178,10 @@ def solar_eclipse_visibility(
     visible = global_class is not None and sun_up and moon_up and coverage_frac > 0.0
 
     return {
-        "jd": jd,
+        "jd": float(jd_input),
+        "scale": scale,
+        "jd_tt": float(jd),
+        "tier": tier,
         "type": "solar",
         "visible": visible,
         "classification_global": global_class,  # None / 'centralne' / 'częściowe'
@@ -163,10 +200,12 @@ def solar_eclipse_visibility(
 
 
 def lunar_eclipse_visibility(
-    jd: float,
+    jd: float | JulianDay,
     lat_deg: float,
     lon_deg: float,
     elevation_m: float = 0.0,
+    scale: str = "TT",
+    tier: str = "jpl",
 ) -> Dict[str, Any]:
     """Czy zaćmienie Księżyca jest widoczne z danej lokalizacji o podanym JD?
 
@@ -174,10 +213,11 @@ def lunar_eclipse_visibility(
     - Zakładamy, że JD to moment maksymalny zaćmienia (z NASA/GSFC).
     - Księżyc musi być powyżej horyzontu (alt > 0).
     - Illuminacja ~1 (pełnia), kąt fazy blisko 180°.
+    `scale` i `tier` jak w solar_eclipse_visibility.
     """
 
-    state = sun_moon_state_from_jd(jd)
-    altaz = _sun_moon_altaz(jd, lat_deg, lon_deg, elevation_m=elevation_m)
+    jd_input, jd = jd, to_tt(jd, scale)
+    state = sun_moon_state_from_jd(jd, engine_for_tier(tier))
 
     illum = state["illumination"]        # ~1 przy pełni, ~0 przy nowiu
     phase_angle = state["phase_angle_deg"]
@@ -186,7 +226,8 @@ def lunar_eclipse_visibility(
     near_full = illum > 0.9
     near_opposition = phase_angle > 150.0
 
-    moon_up = altaz["moon_alt_deg"] > 0.0
+    altaz = _local_altaz(jd, lat_deg, lon_deg, elevation_m, tier, near_full and near_opposition)
+    moon_up = altaz["moon_alt_deg"] is not None and altaz["moon_alt_deg"] > 0.0
 
     visible = near_full and near_opposition and moon_up
 
@@ -194,7 +235,10 @@ def lunar_eclipse_visibility(
     classification = "możliwe" if visible else None
 
     return {
-        "jd": jd,
+        "jd": float(jd_input),
+        "scale": scale,
+        "jd_tt": float(jd),
+        "tier": tier,
         "type": "lunar",
         "visible": visible,
         "classification": classification,
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+# ephemeris_chebyshev.py — szybki silnik Słońce/Księżyc: wielomiany Czebyszewa.
+#
+# Pozorne geocentryczne wektory Słońca i Księżyca (au, osie ICRS – to samo, co
+# daje skyfield observe().apparent()) dopasowujemy w blokach po BLOCK_DAYS dni
+# i zapisujemy jako jeden plik .npy (mmap). Wiersz = blok:
+#
+#   [JD startu (TT), błąd Słońca ["], błąd Księżyca ["], 6 × N_COEF współczynników]
+#
+# Błąd każdego bloku jest mierzony przy budowie względem pełnego skyfield
+# (punkty kontrolne spoza węzłów), więc plik sam niesie raport dokładności.
+# Ewaluacja to rekurencja T_k(x) + iloczyn – mikrosekundy zamiast milisekund.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from .am_core import JulianDay, JulianDayArray
+from .ephemeris_nasa import EPHEMERIS_DIR, _apparent_sun_moon_xyz, _load_timescale
+
+CHEBYSHEV_CACHE_FILE = EPHEMERIS_DIR / "sun_moon_chebyshev.npy"
+
+BLOCK_DAYS = 4.0
+N_COEF = 10
+_HEADER = 3
+_CHECK_POINTS = 9
+_ARCSEC = 180.0 / np.pi * 3600.0
+
+
+def apparent_sun_moon_xyz(jd_tt, eph=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Pozorne wektory geocentryczne (3, n) [au] Słońca i Księżyca z pełnego skyfield.
+
+    Bez `eph` każdy JD idzie do kernela z data/ephemeris, który go pokrywa.
+    """
+    if eph is None:
+        return _apparent_sun_moon_xyz(np.atleast_1d(np.asarray(jd_tt, dtype=np.float64)))
+    t = _load_timescale().tt_jd(np.asarray(jd_tt, dtype=np.float64))
+    earth = eph["earth"].at(t)
+    sun = earth.observe(eph["sun"]).apparent().position.au
+    moon = earth.observe(eph["moon"]).apparent().position.au
+    return sun, moon
+
+
+def _chebyshev_basis(x: np.ndarray, n_coef: int) -> np.ndarray:
+    """T_0…T_{n-1}(x), kształt (n_coef, *x.shape)."""
+    basis = np.empty((n_coef,) + np.shape(x))
+    basis[0] = 1.0
+    if n_coef > 1:
+        basis[1] = x
+    for k in range(2, n_coef):
+        basis[k] = 2.0 * x * basis[k - 1] - basis[k - 2]
+    return basis
+
+
+def _angle_arcsec(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Kąt między wektorami (oś 0 = xyz) w sekundach łuku."""
+    cross = np.linalg.norm(np.cross(a, b, axis=0), axis=0)
+    return np.arctan2(cross, np.sum(a * b, axis=0)) * _ARCSEC
+
+
+def fit_sun_moon_blocks(
+    jd_start: float,
+    jd_end: float,
+    block_days: float = BLOCK_DAYS,
+    n_coef: int = N_COEF,
+    positions: Optional[Callable] = None,
+    chunk_blocks: int = 1000,
+) -> np.ndarray:
+    """Dopasowuje bloki Czebyszewa na [jd_start, jd_end) i mierzy ich błąd.
+
+    `positions(jd_tt) -> (sun_xyz, moon_xyz)` – domyślnie pełny skyfield.
+    """
+    if positions is None:
+        positions = apparent_sun_moon_xyz
+    n_blocks = int(np.ceil((jd_end - jd_start) / block_days))
+    starts = jd_start + block_days * np.arange(n_blocks)
+
+    # węzły Czebyszewa–Gaussa i macierz transformacji wartości -> współczynniki
+    theta = np.pi * (np.arange(n_coef) + 0.5) / n_coef
+    nodes = np.cos(theta)
+    to_coef = 2.0 / n_coef * np.cos(np.outer(np.arange(n_coef), theta))
+    to_coef[0] /= 2.0
+    check = np.linspace(-1.0, 1.0, _CHECK_POINTS)
+    check_basis = _chebyshev_basis(check, n_coef)
+
+    out = np.empty((n_blocks, _HEADER + 6 * n_coef))
+    out[:, 0] = starts
+    for lo in range(0, n_blocks, chunk_blocks):
+        s = starts[lo:lo + chunk_blocks]
+        m = len(s)
+        t_nodes = s[:, None] + (nodes[None, :] + 1.0) * block_days / 2.0
+        t_check = s[:, None] + (check[None, :] + 1.0) * block_days / 2.0
+        sun, moon = positions(np.concatenate([t_nodes.ravel(), t_check.ravel()]))
+        values = np.concatenate([sun, moon])  # (6, m·n_coef + m·check)
+        node_vals = values[:, : m * n_coef].reshape(6, m, n_coef)
+        true_check = values[:, m * n_coef:].reshape(6, m, _CHECK_POINTS)
+
+        coef = np.einsum("cmj,kj->mck", node_vals, to_coef)  # (m, 6, n_coef)
+        fitted = np.einsum("mck,kp->cmp", coef, check_basis)
+        out[lo:lo + m, 1] = _angle_arcsec(fitted[:3], true_check[:3]).max(axis=-1)
+        out[lo:lo + m, 2] = _angle_arcsec(fitted[3:], true_check[3:]).max(axis=-1)
+        out[lo:lo + m, _HEADER:] = coef.reshape(m, -1)
+    return out
+
+
+def save_chebyshev_cache(table: np.ndarray, path: Path = CHEBYSHEV_CACHE_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, table)
+    return path
+
+
+class ChebyshevEphemeris:
+    """Ewaluator bloków Czebyszewa (tablica z fit_sun_moon_blocks)."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data)
+        self.starts = data[:, 0]
+        self.errors_arcsec = data[:, 1:_HEADER]
+        self.n_coef = (data.shape[1] - _HEADER) // 6
+        self.coef = data[:, _HEADER:].reshape(len(data), 6, self.n_coef)
+        self.jd_start = float(self.starts[0])
+        self.block_days = float(self.starts[1] - self.starts[0]) if len(data) > 1 else BLOCK_DAYS
+        self.jd_end = self.jd_start + self.block_days * len(data)
+
+    def sun_moon_xyz(self, jd) -> Tuple[np.ndarray, np.ndarray]:
+        """(sun, moon) o kształcie (3, *jd.shape) [au] dla JD (TT) – float, tablica lub JulianDay."""
+        if isinstance(jd, (JulianDay, JulianDayArray)):
+            # różnica liczona na części całkowitej – ułamek nie ginie przy JD≈2.4e6
+            offset = (np.asarray(jd.day, dtype=np.float64) - self.jd_start) + jd.frac
+        else:
+            offset = np.asarray(jd, dtype=np.float64) - self.jd_start
+        block = np.floor(offset / self.block_days).astype(np.int64)
+        if np.any((block < 0) | (block >= len(self.starts))):
+            raise ValueError(
+                f"JD poza zakresem cache Czebyszewa ({self.jd_start}…{self.jd_end}); "
+                "użyj engine='skyfield' albo przebuduj cache"
+            )
+        x = 2.0 * (offset - block * self.block_days) / self.block_days - 1.0
+        basis = _chebyshev_basis(x, self.n_coef)
+        xyz = np.einsum("...ck,k...->c...", self.coef[block], basis)
+        return xyz[:3], xyz[3:]
+
+    def accuracy_report(self) -> Dict[str, object]:
+        """Błędy bloków względem skyfield (zmierzone przy budowie), w sekundach łuku."""
+        report: Dict[str, object] = {
+            "jd_start": self.jd_start,
+            "jd_end": self.jd_end,
+            "blocks": len(self.starts),
+            "block_days": self.block_days,
+            "n_coef": self.n_coef,
+        }
+        for i, body in enumerate(("sun", "moon")):
+            err = self.errors_arcsec[:, i]
+            report[body] = {
+                "max_arcsec": float(err.max()),
+                "mean_arcsec": float(err.mean()),
+                "p99_arcsec": float(np.percentile(err, 99)),
+            }
+        return report
+
+
+@lru_cache(maxsize=1)
+def get_chebyshev_ephemeris(path: Optional[Path] = None) -> ChebyshevEphemeris:
+    """Cache z pliku (mmap). Brak pliku -> RuntimeError z instrukcją budowy."""
+    path = Path(path) if path is not None else CHEBYSHEV_CACHE_FILE
+    if not path.exists():
+        raise RuntimeError(
+            f"Brak cache Czebyszewa: {path}\n"
+            "Zbuduj go: python scripts/amjd_build_chebyshev_cache.py OD DO"
+        )
+    return ChebyshevEphemeris(np.load(path, mmap_mode="r"))
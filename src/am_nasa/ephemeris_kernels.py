@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+# ephemeris_kernels.py — indeks pokrycia plików .bsp i routing JD -> kernel.
+#
+# DE430 i DE442 (i każdy inny .bsp w data/ephemeris) pokrywają różne lata.
+# Przy pierwszym użyciu czytamy tylko rekordy podsumowań DAF każdego pliku
+# (kilka KB, bez mapowania współczynników) i zapamiętujemy, jaki przedział JD
+# obejmują segmenty potrzebne dla Słońca, Księżyca i Ziemi. Sam kernel
+# otwiera dopiero pierwsze zapytanie o epokę, którą on obsługuje.
+#
+# Kolejność = priorytet: najpierw nazwy z EPHEMERIS_CANDIDATES, potem reszta
+# alfabetycznie; JD trafia do pierwszego pliku, który go pokrywa.
+#
+# subset_kernel wycina z pełnego DE tylko REQUIRED_SEGMENTS na zadany zakres
+# JD (DAF/SPK typu 2, zapis przez jplephem.excerpter). Taki plik wrzucony do
+# data/ephemeris indeks traktuje jak każdy inny kernel.
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from jplephem.excerpter import write_excerpt
+from jplephem.spk import SPK
+
+# SSB→EMB, EMB→Ziemia, EMB→Księżyc, SSB→Słońce
+REQUIRED_SEGMENTS: Tuple[Tuple[int, int], ...] = ((0, 3), (3, 399), (3, 301), (0, 10))
+
+
+@dataclass(frozen=True)
+class KernelCoverage:
+    path: Path
+    start_jd: float
+    end_jd: float
+    segments: Tuple[Tuple[int, int], ...]
+
+    def covers(self, jd) -> np.ndarray:
+        jd = np.asarray(jd, dtype=np.float64)
+        return (jd >= self.start_jd) & (jd <= self.end_jd)
+
+
+def is_lfs_pointer(path: Path) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(64).startswith(b"version https://git-lfs")
+
+
+def scan_kernel(path: Path) -> Optional[KernelCoverage]:
+    """Pokrycie segmentów REQUIRED_SEGMENTS; None dla wskaźnika LFS / pliku bez nich."""
+    path = Path(path)
+    if is_lfs_pointer(path):
+        return None
+    kernel = SPK.open(str(path))
+    try:
+        spans = {}
+        for seg in kernel.segments:
+            key = (seg.center, seg.target)
+            lo, hi = spans.get(key, (np.inf, -np.inf))
+            spans[key] = (min(lo, seg.start_jd), max(hi, seg.end_jd))
+    finally:
+        kernel.close()
+    if not all(key in spans for key in REQUIRED_SEGMENTS):
+        return None
+    start = max(spans[key][0] for key in REQUIRED_SEGMENTS)
+    end = min(spans[key][1] for key in REQUIRED_SEGMENTS)
+    return KernelCoverage(path, float(start), float(end), tuple(sorted(spans)))
+
+
+class EphemerisIndex:
+    """Uporządkowana lista kerneli + routing pojedynczych JD i całych tablic."""
+
+    def __init__(self, kernels: Sequence[KernelCoverage]) -> None:
+        self.kernels = list(kernels)
+
+    def _uncovered(self, jd) -> ValueError:
+        spans = ", ".join(f"{k.path.name} {k.start_jd}…{k.end_jd}" for k in self.kernels) or "brak"
+        return ValueError(f"Żaden plik efemeryd nie pokrywa JD {jd} (dostępne: {spans})")
+
+    def kernel_for(self, jd: float) -> KernelCoverage:
+        for kernel in self.kernels:
+            if kernel.covers(jd):
+                return kernel
+        raise self._uncovered(jd)
+
+    def route(self, jd) -> List[Tuple[KernelCoverage, np.ndarray]]:
+        """Tablica JD -> [(kernel, indeksy elementów)], każdy element dokładnie raz."""
+        jd = np.asarray(jd, dtype=np.float64).ravel()
+        owner = np.full(jd.shape, -1)
+        for i, kernel in enumerate(self.kernels):
+            owner[(owner < 0) & kernel.covers(jd)] = i
+        if np.any(owner < 0):
+            raise self._uncovered(jd[owner < 0][0])
+        return [(self.kernels[i], np.flatnonzero(owner == i)) for i in np.unique(owner)]
+
+
+def build_ephemeris_index(directory: Path, preferred: Iterable[str] = ()) -> EphemerisIndex:
+    preferred = list(preferred)
+    paths = sorted(Path(directory).glob("*.bsp"), key=lambda p: (
+        preferred.index(p.name) if p.name in preferred else len(preferred), p.name,
+    ))
+    coverages = (scan_kernel(path) for path in paths)
+    return EphemerisIndex([c for c in coverages if c is not None])
+
+
+def subset_kernel(
+    source: Path,
+    output: Path,
+    jd_start: float,
+    jd_end: float,
+    segments: Sequence[Tuple[int, int]] = REQUIRED_SEGMENTS,
+) -> KernelCoverage:
+    """Zapisuje do `output` SPK z samymi `segments` przyciętymi do [jd_start, jd_end]."""
+    if not jd_start < jd_end:
+        raise ValueError(f"Pusty zakres JD: {jd_start}…{jd_end}")
+    source, output = Path(source), Path(output)
+    if source.resolve() == output.resolve():
+        raise ValueError("Plik wynikowy nie może nadpisać źródła")
+
+    wanted = set(segments)
+    kernel = SPK.open(str(source))
+    try:
+        chosen = [
+            summary for summary, seg in zip(kernel.daf.summaries(), kernel.segments)
+            if (seg.center, seg.target) in wanted and seg.start_jd <= jd_end and seg.end_jd >= jd_start
+        ]
+        found = {(seg.center, seg.target) for seg in kernel.segments
+                 if seg.start_jd <= jd_start and seg.end_jd >= jd_end}
+        missing = wanted - found
+        if missing:
+            raise ValueError(f"{source.name} nie pokrywa {jd_start}…{jd_end} dla segmentów {sorted(missing)}")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w+b") as fh:
+            write_excerpt(kernel, fh, jd_start, jd_end, chosen)
+    finally:
+        kernel.close()
+    return scan_kernel(output)
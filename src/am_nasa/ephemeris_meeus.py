@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+# ephemeris_meeus.py — analityczny silnik Słońce/Księżyc (tier "fast").
+#
+# Słońce z planetary_positions (obcięty szereg Meeusa) + aberracja roczna
+# (−20.4898″ w długości), Księżyc z pełnej teorii lunar_theory (tablice
+# 47.A/47.B) – oba z jednego zestawu argumentów podstawowych na wsad.
+# Współrzędne są względem średniej ekliptyki i równonocy daty: obracamy je
+# średnim nachyleniem ekliptyki do równika daty, a potem odwrotną macierzą
+# precesji (IAU 2006, skyfield.precessionlib) do osi ICRS. Ten sam interfejs
+# sun_moon_xyz co silniki JPL, więc ephemeris_nasa składa z tego identyczny
+# słownik stanu.
+#
+# Odległość Słońca jest średnia (liczą się kierunki: kąt fazy, elongacja,
+# RA/Dec), Księżyca – z teorii. Bez nutacji (osie GCRS jej nie zawierają) i
+# bez aberracji Księżyca (<1″) – budżet błędu: TIER_ERROR_BUDGET["fast"].
+
+from typing import Tuple
+
+import numpy as np
+
+from .am_core import JulianDay, JulianDayArray
+from .lunar_theory import moon_position_array
+from .planetary_positions import fundamental_arguments_array, sun_moon_positions_array
+
+SUN_MEAN_DISTANCE_AU = 1.000001018
+MOON_MEAN_DISTANCE_AU = 385000.56 / 149597870.7
+
+_AU_KM = 149597870.7
+_SUN_ABERRATION_DEG = 20.4898 / 3600.0
+
+
+def _ecliptic_of_date_to_icrs(lon_deg, lat_deg, distance, jd) -> np.ndarray:
+    from skyfield.nutationlib import mean_obliquity
+    from skyfield.precessionlib import compute_precession
+
+    lon, lat = np.broadcast_arrays(np.radians(lon_deg), np.radians(lat_deg))
+    x, y, z = distance * np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    eps = np.radians(mean_obliquity(jd) / 3600.0)
+    cos_eps, sin_eps = np.cos(eps), np.sin(eps)
+    equator = np.array([x, cos_eps * y - sin_eps * z, sin_eps * y + cos_eps * z])
+    # compute_precession: J2000 -> średni równik daty; ortogonalna, więc odwrotna = transpozycja
+    return np.einsum("ji...,j...->i...", compute_precession(jd), equator)
+
+
+class MeeusSunMoon:
+    """Geocentryczne wektory (3, ...) [au] Słońca i Księżyca z szeregów Meeusa."""
+
+    def sun_moon_xyz(self, jd) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(jd, (JulianDay, JulianDayArray)):
+            jd = np.asarray(jd.day + jd.frac, dtype=np.float64)
+        jd = np.asarray(jd, dtype=np.float64)
+        args = fundamental_arguments_array(jd)
+        sun_lon = sun_moon_positions_array(jd, args)["sun_lon"] - _SUN_ABERRATION_DEG
+        moon = moon_position_array(jd, args)
+        sun = _ecliptic_of_date_to_icrs(sun_lon, 0.0, SUN_MEAN_DISTANCE_AU, jd)
+        moon = _ecliptic_of_date_to_icrs(moon["lon"], moon["lat"], moon["distance_km"] / _AU_KM, jd)
+        return sun, moon
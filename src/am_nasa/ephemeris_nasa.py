@@ -1,18 +1,30 @@
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Tuple
 
-from skyfield.api import load
+from skyfield.api import load, load_file
 from skyfield.positionlib import Geocentric
 from skyfield.units import Angle
 
+from .am_core import JulianDay, JulianDayArray
+from .delta_t import to_tt
+from .ephemeris_kernels import EphemerisIndex, build_ephemeris_index
+
 
 # Root projektu = AM-NASA-v6/
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 EPHEMERIS_DIR = PROJECT_ROOT / "data" / "ephemeris"
 
+# Dane skali czasu (ΔT dzienne + sekundy przestępne) w pakiecie – bez sieci.
+# Format jak wbudowany iers.npz skyfield; odświeżenie z lokalnego
+# finals2000A.all: scripts/amjd_build_timescale.py.
+TIMESCALE_FILE = Path(__file__).resolve().parent / "data" / "timescale" / "iers.npz"
+
 # Lista kandydatów – bierzemy pierwszy, który istnieje
 EPHEMERIS_CANDIDATES = [
     "de442.bsp",   # Twój główny plik
@@ -34,24 +46,129 @@ def _find_ephemeris_file() -> Path:
     )
 
 
+def build_timescale_file(finals_path: Path | None = None, path: Path = TIMESCALE_FILE) -> Path:
+    """Zapisuje tablice skali czasu: z lokalnego finals2000A.all albo z danych skyfield."""
+    import numpy as np
+
+    if finals_path is None:
+        from skyfield.iokit import load_bundled_npy
+
+        arrays = dict(load_bundled_npy("iers.npz"))
+    else:
+        from skyfield.data import iers
+
+        with open(finals_path, "rb") as fh:
+            utc_mjd, dut1 = iers.parse_dut1_from_finals_all(fh)
+        daily_tt, daily_delta_t, leap_dates, leap_offsets = iers.build_timescale_arrays(utc_mjd, dut1)
+        arrays = {
+            "tt_jd_minus_arange": daily_tt - np.arange(len(daily_tt)),
+            "delta_t_1e7": (daily_delta_t * 1e7).round(),
+            "leap_dates": leap_dates,
+            "leap_offsets": leap_offsets,
+        }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, **arrays)
+    return path
+
+
+@lru_cache(maxsize=1)
+def _load_timescale():
+    """Timescale skyfield z danych w pakiecie (TIMESCALE_FILE), z cache'em.
+
+    Nigdy nie sięga do sieci: bez pliku bierze tablice wbudowane w skyfield.
+    """
+    if not TIMESCALE_FILE.exists():
+        return load.timescale(builtin=True)
+
+    import numpy as np
+    from skyfield.timelib import Timescale
+
+    with np.load(TIMESCALE_FILE) as arrays:
+        daily_tt = arrays["tt_jd_minus_arange"] + np.arange(len(arrays["tt_jd_minus_arange"]))
+        daily_delta_t = (arrays["delta_t_1e7"] / 1e7).round(7)
+        return Timescale((daily_tt, daily_delta_t), arrays["leap_dates"], arrays["leap_offsets"])
+
+
+@lru_cache(maxsize=None)
+def _load_kernel(path: Path):
+    """Kernel skyfield dla pliku – otwierany dopiero przy pierwszym użyciu.
+
+    load_file (a nie load): brakujący plik to błąd, nigdy próba pobrania.
+    """
+    return load_file(str(path))
+
+
 @lru_cache(maxsize=1)
 def _load_ephemeris():
     """Ładuje efemerydy JPL i obiekt timescale, z cache'em."""
-    eph_path = _find_ephemeris_file()
-    eph = load(str(eph_path))
-    ts = load.timescale()
+    eph = _load_kernel(_find_ephemeris_file())
+    ts = _load_timescale()
     return eph, ts
 
 
-def _to_time(jd: float):
-    """Konwertuje JD -> obiekt czasu skyfield (TT)."""
-    eph, ts = _load_ephemeris()
-    # zakładamy, że JD przekazywany do API jest blisko TT; ΔT można dodać później
-    t = ts.tt_jd(jd)
+@lru_cache(maxsize=1)
+def get_ephemeris_index() -> EphemerisIndex:
+    """Pokrycie wszystkich .bsp z EPHEMERIS_DIR (tylko podsumowania DAF, bez mapowania)."""
+    return build_ephemeris_index(EPHEMERIS_DIR, EPHEMERIS_CANDIDATES)
+
+
+def _kernel_paths(jd) -> list:
+    """Tablica JD (float) -> [(ścieżka kernela, indeksy)]; bez indeksu – pierwszy kandydat."""
+    import numpy as np
+
+    jd = np.asarray(jd, dtype=np.float64).ravel()
+    index = get_ephemeris_index()
+    if not index.kernels:
+        return [(_find_ephemeris_file(), np.arange(jd.size))]
+    return [(kernel.path, idx) for kernel, idx in index.route(jd)]
+
+
+def _to_time(jd: float | JulianDay | JulianDayArray):
+    """Konwertuje JD -> (kernel pokrywający JD, obiekt czasu skyfield TT).
+
+    JulianDay / JulianDayArray idą prosto do dwuczęściowego `tt_jd(jd, fraction)`,
+    więc ułamek dnia nie traci precyzji na sumowaniu z JD≈2.4e6. Tablica
+    rozpięta na kilka plików -> ValueError (od tego jest _apparent_sun_moon_xyz).
+    """
+    ts = _load_timescale()
+    groups = _kernel_paths(jd.to_float() if isinstance(jd, JulianDayArray) else float(jd) if isinstance(jd, JulianDay) else jd)
+    if len(groups) > 1:
+        raise ValueError("JD z zakresów kilku plików efemeryd – użyj sun_moon_state_batch")
+    eph = _load_kernel(groups[0][0])
+    # JD jest tu już w TT – wejście w UT zamieniają funkcje publiczne (scale="UT")
+    if isinstance(jd, (JulianDay, JulianDayArray)):
+        t = ts.tt_jd(jd.day, jd.frac)
+    else:
+        t = ts.tt_jd(jd)
     return eph, t
 
 
-def _geocentric_positions(jd: float) -> Dict[str, Geocentric]:
+def _apparent_sun_moon_xyz(jd):
+    """Pozorne wektory (3, n) [au] dla 1-wymiarowej tablicy JD / JulianDayArray.
+
+    Każdy kawałek tablicy idzie do kernela, który go pokrywa (jeden wektorowy
+    `Time` na kernel).
+    """
+    import numpy as np
+
+    ts = _load_timescale()
+    flat = jd.to_float() if isinstance(jd, JulianDayArray) else np.asarray(jd, dtype=np.float64)
+    sun = np.empty((3, flat.size))
+    moon = np.empty((3, flat.size))
+    for path, idx in _kernel_paths(flat):
+        eph = _load_kernel(path)
+        if isinstance(jd, JulianDayArray):
+            t = ts.tt_jd(jd.day[idx], jd.frac[idx])
+        else:
+            t = ts.tt_jd(flat[idx])
+        earth = eph["earth"].at(t)
+        sun[:, idx] = earth.observe(eph["sun"]).apparent().position.au
+        moon[:, idx] = earth.observe(eph["moon"]).apparent().position.au
+    return sun, moon
+
+
+def _geocentric_positions(jd: float | JulianDay) -> Dict[str, Geocentric]:
     """Zwraca geocentryczne pozycje Słońca i Księżyca dla danego JD."""
     eph, t = _to_time(jd)
     earth = eph["earth"]
@@ -86,9 +203,230 @@ def _moon_illumination(phase_angle_deg: float) -> float:
     return 0.5 * (1.0 + math.cos(rad))
 
 
-def sun_moon_state_from_jd(jd: float) -> Dict[str, Any]:
+# Silniki stanu Słońce/Księżyc:
+#   "skyfield"  – pełny observe().apparent() na efemerydach JPL (domyślny),
+#   "chebyshev" – wielomiany Czebyszewa z ephemeris_chebyshev (szybki cache,
+#                 błąd sprawdzony blok po bloku względem skyfield),
+#   "jplephem"  – segmenty .bsp wprost z jplephem (ephemeris_spk): ta sama
+#                 fizyka co skyfield, bez jego obiektów, wektorowo,
+#   "jplephem-geometric" – to samo bez czasu świetlnego, ugięcia i aberracji,
+#   "meeus"     – szeregi Meeusa + pełna teoria Księżyca (ephemeris_meeus),
+#                 bez plików.
+ENGINES = ("skyfield", "chebyshev", "jplephem", "jplephem-geometric", "meeus")
+
+# Poziomy dokładności (tiery) dla wywołujących, którzy nie wybierają silnika
+# wprost: zadania masowe liczą tanim tierem i dopiero kandydatów poprawiają
+# przez "jpl". Budżet błędu – kierunek geocentryczny względem "jpl", zmierzony
+# na 1900–2050 (DE421); koszt – jeden stan skalarny / element wsadu.
+TIERS: Dict[str, str] = {
+    "fast": "meeus",
+    "cached": "chebyshev",
+    "jpl": "skyfield",
+    "jpl-geometric": "jplephem-geometric",
+}
+TIER_ERROR_BUDGET: Dict[str, Dict[str, Any]] = {
+    "fast": {
+        "sun_arcsec": 40.0,
+        "moon_arcsec": 20.0,
+        "cost": "~0.35 ms / stan, ~5 µs / element wsadu",
+        "requires": "nic (analityka)",
+        "notes": "Księżyc: tablice 47.A/47.B Meeusa (lunar_theory); Słońce: obcięty szereg; do odsiewu kandydatów",
+    },
+    "cached": {
+        "sun_arcsec": 0.0001,
+        "moon_arcsec": 0.001,
+        "cost": "~0.1 ms / stan, ~0.5 µs / element wsadu",
+        "requires": "cache Czebyszewa (scripts/amjd_build_chebyshev_cache.py)",
+        "notes": "dokładny budżet pliku: get_chebyshev_ephemeris().accuracy_report()",
+    },
+    "jpl": {
+        "sun_arcsec": 0.0,
+        "moon_arcsec": 0.0,
+        "cost": "~4 ms / stan, ~16 µs / element wsadu",
+        "requires": "kernel JPL .bsp w data/ephemeris",
+        "notes": "referencja: pozorne położenia skyfield (czas świetlny, ugięcie, aberracja)",
+    },
+    "jpl-geometric": {
+        "sun_arcsec": 21.0,
+        "moon_arcsec": 1.0,
+        "cost": "~0.8 ms / stan, ~1.5 µs / element wsadu",
+        "requires": "kernel JPL .bsp w data/ephemeris",
+        "notes": "położenia geometryczne: Słońce bez aberracji rocznej; u Księżyca aberracja i czas świetlny prawie się znoszą",
+    },
+}
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINES:
+        raise ValueError(f"Nieznany silnik: {engine!r} (dostępne: {', '.join(ENGINES)})")
+
+
+def engine_for_tier(tier: str) -> str:
+    """Tier dokładności (TIERS) -> nazwa silnika."""
+    try:
+        return TIERS[tier]
+    except KeyError:
+        raise ValueError(f"Nieznany tier: {tier!r} (dostępne: {', '.join(TIERS)})") from None
+
+
+# ===== CACHE STANÓW NIEBA =====
+# Jeden request liczy ten sam moment kilka razy: stan + nazwa fazy w api,
+# wysokości + zakrycie tarczy w eclipses. Wyniki trzymamy w ograniczonym LRU
+# z kluczem (rodzaj, …, JD skwantowany do `resolution_days`). Wołający dostaje
+# kopię – jego zmiany nie psują wpisu. Źródło danych (indeks kerneli, cache
+# Czebyszewa) rejestruje bind(); inny obiekt niż ostatnio = cache od nowa.
+
+class SkyStateCache:
+    """LRU stanów nieba z licznikami trafień/chybień."""
+
+    def __init__(self, maxsize: int = 4096, resolution_days: float = 1e-9) -> None:
+        self.maxsize = maxsize
+        self.resolution_days = resolution_days
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sources: Dict[str, Any] = {}
+        self._lock = Lock()
+
+    def quantize(self, jd: float | JulianDay) -> Tuple[int, int]:
+        """JD -> (dzień, numer przedziału w dniu); JulianDay bez utraty ułamka."""
+        if isinstance(jd, JulianDay):
+            day, frac = jd.day, jd.frac
+        else:
+            jd = float(jd)
+            day = int(jd // 1.0)
+            frac = jd - day
+        # ułamek tuż pod 1 zaokrągla się do pełnej doby – przenosimy ją do `day`
+        per_day = round(1.0 / self.resolution_days)
+        carry, step = divmod(round(frac / self.resolution_days), per_day)
+        return day + carry, step
+
+    def bind(self, name: str, source: Any) -> None:
+        """Źródło danych wpisów `name`; podmiana obiektu (przebudowa) czyści cache."""
+        with self._lock:
+            if name in self._sources and self._sources[name] is not source:
+                self._data.clear()
+            self._sources[name] = source
+
+    def get_or_compute(self, key: Tuple, jd: float | JulianDay, compute: Callable[[], Any]) -> Any:
+        full_key = key + self.quantize(jd)
+        with self._lock:
+            if full_key in self._data:
+                self.hits += 1
+                self._data.move_to_end(full_key)
+                return copy.deepcopy(self._data[full_key])
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._data[full_key] = value
+            self._data.move_to_end(full_key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sources.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "resolution_days": self.resolution_days,
+        }
+
+
+SKY_STATE_CACHE = SkyStateCache()
+
+
+def configure_sky_state_cache(maxsize: int | None = None, resolution_days: float | None = None) -> None:
+    """Zmienia rozmiar / rozdzielczość klucza wspólnego cache (czyści go)."""
+    if maxsize is not None:
+        SKY_STATE_CACHE.maxsize = maxsize
+    if resolution_days is not None:
+        SKY_STATE_CACHE.resolution_days = resolution_days
+    SKY_STATE_CACHE.clear()
+
+
+def sky_state_cache_info() -> Dict[str, Any]:
+    return SKY_STATE_CACHE.info()
+
+
+def _state_columns(sun, moon) -> Dict[str, Any]:
+    """Kolumny stanu z wektorów geocentrycznych (3, ...) – skalary albo tablice."""
+    import numpy as np
+    from skyfield.framelib import ecliptic_J2000_frame
+
+    ecliptic = ecliptic_J2000_frame.rotation_at(None)
+    columns: Dict[str, Any] = {}
+    for body, xyz in (("sun", sun), ("moon", moon)):
+        x, y, z = xyz
+        ex, ey, _ = np.einsum("ij,j...->i...", ecliptic, xyz)
+        columns[f"{body}_ra_deg"] = np.degrees(np.arctan2(y, x)) % 360.0
+        columns[f"{body}_dec_deg"] = np.degrees(np.arctan2(z, np.hypot(x, y)))
+        columns[f"{body}_ecliptic_lon_deg"] = np.degrees(np.arctan2(ey, ex)) % 360.0
+
+    cross = np.linalg.norm(np.cross(sun, moon, axis=0), axis=0)
+    phase_angle = np.degrees(np.arctan2(cross, np.sum(sun * moon, axis=0)))
+    columns["phase_angle_deg"] = phase_angle
+    columns["elongation_deg"] = phase_angle
+    columns["illumination"] = 0.5 * (1.0 + np.cos(np.radians(phase_angle)))
+    return columns
+
+
+def _vector_engine(engine: str):
+    """Silnik dający wprost wektory: obiekt z metodą sun_moon_xyz(jd)."""
+    if engine == "chebyshev":
+        from .ephemeris_chebyshev import get_chebyshev_ephemeris
+
+        return get_chebyshev_ephemeris()
+    if engine == "meeus":
+        from .ephemeris_meeus import MeeusSunMoon
+
+        return MeeusSunMoon()
+    from .ephemeris_spk import get_spk_sun_moon
+
+    return get_spk_sun_moon(apparent=engine != "jplephem-geometric")
+
+
+def _state_source(engine: str) -> Any:
+    """Obiekt, z którego silnik bierze dane – klucz ważności SKY_STATE_CACHE."""
+    if engine == "chebyshev":
+        from .ephemeris_chebyshev import get_chebyshev_ephemeris
+
+        return get_chebyshev_ephemeris()
+    if engine == "meeus":
+        return None
+    return get_ephemeris_index()
+
+
+def _vector_state(jd: float | JulianDay, engine: str) -> Dict[str, Any]:
+    """Ten sam słownik co sun_moon_state_from_jd, ale z wektorów silnika."""
+    columns = _state_columns(*_vector_engine(engine).sun_moon_xyz(jd))
+    state: Dict[str, Any] = {
+        body: {key: float(columns[f"{body}_{key}"]) for key in ("ra_deg", "dec_deg", "ecliptic_lon_deg")}
+        for body in ("sun", "moon")
+    }
+    for key in ("phase_angle_deg", "elongation_deg", "illumination"):
+        state[key] = float(columns[key])
+    return state
+
+
+def sun_moon_state_from_jd(
+    jd: float | JulianDay,
+    engine: str = "skyfield",
+    scale: str = "TT",
+) -> Dict[str, Any]:
     """Zwraca pełen stan Słońce/Księżyc oparty o efemerydy JPL.
 
+    `engine` wybiera silnik (ENGINES); "chebyshev" wymaga zbudowanego cache,
+    "jplephem" liczy to samo co "skyfield" bezpośrednio na segmentach .bsp.
+    `scale`: "TT" (domyślnie) albo "UT" – wtedy JD przesuwamy o ΔT (delta_t).
+
     Wynik:
         {
             "sun": { "ra_deg": ..., "dec_deg": ..., "ecliptic_lon_deg": ... },
@@ -98,6 +436,16 @@ def sun_moon_state_from_jd(jd: float) -> Dict[str, Any]:
             "illumination": ...,
         }
     """
+    _check_engine(engine)
+    jd = to_tt(jd, scale)
+    SKY_STATE_CACHE.bind(engine, _state_source(engine))
+    return SKY_STATE_CACHE.get_or_compute(("state", engine), jd, lambda: _compute_sun_moon_state(jd, engine))
+
+
+def _compute_sun_moon_state(jd: float | JulianDay, engine: str) -> Dict[str, Any]:
+    if engine != "skyfield":
+        return _vector_state(jd, engine)
+
     pos = _geocentric_positions(jd)
     sun = pos["sun"]
     moon = pos["moon"]
@@ -133,9 +481,44 @@ def sun_moon_state_from_jd(jd: float) -> Dict[str, Any]:
     }
 
 
-def moon_phase_name_from_nasa(jd: float) -> str:
+def sun_moon_state_batch(jd, engine: str = "skyfield", as_frame: bool = False, scale: str = "TT"):
+    """Wsadowy sun_moon_state_from_jd: jeden wektorowy `Time` zamiast pętli.
+
+    `jd` – tablica JD (w skali `scale`) albo JulianDayArray. Wynik to struktura
+    tablic: np.recarray (domyślnie) albo pandas.DataFrame (`as_frame=True`)
+    z kolumnami JD (jak na wejściu), sun_ra_deg, sun_dec_deg,
+    sun_ecliptic_lon_deg, moon_… (to samo), phase_angle_deg, elongation_deg,
+    illumination. Przy scale="UT" dochodzi kolumna JD_TT.
+    """
+    import numpy as np
+
+    _check_engine(engine)
+    if not isinstance(jd, JulianDayArray):
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+    jd_input, jd = jd, to_tt(jd, scale)
+
+    if engine != "skyfield":
+        sun, moon = _vector_engine(engine).sun_moon_xyz(jd)
+    else:
+        sun, moon = _apparent_sun_moon_xyz(jd)
+
+    def as_float(value):
+        return value.to_float() if isinstance(value, JulianDayArray) else value
+
+    columns = {"JD": as_float(jd_input)}
+    if scale == "UT":
+        columns["JD_TT"] = as_float(jd)
+    columns.update(_state_columns(sun, moon))
+    if as_frame:
+        import pandas as pd
+
+        return pd.DataFrame(columns)
+    return np.rec.fromarrays(list(columns.values()), names=list(columns))
+
+
+def moon_phase_name_from_nasa(jd: float | JulianDay, engine: str = "skyfield", scale: str = "TT") -> str:
     """Prosty label fazy na podstawie kąta fazy z efemeryd NASA."""
-    state = sun_moon_state_from_jd(jd)
+    state = sun_moon_state_from_jd(jd, engine, scale)
     phase = state["phase_angle_deg"]
 
     # Zgrubne klasy faz na podstawie kąta:
@@ -149,3 +532,44 @@ def moon_phase_name_from_nasa(jd: float) -> str:
         return "sierp"
     else:
         return "blisko nowiu"
+
+
+def startup_check(jd: float = 2451545.0) -> Dict[str, Any]:
+    """Mierzy zimny start: skala czasu, indeks kerneli, otwarcie pliku, pierwsze zapytanie.
+
+    Nie rzuca wyjątków – błąd (np. same wskaźniki LFS zamiast .bsp) trafia
+    do raportu jako `ok: False` + `error`.
+    """
+    import time
+
+    report: Dict[str, Any] = {
+        "cold": _load_timescale.cache_info().currsize == 0 and _load_kernel.cache_info().currsize == 0,
+        "timescale_source": str(TIMESCALE_FILE) if TIMESCALE_FILE.exists() else "skyfield builtin",
+    }
+    start = step = time.perf_counter()
+
+    def lap(name: str) -> None:
+        nonlocal step
+        now = time.perf_counter()
+        report[name] = round((now - step) * 1000.0, 3)
+        step = now
+
+    try:
+        _load_timescale()
+        lap("timescale_ms")
+        index = get_ephemeris_index()
+        report["kernels"] = [
+            {"file": k.path.name, "start_jd": k.start_jd, "end_jd": k.end_jd} for k in index.kernels
+        ]
+        lap("index_ms")
+        _to_time(jd)
+        lap("kernel_open_ms")
+        sun_moon_state_from_jd(jd)
+        lap("first_query_ms")
+        report["ok"] = True
+    except Exception as exc:  # noqa: BLE001
+        report["ok"] = False
+        report["error"] = f"{type(exc).__name__}: {exc}"
+    report["total_ms"] = round((time.perf_counter() - start) * 1000.0, 3)
+    return report
+
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+# ephemeris_spk.py — niskopoziomowy silnik Słońce/Księżyc wprost na jplephem.
+#
+# Bez grafu obiektów skyfield: plik .bsp jest mapowany (mmap) przez jplephem,
+# a rekordy Czebyszewa segmentów SSB→EMB, EMB→Ziemia, EMB→Księżyc i SSB→Słońce
+# liczymy sami w NumPy (pozycja + pochodna jednym przebiegiem). Na wektorach
+# robimy to samo, co observe().apparent():
+#
+#   1. czas świetlny – iteracja target(t − τ) − Ziemia(t) (τ z prędkości),
+#   2. ugięcie światła w polu Słońca (Jowisz/Saturn dają µas – pomijamy),
+#   3. aberracja – wzór relatywistyczny jak w skyfield.relativity.
+#
+# Wynik: pozorne wektory geocentryczne (GCRS, au), ten sam interfejs co
+# ephemeris_chebyshev, więc ephemeris_nasa składa z nich identyczny słownik.
+# Z `apparent=False` – wektory geometryczne (bez kroków 1–3), tier
+# "jpl-geometric": ~20″ różnicy (głównie aberracja), za to jeden przebieg.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from jplephem.spk import SPK
+from skyfield.constants import AU_KM, AU_M, C, C_AUDAY, GS
+from skyfield.timelib import tdb_minus_tt
+
+from .am_core import JulianDay, JulianDayArray
+from .ephemeris_nasa import _kernel_paths
+
+_SSB, _EMB, _SUN, _MOON, _EARTH = 0, 3, 10, 301, 399
+_LIGHT_TIME_ITERATIONS = 10
+_LIGHT_TIME_TOLERANCE = 1e-12  # dni
+
+
+def _split_tdb(jd) -> Tuple[np.ndarray, np.ndarray, tuple]:
+    """JD (TT) -> (część całkowita, ułamek) w TDB, spłaszczone, + kształt wejścia."""
+    if isinstance(jd, (JulianDay, JulianDayArray)):
+        whole = np.asarray(jd.day, dtype=np.float64)
+        frac = np.asarray(jd.frac, dtype=np.float64)
+    else:
+        whole = np.asarray(jd, dtype=np.float64)
+        frac = np.zeros_like(whole)
+    shape = whole.shape
+    whole, frac = whole.ravel(), frac.ravel()
+    frac = frac + tdb_minus_tt(whole, frac) / 86400.0
+    return whole, frac, shape
+
+
+def _deflection_by_sun(position: np.ndarray, pe: np.ndarray) -> np.ndarray:
+    """Poprawka ugięcia światła (au); `pe` = obserwator względem Słońca."""
+    pq = position + pe
+    pmag = np.linalg.norm(position, axis=0)
+    qmag = np.linalg.norm(pq, axis=0)
+    emag = np.linalg.norm(pe, axis=0)
+    phat, qhat, ehat = position / pmag, pq / qmag, pe / emag
+    pdotq = np.sum(phat * qhat, axis=0)
+    qdote = np.sum(qhat * ehat, axis=0)
+    edotp = np.sum(ehat * phat, axis=0)
+    # cel (prawie) na linii Słońca – np. samo Słońce – bez ugięcia
+    flag = np.abs(edotp) <= 0.99999999999
+    fac1 = 2.0 * GS / (C * C * emag * AU_M)
+    return flag * fac1 * (pdotq * ehat - edotp * qhat) / (1.0 + qdote) * pmag
+
+
+def _add_aberration(position: np.ndarray, velocity: np.ndarray, light_time: np.ndarray) -> np.ndarray:
+    p1mag = light_time * C_AUDAY
+    vemag = np.linalg.norm(velocity, axis=0)
+    beta = vemag / C_AUDAY
+    cosd = np.sum(position * velocity, axis=0) / (p1mag * vemag)
+    gammai = np.sqrt(1.0 - beta * beta)
+    p = beta * cosd
+    q = (1.0 + p / (1.0 + gammai)) * light_time
+    return (gammai * position + q * velocity) / (1.0 + p)
+
+
+class _ChebyshevSegment:
+    """Rekordy Czebyszewa jednego segmentu typu 2 (widok na mmap z jplephem)."""
+
+    def __init__(self, segment) -> None:
+        self.init, self.intlen, coef = segment.load_array()  # coef: (3, n, k)
+        self.coef = np.asarray(coef)
+        self.n_records = self.coef.shape[1]
+        self.start_jd, self.end_jd = segment.start_jd, segment.end_jd
+
+    def position_velocity(self, whole: np.ndarray, frac: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Pozycja [km] i prędkość [km/d], kształt (3, n); czas TDB jako dwie części."""
+        offset = (whole - self.init) + frac
+        index = np.floor(offset / self.intlen).astype(np.int64)
+        if np.any((index < 0) | (index > self.n_records)):
+            raise ValueError(
+                f"JD poza zakresem segmentu SPK ({self.start_jd}…{self.end_jd})"
+            )
+        index = np.minimum(index, self.n_records - 1)  # sam koniec segmentu
+        x = 2.0 * (offset - index * self.intlen) / self.intlen - 1.0
+
+        n_coef = self.coef.shape[2]
+        t = np.empty((n_coef,) + x.shape)
+        dt = np.empty_like(t)
+        t[0], dt[0] = 1.0, 0.0
+        t[1], dt[1] = x, 1.0
+        for k in range(2, n_coef):
+            t[k] = 2.0 * x * t[k - 1] - t[k - 2]
+            dt[k] = 2.0 * t[k - 1] + 2.0 * x * dt[k - 1] - dt[k - 2]
+
+        coef = self.coef[:, index, :]  # (3, n, k)
+        position = np.einsum("cnk,kn->cn", coef, t)
+        velocity = np.einsum("cnk,kn->cn", coef, dt) * (2.0 / self.intlen)
+        return position, velocity
+
+
+class _SegmentChain:
+    """Wszystkie segmenty jednej pary (centrum, cel) – każdy JD liczy segment, który go pokrywa.
+
+    SPK[centrum, cel] z jplephem daje tylko ostatni segment pary, a scan_kernel
+    zgłasza sumę pokryć wszystkich; de441 ma po dwa segmenty na parę (przed i po
+    roku 0), a pliki sklejone przez spkmerge – dowolnie wiele.
+    """
+
+    def __init__(self, segments) -> None:
+        self.segments = [_ChebyshevSegment(segment) for segment in segments]
+        self.start_jd = min(segment.start_jd for segment in self.segments)
+        self.end_jd = max(segment.end_jd for segment in self.segments)
+
+    def position_velocity(self, whole: np.ndarray, frac: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self.segments) == 1:
+            return self.segments[0].position_velocity(whole, frac)
+        jd = whole + frac
+        owner = np.full(jd.shape, -1)
+        # przy nakładaniu wygrywa późniejszy segment pliku (jak w SPICE)
+        for i in range(len(self.segments) - 1, -1, -1):
+            segment = self.segments[i]
+            owner[(owner < 0) & (segment.start_jd <= jd) & (jd <= segment.end_jd)] = i
+        if np.any(owner < 0):
+            spans = ", ".join(f"{segment.start_jd}…{segment.end_jd}" for segment in self.segments)
+            raise ValueError(f"JD {jd[owner < 0][0]} poza segmentami SPK ({spans})")
+        position = np.empty((3,) + jd.shape)
+        velocity = np.empty((3,) + jd.shape)
+        for i in np.unique(owner):
+            idx = owner == i
+            position[:, idx], velocity[:, idx] = self.segments[i].position_velocity(whole[idx], frac[idx])
+        return position, velocity
+
+
+def _segment_chain(kernel: SPK, center: int, target: int) -> _SegmentChain:
+    segments = [s for s in kernel.segments if (s.center, s.target) == (center, target)]
+    if not segments:
+        raise KeyError((center, target))
+    return _SegmentChain(segments)
+
+
+class SpkSunMoon:
+    """Pozorne położenia Słońca i Księżyca z segmentów SPK (jplephem, mmap)."""
+
+    def __init__(self, path: Path, apparent: bool = True) -> None:
+        self.path = Path(path)
+        self.apparent = apparent
+        self.kernel = SPK.open(str(self.path))
+        self._emb = _segment_chain(self.kernel, _SSB, _EMB)
+        self._earth = _segment_chain(self.kernel, _EMB, _EARTH)
+        self._moon = _segment_chain(self.kernel, _EMB, _MOON)
+        self._sun = _segment_chain(self.kernel, _SSB, _SUN)
+
+    def _observe(self, position, velocity, earth_p):
+        """Astrometryczny wektor celu (au) i czas świetlny (dni), wektorowo.
+
+        Cel cofamy o τ liniowo z prędkości w chwili t: dla τ ≤ 500 s błąd
+        od przyspieszenia to ułamki metra, a segmenty liczymy tylko raz.
+        """
+        light_time = np.zeros(position.shape[1:])
+        for _ in range(_LIGHT_TIME_ITERATIONS):
+            astrometric = position - velocity * light_time - earth_p
+            previous, light_time = light_time, np.linalg.norm(astrometric, axis=0) / C_AUDAY
+            if np.max(np.abs(light_time - previous)) < _LIGHT_TIME_TOLERANCE:
+                break
+        return position - velocity * light_time - earth_p, light_time
+
+    def sun_moon_xyz(self, jd) -> Tuple[np.ndarray, np.ndarray]:
+        """(sun, moon) o kształcie (3, *jd.shape) [au], pozorne GCRS, dla JD (TT)."""
+        whole, frac, shape = _split_tdb(jd)
+        # po jednym przebiegu każdego segmentu: pozycja [km] i prędkość [km/d]
+        (emb_p, emb_v), (earth_p, earth_v), (moon_p, moon_v), (sun_p, sun_v) = (
+            segment.position_velocity(whole, frac)
+            for segment in (self._emb, self._earth, self._moon, self._sun)
+        )
+        earth_p, earth_v = (emb_p + earth_p) / AU_KM, (emb_v + earth_v) / AU_KM
+        sun_p, sun_v = sun_p / AU_KM, sun_v / AU_KM
+        moon_p, moon_v = (emb_p + moon_p) / AU_KM, (emb_v + moon_v) / AU_KM
+        if not self.apparent:
+            return (sun_p - earth_p).reshape((3,) + shape), (moon_p - earth_p).reshape((3,) + shape)
+
+        sun, sun_lt = self._observe(sun_p, sun_v, earth_p)
+        moon, moon_lt = self._observe(moon_p, moon_v, earth_p)
+        moon = moon + _deflection_by_sun(moon, earth_p - sun_p)
+
+        sun = _add_aberration(sun, earth_v, sun_lt)
+        moon = _add_aberration(moon, earth_v, moon_lt)
+        return sun.reshape((3,) + shape), moon.reshape((3,) + shape)
+
+
+class RoutedSpkSunMoon:
+    """SpkSunMoon na wszystkich kernelach z indeksu – każdy JD do swojego pliku."""
+
+    def __init__(self, apparent: bool = True) -> None:
+        self.apparent = apparent
+
+    def sun_moon_xyz(self, jd) -> Tuple[np.ndarray, np.ndarray]:
+        if isinstance(jd, (JulianDay, JulianDayArray)):
+            flat = np.asarray(jd.day + jd.frac, dtype=np.float64)
+        else:
+            flat = np.asarray(jd, dtype=np.float64)
+        groups = _kernel_paths(flat)
+        if len(groups) == 1:
+            return get_spk_sun_moon(groups[0][0], self.apparent).sun_moon_xyz(jd)
+
+        sun = np.empty((3, flat.size))
+        moon = np.empty((3, flat.size))
+        for path, idx in groups:
+            if isinstance(jd, JulianDayArray):
+                part = JulianDayArray(jd.day.ravel()[idx], jd.frac.ravel()[idx])
+            else:
+                part = flat.ravel()[idx]
+            sun[:, idx], moon[:, idx] = get_spk_sun_moon(path, self.apparent).sun_moon_xyz(part)
+        return sun.reshape((3,) + flat.shape), moon.reshape((3,) + flat.shape)
+
+
+@lru_cache(maxsize=None)
+def get_spk_sun_moon(path: Optional[Path] = None, apparent: bool = True):
+    """Silnik na konkretnym pliku .bsp; bez ścieżki – routing po indeksie kerneli."""
+    if path is None:
+        return RoutedSpkSunMoon(apparent)
+    return SpkSunMoon(Path(path), apparent)
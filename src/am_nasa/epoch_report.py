@@ -2,17 +2,35 @@ import csv
 from typing import Iterable, Tuple
 
 from .am_core import am_from_jd, jd_from_am
-from .faza_ksiezyca import moon_phase, moon_phase_value
+from .faza_ksiezyca import moon_phase_value
+from .lunation_index import lunation_state
+
+
+def _moon_phase(jd: float, tier: str) -> Tuple[str, float]:
+    """(nazwa fazy, faza 0–1) – nazwa z indeksu faz JPL (lunation_index),
+    faza 0–1: "fast" – szeregi Meeusa, inne tiery – efemerydy.
+
+    Faza 0–1 to w obu przypadkach (1 + cos elongacji) / 2, więc kolumny
+    raportu znaczą to samo niezależnie od tieru.
+    """
+    name = lunation_state(jd)["phase_name"]
+    if tier == "fast":
+        return name, moon_phase_value(jd)
+    from .ephemeris_nasa import engine_for_tier, sun_moon_state_from_jd
+
+    return name, sun_moon_state_from_jd(jd, engine_for_tier(tier))["illumination"]
 
 
 def generate_report(
     dataset: Iterable[Tuple[str, float, int]],
     filename: str = "epoch_report.csv",
+    tier: str = "fast",
 ) -> str:
     """
     Tworzy raport CSV z porównaniem JD_NASA vs JD_AM dla podanych kotwic.
 
     dataset: iterowalne (name, jd_nasa, year)
+    tier: dokładność fazy Księżyca (ephemeris_nasa.TIERS), domyślnie analityczna
     """
     with open(filename, "w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
@@ -30,8 +48,7 @@ def generate_report(
             am = am_from_jd(jd_nasa, year)
             jd_am = jd_from_am(am, year)
             diff = jd_am - jd_nasa
-            phase_name = moon_phase(jd_nasa)
-            phase_val = moon_phase_value(jd_nasa)
+            phase_name, phase_val = _moon_phase(jd_nasa, tier)
             w.writerow([name, jd_nasa, jd_am, diff, phase_name, f"{phase_val:.4f}"])
     return filename
 
@@ -39,6 +56,7 @@ def generate_report(
 def generate_html_report(
     dataset: Iterable[Tuple[str, float, int]],
     filename: str = "epoch_report.html",
+    tier: str = "fast",
 ) -> str:
     """
     Generuje prosty raport HTML na podstawie tego samego datasetu.
@@ -48,8 +66,7 @@ def generate_html_report(
         am = am_from_jd(jd_nasa, year)
         jd_am = jd_from_am(am, year)
         diff = jd_am - jd_nasa
-        phase_name = moon_phase(jd_nasa)
-        phase_val = moon_phase_value(jd_nasa)
+        phase_name, phase_val = _moon_phase(jd_nasa, tier)
         rows.append(
             (
                 name,
@@ -1,17 +1,37 @@
 import math
+
+import numpy as np
+
+from .planetary_positions import _sincos, fundamental_arguments_array
+
 J2000 = 2451545.0
 T_CENT = 36525.0
 
-def moon_phase(jd: float) -> str:
+# granice klas wartości fazy (0 = pełnia, 1 = nów) i nazwy przedziałów
+PHASE_BOUNDS = (0.03, 0.25, 0.47, 0.53, 0.75, 0.97)
+PHASE_NAMES = (
+    "nów",
+    "wzrastający sierp",
+    "pierwsza kwadra",
+    "pełnia",
+    "ostatnia kwadra",
+    "malejący sierp",
+    "nów",
+)
+
+def _phase_angle(jd: float) -> float:
     T = (jd - J2000) / T_CENT
     D = (297.8501921 + 445267.1114034*T - 0.0018819*T**2 + T**3 / 545868 - T**4 / 113065000) % 360
     M = (357.5291092 + 35999.0502909*T - 0.0001536*T**2 + T**3 / 24490000) % 360
     M_ = (134.9633964 + 477198.8675055*T + 0.0087414*T**2 + T**3 / 69699 - T**4 / 14712000) % 360
-    F = (93.2720950 + 483202.0175233*T - 0.0036539*T**2 - T**3 / 3526000 + T**4 / 863310000) % 360
-    elong = 180 - D - 6.289 * math.sin(math.radians(M_)) + 2.100 * math.sin(math.radians(M)) \
+    return 180 - D - 6.289 * math.sin(math.radians(M_)) + 2.100 * math.sin(math.radians(M)) \
         - 1.274 * math.sin(math.radians(2*D - M_)) - 0.658 * math.sin(math.radians(2*D)) \
         - 0.214 * math.sin(math.radians(2*M_)) - 0.110 * math.sin(math.radians(D))
-    phase_value = (1 - math.cos(math.radians(elong))) / 2
+
+def moon_phase(jd: float) -> str:
+    return phase_name_from_value(moon_phase_value(jd))
+
+def phase_name_from_value(phase_value: float) -> str:
     if phase_value < 0.03:
         return "nów"
     elif 0.03 <= phase_value < 0.25:
@@ -28,8 +48,34 @@ def moon_phase(jd: float) -> str:
         return "nów"
 
 def moon_phase_value(jd: float) -> float:
-    T = (jd - J2000) / T_CENT
-    D = (297.8501921 + 445267.1114034*T) % 360
-    M_ = (134.9633964 + 477198.8675055*T) % 360
-    elong = 180 - D - 6.289 * math.sin(math.radians(M_))
-    return (1 - math.cos(math.radians(elong))) / 2
+    # ten sam szereg co moon_phase (wcześniej tylko D i M')
+    return (1 - math.cos(math.radians(_phase_angle(jd)))) / 2
+
+
+# ===== WERSJE TABLICOWE =====
+# Argumenty D, M, M' z planetary_positions.fundamental_arguments_array – raz na
+# wsad; klasyfikacja przez np.digitize po PHASE_BOUNDS zamiast łańcucha if.
+
+def moon_phase_state_array(jd, args=None):
+    """JD -> słownik tablic: phase_angle [deg], phase_value (0–1), phase_index, phase_name."""
+    a = fundamental_arguments_array(jd) if args is None else args
+    sD, cD = _sincos(a, "D")
+    sM, _ = _sincos(a, "M")
+    sM_, cM_ = _sincos(a, "M_")
+    s2D, c2D = 2*sD*cD, 1 - 2*sD*sD
+    angle = 180 - a["D"] - 6.289*sM_ + 2.100*sM - 1.274*(s2D*cM_ - c2D*sM_) \
+        - 0.658*s2D - 0.214*2*sM_*cM_ - 0.110*sD
+    value = (1 - np.cos(np.radians(angle))) / 2
+    index = np.digitize(value, PHASE_BOUNDS)
+    return {
+        "phase_angle": angle % 360,
+        "phase_value": value,
+        "phase_index": index,
+        "phase_name": np.take(PHASE_NAMES, index),
+    }
+
+def moon_phase_value_array(jd):
+    return moon_phase_state_array(jd)["phase_value"]
+
+def moon_phase_array(jd):
+    return moon_phase_state_array(jd)["phase_name"]
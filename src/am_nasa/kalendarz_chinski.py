@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+# kalendarz_chinski.py — astronomiczny kalendarz chiński z tablicy miesięcy.
+#
+# Miesiąc zaczyna się w dniu (czas Pekinu) nowiu; miesiąc z przesileniem
+# zimowym to 11. W sui (od 11. do 11. miesiąca) z 13 miesiącami przestępny
+# jest pierwszy miesiąc bez zhongqi (wyraz główny: długość Słońca = k·30°).
+# Nowie i zhongqi liczy astro_events z efemeryd JPL – raz, przy budowie tablicy.
+#
+# Tablica (int64, kształt (5, n + 1)) jest zapisana w data/calendar_tables/
+# chinese.npy: wiersze = początek miesiąca N (kernel daje N + 0.5), rok, numer
+# miesiąca w roku (1…12/13 – tak jak `month` w konwertuj), nazwa miesiąca
+# (1…12) i flaga przestępności. Ostatnia kolumna to pierwszy miesiąc roku
+# po zakresie (zamyka długość ostatniego miesiąca).
+#
+# Rok liczony jak w dotychczasowym kernelu liniowym: rok 1 = 2637 p.n.e.,
+# czyli rok chiński = rok gregoriański nowego roku + 2637. Poza zakresem
+# tablicy (albo bez pliku) zostaje stare przybliżenie liniowe.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from .kalendarze_lunisolarne import (
+    _split_day_number,
+    chinese_from_jd_array,
+    jd_from_chinese,
+    jd_from_chinese_array,
+)
+
+CHINESE_TABLE_FILE = Path(__file__).resolve().parent / "data" / "calendar_tables" / "chinese.npy"
+
+CHINESE_YEAR_OFFSET = 2637
+
+# Czas strefowy: do 1929 średni czas słoneczny Pekinu (116°25′E), potem UTC+8
+_BEIJING_LMT = 1397 / 180 / 24
+_UTC8 = 8 / 24
+_UTC8_SINCE_JD = 2425612.5  # 1.01.1929 (UT)
+
+
+def _local_day_number(jd_ut: np.ndarray) -> np.ndarray:
+    """JD (UT) -> numer dnia N daty cywilnej w Pekinie."""
+    offset = np.where(jd_ut >= _UTC8_SINCE_JD, _UTC8, _BEIJING_LMT)
+    return np.floor(jd_ut + offset + 0.5).astype(np.int64)
+
+
+def build_chinese_table(gregorian_start: int, gregorian_end: int, eph=None) -> np.ndarray:
+    """Liczy tablicę miesięcy dla lat chińskich zaczynających się w latach
+    gregoriańskich gregorian_start…gregorian_end (nowie i zhongqi z JPL)."""
+    from .astro_events import new_moons
+    from .delta_t import tt_to_ut
+    from .solar_terms import solar_terms
+    from .konwersja_wielosystemowa import gregorian_from_jd_array, jd_from_gregorian
+
+    jd_start = jd_from_gregorian(gregorian_start - 1, 11, 1)
+    jd_end = jd_from_gregorian(gregorian_end + 2, 2, 1)
+
+    starts = _local_day_number(tt_to_ut(new_moons(jd_start, jd_end, eph)))
+    zq_tt, zq_lon = solar_terms(jd_start, jd_end, 30.0, eph)
+    zhongqi = _local_day_number(tt_to_ut(zq_tt))
+    solstices = zhongqi[zq_lon == 270.0]
+
+    # miesiąc i ma zhongqi, gdy któryś wypada w [start_i, start_i+1)
+    no_zhongqi = np.searchsorted(zhongqi, starts[1:]) == np.searchsorted(zhongqi, starts[:-1])
+    month11 = np.searchsorted(starts, solstices, side="right") - 1
+    month11 = month11[(month11 >= 0) & (month11 < len(starts) - 1)]
+
+    number = np.zeros(len(starts), dtype=np.int64)
+    leap = np.zeros(len(starts), dtype=np.int64)
+    for a, b in zip(month11[:-1], month11[1:]):
+        count = np.arange(1, b - a + 1)
+        if b - a == 13:
+            first = a + 1 + int(np.argmax(no_zhongqi[a + 1:b + 1]))
+            leap[first] = 1
+            count = count - (np.arange(a + 1, b + 1) >= first)
+        number[a + 1:b + 1] = (10 + count) % 12 + 1
+
+    new_year = np.flatnonzero((number == 1) & (leap == 0))
+    year = gregorian_from_jd_array(starts[new_year] + 0.5)[0] + CHINESE_YEAR_OFFSET
+    keep = (year >= gregorian_start + CHINESE_YEAR_OFFSET) & (year <= gregorian_end + CHINESE_YEAR_OFFSET + 1)
+    new_year, year = new_year[keep], year[keep]
+
+    first, last = new_year[0], new_year[-1]
+    months = np.arange(first, last + 1)
+    which = np.searchsorted(new_year, months, side="right") - 1
+    return np.stack([
+        starts[months],
+        year[which],
+        months - new_year[which] + 1,
+        number[months],
+        leap[months],
+    ])
+
+
+def save_chinese_table(table: np.ndarray, path: Path = CHINESE_TABLE_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, table)
+    return path
+
+
+class ChineseTable:
+    """Tablica miesięcy + kernele oparte na niej (lookup zamiast root-findingu)."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        # np.asarray: zwykły widok na mmap (bez narzutu podklasy np.memmap)
+        self.starts, self.years, self.ordinals, self.numbers, self.leaps = (np.asarray(row) for row in data)
+        self.first_year = int(self.years[0])
+        self.last_year = int(self.years[-1]) - 1  # ostatnia kolumna = rok po zakresie
+        # indeks pierwszego miesiąca każdego roku (+ zamykający)
+        self.year_index = np.flatnonzero(self.ordinals == 1)
+
+    def to_jd_array(self, year, month, day) -> np.ndarray:
+        year, month, day = np.broadcast_arrays(*(np.asarray(a, dtype=np.int64) for a in (year, month, day)))
+        inside = (year >= self.first_year) & (year <= self.last_year)
+        i = self.year_index[np.where(inside, year - self.first_year, 0)] + month - 1
+        inside &= (i >= 0) & (i < len(self.starts) - 1)
+        i = np.where(inside, i, 0)
+        out = self.starts[i] + day - 0.5
+        if not inside.all():
+            out = np.where(inside, out, jd_from_chinese_array(year, month, day))
+        return out
+
+    def from_jd_array(self, jd):
+        n, frac = _split_day_number(jd)
+        i = np.searchsorted(self.starts, n, side="right") - 1
+        inside = (i >= 0) & (i < len(self.starts) - 1)
+        i = np.where(inside, i, 0)
+        year, month = self.years[i], self.ordinals[i]
+        day = n - self.starts[i] + 1 + frac
+        if not inside.all():
+            fy, fm, fd = chinese_from_jd_array(jd)
+            year, month, day = np.where(inside, year, fy), np.where(inside, month, fm), np.where(inside, day, fd)
+        return year, month, day
+
+    def month_info_array(self, jd):
+        """(nazwa miesiąca 1…12, flaga przestępności) dla tablicy JD; -1 poza zakresem."""
+        n, _ = _split_day_number(jd)
+        i = np.searchsorted(self.starts, n, side="right") - 1
+        inside = (i >= 0) & (i < len(self.starts) - 1)
+        i = np.where(inside, i, 0)
+        return np.where(inside, self.numbers[i], -1), np.where(inside, self.leaps[i], -1)
+
+
+@lru_cache(maxsize=1)
+def get_chinese_table() -> Optional[ChineseTable]:
+    """Tablica z pakietu (mmap) albo None, gdy pliku brak."""
+    if not CHINESE_TABLE_FILE.exists():
+        return None
+    return ChineseTable(np.load(CHINESE_TABLE_FILE, mmap_mode="r"))
+
+
+# ===== KERNELE DLA REJESTRU =====
+
+def jd_from_chinese_astro_array(year, month, day) -> np.ndarray:
+    table = get_chinese_table()
+    if table is None:
+        return jd_from_chinese_array(year, month, day)
+    return table.to_jd_array(year, month, day)
+
+
+def jd_from_chinese_astro(year: int, month: int, day: int) -> float:
+    if get_chinese_table() is None:
+        return jd_from_chinese(year, month, day)
+    return float(jd_from_chinese_astro_array(year, month, day))
+
+
+def chinese_astro_from_jd_array(jd):
+    table = get_chinese_table()
+    if table is None:
+        return chinese_from_jd_array(jd)
+    return table.from_jd_array(jd)
+
+
+def chinese_astro_from_jd(jd: float):
+    year, month, day = chinese_astro_from_jd_array(jd)
+    return int(year), int(month), float(day)
+
+
+def chinese_range(jd_start: float, jd_end: float) -> Dict[str, np.ndarray]:
+    """Wsadowo: każdy dzień z [jd_start, jd_end) -> data chińska.
+
+    Zwraca kolumny JD, year, month (numer w roku), month_number (1…12),
+    leap (0/1, -1 poza tablicą) i day.
+    """
+    jd = np.arange(np.floor(jd_start - 0.5), np.floor(jd_end - 0.5)) + 0.5
+    year, month, day = chinese_astro_from_jd_array(jd)
+    table = get_chinese_table()
+    if table is None:
+        number, leap = np.full(jd.shape, -1), np.full(jd.shape, -1)
+    else:
+        number, leap = table.month_info_array(jd)
+    return {
+        "JD": jd,
+        "year": year,
+        "month": month,
+        "month_number": number,
+        "leap": leap,
+        "day": day,
+    }
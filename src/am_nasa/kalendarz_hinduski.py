@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+# kalendarz_hinduski.py — hinduski kalendarz słoneczny i księżycowy z tablic zdarzeń.
+#
+# Słoneczny: miesiąc = znak, w którym stoi Słońce (długość syderyczna, ajanamsa
+# Lahiri); zaczyna się w dniu pierwszego wschodu Słońca po sankranti. Rok
+# zaczyna Mesha sankranti; numeracja jak w dotychczasowym kernelu liniowym
+# (lata Kali: rok = rok gregoriański Mesha sankranti + 3101).
+#
+# Księżycowy: dzień = tithi panujące o wschodzie Słońca (1…30, może się
+# powtórzyć albo wypaść). Miesiąc amanta biegnie od nowiu do nowiu i bierze
+# nazwę od znaku Słońca w chwili nowiu (Słońce w Mina -> 1 = Chaitra); gdy
+# kolejny nów wypada w tym samym znaku, miesiąc jest adhika (przestępny).
+# Purnimanta: ciemna połowa (tithi 16…30) należy już do następnego miesiąca
+# (razem z jego rokiem – ciemna Chaitra otwiera nowy rok).
+# Miesiące kshaya (dwa sankranti w jednym miesiącu) nie są osobno oznaczane.
+#
+# Dni liczymy od wschodu Słońca w Ujjain (wzór analityczny, ~1 min). Momenty
+# sankranti i granic tithi z efemeryd JPL liczone są raz (astro_events) i
+# zapisane w data/calendar_tables/hindu_*.npy jako int64: minuta UT · 32 +
+# indeks (znak 0…11 / tithi 0…29). Konwersje to searchsorted po tych tablicach.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .kalendarze_lunisolarne import (
+    _split_day_number,
+    hindu_from_jd_array,
+    jd_from_hindu,
+    jd_from_hindu_array,
+)
+
+TABLES_DIR = Path(__file__).resolve().parent / "data" / "calendar_tables"
+HINDU_SANKRANTI_FILE = TABLES_DIR / "hindu_sankranti.npy"
+HINDU_TITHI_FILE = TABLES_DIR / "hindu_tithi.npy"
+
+KALI_YEAR_OFFSET = 3101
+
+UJJAIN_LAT_DEG = 23.1765
+UJJAIN_LON_DEG = 75.7885
+
+_PACK = 32  # minuta · 32 + indeks zdarzenia
+
+
+def pack_events(jd_ut, index) -> np.ndarray:
+    """(JD UT, indeks) -> int64 posortowane tak jak czasy."""
+    minutes = np.rint(np.asarray(jd_ut, dtype=np.float64) * 1440.0).astype(np.int64)
+    return minutes * _PACK + np.asarray(index, dtype=np.int64)
+
+
+def unpack_events(packed) -> Tuple[np.ndarray, np.ndarray]:
+    minutes, index = np.divmod(np.asarray(packed, dtype=np.int64), _PACK)
+    return minutes / 1440.0, index
+
+
+def sunrise_ut(n) -> np.ndarray:
+    """JD (UT) wschodu Słońca w Ujjain w dniu o numerze N (górny brzeg, refrakcja 34′).
+
+    Niska precyzja (deklinacja i równanie czasu ze średniej anomalii), ~1 min.
+    """
+    n = np.asarray(n, dtype=np.float64)
+    d = n - UJJAIN_LON_DEG / 360.0 - 2451545.0  # ~ lokalne południe
+    g = np.radians(357.529 + 0.98560028 * d)
+    q = 280.459 + 0.98564736 * d
+    lam = np.radians(q + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g))
+    eps = np.radians(23.439 - 3.6e-7 * d)
+    ra = np.degrees(np.arctan2(np.cos(eps) * np.sin(lam), np.cos(lam)))
+    dec = np.arcsin(np.sin(eps) * np.sin(lam))
+    eot_h = ((q - ra + 180.0) % 360.0 - 180.0) / 15.0
+    lat = np.radians(UJJAIN_LAT_DEG)
+    cos_h = (np.sin(np.radians(-0.8333)) - np.sin(lat) * np.sin(dec)) / (np.cos(lat) * np.cos(dec))
+    half_day_h = np.degrees(np.arccos(cos_h)) / 15.0
+    noon_h = 12.0 - UJJAIN_LON_DEG / 15.0 - eot_h
+    return n - 0.5 + (noon_h - half_day_h) / 24.0
+
+
+def sunrise_day(jd_ut) -> np.ndarray:
+    """Numer dnia N pierwszego wschodu Słońca po chwili jd_ut."""
+    jd_ut = np.asarray(jd_ut, dtype=np.float64)
+    n = np.floor(jd_ut + 0.5).astype(np.int64)
+    return n + (sunrise_ut(n) <= jd_ut)
+
+
+def build_hindu_tables(gregorian_start: int, gregorian_end: int, eph=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Liczy (sankranti, granice tithi) dla lat gregoriańskich gregorian_start…gregorian_end."""
+    from .astro_events import lunar_elongation_times, solar_longitude_times
+    from .delta_t import tt_to_ut
+    from .konwersja_wielosystemowa import jd_from_gregorian
+
+    jd_start = jd_from_gregorian(gregorian_start, 1, 1)
+    jd_end = jd_from_gregorian(gregorian_end + 1, 1, 1)
+    sk_tt, sk_lon = solar_longitude_times(jd_start, jd_end, 30.0, eph, sidereal=True)
+    ti_tt, ti_elong = lunar_elongation_times(jd_start, jd_end, 12.0, eph)
+    return (
+        pack_events(tt_to_ut(sk_tt), np.rint(sk_lon / 30.0) % 12),
+        pack_events(tt_to_ut(ti_tt), np.rint(ti_elong / 12.0) % 30),
+    )
+
+
+def save_hindu_tables(tables: Tuple[np.ndarray, np.ndarray], directory: Path = TABLES_DIR) -> Tuple[Path, Path]:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = (directory / HINDU_SANKRANTI_FILE.name, directory / HINDU_TITHI_FILE.name)
+    for path, table in zip(paths, tables):
+        np.save(path, table)
+    return paths
+
+
+class HinduTable:
+    """Tablice sankranti / tithi + wyprowadzone z nich miesiące słoneczne i księżycowe."""
+
+    def __init__(self, sankranti: np.ndarray, tithi: np.ndarray) -> None:
+        s_jd, s_sign = unpack_events(sankranti)
+        t_jd, t_index = unpack_events(tithi)
+
+        # --- słoneczny: pełne lata od Mesha do Mesha (12 sankranti na rok) ---
+        mesha = np.flatnonzero(s_sign == 0)
+        sel = slice(mesha[0], mesha[-1] + 1)
+        self.solar_starts = sunrise_day(s_jd[sel])
+        self.solar_months = s_sign[sel] + 1
+        self.first_year = int(_gregorian_year(self.solar_starts[0])) + KALI_YEAR_OFFSET
+        self.last_year = self.first_year + (len(self.solar_starts) - 1) // 12 - 1
+
+        # --- księżycowy: dzień wejścia każdego tithi + miesiące amanta ---
+        self.tithi_days = sunrise_day(t_jd)
+        self.tithi_index = t_index
+        nm = np.flatnonzero(t_index == 0)
+        nm = nm[(t_jd[nm] >= s_jd[0])]
+        zodiac = s_sign[np.searchsorted(s_jd, t_jd[nm], side="right") - 1]
+        month = (zodiac + 1) % 12 + 1
+        leap = (zodiac[:-1] == zodiac[1:]).astype(np.int64)
+        # rok zaczyna pierwsza Chaitra (także adhika – poprzedza wtedy nija Chaitrę)
+        new_year = (month == 1) & np.concatenate([[False], month[:-1] != 1])
+        chaitra = np.flatnonzero(new_year[:-1])
+        sel = slice(chaitra[0], chaitra[-1] + 1)  # ostatni Chaitra zamyka zakres
+        self.lunar_nm = nm[sel]
+        self.lunar_months = month[sel]
+        self.lunar_leaps = np.append(leap, 0)[sel]
+        # numer roku = rok słoneczny pierwszej Vaishakhy (zawsze po Mesha sankranti)
+        count = np.cumsum(new_year[sel])
+        vaishakha = np.flatnonzero((self.lunar_months == 2) & (self.lunar_leaps == 0))[0]
+        year = self.solar_from_day(self.tithi_days[self.lunar_nm[vaishakha:vaishakha + 1]])[0][0]
+        self.lunar_years = count - count[vaishakha] + year
+        # klucz (rok, miesiąc, adhika przed nija) rośnie wzdłuż tablicy
+        self.lunar_keys = self.lunar_years * 26 + self.lunar_months * 2 + (1 - self.lunar_leaps)
+
+    # --- słoneczny ---
+
+    def solar_to_jd_array(self, year, month, day) -> np.ndarray:
+        year, month, day = np.broadcast_arrays(*(np.asarray(a, dtype=np.int64) for a in (year, month, day)))
+        i = (year - self.first_year) * 12 + month - 1
+        inside = (year >= self.first_year) & (year <= self.last_year) & (i >= 0) & (i < len(self.solar_starts) - 1)
+        out = self.solar_starts[np.where(inside, i, 0)] + day - 0.5
+        if not inside.all():
+            out = np.where(inside, out, jd_from_hindu_array(year, month, day))
+        return out
+
+    def solar_from_day(self, n):
+        n = np.asarray(n, dtype=np.int64)
+        i = np.searchsorted(self.solar_starts, n, side="right") - 1
+        inside = (i >= 0) & (i < len(self.solar_starts) - 1)
+        i = np.where(inside, i, 0)
+        return self.first_year + i // 12, self.solar_months[i], n - self.solar_starts[i] + 1, inside
+
+    def solar_from_jd_array(self, jd):
+        n, frac = _split_day_number(jd)
+        year, month, day, inside = self.solar_from_day(n)
+        day = day + frac
+        if not inside.all():
+            fy, fm, fd = hindu_from_jd_array(jd)
+            year, month, day = np.where(inside, year, fy), np.where(inside, month, fm), np.where(inside, day, fd)
+        return year, month, day
+
+    # --- księżycowy ---
+
+    def lunar_from_jd_array(self, jd, scheme: str = "amanta") -> Dict[str, np.ndarray]:
+        n, _ = _split_day_number(jd)
+        j = np.searchsorted(self.tithi_days, n, side="right") - 1
+        m = np.searchsorted(self.tithi_days[self.lunar_nm], n, side="right") - 1
+        inside = (j >= 1) & (m >= 0) & (m < len(self.lunar_nm) - 1)
+        j, m = np.where(inside, j, 1), np.where(inside, m, 0)
+        tithi = self.tithi_index[j] + 1
+        leap_day = np.searchsorted(self.tithi_days, n - 1, side="right") - 1 == j
+        if scheme == "purnimanta":
+            m = np.where(tithi > 15, np.minimum(m + 1, len(self.lunar_nm) - 1), m)
+        elif scheme != "amanta":
+            raise ValueError(f"Nieznany schemat miesięcy: {scheme!r} (amanta/purnimanta)")
+        return {
+            "year": np.where(inside, self.lunar_years[m], -1),
+            "month": np.where(inside, self.lunar_months[m], -1),
+            "leap_month": np.where(inside, self.lunar_leaps[m], -1),
+            "tithi": np.where(inside, tithi, -1),
+            "leap_day": np.where(inside, leap_day, False),
+        }
+
+    def lunar_to_jd_array(self, year, month, tithi, leap=0, scheme: str = "amanta") -> np.ndarray:
+        year, month, tithi, leap = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.int64) for a in (year, month, tithi, leap))
+        )
+        last = len(self.lunar_keys) - 1  # ostatni wpis (Chaitra) tylko zamyka zakres
+
+        def lookup(y):
+            key = y * 26 + month * 2 + (1 - leap)
+            i = np.searchsorted(self.lunar_keys, key)
+            clipped = np.minimum(i, last)
+            return clipped, (i <= last) & (self.lunar_keys[clipped] == key)
+
+        m, found = lookup(year)
+        if scheme == "purnimanta":
+            m = m - (tithi > 15)  # ciemna połowa leży w poprzednim miesiącu amanta
+            found &= m >= 0
+        found &= m < last
+        b = self.lunar_nm[np.clip(m, 0, len(self.lunar_nm) - 1)] + tithi - 1
+        ok = found & (m >= 0) & (tithi >= 1) & (tithi <= 30) & (b < len(self.tithi_days))
+        return np.where(ok, self.tithi_days[np.where(ok, b, 0)] + 0.5, np.nan)
+
+
+def _gregorian_year(n) -> np.ndarray:
+    from .konwersja_wielosystemowa import gregorian_from_jd_array
+
+    return gregorian_from_jd_array(np.asarray(n) + 0.5)[0]
+
+
+@lru_cache(maxsize=1)
+def get_hindu_table() -> Optional[HinduTable]:
+    """Tablice z pakietu (mmap) albo None, gdy plików brak."""
+    if not (HINDU_SANKRANTI_FILE.exists() and HINDU_TITHI_FILE.exists()):
+        return None
+    return HinduTable(np.load(HINDU_SANKRANTI_FILE, mmap_mode="r"), np.load(HINDU_TITHI_FILE, mmap_mode="r"))
+
+
+# ===== KERNELE DLA REJESTRU (kalendarz słoneczny) =====
+
+def jd_from_hindu_solar_array(year, month, day) -> np.ndarray:
+    table = get_hindu_table()
+    if table is None:
+        return jd_from_hindu_array(year, month, day)
+    return table.solar_to_jd_array(year, month, day)
+
+
+def jd_from_hindu_solar(year: int, month: int, day: int) -> float:
+    if get_hindu_table() is None:
+        return jd_from_hindu(year, month, day)
+    return float(jd_from_hindu_solar_array(year, month, day))
+
+
+def hindu_solar_from_jd_array(jd):
+    table = get_hindu_table()
+    if table is None:
+        return hindu_from_jd_array(jd)
+    return table.solar_from_jd_array(jd)
+
+
+def hindu_solar_from_jd(jd: float):
+    year, month, day = hindu_solar_from_jd_array(jd)
+    return int(year), int(month), float(day)
+
+
+# ===== KALENDARZ KSIĘŻYCOWY (amanta / purnimanta) =====
+
+def _require_table() -> HinduTable:
+    table = get_hindu_table()
+    if table is None:
+        raise RuntimeError(
+            "Brak tablic hindu_sankranti.npy / hindu_tithi.npy – "
+            "zbuduj je: scripts/amjd_build_calendar_tables.py --hindu OD DO"
+        )
+    return table
+
+
+def hindu_lunar_from_jd_array(jd, scheme: str = "amanta") -> Dict[str, np.ndarray]:
+    """JD -> kolumny year, month, leap_month (adhika), tithi, leap_day (-1 poza tablicą)."""
+    return _require_table().lunar_from_jd_array(jd, scheme)
+
+
+def hindu_lunar_from_jd(jd: float, scheme: str = "amanta") -> dict:
+    out = hindu_lunar_from_jd_array(np.array([jd]), scheme)
+    return {key: value[0].item() for key, value in out.items()}
+
+
+def jd_from_hindu_lunar_array(year, month, tithi, leap=0, scheme: str = "amanta") -> np.ndarray:
+    """(rok, miesiąc, tithi, adhika) -> JD dnia, o którego wschodzie panuje to tithi.
+
+    Dla tithi kshaya (bez wschodu Słońca) zwraca dzień następny; NaN dla dat spoza tablicy.
+    """
+    return _require_table().lunar_to_jd_array(year, month, tithi, leap, scheme)
+
+
+def hindu_range(jd_start: float, jd_end: float, scheme: str = "amanta") -> Dict[str, np.ndarray]:
+    """Wsadowo: każdy dzień z [jd_start, jd_end) -> data słoneczna i księżycowa."""
+    jd = np.arange(np.floor(jd_start - 0.5), np.floor(jd_end - 0.5)) + 0.5
+    year, month, day = hindu_solar_from_jd_array(jd)
+    lunar = hindu_lunar_from_jd_array(jd, scheme)
+    return {
+        "JD": jd,
+        "solar_year": year,
+        "solar_month": month,
+        "solar_day": day,
+        **{f"lunar_{key}": value for key, value in lunar.items()},
+    }
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+# kalendarz_majow.py — Długa Rachuba, Tzolk'in, Haab' i Koło Kalendarzowe.
+#
+# Wszystko liczone na liczbie dni od 13.0.0.0.0 (4 Ahau 8 Cumku); numer dnia
+# N = korelacja + dni (kernel zwraca N + 0.5, jak pozostałe systemy), więc
+# zmiana korelacji to tylko inna stała. Funkcje przyjmują skalary albo tablice.
+#
+# Koło Kalendarzowe (18980 dni) szukamy z chińskiego twierdzenia o resztach:
+# Tzolk'in daje resztę mod 260 (13 × 20), Haab' mod 365; gcd = 5, więc para
+# istnieje tylko, gdy reszty zgadzają się mod 5. Bez skanowania dzień po dniu.
+
+from typing import Dict, Tuple, Union
+
+import numpy as np
+
+from .kalendarze_lunisolarne import _split_day_number
+
+# Numer dnia (JDN) dla 13.0.0.0.0
+CORRELATIONS: Dict[str, int] = {
+    "gmt": 584283,              # Goodman–Martinez–Thompson
+    "lounsbury": 584285,        # „astronomiczna” GMT (+2)
+    "martin_skidmore": 584286,
+}
+DEFAULT_CORRELATION = "gmt"
+
+TZOLKIN_NAMES = (
+    "imix", "ik", "akbal", "kan", "chicchan", "cimi", "manik", "lamat", "muluc", "oc",
+    "chuen", "eb", "ben", "ix", "men", "cib", "caban", "etznab", "cauac", "ahau",
+)
+HAAB_MONTHS = (
+    "pop", "uo", "zip", "zotz", "tzec", "xul", "yaxkin", "mol", "chen", "yax",
+    "zac", "ceh", "mac", "kankin", "muan", "pax", "kayab", "cumku", "uayeb",
+)
+
+CALENDAR_ROUND = 18980  # lcm(260, 365)
+
+# pozycje w dniu 13.0.0.0.0: 4 Ahau (20), 8 Cumku (dzień 17·20 + 8 roku Haab')
+_TZOLKIN_NUMBER_0 = 4
+_TZOLKIN_NAME_0 = 20
+_HAAB_DAY_0 = 348
+
+_LONG_COUNT_UNITS = (144000, 7200, 360, 20, 1)  # baktun, katun, tun, uinal, kin
+
+
+def _correlation(correlation: Union[str, int]) -> int:
+    if isinstance(correlation, str):
+        try:
+            return CORRELATIONS[correlation.lower()]
+        except KeyError:
+            raise ValueError(
+                f"Nieznana korelacja: {correlation!r} (dostępne: {', '.join(CORRELATIONS)})"
+            ) from None
+    return int(correlation)
+
+
+def _days_from_jd(jd, correlation):
+    n, frac = _split_day_number(jd)
+    return n - _correlation(correlation), frac
+
+
+# ===== DŁUGA RACHUBA =====
+
+def jd_from_long_count_array(baktun, katun, tun, uinal, kin, correlation=DEFAULT_CORRELATION) -> np.ndarray:
+    days = sum(np.asarray(v, dtype=np.int64) * unit
+               for v, unit in zip((baktun, katun, tun, uinal, kin), _LONG_COUNT_UNITS))
+    return _correlation(correlation) + days + 0.5
+
+
+def long_count_from_jd_array(jd, correlation=DEFAULT_CORRELATION):
+    """JD -> (baktun, katun, tun, uinal, kin); kin z ułamkiem dnia, baktun może być ujemny."""
+    days, frac = _days_from_jd(jd, correlation)
+    baktun, rest = np.divmod(days, 144000)
+    katun, rest = np.divmod(rest, 7200)
+    tun, rest = np.divmod(rest, 360)
+    uinal, kin = np.divmod(rest, 20)
+    return baktun, katun, tun, uinal, kin + frac
+
+
+def jd_from_long_count(baktun: int, katun: int, tun: int, uinal: int, kin: int,
+                       correlation=DEFAULT_CORRELATION) -> float:
+    return float(jd_from_long_count_array(baktun, katun, tun, uinal, kin, correlation))
+
+
+def long_count_from_jd(jd: float, correlation=DEFAULT_CORRELATION) -> Tuple[int, int, int, int, float]:
+    *head, kin = long_count_from_jd_array(jd, correlation)
+    return (*(int(v) for v in head), float(kin))
+
+
+# ===== TZOLK'IN / HAAB' =====
+
+def tzolkin_from_jd_array(jd, correlation=DEFAULT_CORRELATION):
+    """JD -> (liczba 1…13, nazwa dnia 1…20; 20 = Ahau)."""
+    days, _ = _days_from_jd(jd, correlation)
+    return (days + _TZOLKIN_NUMBER_0 - 1) % 13 + 1, (days + _TZOLKIN_NAME_0 - 1) % 20 + 1
+
+
+def haab_from_jd_array(jd, correlation=DEFAULT_CORRELATION):
+    """JD -> (miesiąc 0…18 – Pop…Uayeb, dzień 0…19)."""
+    days, _ = _days_from_jd(jd, correlation)
+    return np.divmod((days + _HAAB_DAY_0) % 365, 20)
+
+
+def calendar_round_from_jd(jd: float, correlation=DEFAULT_CORRELATION) -> str:
+    """Np. '4 ahau 8 cumku'."""
+    number, name = tzolkin_from_jd_array(jd, correlation)
+    month, day = haab_from_jd_array(jd, correlation)
+    return f"{int(number)} {TZOLKIN_NAMES[int(name) - 1]} {int(day)} {HAAB_MONTHS[int(month)]}"
+
+
+# ===== RACHUBA LAT HAAB' (system „maya” w rejestrze) =====
+# rok = liczba lat Haab' od 0 Pop poprzedzającego 13.0.0.0.0, miesiąc 0…18, dzień 0…19
+# (Uayeb, miesiąc 18, ma tylko dni 0…4). Kernel wektorowy nie rzuca wyjątków –
+# konwertuj_batch odrzuca dni Uayeb > 4 sprawdzeniem przez haab_count_from_jd_array.
+
+_UAYEB_DAYS = 5
+
+def jd_from_haab_count_array(year, month, day, correlation=DEFAULT_CORRELATION) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return _correlation(correlation) + (365 * year + 20 * month + day - _HAAB_DAY_0) + 0.5
+
+
+def haab_count_from_jd_array(jd, correlation=DEFAULT_CORRELATION):
+    days, frac = _days_from_jd(jd, correlation)
+    year, doy = np.divmod(days + _HAAB_DAY_0, 365)
+    month, day = np.divmod(doy, 20)
+    return year, month, day + frac
+
+
+def jd_from_haab_count(year: int, month: int, day: int) -> float:
+    if not (0 <= month <= 18 and 0 <= day <= (_UAYEB_DAYS - 1 if month == 18 else 19)):
+        raise ValueError(f"Nie ma daty Haab' {day} {HAAB_MONTHS[month] if 0 <= month <= 18 else month} "
+                         f"(miesiące 0–18, dni 0–19, Uayeb 0–{_UAYEB_DAYS - 1})")
+    return float(jd_from_haab_count_array(year, month, day))
+
+
+def haab_count_from_jd(jd: float) -> Tuple[int, int, float]:
+    year, month, day = haab_count_from_jd_array(jd)
+    return int(year), int(month), float(day)
+
+
+# ===== KOŁO KALENDARZOWE (CRT) =====
+
+_INV_20_MOD_13 = pow(20, -1, 13)
+_INV_52_MOD_73 = pow(52, -1, 73)  # 260 / 5 mod 365 / 5
+
+
+def calendar_round_residue(tzolkin_number, tzolkin_name, haab_month, haab_day) -> np.ndarray:
+    """Reszta (dni od 13.0.0.0.0) mod 18980 dla danej daty Koła; -1 gdy takiej daty nie ma."""
+    tzolkin_number, tzolkin_name, haab_month, haab_day = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.int64) for a in (tzolkin_number, tzolkin_name, haab_month, haab_day))
+    )
+    r13 = (tzolkin_number - _TZOLKIN_NUMBER_0) % 13
+    r20 = (tzolkin_name - _TZOLKIN_NAME_0) % 20
+    r260 = r20 + 20 * (((r13 - r20) * _INV_20_MOD_13) % 13)
+    r365 = (20 * haab_month + haab_day - _HAAB_DAY_0) % 365
+    diff = r365 - r260
+    k = ((diff // 5) * _INV_52_MOD_73) % 73
+    valid = (
+        (diff % 5 == 0)
+        & (tzolkin_number >= 1) & (tzolkin_number <= 13)
+        & (tzolkin_name >= 1) & (tzolkin_name <= 20)
+        & (haab_month >= 0) & (haab_day >= 0) & (haab_day <= 19)
+        & (20 * haab_month + haab_day < 365)
+    )
+    return np.where(valid, (r260 + 260 * k) % CALENDAR_ROUND, -1)
+
+
+def _calendar_round_search(jd, residue, correlation, direction: int) -> np.ndarray:
+    days, _ = _days_from_jd(jd, correlation)
+    if direction > 0:
+        found = days + (residue - days) % CALENDAR_ROUND
+    else:
+        found = days - (days - residue) % CALENDAR_ROUND
+    return np.where(residue >= 0, _correlation(correlation) + found + 0.5, np.nan)
+
+
+def calendar_round_on_or_after(jd, tzolkin_number, tzolkin_name, haab_month, haab_day,
+                               correlation=DEFAULT_CORRELATION) -> np.ndarray:
+    """Najbliższy dzień >= jd o danej dacie Koła (JD dnia); NaN gdy data niemożliwa."""
+    residue = calendar_round_residue(tzolkin_number, tzolkin_name, haab_month, haab_day)
+    return _calendar_round_search(jd, residue, correlation, +1)
+
+
+def calendar_round_on_or_before(jd, tzolkin_number, tzolkin_name, haab_month, haab_day,
+                                correlation=DEFAULT_CORRELATION) -> np.ndarray:
+    """Najbliższy dzień <= jd o danej dacie Koła (JD dnia); NaN gdy data niemożliwa."""
+    residue = calendar_round_residue(tzolkin_number, tzolkin_name, haab_month, haab_day)
+    return _calendar_round_search(jd, residue, correlation, -1)
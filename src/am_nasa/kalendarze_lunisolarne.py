@@ -1,4 +1,9 @@
 import math
+from functools import lru_cache
+from threading import Lock
+from typing import Tuple
+
+import numpy as np
 
 def jd_from_french_rev(year: int, month: int, day: int) -> float:
     jd_epoch = 2375839.5
@@ -6,11 +11,6 @@ def jd_from_french_rev(year: int, month: int, day: int) -> float:
     jd += (month - 1) * 30 + (day - 1)
     return jd
 
-def jd_from_maya(haab_year: int, haab_month: int, haab_day: int) -> float:
-    GMT_CORR = 584283.5
-    total_days = haab_year * 365 + haab_month * 20 + haab_day
-    return GMT_CORR + total_days
-
 def jd_from_islamic(year: int, month: int, day: int) -> float:
     return (day +
             math.ceil(29.5 * (month - 1)) +
@@ -21,7 +21,7 @@ def jd_from_islamic(year: int, month: int, day: int) -> float:
 def jd_from_persian(year: int, month: int, day: int) -> float:
     epbase = year - (474 if year >= 0 else 473)
     epyear = 474 + (epbase % 2820)
-    jd = day + (month <= 7 and (month - 1) * 31 or ((month - 1) * 30 + 6))
+    jd = day + ((month - 1) * 31 if month <= 7 else (month - 1) * 30 + 6)
     jd += math.floor((epyear * 682 - 110) / 2816) + (epyear - 1) * 365
     jd += math.floor(epbase / 2820) * 1029983 + 1948320.5
     return jd
@@ -41,3 +41,299 @@ def jd_from_coptic(year: int, month: int, day: int) -> float:
 
 def jd_from_ethiopian(year: int, month: int, day: int) -> float:
     return jd_from_coptic(year - 8, month, day)
+
+
+# ===== WERSJE WEKTOROWE (te same wzory, tablice int64 / float64) =====
+# Dzielenie `//` na int64 to floor, jak math.floor w wersjach skalarnych,
+# więc lata ujemne dają identyczne wyniki.
+
+def jd_from_french_rev_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return 2375839.5 + (year - 1) * 365 + (year - 1) // 4 + (month - 1) * 30 + (day - 1)
+
+def jd_from_islamic_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return (day + np.ceil(29.5 * (month - 1)) + (year - 1) * 354
+            + (3 + 11 * year) // 30 + 1948439.5)
+
+def jd_from_persian_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    epbase = year - np.where(year >= 0, 474, 473)
+    epyear = 474 + epbase % 2820
+    jd = day + np.where(month <= 7, (month - 1) * 31, (month - 1) * 30 + 6)
+    jd = jd + (epyear * 682 - 110) // 2816 + (epyear - 1) * 365
+    return jd + (epbase // 2820) * 1029983 + 1948320.5
+
+def jd_from_chinese_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return 758325.5 + ((year - 1) * 365.2422 + (month - 1) * 29.5306 + (day - 1))
+
+def jd_from_hindu_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return 588465.5 + ((year * 365.25875) + ((month - 1) * 30.438) + (day - 1))
+
+def jd_from_coptic_array(year, month, day) -> np.ndarray:
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    return 1824665.5 + 365 * (year - 1) + (year - 1) // 4 + 30 * (month - 1) + day - 1
+
+def jd_from_ethiopian_array(year, month, day) -> np.ndarray:
+    return jd_from_coptic_array(np.asarray(year, dtype=np.int64) - 8, month, day)
+
+
+# ===== KONWERSJE ODWROTNE JD -> KALENDARZ (wektorowe) =====
+#
+# Każda funkcja *_from_jd_array odwraca odpowiadający jej kernel jd_from_*:
+# X_from_jd(jd_from_X(y, m, d) + f) == (y, m, d + f). Dzień wraca z ułamkiem.
+# Wszystko na int64 z dzieleniem `//` (floor), więc lata ujemne (proleptyczne)
+# nie wymagają osobnych gałęzi.
+
+def _split_day_number(jd):
+    """JD -> (numer dnia N: kernel daje N + 0.5, ułamek dnia)."""
+    jd = np.asarray(jd, dtype=np.float64)
+    n = np.floor(jd - 0.5)
+    return n.astype(np.int64), (jd - 0.5) - n
+
+def _scalar(func):
+    """Skalarna wersja kernela tablicowego -> (int, int, float)."""
+    def wrapper(jd: float):
+        year, month, day = func(jd)
+        return int(year), int(month), float(day)
+    wrapper.__name__ = func.__name__.replace("_array", "")
+    wrapper.__doc__ = f"Skalarna wersja {func.__name__}: JD -> (rok, miesiąc, dzień)."
+    return wrapper
+
+def _four_year_cycle_from_day(n):
+    """Kalendarze 12×30 + epagomenai z przestępnym co 4. rokiem (koptyjski, rewolucyjny).
+
+    n = dni od 1.1.1 (0-based). Rok przestępny to ostatni w bloku 1461 dni.
+    """
+    k, rem = np.divmod(n, 1461)
+    r = np.minimum(rem // 365, 3)
+    doy = rem - 365 * r
+    return 4 * k + r + 1, doy // 30 + 1, doy % 30 + 1
+
+def french_rev_from_jd_array(jd):
+    n, frac = _split_day_number(jd)
+    year, month, day = _four_year_cycle_from_day(n - 2375839)
+    return year, month, day + frac
+
+def coptic_from_jd_array(jd):
+    n, frac = _split_day_number(jd)
+    year, month, day = _four_year_cycle_from_day(n - 1824665)
+    return year, month, day + frac
+
+def ethiopian_from_jd_array(jd):
+    year, month, day = coptic_from_jd_array(jd)
+    return year + 8, month, day
+
+# ceil(29.5 * (m - 1)) dla m = 1..12
+_ISLAMIC_MONTH_OFFSETS = np.ceil(29.5 * np.arange(12)).astype(np.int64)
+
+def islamic_from_jd_array(jd):
+    n, frac = _split_day_number(jd)
+    n = n - 1948439  # dzień 1.1.1 -> n = 1
+
+    def year_start(y):
+        return (y - 1) * 354 + (3 + 11 * y) // 30
+
+    # przybliżenie z długości cyklu 30 lat = 10631 dni, potem korekta ±1
+    year = (30 * (n - 1)) // 10631 + 1
+    year = np.where(year_start(year) >= n, year - 1, year)
+    year = np.where(year_start(year + 1) < n, year + 1, year)
+    doy = n - 1 - year_start(year)
+    month = np.searchsorted(_ISLAMIC_MONTH_OFFSETS, doy, side="right")
+    return year, month, doy - _ISLAMIC_MONTH_OFFSETS[month - 1] + 1 + frac
+
+_PERSIAN_MONTH_OFFSETS = np.array([0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336])
+
+def persian_from_jd_array(jd):
+    n, frac = _split_day_number(jd)
+
+    # rok „ciągły” bez dziury w zerze: ey <= 0 odpowiada year = ey - 1
+    def year_start(ey):
+        year = np.where(ey > 0, ey, ey - 1)
+        return jd_from_persian_array(year, 1, 1) - 0.5
+
+    ey = np.floor((n - 1948320) / 365.2422).astype(np.int64) + 1
+    for _ in range(2):
+        ey = np.where(year_start(ey) > n, ey - 1, ey)
+        ey = np.where(year_start(ey + 1) <= n, ey + 1, ey)
+    doy = (n - year_start(ey)).astype(np.int64)
+    month = np.searchsorted(_PERSIAN_MONTH_OFFSETS, doy, side="right")
+    year = np.where(ey > 0, ey, ey - 1)
+    return year, month, doy - _PERSIAN_MONTH_OFFSETS[month - 1] + 1 + frac
+
+# Systemy liniowe (chiński, hinduski, majański) – odwrotność tych samych przybliżeń.
+# _EPS chroni floor przed 8.999999… na granicy miesiąca.
+_EPS = 1e-9
+
+def chinese_from_jd_array(jd):
+    days = np.asarray(jd, dtype=np.float64) - 758325.5
+    year = np.floor(days / 365.2422 + _EPS)
+    rem = days - year * 365.2422
+    month = np.floor(rem / 29.5306 + _EPS)
+    return year.astype(np.int64) + 1, month.astype(np.int64) + 1, rem - month * 29.5306 + 1
+
+def hindu_from_jd_array(jd):
+    days = np.asarray(jd, dtype=np.float64) - 588465.5
+    year = np.floor(days / 365.25875 + _EPS)
+    rem = days - year * 365.25875
+    month = np.minimum(np.floor(rem / 30.438 + _EPS), 11)
+    return year.astype(np.int64), month.astype(np.int64) + 1, rem - month * 30.438 + 1
+
+french_rev_from_jd = _scalar(french_rev_from_jd_array)
+coptic_from_jd = _scalar(coptic_from_jd_array)
+ethiopian_from_jd = _scalar(ethiopian_from_jd_array)
+islamic_from_jd = _scalar(islamic_from_jd_array)
+persian_from_jd = _scalar(persian_from_jd_array)
+chinese_from_jd = _scalar(chinese_from_jd_array)
+hindu_from_jd = _scalar(hindu_from_jd_array)
+
+
+# ===== KALENDARZ HEBRAJSKI (arytmetyczny: molad, dechiyot, cykl 19-letni) =====
+#
+# Miesiące numerowane od Nisanu: 1 nisan … 6 elul, 7 tishri … 12 adar (adar I
+# w roku przestępnym), 13 adar II. Rok liczony od 1 Tishri, więc 14 nisan 3790
+# leży wiosną w roku, który zaczął się jesienią poprzedniego roku cywilnego.
+# Miesiąc 13 (adar II) istnieje tylko w roku przestępnym: jd_from_hebrew
+# rzuca wtedy ValueError, a kernel wektorowy (bez wyjątków) przelewa go na
+# nisan – konwertuj_batch oznacza taki wiersz jako błędny (BATCH_INVALID_DATE).
+#
+# Wszystko jest liczone na numerach dni N (kernel zwraca N + 0.5, jak pozostałe).
+# Początek roku wymaga molad z trzech kolejnych lat, więc wyniki trzymamy
+# w cache: skalarnie lru_cache, wektorowo tablica początków lat dociągana
+# tylko o brakujące lata.
+
+_HEBREW_EPOCH_N = 347998          # N dla dnia 1 Tishri roku 1 bez dechiyot
+_HEBREW_MEAN_YEAR = 35975351 / 98496  # średni rok (235 miesięcy / 19 lat)
+_HEBREW_CACHE_YEARS = (-20000, 20000)  # zakres lat trzymany w tablicy
+
+
+def _hebrew_elapsed_days(year):
+    """Dni od epoki do molad Tishri roku `year` (+ dechiya lo ADU rosh)."""
+    months = (235 * year - 234) // 19
+    parts = 12084 + 13753 * months
+    days = 29 * months + parts // 25920
+    return days + ((3 * (days + 1)) % 7 < 3)
+
+
+def _hebrew_new_year_array(year) -> np.ndarray:
+    """N dnia 1 Tishri dla tablicy lat (dechiyot z sąsiednich lat)."""
+    year = np.asarray(year, dtype=np.int64)
+    prev, cur, nxt = (_hebrew_elapsed_days(year + k) for k in (-1, 0, 1))
+    delay = np.where(nxt - cur == 356, 2, np.where(cur - prev == 382, 1, 0))
+    return _HEBREW_EPOCH_N + cur + delay
+
+
+@lru_cache(maxsize=8192)
+def hebrew_year_bounds(year: int) -> Tuple[int, int]:
+    """(N dnia 1 Tishri, długość roku w dniach) – skalarnie, z pamięcią."""
+    start, end = _hebrew_new_year_array([year, year + 1]).tolist()
+    return start, end - start
+
+
+class _HebrewYearCache:
+    """Tablica N początków lat hebrajskich, rozszerzana o brakujące lata.
+
+    Para (pierwszy rok, początki) jest publikowana jednym przypisaniem, a jej
+    rozszerzanie idzie pod blokadą – współbieżne żądania API widzą zawsze
+    spójną parę.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._table = (1, _hebrew_new_year_array(np.arange(1, 6002)))
+
+    def span(self, lo: int, hi: int) -> Tuple[int, np.ndarray]:
+        """(pierwszy rok, początki) obejmujące lata lo…hi + 1 (każdy rok liczony raz)."""
+        first, starts = self._table
+        if lo >= first and hi + 1 <= first + len(starts) - 1:
+            return first, starts
+        with self._lock:
+            first, starts = self._table
+            last = first + len(starts) - 1
+            if lo < first:
+                starts = np.concatenate([_hebrew_new_year_array(np.arange(lo, first)), starts])
+                first = lo
+            if hi + 1 > last:
+                starts = np.concatenate([starts, _hebrew_new_year_array(np.arange(last + 1, hi + 2))])
+            self._table = (first, starts)
+        return first, starts
+
+    def bounds(self, year: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """(N 1 Tishri, długość roku) dla tablicy lat."""
+        first, starts = self._table
+        if year.size:
+            lo, hi = int(year.min()), int(year.max())
+            if lo < _HEBREW_CACHE_YEARS[0] or hi > _HEBREW_CACHE_YEARS[1]:
+                # lata spoza rozsądnego zakresu (lub śmieci z NaN) – bez cache
+                start = _hebrew_new_year_array(year)
+                return start, _hebrew_new_year_array(year + 1) - start
+            first, starts = self.span(lo, hi)
+        i = year - first
+        start = starts[i]
+        return start, starts[i + 1] - start
+
+
+_HEBREW_YEARS = _HebrewYearCache()
+
+# Długości lat: 353/354/355 (zwykły: braki/regularny/pełny), 383/384/385 (przestępny).
+_HEBREW_YEAR_LENGTHS = (353, 354, 355, 383, 384, 385)
+
+
+def _hebrew_year_type(length):
+    """Długość roku -> indeks 0…5 w _HEBREW_YEAR_LENGTHS."""
+    return (length - 353) - 27 * (length >= 383)
+
+
+def _hebrew_month_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """Offsety miesięcy od 1 Tishri [typ roku, miesiąc] i mapa dzień roku -> miesiąc."""
+    offsets = np.zeros((6, 14), dtype=np.int64)
+    doy_month = np.zeros((6, 385), dtype=np.int64)
+    for t, length in enumerate(_HEBREW_YEAR_LENGTHS):
+        leap = length > 355
+        lengths = {1: 30, 2: 29, 3: 30, 4: 29, 5: 30, 6: 29, 7: 30,
+                   8: 30 if length % 10 == 5 else 29,
+                   9: 29 if length % 10 == 3 else 30,
+                   10: 29, 11: 30, 12: 30 if leap else 29, 13: 29}
+        order = [7, 8, 9, 10, 11, 12] + ([13] if leap else []) + [1, 2, 3, 4, 5, 6]
+        pos = 0
+        for month in order:
+            offsets[t, month] = pos
+            doy_month[t, pos:pos + lengths[month]] = month
+            pos += lengths[month]
+        if not leap:
+            offsets[t, 13] = offsets[t, 1]
+    return offsets, doy_month
+
+
+_HEBREW_MONTH_OFFSETS, _HEBREW_DOY_MONTH = _hebrew_month_tables()
+
+
+def jd_from_hebrew(year: int, month: int, day: int) -> float:
+    start, length = hebrew_year_bounds(year)
+    if month == 13 and length < 383:
+        raise ValueError(f"Rok hebrajski {year} jest zwykły – nie ma miesiąca 13 (adar II)")
+    return start + int(_HEBREW_MONTH_OFFSETS[_hebrew_year_type(length), month]) + day - 0.5
+
+
+def jd_from_hebrew_array(year, month, day) -> np.ndarray:
+    year, month, day = np.broadcast_arrays(*(np.asarray(a, dtype=np.int64) for a in (year, month, day)))
+    start, length = _HEBREW_YEARS.bounds(year)
+    return start + _HEBREW_MONTH_OFFSETS[_hebrew_year_type(length), month] + day - 0.5
+
+
+def hebrew_from_jd_array(jd):
+    n, frac = _split_day_number(jd)
+    # przybliżenie średnim rokiem, potem korekta ±1 na prawdziwych początkach
+    year = np.floor((n - _HEBREW_EPOCH_N) / _HEBREW_MEAN_YEAR).astype(np.int64) + 1
+    start, length = _HEBREW_YEARS.bounds(year)
+    year = year - (start > n) + (start + length <= n)
+    start, length = _HEBREW_YEARS.bounds(year)
+    doy = n - start
+    kind = _hebrew_year_type(length)
+    month = _HEBREW_DOY_MONTH[kind, np.clip(doy, 0, 384)]  # clip: NaN/śmieci nie wywracają indeksu
+    return year, month, doy - _HEBREW_MONTH_OFFSETS[kind, month] + 1 + frac
+
+
+hebrew_from_jd = _scalar(hebrew_from_jd_array)
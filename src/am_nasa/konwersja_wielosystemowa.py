@@ -1,14 +1,52 @@
-import math
-from .am_core import jd_from_am, am_from_jd
+from typing import Dict
+
+import numpy as np
+
+from .am_core import AM_EPOCH_JD, JulianDay, jd_from_am, am_from_jd
+from .rejestr_kalendarzy import CalendarSystem, get_calendar, register_calendar
+from .tablice_kalendarzy import table_kernels
+from .kalendarz_chinski import (
+    chinese_astro_from_jd,
+    chinese_astro_from_jd_array,
+    jd_from_chinese_astro,
+    jd_from_chinese_astro_array,
+)
+from .kalendarz_hinduski import (
+    hindu_solar_from_jd,
+    hindu_solar_from_jd_array,
+    jd_from_hindu_solar,
+    jd_from_hindu_solar_array,
+)
+from .kalendarz_majow import (
+    HAAB_MONTHS,
+    haab_count_from_jd,
+    haab_count_from_jd_array,
+    jd_from_haab_count,
+    jd_from_haab_count_array,
+)
 from .kalendarze_lunisolarne import (
     jd_from_islamic,
-    jd_from_persian,
-    jd_from_chinese,
-    jd_from_hindu,
     jd_from_coptic,
     jd_from_ethiopian,
     jd_from_french_rev,
-    jd_from_maya,
+    jd_from_hebrew,
+    jd_from_islamic_array,
+    jd_from_coptic_array,
+    jd_from_ethiopian_array,
+    jd_from_french_rev_array,
+    jd_from_hebrew_array,
+    _scalar,
+    _split_day_number,
+    islamic_from_jd,
+    coptic_from_jd,
+    ethiopian_from_jd,
+    french_rev_from_jd,
+    hebrew_from_jd,
+    islamic_from_jd_array,
+    coptic_from_jd_array,
+    ethiopian_from_jd_array,
+    french_rev_from_jd_array,
+    hebrew_from_jd_array,
 )
 
 
@@ -28,7 +66,292 @@ def jd_from_gregorian(year: int, month: int, day: int) -> float:
     return jd + 0.5
 
 
-def konwertuj(data: dict) -> dict:
+def jd_from_julian_array(year, month, day) -> np.ndarray:
+    """Wektorowa wersja jd_from_julian (int64, `//` = floor jak w Pythonie)."""
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    return (day + ((153 * m + 2) // 5) + 365 * y + y // 4 - 32083) + 0.5
+
+
+def jd_from_gregorian_array(year, month, day) -> np.ndarray:
+    """Wektorowa wersja jd_from_gregorian."""
+    year, month, day = (np.asarray(a, dtype=np.int64) for a in (year, month, day))
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    jd = day + ((153 * m + 2) // 5) + 365 * y + y // 4 - y // 100 + y // 400 - 32045
+    return jd + 0.5
+
+
+def julian_from_jd_array(jd):
+    """
+    JD -> (rok, miesiąc, dzień z ułamkiem) w proleptycznym kalendarzu juliańskim.
+
+    Odwrotność jd_from_julian (ta sama konwencja: kernel daje JDN + 0.5).
+    Dzielenie `//` na int64 = floor, więc działa też dla lat ujemnych.
+    """
+    n, frac = _split_day_number(jd)
+    c = n + 32082
+    d = (4 * c + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = d - 4800 + m // 10
+    return year, month, day + frac
+
+
+def gregorian_from_jd_array(jd):
+    """
+    JD -> (rok, miesiąc, dzień z ułamkiem) w proleptycznym kalendarzu gregoriańskim.
+
+    Fliegel–Van Flandern na floor-division – poprawne także przed rokiem 1 i -4713.
+    """
+    n, frac = _split_day_number(jd)
+    a = n + 32044
+    b = (4 * a + 3) // 146097
+    c = a - (146097 * b) // 4
+    d = (4 * c + 3) // 1461
+    e = c - (1461 * d) // 4
+    m = (5 * e + 2) // 153
+    day = e - (153 * m + 2) // 5 + 1
+    month = m + 3 - 12 * (m // 10)
+    year = 100 * b + d - 4800 + m // 10
+    return year, month, day + frac
+
+
+julian_from_jd = _scalar(julian_from_jd_array)
+gregorian_from_jd = _scalar(gregorian_from_jd_array)
+
+
+# AUC (Ab Urbe Condita): rok AUC − 753 = rok astronomiczny kalendarza juliańskiego
+AUC_OFFSET = 753
+
+
+def jd_from_auc(year: int, month: int, day: int) -> float:
+    return jd_from_julian(year - AUC_OFFSET, month, day)
+
+
+def jd_from_auc_array(year, month, day) -> np.ndarray:
+    return jd_from_julian_array(np.asarray(year, dtype=np.int64) - AUC_OFFSET, month, day)
+
+
+def auc_from_jd_array(jd):
+    year, month, day = julian_from_jd_array(jd)
+    return year + AUC_OFFSET, month, day
+
+
+auc_from_jd = _scalar(auc_from_jd_array)
+
+
+def _jd_from_am_date(_year, _month, day):
+    """AM jako „kalendarz” dla rejestru: dzień jest ciągłym AM-day."""
+    return jd_from_am(day)
+
+
+def _jd_from_am_date_array(_year, _month, day) -> np.ndarray:
+    return np.asarray(day, dtype=np.float64) + AM_EPOCH_JD
+
+
+# ===== NAZWY MIESIĘCY (parser dat tekstowych w API/UI) =====
+
+MONTHS_GREGORIAN: Dict[str, int] = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "sept": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+MONTHS_HEBREW: Dict[str, int] = {
+    "nisan": 1,
+    "nissan": 1,
+    "iyyar": 2,
+    "iyar": 2,
+    "sivan": 3,
+    "tammuz": 4,
+    "av": 5,
+    "elul": 6,
+    "tishri": 7,
+    "tishrei": 7,
+    "cheshvan": 8,
+    "marcheshvan": 8,
+    "kislev": 9,
+    "tevet": 10,
+    "shevat": 11,
+    "adar": 12,
+    "adar1": 12,
+    "adar i": 12,
+    "adar2": 13,
+    "adar ii": 13,
+}
+
+MONTHS_ISLAMIC: Dict[str, int] = {
+    "muharram": 1,
+    "safar": 2,
+    "rabi al-awwal": 3,
+    "rabi al awwal": 3,
+    "rabi i": 3,
+    "rabi al-thani": 4,
+    "rabi al thani": 4,
+    "rabi ii": 4,
+    "jumada al-awwal": 5,
+    "jumada al awwal": 5,
+    "jumada i": 5,
+    "jumada al-thani": 6,
+    "jumada al thani": 6,
+    "jumada ii": 6,
+    "rajab": 7,
+    "shaban": 8,
+    "sha'ban": 8,
+    "ramadan": 9,
+    "shawwal": 10,
+    "dhu al-qadah": 11,
+    "dhu al hijjah": 12,
+    "dhu al-hijjah": 12,
+}
+
+MONTHS_PERSIAN: Dict[str, int] = {
+    "farvardin": 1,
+    "ordibehesht": 2,
+    "khordad": 3,
+    "tir": 4,
+    "mordad": 5,
+    "shahrivar": 6,
+    "mehr": 7,
+    "aban": 8,
+    "azar": 9,
+    "dey": 10,
+    "bahman": 11,
+    "esfand": 12,
+}
+
+MONTHS_FRENCH_REV: Dict[str, int] = {
+    "vendemiaire": 1,
+    "brumaire": 2,
+    "frimaire": 3,
+    "nivose": 4,
+    "pluviose": 5,
+    "ventose": 6,
+    "germinal": 7,
+    "floreal": 8,
+    "prairial": 9,
+    "messidor": 10,
+    "thermidor": 11,
+    "fructidor": 12,
+}
+
+MONTHS_COPTIC: Dict[str, int] = {
+    "thout": 1,
+    "paopi": 2,
+    "hathor": 3,
+    "koiak": 4,
+    "tobi": 5,
+    "meshir": 6,
+    "pamenot": 7,
+    "parmouti": 8,
+    "pashons": 9,
+    "paoni": 10,
+    "epip": 11,
+    "mesori": 12,
+    "nasie": 13,
+}
+
+MONTHS_ETHIOPIAN: Dict[str, int] = {
+    "meskerem": 1,
+    "tikimt": 2,
+    "hidar": 3,
+    "tahsas": 4,
+    "tir": 5,
+    "yekatit": 6,
+    "megabit": 7,
+    "miyazya": 8,
+    "genbot": 9,
+    "sene": 10,
+    "hamle": 11,
+    "nehase": 12,
+    "pagume": 13,
+}
+
+
+# Haab': miesiące od 0 (Pop) do 18 (Uayeb) – jak w zapisie „8 cumku”
+MONTHS_HAAB: Dict[str, int] = {name: i for i, name in enumerate(HAAB_MONTHS)}
+
+
+# ===== REJESTRACJA SYSTEMÓW WBUDOWANYCH =====
+# Kalendarze arytmetyczne – kernele zamknięte, poza perskim: jego 2820-letni
+# cykl jest wolniejszy niż lookup w prekomputowanej tablicy lat
+# (tablice_kalendarzy), więc perski idzie przez tablicę (arytmetyka jako
+# fallback poza zakresem). Gregoriański, juliański, koptyjski, etiopski,
+# republikański i islamski liczą się szybciej wprost niż przez tablicę.
+# Chiński: tablica miesięcy z nowiów/zhongqi JPL (kalendarz_chinski).
+# Hinduski (słoneczny): tablica sankranti z JPL (kalendarz_hinduski).
+# Maya: rachuba lat Haab' (kalendarz_majow, korelacja GMT).
+
+for _system in (
+    CalendarSystem("gregorian", jd_from_gregorian, jd_from_gregorian_array,
+                   gregorian_from_jd, gregorian_from_jd_array,
+                   month_names=MONTHS_GREGORIAN),
+    CalendarSystem("julian", jd_from_julian, jd_from_julian_array,
+                   julian_from_jd, julian_from_jd_array,
+                   month_names=MONTHS_GREGORIAN),
+    CalendarSystem("auc", jd_from_auc, jd_from_auc_array,
+                   auc_from_jd, auc_from_jd_array,
+                   label="auc (Ab Urbe Condita)", month_names=MONTHS_GREGORIAN),
+    CalendarSystem("am", _jd_from_am_date, _jd_from_am_date_array,
+                   label="am (Anno Mundi)", whole_days=False),
+    CalendarSystem("hebrew", jd_from_hebrew, jd_from_hebrew_array,
+                   hebrew_from_jd, hebrew_from_jd_array,
+                   month_names=MONTHS_HEBREW, month_range=(1, 13), day_range=(1, 30)),
+    CalendarSystem("islamic", jd_from_islamic, jd_from_islamic_array,
+                   islamic_from_jd, islamic_from_jd_array,
+                   month_names=MONTHS_ISLAMIC, day_range=(1, 30)),
+    CalendarSystem("persian", *table_kernels("persian"),
+                   month_names=MONTHS_PERSIAN),
+    CalendarSystem("french_rev", jd_from_french_rev, jd_from_french_rev_array,
+                   french_rev_from_jd, french_rev_from_jd_array,
+                   month_names=MONTHS_FRENCH_REV, month_range=(1, 13), day_range=(1, 30)),
+    CalendarSystem("coptic", jd_from_coptic, jd_from_coptic_array,
+                   coptic_from_jd, coptic_from_jd_array,
+                   month_names=MONTHS_COPTIC, month_range=(1, 13), day_range=(1, 30)),
+    CalendarSystem("ethiopian", jd_from_ethiopian, jd_from_ethiopian_array,
+                   ethiopian_from_jd, ethiopian_from_jd_array,
+                   month_names=MONTHS_ETHIOPIAN, month_range=(1, 13), day_range=(1, 30)),
+    CalendarSystem("chinese", jd_from_chinese_astro, jd_from_chinese_astro_array,
+                   chinese_astro_from_jd, chinese_astro_from_jd_array,
+                   month_range=(1, 13), day_range=(1, 30)),
+    CalendarSystem("hindu", jd_from_hindu_solar, jd_from_hindu_solar_array,
+                   hindu_solar_from_jd, hindu_solar_from_jd_array,
+                   day_range=(1, 32)),
+    CalendarSystem("maya", jd_from_haab_count, jd_from_haab_count_array,
+                   haab_count_from_jd, haab_count_from_jd_array,
+                   month_names=MONTHS_HAAB, month_range=(0, 18), day_range=(0, 19)),
+):
+    register_calendar(_system)
+
+
+def konwertuj(data: dict, precise: bool = False) -> dict:
     """
     Centralna funkcja: system + rok/miesiąc/dzień -> JD, AM.
 
@@ -38,39 +361,162 @@ def konwertuj(data: dict) -> dict:
         "month": int,
         "day": int lub float (dla AM: AM-day),
     }
+
+    System jest szukany w rejestrze (rejestr_kalendarzy) – nowy kalendarz
+    wystarczy zarejestrować, bez zmian w tej funkcji.
+
+    Ułamek dnia (np. czas UT doklejony do `day`) jest zachowany w JD –
+    zmiana zachowania: wcześniej dzień był obcinany przez int(day), więc
+    {"day": 9.25} dawał JD północy. `day` może być też napisem ("9", "9.25").
+    precise=True zwraca JD i AM jako JulianDay (dzień + ułamek osobno),
+    bez utraty precyzji na dodawaniu ułamka do JD≈2.4e6.
     """
-    system = data["system"].lower()
+    cal = get_calendar(data["system"])
     year = int(data["year"])
     month = int(data["month"])
     day = data["day"]
 
-    if system == "gregorian":
-        jd = jd_from_gregorian(year, month, int(day))
-    elif system == "julian":
-        jd = jd_from_julian(year, month, int(day))
-    elif system == "islamic":
-        jd = jd_from_islamic(year, month, int(day))
-    elif system == "persian":
-        jd = jd_from_persian(year, month, int(day))
-    elif system == "chinese":
-        jd = jd_from_chinese(year, month, int(day))
-    elif system == "hindu":
-        jd = jd_from_hindu(year, month, int(day))
-    elif system == "coptic":
-        jd = jd_from_coptic(year, month, int(day))
-    elif system == "ethiopian":
-        jd = jd_from_ethiopian(year, month, int(day))
-    elif system == "french_rev":
-        jd = jd_from_french_rev(year, month, int(day))
-    elif system == "maya":
-        jd = jd_from_maya(year, month, int(day))
-    elif system == "am":
-        jd = jd_from_am(float(day), year)
+    if not cal.whole_days:
+        if not precise:
+            day = float(day)
+        elif not isinstance(day, JulianDay):
+            day = JulianDay.from_float(float(day))
+        jd = cal.to_jd(year, month, day)
+        return {
+            "JD": jd,
+            "AM": am_from_jd(jd, year),
+        }
+
+    if isinstance(day, JulianDay):
+        day_int, day_frac = day.day, day.frac
+    else:
+        day = float(day)
+        day_int = int(day)
+        day_frac = day - day_int
+    jd = cal.to_jd(year, month, day_int)
+
+    if precise:
+        jd = JulianDay.from_float(jd) + day_frac
     else:
-        raise ValueError(f"Nieznany system kalendarzowy: {system}")
+        jd = jd + day_frac
 
     am_day = am_from_jd(jd, year)
     return {
         "JD": jd,
         "AM": am_day,
     }
+
+
+def kalendarz_z_jd(system: str, jd: float) -> dict:
+    """
+    Odwrotność konwertuj: JD -> {"system", "year", "month", "day"} (dzień z ułamkiem).
+    """
+    cal = get_calendar(system)
+    if cal.from_jd is None:
+        raise ValueError(f"System {cal.name!r} nie ma konwersji odwrotnej JD -> data")
+    year, month, day = cal.from_jd(float(jd))
+    return {
+        "system": cal.name,
+        "year": year,
+        "month": month,
+        "day": day,
+    }
+
+
+def kalendarz_z_jd_batch(system: str, jd) -> Dict[str, np.ndarray]:
+    """
+    Wektorowa odwrotność dla jednego systemu: tablica JD -> tablice year/month/day.
+
+    Bez pętli Pythona – miliony JD renderowane jednym wywołaniem kernela.
+    """
+    cal = get_calendar(system)
+    if cal.from_jd_array is None:
+        raise ValueError(f"System {cal.name!r} nie ma konwersji odwrotnej JD -> data")
+    year, month, day = cal.from_jd_array(jd)
+    return {
+        "year": year,
+        "month": month,
+        "day": day,
+    }
+
+
+# ===== KONWERSJA WSADOWA (kolumnowa) =====
+
+# Kody błędów per wiersz w konwertuj_batch
+BATCH_OK = 0
+BATCH_UNKNOWN_SYSTEM = 1
+BATCH_INVALID_DATE = 2
+
+
+def konwertuj_batch(system, year, month, day) -> Dict[str, np.ndarray]:
+    """
+    Wsadowa wersja konwertuj: równoległe tablice (system, rok, miesiąc, dzień) -> JD, AM.
+
+    `system` może być jednym napisem albo tablicą napisów (różne systemy w jednym
+    wsadzie). Wiersze są grupowane po systemie, każda grupa idzie jednym wywołaniem
+    kernela wektorowego z rejestru, a wyniki wracają w kolejności wejścia.
+
+    Dzień może mieć ułamek (czas UT). Błędne wiersze nie rzucają wyjątku – dostają
+    JD/AM = NaN i kod w tablicy "error" (BATCH_UNKNOWN_SYSTEM / BATCH_INVALID_DATE).
+    Poza zakresami z rejestru dzień jest sprawdzany z długością miesiąca w danym
+    roku: data musi wrócić bez zmian przez kernel odwrotny (from_jd_array).
+
+    Zwraca: {"JD": float64, "AM": float64, "error": int8} w kształcie wejścia.
+    """
+    year = np.asarray(year, dtype=np.float64)
+    month = np.asarray(month, dtype=np.float64)
+    day = np.asarray(day, dtype=np.float64)
+    year, month, day = np.broadcast_arrays(year, month, day)
+    system = np.broadcast_to(np.char.lower(np.asarray(system, dtype=str)), year.shape)
+
+    shape, n = year.shape, year.size
+    year, month, day, system = year.ravel(), month.ravel(), day.ravel(), system.ravel()
+    jd = np.full(n, np.nan)
+    error = np.full(n, BATCH_UNKNOWN_SYSTEM, dtype=np.int8)
+
+    # grupowanie: jedno sortowanie zamiast maski per system
+    names, codes = np.unique(system, return_inverse=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+
+    for k, name in enumerate(names):
+        try:
+            cal = get_calendar(str(name))
+        except ValueError:
+            continue
+        rows = order[bounds[k]:bounds[k + 1]]
+        y, m, d = year[rows], month[rows], day[rows]
+
+        if not cal.whole_days:
+            ok = np.isfinite(d)
+            error[rows] = np.where(ok, BATCH_OK, BATCH_INVALID_DATE)
+            jd[rows[ok]] = cal.to_jd_array(y[ok], m[ok], d[ok])
+            continue
+
+        (m_lo, m_hi), (d_lo, d_hi) = cal.month_range, cal.day_range
+        with np.errstate(invalid="ignore"):
+            d_int = np.trunc(d)
+            ok = (
+                np.isfinite(y) & np.isfinite(m) & np.isfinite(d)
+                & (y == np.trunc(y)) & (m == np.trunc(m))
+                & (m >= m_lo) & (m <= m_hi) & (d_int >= d_lo) & (d_int <= d_hi)
+            )
+            if cal.year_range is not None:
+                ok &= (y >= cal.year_range[0]) & (y <= cal.year_range[1])
+        day_jd = cal.to_jd_array(y[ok], m[ok], d_int[ok])
+        if cal.from_jd_array is not None:
+            # długość miesiąca w danym roku: dzień spoza miesiąca (30 Pagume,
+            # Adar II w roku zwykłym, 5 Uayeb) wraca z kernela odwrotnego jako inna data
+            back_y, back_m, back_d = cal.from_jd_array(day_jd)
+            same = (back_y == y[ok]) & (back_m == m[ok]) & (np.floor(np.asarray(back_d) + 1e-9) == d_int[ok])
+            ok[ok] = same
+            day_jd = day_jd[same]
+        error[rows] = np.where(ok, BATCH_OK, BATCH_INVALID_DATE)
+        jd[rows[ok]] = day_jd + (d[ok] - d_int[ok])
+
+    jd = jd.reshape(shape)
+    return {
+        "JD": jd,
+        "AM": jd - AM_EPOCH_JD,
+        "error": error.reshape(shape),
+    }
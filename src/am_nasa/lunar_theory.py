@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+# lunar_theory.py — pełna teoria Księżyca Meeusa (rozdz. 47, skrót ELP-2000/82).
+#
+# Tablice 47.A (długość Σl i odległość Σr) i 47.B (szerokość Σb) trzymamy jako
+# tablice NumPy: wiersz = wyraz, kolumny = mnożniki D, M, M′, F + współczynnik.
+# Wszystkie 120 argumentów liczymy jednym iloczynem macierzy
+# [mnożniki] @ [D, M, M′, F], a sumy Σl, Σr, Σb – drugim: [wagi] @ [sin; cos].
+# Wyrazy z M mnożymy przez E^|M| (malejąca mimośrodowość orbity Ziemi).
+#
+# Wynik: geometryczna długość i szerokość względem średniej ekliptyki
+# i równonocy daty + odległość środków Ziemia–Księżyc. Dokładność wg Meeusa
+# ~10″ w długości i ~4″ w szerokości; błąd względem DE – tests/test_lunar_theory.py.
+# Argumenty podstawowe są te same co w planetary_positions (jeden zestaw na wsad).
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from .planetary_positions import fundamental_arguments_array
+
+MOON_MEAN_DISTANCE_KM = 385000.56
+
+# Tablica 47.A: D, M, M′, F, Σl [1e-6 deg], Σr [1e-3 km]
+MOON_LR_TERMS = np.array([
+    [0, 0, 1, 0, 6288774, -20905355],
+    [2, 0, -1, 0, 1274027, -3699111],
+    [2, 0, 0, 0, 658314, -2955968],
+    [0, 0, 2, 0, 213618, -569925],
+    [0, 1, 0, 0, -185116, 48888],
+    [0, 0, 0, 2, -114332, -3149],
+    [2, 0, -2, 0, 58793, 246158],
+    [2, -1, -1, 0, 57066, -152138],
+    [2, 0, 1, 0, 53322, -170733],
+    [2, -1, 0, 0, 45758, -204586],
+    [0, 1, -1, 0, -40923, -129620],
+    [1, 0, 0, 0, -34720, 108743],
+    [0, 1, 1, 0, -30383, 104755],
+    [2, 0, 0, -2, 15327, 10321],
+    [0, 0, 1, 2, -12528, 0],
+    [0, 0, 1, -2, 10980, 79661],
+    [4, 0, -1, 0, 10675, -34782],
+    [0, 0, 3, 0, 10034, -23210],
+    [4, 0, -2, 0, 8548, -21636],
+    [2, 1, -1, 0, -7888, 24208],
+    [2, 1, 0, 0, -6766, 30824],
+    [1, 0, -1, 0, -5163, -8379],
+    [1, 1, 0, 0, 4987, -16675],
+    [2, -1, 1, 0, 4036, -12831],
+    [2, 0, 2, 0, 3994, -10445],
+    [4, 0, 0, 0, 3861, -11650],
+    [2, 0, -3, 0, 3665, 14403],
+    [0, 1, -2, 0, -2689, -7003],
+    [2, 0, -1, 2, -2602, 0],
+    [2, -1, -2, 0, 2390, 10056],
+    [1, 0, 1, 0, -2348, 6322],
+    [2, -2, 0, 0, 2236, -9884],
+    [0, 1, 2, 0, -2120, 5751],
+    [0, 2, 0, 0, -2069, 0],
+    [2, -2, -1, 0, 2048, -4950],
+    [2, 0, 1, -2, -1773, 4130],
+    [2, 0, 0, 2, -1595, 0],
+    [4, -1, -1, 0, 1215, -3958],
+    [0, 0, 2, 2, -1110, 0],
+    [3, 0, -1, 0, -892, 3258],
+    [2, 1, 1, 0, -810, 2616],
+    [4, -1, -2, 0, 759, -1897],
+    [0, 2, -1, 0, -713, -2117],
+    [2, 2, -1, 0, -700, 2354],
+    [2, 1, -2, 0, 691, 0],
+    [2, -1, 0, -2, 596, 0],
+    [4, 0, 1, 0, 549, -1423],
+    [0, 0, 4, 0, 537, -1117],
+    [4, -1, 0, 0, 520, -1571],
+    [1, 0, -2, 0, -487, -1739],
+    [2, 1, 0, -2, -399, 0],
+    [0, 0, 2, -2, -381, -4421],
+    [1, 1, 1, 0, 351, 0],
+    [3, 0, -2, 0, -340, 0],
+    [4, 0, -3, 0, 330, 0],
+    [2, -1, 2, 0, 327, 0],
+    [0, 2, 1, 0, -323, 1165],
+    [1, 1, -1, 0, 299, 0],
+    [2, 0, 3, 0, 294, 0],
+    [2, 0, -1, -2, 0, 8752],
+], dtype=np.float64)
+
+# Tablica 47.B: D, M, M′, F, Σb [1e-6 deg]
+MOON_B_TERMS = np.array([
+    [0, 0, 0, 1, 5128122],
+    [0, 0, 1, 1, 280602],
+    [0, 0, 1, -1, 277693],
+    [2, 0, 0, -1, 173237],
+    [2, 0, -1, 1, 55413],
+    [2, 0, -1, -1, 46271],
+    [2, 0, 0, 1, 32573],
+    [0, 0, 2, 1, 17198],
+    [2, 0, 1, -1, 9266],
+    [0, 0, 2, -1, 8822],
+    [2, -1, 0, -1, 8216],
+    [2, 0, -2, -1, 4324],
+    [2, 0, 1, 1, 4200],
+    [2, 1, 0, -1, -3359],
+    [2, -1, -1, 1, 2463],
+    [2, -1, 0, 1, 2211],
+    [2, -1, -1, -1, 2065],
+    [0, 1, -1, -1, -1870],
+    [4, 0, -1, -1, 1828],
+    [0, 1, 0, 1, -1794],
+    [0, 0, 0, 3, -1749],
+    [0, 1, -1, 1, -1565],
+    [1, 0, 0, 1, -1491],
+    [0, 1, 1, 1, -1475],
+    [0, 1, 1, -1, -1410],
+    [0, 1, 0, -1, -1344],
+    [1, 0, 0, -1, -1335],
+    [0, 0, 3, 1, 1107],
+    [4, 0, 0, -1, 1021],
+    [4, 0, -1, 1, 833],
+    [0, 0, 1, -3, 777],
+    [4, 0, -2, 1, 671],
+    [2, 0, 0, -3, 607],
+    [2, 0, 2, -1, 596],
+    [2, -1, 1, -1, 491],
+    [2, 0, -2, 1, -451],
+    [0, 0, 3, -1, 439],
+    [2, 0, 2, 1, 422],
+    [2, 0, -3, -1, 421],
+    [2, 1, -1, 1, -366],
+    [2, 1, 0, 1, -351],
+    [4, 0, 0, 1, 331],
+    [2, -1, 1, 1, 315],
+    [2, -2, 0, -1, 302],
+    [0, 0, 1, 3, -283],
+    [2, 1, 1, -1, -229],
+    [1, 1, 0, -1, 223],
+    [1, 1, 0, 1, 223],
+    [0, 1, -2, -1, -220],
+    [2, 1, -1, -1, -220],
+    [1, 0, 1, 1, -185],
+    [2, -1, -2, -1, 181],
+    [0, 1, 2, 1, -177],
+    [4, 0, -2, -1, 176],
+    [4, -1, -1, -1, 166],
+    [1, 0, 1, -1, -164],
+    [4, 0, 1, -1, 132],
+    [1, 0, -1, -1, -119],
+    [4, -1, 0, -1, 115],
+    [2, -2, 0, 1, 107],
+], dtype=np.float64)
+
+# Złożone raz przy imporcie: wszystkie mnożniki w jednej macierzy (120 × 4)
+# i wagi dla bazy [sin(120 argumentów); cos(120 argumentów)], rozbite wg
+# potęgi E: wiersz (p, suma) zbiera tylko wyrazy z |M| = p. Dzięki temu E
+# mnoży 3 wiersze wyniku, a nie całą bazę (240 × n).
+_MULTIPLIERS = np.vstack([MOON_LR_TERMS[:, :4], MOON_B_TERMS[:, :4]])
+_N_LR, _N_ALL = len(MOON_LR_TERMS), len(_MULTIPLIERS)
+_E_POWER = np.abs(_MULTIPLIERS[:, 1]).astype(np.int64)
+_WEIGHTS = np.zeros((3, 3, 2 * _N_ALL))  # (potęga E, Σl/Σr/Σb, baza)
+for _p in range(3):
+    _lr = (_E_POWER[:_N_LR] == _p) * 1.0
+    _b = (_E_POWER[_N_LR:] == _p) * 1.0
+    _WEIGHTS[_p, 0, :_N_LR] = MOON_LR_TERMS[:, 4] * _lr                  # Σl: sin
+    _WEIGHTS[_p, 1, _N_ALL:_N_ALL + _N_LR] = MOON_LR_TERMS[:, 5] * _lr   # Σr: cos
+    _WEIGHTS[_p, 2, _N_LR:_N_ALL] = MOON_B_TERMS[:, 4] * _b              # Σb: sin
+_LON_WEIGHTS = _WEIGHTS[:, 0, :_N_LR].copy()  # sama długość: (potęga E, 60 × sin)
+_WEIGHTS = _WEIGHTS.reshape(9, 2 * _N_ALL)
+
+_TWO_PI = 2.0 * np.pi
+_CHUNK = 8192  # epok na przebieg – baza (240, chunk) mieści się w cache
+
+
+def _periodic_sums(args: Dict[str, np.ndarray], lo: int, hi: int) -> np.ndarray:
+    """(Σl, Σr, Σb) dla epok [lo, hi) spłaszczonego wsadu, kształt (3, hi − lo)."""
+    T = args["T"].ravel()[lo:hi]
+    fundamental = np.stack([args[k].ravel()[lo:hi] for k in ("D", "M", "M_", "F")])
+    # redukcja przed mnożeniem – sin/cos małych kątów są wyraźnie szybsze
+    fundamental = np.radians(fundamental - 360.0 * np.floor(fundamental / 360.0))
+    angles = _MULTIPLIERS @ fundamental
+    angles -= _TWO_PI * np.rint(angles / _TWO_PI)
+    basis = np.empty((2 * _N_ALL, hi - lo))
+    np.sin(angles, out=basis[:_N_ALL])
+    np.cos(angles, out=basis[_N_ALL:])
+    by_power = (_WEIGHTS @ basis).reshape(3, 3, hi - lo)
+    E = 1.0 - 0.002516 * T - 0.0000074 * T * T
+    return by_power[0] + E * (by_power[1] + E * by_power[2])
+
+
+def _longitude_sum(args: Dict[str, np.ndarray], lo: int, hi: int) -> np.ndarray:
+    """Σl dla epok [lo, hi) – tylko 60 sinusów tablicy 47.A."""
+    T = args["T"].ravel()[lo:hi]
+    fundamental = np.stack([args[k].ravel()[lo:hi] for k in ("D", "M", "M_", "F")])
+    fundamental = np.radians(fundamental - 360.0 * np.floor(fundamental / 360.0))
+    angles = _MULTIPLIERS[:_N_LR] @ fundamental
+    angles -= _TWO_PI * np.rint(angles / _TWO_PI)
+    by_power = _LON_WEIGHTS @ np.sin(angles)
+    E = 1.0 - 0.002516 * T - 0.0000074 * T * T
+    return by_power[0] + E * (by_power[1] + E * by_power[2])
+
+
+def moon_longitude_array(jd, args: Optional[Dict[str, np.ndarray]] = None) -> np.ndarray:
+    """Sama długość z moon_position_array [deg] – ~4× taniej (bez Σr i Σb)."""
+    a = fundamental_arguments_array(jd) if args is None else args
+    T = a["T"]
+    sum_l = np.empty(T.size)
+    for lo in range(0, T.size, _CHUNK):
+        sum_l[lo:lo + _CHUNK] = _longitude_sum(a, lo, min(lo + _CHUNK, T.size))
+    sum_l = sum_l.reshape(T.shape)
+    A1 = np.radians(119.75 + 131.849 * T)
+    A2 = np.radians(53.09 + 479264.290 * T)
+    sum_l = sum_l + 3958 * np.sin(A1) + 1962 * np.sin(np.radians(a["L"] - a["F"])) + 318 * np.sin(A2)
+    return (a["L"] + sum_l / 1e6) % 360.0
+
+
+def moon_position_array(jd, args: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """JD (TT) -> słownik tablic: lon, lat [deg, ekliptyka daty], distance_km.
+
+    `args` – gotowe planetary_positions.fundamental_arguments_array(jd).
+    """
+    a = fundamental_arguments_array(jd) if args is None else args
+    T = a["T"]
+    sums = np.empty((3, T.size))
+    for lo in range(0, T.size, _CHUNK):
+        sums[:, lo:lo + _CHUNK] = _periodic_sums(a, lo, min(lo + _CHUNK, T.size))
+    sum_l, sum_r, sum_b = (row.reshape(T.shape) for row in sums)
+
+    L_, M_, F = (np.radians(a[k]) for k in ("L", "M_", "F"))
+    A1 = np.radians(119.75 + 131.849 * T)
+    A2 = np.radians(53.09 + 479264.290 * T)
+    A3 = np.radians(313.45 + 481266.484 * T)
+    sum_l = sum_l + 3958 * np.sin(A1) + 1962 * np.sin(L_ - F) + 318 * np.sin(A2)
+    sum_b = (sum_b - 2235 * np.sin(L_) + 382 * np.sin(A3) + 175 * np.sin(A1 - F)
+             + 175 * np.sin(A1 + F) + 127 * np.sin(L_ - M_) - 115 * np.sin(L_ + M_))
+    return {
+        "lon": (a["L"] + sum_l / 1e6) % 360.0,
+        "lat": sum_b / 1e6,
+        "distance_km": MOON_MEAN_DISTANCE_KM + sum_r / 1000.0,
+    }
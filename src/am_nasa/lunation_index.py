@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+# lunation_index.py — prekomputowany indeks faz Księżyca: wiek, numer lunacji, nazwa fazy.
+#
+# Plik data/lunations/lunation_index.npy (float64, kształt (n, 2), mmap):
+#   [JD (TT) fazy, q = 4·k + faza]  – k numer lunacji (lunations.find_lunations),
+#                                     faza 0 nów, 1 pierwsza kwadra, 2 pełnia, 3 ostatnia kwadra.
+# Budowa: find_lunations na silniku JPL ("jplephem") w pokryciu kerneli
+# z data/ephemeris (scripts/amjd_build_lunation_index.py).
+#
+# Zapytanie to searchsorted po czasach faz – O(log n) – i interpolacja między
+# sąsiednimi fazami: wiek = JD − ostatni nów, elongacja liniowo między
+# kwadrami (90° na przedział). Nazwa: faza główna w ±PHASE_EVENT_WINDOW
+# od zdarzenia, poza nim – przedział między fazami (sierp / garb).
+# JD spoza indeksu: te same wzory na fazach z find_lunations (silnik "meeus")
+# policzonych lokalnie wokół zapytania.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .delta_t import _jd_float, to_tt
+
+LUNATION_INDEX_FILE = Path(__file__).resolve().parent / "data" / "lunations" / "lunation_index.npy"
+
+LUNATION_PHASE_NAMES = (
+    "nów",
+    "wzrastający sierp",
+    "pierwsza kwadra",
+    "wzrastający garb",
+    "pełnia",
+    "malejący garb",
+    "ostatnia kwadra",
+    "malejący sierp",
+)
+PHASE_EVENT_WINDOW = 0.5  # doby – „pełnia” to ±12 h od chwili pełni
+
+_MAX_QUARTER_GAP = 9.0  # doby; kwadry dzieli 6–8.5 doby
+
+
+def build_lunation_index(
+    jd_start: Optional[float] = None,
+    jd_end: Optional[float] = None,
+    engine: str = "jplephem",
+) -> np.ndarray:
+    """Tablica (n, 2) [JD TT, 4·k + faza]; bez zakresu – pokrycie kerneli z indeksu."""
+    from .ephemeris_nasa import get_ephemeris_index
+    from .lunations import find_lunations
+
+    if jd_start is None or jd_end is None:
+        kernels = get_ephemeris_index().kernels
+        if not kernels:
+            raise RuntimeError("Brak kerneli .bsp w data/ephemeris – podaj zakres JD albo dodaj efemerydy")
+        # margines: find_lunations liczy fazę do 2 + 1.5 doby poza zakresem
+        jd_start = min(k.start_jd for k in kernels) + 4.0 if jd_start is None else jd_start
+        jd_end = max(k.end_jd for k in kernels) - 4.0 if jd_end is None else jd_end
+    events = find_lunations(jd_start, jd_end, engine=engine)
+    return np.column_stack([events.JD, 4.0 * events.lunation + events.phase])
+
+
+def save_lunation_index(table: np.ndarray, path: Path = LUNATION_INDEX_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, table)
+    return path
+
+
+class LunationIndex:
+    """Czasy faz (tablica z build_lunation_index) + zapytania searchsorted."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data).reshape(-1, 2)
+        # zaczynamy od nowiu: wiek i numer lunacji znane od pierwszego wiersza
+        first_new = int(np.argmax(data[:, 1] % 4 == 0)) if len(data) else 0
+        self.jd = data[first_new:, 0]
+        self.quarter = data[first_new:, 1].astype(np.int64)
+        self.jd_start = float(self.jd[0]) if len(self.jd) else np.inf
+        self.jd_end = float(self.jd[-1]) if len(self.jd) else -np.inf
+
+    def covers(self, jd) -> np.ndarray:
+        """Czy JD (TT) leży między pierwszym a ostatnim nowiem indeksu."""
+        jd = np.asarray(jd, dtype=np.float64)
+        return (jd >= self.jd_start) & (jd < self.jd_end)
+
+    def lookup(self, jd) -> Dict[str, np.ndarray]:
+        """JD (TT, wewnątrz indeksu) -> lunation, age_days, elongation_deg, phase_index, phase_name."""
+        jd = np.asarray(jd, dtype=np.float64)
+        if not np.all(self.covers(jd)):
+            raise ValueError(f"JD poza indeksem lunacji ({self.jd_start}…{self.jd_end})")
+        i = np.searchsorted(self.jd, jd, side="right") - 1
+        t_prev, t_next = self.jd[i], self.jd[i + 1]
+        q = self.quarter[i]
+        phase = q % 4
+        # ostatni nów: cofamy się o `phase` wierszy (kwadry idą bez przerw)
+        new_moon = self.jd[i - phase]
+        name = np.where(jd - t_prev <= PHASE_EVENT_WINDOW, 2 * phase,
+                        np.where(t_next - jd < PHASE_EVENT_WINDOW, (2 * phase + 2) % 8, 2 * phase + 1))
+        return {
+            "lunation": q // 4,
+            "age_days": jd - new_moon,
+            "elongation_deg": 90.0 * (phase + (jd - t_prev) / (t_next - t_prev)),
+            "phase_index": name,
+            "phase_name": np.take(LUNATION_PHASE_NAMES, name),
+        }
+
+
+@lru_cache(maxsize=1)
+def get_lunation_index(path: Optional[Path] = None) -> LunationIndex:
+    """Indeks z pliku (mmap); bez pliku – pusty (wszystko liczone lokalnie)."""
+    path = Path(path) if path is not None else LUNATION_INDEX_FILE
+    if not path.exists():
+        return LunationIndex(np.empty((0, 2)))
+    return LunationIndex(np.load(path, mmap_mode="r"))
+
+
+def _local_index(jd: np.ndarray) -> LunationIndex:
+    """Fazy z find_lunations (meeus) wokół zapytań spoza indeksu – od nowiu przed nimi."""
+    from .lunations import SYNODIC_MONTH, find_lunations
+
+    start = float(jd.min()) - SYNODIC_MONTH - _MAX_QUARTER_GAP
+    events = find_lunations(start, float(jd.max()) + _MAX_QUARTER_GAP, engine="meeus")
+    return LunationIndex(np.column_stack([events.JD, 4.0 * events.lunation + events.phase]))
+
+
+def lunation_state(jd, scale: str = "TT") -> Dict[str, Any]:
+    """Wiek Księżyca, numer lunacji i nazwa fazy dla JD w skali `scale`.
+
+    Skalar -> słownik skalarów (float / int / str), tablica -> słownik tablic.
+    Klucz "source": "index" (plik JPL) albo "meeus" (poza zakresem indeksu).
+    """
+    jd_tt = _jd_float(to_tt(jd, scale))
+    flat = np.atleast_1d(jd_tt).ravel()
+    index = get_lunation_index()
+    inside = index.covers(flat)
+    state = {
+        "lunation": np.empty(flat.size, dtype=np.int64),
+        "age_days": np.empty(flat.size),
+        "elongation_deg": np.empty(flat.size),
+        "phase_index": np.empty(flat.size, dtype=np.int64),
+    }
+    for mask, from_file in ((inside, True), (~inside, False)):
+        if not np.any(mask):
+            continue
+        part = flat[mask]
+        result = (index if from_file else _local_index(part)).lookup(part)
+        for key in state:
+            state[key][mask] = result[key]
+    state["phase_name"] = np.take(LUNATION_PHASE_NAMES, state["phase_index"])
+    state["source"] = np.where(inside, "index", "meeus")
+    if np.ndim(jd_tt) == 0:
+        return {key: values[0].item() for key, values in state.items()}
+    return {key: values.reshape(jd_tt.shape) for key, values in state.items()}
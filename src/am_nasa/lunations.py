@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+# lunations.py — wyszukiwanie nowiu, kwadr i pełni na całym zakresie JD naraz.
+#
+# Fazę definiuje różnica długości ekliptycznych Księżyca i Słońca
+# (0° nów, 90° pierwsza kwadra, 180° pełnia, 270° ostatnia kwadra), liczona
+# z wektorów dowolnego silnika z ephemeris_nasa. Domyślny "meeus" ma skrót:
+# różnicę długości liczymy wprost w ekliptyce daty (lunar_theory.
+# moon_longitude_array – bez szerokości i odległości – oraz długość Słońca
+# z aberracją); obrót do ICRS nie zmienia różnicy długości.
+#
+#   1. zalążki: średnie fazy (Meeus 49.1), k = numer lunacji od nowiu 2000-01-06,
+#   2. przedziały: zalążek ± BRACKET_DAYS – prawdziwa faza odbiega od średniej
+#      o < 1 dzień, a różnica długości rośnie monotonicznie (10–15°/dobę),
+#      więc każdy przedział ma dokładnie jedną zmianę znaku,
+#   3. zawężanie: sieczna z zabezpieczeniem bisekcją, wszystkie przedziały
+#      jednym wywołaniem silnika na iterację (kilka iteracji do 1e-6 doby).
+#
+# Wynik – zwarta np.recarray (JD, phase, lunation), posortowana po czasie.
+
+from typing import Iterable
+
+import numpy as np
+
+from .delta_t import _check_scale, to_tt, tt_to_ut
+from .ephemeris_meeus import _SUN_ABERRATION_DEG
+from .ephemeris_nasa import _apparent_sun_moon_xyz, _check_engine, _vector_engine
+from .lunar_theory import moon_longitude_array
+from .planetary_positions import fundamental_arguments_array, sun_moon_positions_array
+
+LUNATION_PHASES = ("nów", "pierwsza kwadra", "pełnia", "ostatnia kwadra")
+SYNODIC_MONTH = 29.530588861
+NEW_MOON_EPOCH = 2451550.09766  # średni nów k = 0 (Meeus 49.1), JD TT
+
+BRACKET_DAYS = 1.5
+TOLERANCE_DAYS = 1e-6
+_MAX_ITERATIONS = 30
+
+
+def mean_phase_jd(k) -> np.ndarray:
+    """JD (TT) średniej fazy; k całkowite – nów, k + 0.25 – pierwsza kwadra itd."""
+    k = np.asarray(k, dtype=np.float64)
+    T = k / 1236.85
+    return (NEW_MOON_EPOCH + SYNODIC_MONTH * k + 0.00015437 * T**2
+            - 0.000000150 * T**3 + 0.00000000073 * T**4)
+
+
+def lunar_phase_longitude(jd, engine: str = "meeus") -> np.ndarray:
+    """λ_Księżyca − λ_Słońca [deg, 0…360) – tablica jak `jd`."""
+    from skyfield.framelib import ecliptic_J2000_frame
+
+    _check_engine(engine)
+    jd = np.asarray(jd, dtype=np.float64)
+    if engine == "meeus":
+        args = fundamental_arguments_array(jd)
+        sun = sun_moon_positions_array(jd, args)["sun_lon"] - _SUN_ABERRATION_DEG
+        return (moon_longitude_array(jd, args) - sun) % 360.0
+    if engine == "skyfield":
+        sun, moon = _apparent_sun_moon_xyz(jd.ravel())
+        sun, moon = sun.reshape((3,) + jd.shape), moon.reshape((3,) + jd.shape)
+    else:
+        sun, moon = _vector_engine(engine).sun_moon_xyz(jd)
+    rotation = ecliptic_J2000_frame.rotation_at(None)[:2]
+    sx, sy = np.einsum("ij,j...->i...", rotation, sun)
+    mx, my = np.einsum("ij,j...->i...", rotation, moon)
+    return np.degrees(np.arctan2(sx * my - sy * mx, sx * mx + sy * my)) % 360.0
+
+
+def _offset(jd, target, engine):
+    """Różnica fazy od celu, zawinięta do (−180, 180]."""
+    return (lunar_phase_longitude(jd, engine) - target + 180.0) % 360.0 - 180.0
+
+
+def _refine(seed: np.ndarray, target: np.ndarray, engine: str, tol: float) -> np.ndarray:
+    lo, hi = seed - BRACKET_DAYS, seed + BRACKET_DAYS
+    f = _offset(np.concatenate([lo, hi]), np.concatenate([target, target]), engine)
+    f_lo, f_hi = f[: seed.size], f[seed.size:]
+    if np.any(f_lo >= 0.0) or np.any(f_hi <= 0.0):
+        raise RuntimeError("Faza Księżyca poza przedziałem wokół średniej fazy (błąd silnika?)")
+
+    # stan siecznej dla każdego przedziału; iterujemy tylko niezbieżne
+    x_prev, f_prev, x, fx = lo.copy(), f_lo.copy(), hi.copy(), f_hi.copy()
+    active = np.arange(seed.size)
+    for _ in range(_MAX_ITERATIONS):
+        if active.size == 0:
+            break
+        a_prev, a_fprev, a_x, a_fx = x_prev[active], f_prev[active], x[active], fx[active]
+        a_lo, a_hi = lo[active], hi[active]
+        denominator = a_fx - a_fprev
+        safe = np.where(denominator != 0.0, denominator, 1.0)
+        x_new = np.where(denominator != 0.0, a_x - a_fx * (a_x - a_prev) / safe, a_x)
+        outside = (x_new < a_lo) | (x_new > a_hi)
+        x_new = np.where(outside, 0.5 * (a_lo + a_hi), x_new)
+        f_new = _offset(x_new, target[active], engine)
+        lo[active] = np.where(f_new < 0.0, x_new, a_lo)
+        hi[active] = np.where(f_new >= 0.0, x_new, a_hi)
+        x_prev[active], f_prev[active], x[active], fx[active] = a_x, a_fx, x_new, f_new
+        active = active[(np.abs(x_new - a_x) >= tol) & (f_new != 0.0)]
+    return x
+
+
+def find_lunations(
+    jd_start: float,
+    jd_end: float,
+    engine: str = "meeus",
+    phases: Iterable[int] = (0, 1, 2, 3),
+    scale: str = "TT",
+    tol_days: float = TOLERANCE_DAYS,
+) -> np.recarray:
+    """Wszystkie fazy z `phases` (indeksy LUNATION_PHASES) w [jd_start, jd_end].
+
+    Zakres i wynikowa kolumna JD są w skali `scale`; przy "UT" dochodzi JD_TT.
+    Kolumny: JD, phase (int8, indeks LUNATION_PHASES), lunation (numer k).
+    """
+    _check_engine(engine)
+    _check_scale(scale)
+    phases = np.unique(np.asarray(list(phases), dtype=np.int64))
+    if phases.size == 0 or phases.min() < 0 or phases.max() > 3:
+        raise ValueError(f"Fazy to indeksy 0–3 z LUNATION_PHASES, dostałem {phases.tolist()}")
+    start, end = float(to_tt(float(jd_start), scale)), float(to_tt(float(jd_end), scale))
+    if not start <= end:
+        raise ValueError(f"Pusty zakres JD: {jd_start}…{jd_end}")
+
+    k_first = int(np.floor((start - NEW_MOON_EPOCH) / SYNODIC_MONTH)) - 1
+    k_last = int(np.ceil((end - NEW_MOON_EPOCH) / SYNODIC_MONTH)) + 1
+    k = np.repeat(np.arange(k_first, k_last + 1), phases.size)
+    phase = np.tile(phases, k_last - k_first + 1)
+    seed = mean_phase_jd(k + phase / 4.0)
+    keep = (seed > start - 2.0) & (seed < end + 2.0)
+    k, phase, seed = k[keep], phase[keep], seed[keep]
+
+    jd = _refine(seed, 90.0 * phase, engine, tol_days) if seed.size else seed
+    inside = (jd >= start) & (jd <= end)
+    jd, k, phase = jd[inside], k[inside], phase[inside]
+    order = np.argsort(jd, kind="stable")
+
+    columns = {"JD": jd[order] if scale == "TT" else np.asarray(tt_to_ut(jd[order]), dtype=np.float64)}
+    if scale == "UT":
+        columns["JD_TT"] = jd[order]
+    columns["phase"] = phase[order].astype(np.int8)
+    columns["lunation"] = k[order].astype(np.int32)
+    return np.rec.fromarrays(list(columns.values()), names=list(columns))
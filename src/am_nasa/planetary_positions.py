@@ -1,4 +1,7 @@
 import math
+
+import numpy as np
+
 J2000 = 2451545.0
 T_CENT = 36525.0
 
@@ -26,6 +29,17 @@ def moon_ecliptic_longitude(jd: float) -> float:
     lon -= 0.186*math.sin(math.radians(M))
     return lon % 360
 
+def moon_ecliptic_latitude(jd: float) -> float:
+    T = (jd - J2000) / T_CENT
+    M_ = 134.9633964 + 477198.8675055*T + 0.0087414*T**2
+    D = 297.8501921 + 445267.1114034*T - 0.0018819*T**2
+    F = 93.2720950 + 483202.0175233*T - 0.0036539*T**2
+    lat = 5.128*math.sin(math.radians(F))
+    lat += 0.281*math.sin(math.radians(M_ + F))
+    lat += 0.278*math.sin(math.radians(M_ - F))
+    lat += 0.173*math.sin(math.radians(2*D - F))
+    return lat
+
 def elongacja_slonca_ksiezyca(jd: float) -> float:
     sun = sun_ecliptic_longitude(jd)
     moon = moon_ecliptic_longitude(jd)
@@ -37,3 +51,312 @@ def elongacja_slonca_ksiezyca(jd: float) -> float:
 def jasnosc_ksiezyca(jd: float) -> float:
     elong = elongacja_slonca_ksiezyca(jd)
     return (1 + math.cos(math.radians(elong))) / 2
+
+
+# ===== WERSJE TABLICOWE =====
+# Argumenty podstawowe (Meeus, rozdz. 47) liczone raz na cały wsad – jeden
+# iloczyn macierzy [współczynniki] @ [1, T, T², T³, T⁴] – i wspólne dla
+# Słońca, Księżyca i fazy (faza_ksiezyca). Sinus/cosinus każdego argumentu
+# liczymy raz; wielokrotności i kombinacje (2D − M′, M′ + F, …) z tożsamości
+# trygonometrycznych. Szeregi te same co w wersjach skalarnych.
+
+_ARGUMENT_NAMES = ("L0", "L", "D", "M", "M_", "F")
+_ARGUMENT_COEFS = np.array([
+    [280.46646, 36000.76983, 0.0003032, 0.0, 0.0],
+    [218.3164477, 481267.88123421, -0.0015786, 1/538841, -1/65194000],
+    [297.8501921, 445267.1114034, -0.0018819, 1/545868, -1/113065000],
+    [357.5291092, 35999.0502909, -0.0001536, 1/24490000, 0.0],
+    [134.9633964, 477198.8675055, 0.0087414, 1/69699, -1/14712000],
+    [93.2720950, 483202.0175233, -0.0036539, -1/3526000, 1/863310000],
+])
+
+def fundamental_arguments_array(jd):
+    """JD -> słownik tablic [deg, bez redukcji do 0…360]: T, L0 (Słońce), L (Księżyc), D, M, M_, F."""
+    T = (np.asarray(jd, dtype=np.float64) - J2000) / T_CENT
+    flat = T.ravel()
+    T2 = flat*flat
+    values = _ARGUMENT_COEFS @ np.stack([np.ones_like(flat), flat, T2, T2*flat, T2*T2])
+    args = {"T": T}
+    args.update((name, row.reshape(T.shape)) for name, row in zip(_ARGUMENT_NAMES, values))
+    return args
+
+def _sincos(args, name):
+    """(sin, cos) argumentu `name` – liczone raz i zapamiętane w `args`."""
+    key = "sin_" + name
+    if key not in args:
+        rad = np.radians(args[name])
+        args[key], args["cos_" + name] = np.sin(rad), np.cos(rad)
+    return args[key], args["cos_" + name]
+
+def sun_moon_positions_array(jd, args=None):
+    """Wszystko naraz: sun_lon, moon_lon, moon_lat, elongation, illumination (tablice).
+
+    `args` – gotowe fundamental_arguments_array(jd), jeśli wywołujący już je ma
+    (np. faza_ksiezyca.moon_phase_state_array na tym samym wsadzie).
+    """
+    a = fundamental_arguments_array(jd) if args is None else args
+    T = a["T"]
+    sD, cD = _sincos(a, "D")
+    sM, cM = _sincos(a, "M")
+    sM_, cM_ = _sincos(a, "M_")
+    sF, cF = _sincos(a, "F")
+    s2D, c2D = 2*sD*cD, 1 - 2*sD*sD
+
+    C = (1.914602 - 0.004817*T - 0.000014*T*T)*sM
+    C += (0.019993 - 0.000101*T)*2*sM*cM
+    C += 0.000289*sM*(3 - 4*sM*sM)
+    sun = (a["L0"] + C) % 360
+
+    moon = (a["L"] + 6.289*sM_ + 1.274*(s2D*cM_ - c2D*sM_) + 0.658*s2D
+            + 0.214*2*sM_*cM_ - 0.186*sM) % 360
+    lat = (5.128*sF + 0.281*(sM_*cF + cM_*sF) + 0.278*(sM_*cF - cM_*sF)
+           + 0.173*(s2D*cF - c2D*sF))
+
+    elong = (moon - sun) % 360
+    elong = np.where(elong > 180, 360 - elong, elong)
+    return {
+        "sun_lon": sun,
+        "moon_lon": moon,
+        "moon_lat": lat,
+        "elongation": elong,
+        "illumination": (1 + np.cos(np.radians(elong))) / 2,
+    }
+
+def sun_ecliptic_longitude_array(jd):
+    return sun_moon_positions_array(jd)["sun_lon"]
+
+def moon_ecliptic_longitude_array(jd):
+    return sun_moon_positions_array(jd)["moon_lon"]
+
+def moon_ecliptic_latitude_array(jd):
+    return sun_moon_positions_array(jd)["moon_lat"]
+
+def elongacja_slonca_ksiezyca_array(jd):
+    return sun_moon_positions_array(jd)["elongation"]
+
+def jasnosc_ksiezyca_array(jd):
+    return sun_moon_positions_array(jd)["illumination"]
+
+
+# ===== PLANETY (Merkury…Saturn) =====
+# Trzy backendy, wszystkie wektorowe po JD (TT) i zwracające słownik tablic:
+#   "vsop87" – obcięte szeregi VSOP87D (vsop87_terms): sumy A·cos(B + C·t)
+#              dla całego wsadu naraz (kawałkami po _VSOP87_CHUNK JD), planeta
+#              i Ziemia w ekliptyce daty, jedna iteracja czasu świetlnego,
+#              ugięcie światła w polu Słońca i aberracja roczna pierwszego rzędu;
+#              sekundy łuku (VSOP87_ERROR_ARCSEC), domyślny,
+#   "kepler" – elementy keplerowskie JPL (Standish, "Keplerian Elements for
+#              Approximate Positions of the Major Planets", tab. 1, 1800–2050):
+#              elementy liniowe w T, równanie Keplera metodą Newtona dla całej
+#              tablicy naraz, heliocentryczne położenia planety i barycentrum
+#              Ziemia–Księżyc w ekliptyce J2000, czas świetlny i aberracja jak
+#              wyżej (bez ugięcia); tani, ale to minuty łuku (Saturn do 15′,
+#              KEPLER_ERROR_ARCSEC),
+#   "jpl"    – observe().apparent() skyfield na kernelach z data/ephemeris
+#              (każdy kawałek wsadu do pliku, który go pokrywa).
+# Wynik: lon/lat (średnia ekliptyka i równonoc daty, jak sun_ecliptic_longitude)
+# i ra/dec (średni równik daty) – ta sama końcowa konwersja, więc backendy
+# różnią się tylko fizyką. JD spoza PLANET_BACKEND_RANGES -> ValueError
+# (zakres "jpl" wyznaczają kernele).
+
+PLANETS = ("mercury", "venus", "mars", "jupiter", "saturn")
+PLANET_BACKENDS = ("vsop87", "kepler", "jpl")
+# zakresy JD (TT): VSOP87 – |t| ≤ 1 tysiąclecie od J2000 (1000–3000),
+# tab. 1 Standisha – 1800-01-01 … 2050-12-31
+PLANET_BACKEND_RANGES = {
+    "vsop87": (J2000 - 365250.0, J2000 + 365250.0),
+    "kepler": (2378496.5, 2470537.5),
+}
+# maks. błąd kierunku względem "jpl" [″], zmierzony na 1900–2050 (DE421)
+VSOP87_ERROR_ARCSEC = {"mercury": 1.0, "venus": 2.0, "mars": 3.0, "jupiter": 2.0, "saturn": 2.0}
+# Jowisz i Saturn bez wzajemnych perturbacji – stąd minuty łuku
+KEPLER_ERROR_ARCSEC = {"mercury": 60.0, "venus": 120.0, "mars": 240.0, "jupiter": 700.0, "saturn": 900.0}
+
+# a [au], e, I, L, ϖ, Ω [deg] w J2000 i ich zmiany na stulecie
+_KEPLER_BODIES = PLANETS + ("emb",)
+_KEPLER_ELEMENTS = np.array([
+    [[0.38709927, 0.20563593, 7.00497902, 252.25032350, 77.45779628, 48.33076593],
+     [0.00000037, 0.00001906, -0.00594749, 149472.67411175, 0.16047689, -0.12534081]],
+    [[0.72333566, 0.00677672, 3.39467605, 181.97909950, 131.60246718, 76.67984255],
+     [0.00000390, -0.00004107, -0.00078890, 58517.81538729, 0.00268329, -0.27769418]],
+    [[1.52371034, 0.09339410, 1.84969142, -4.55343205, -23.94362959, 49.55953891],
+     [0.00001847, 0.00007882, -0.00813131, 19140.30268499, 0.44441088, -0.29257343]],
+    [[5.20288700, 0.04838624, 1.30439695, 34.39644051, 14.72847983, 100.47390909],
+     [-0.00011607, -0.00013253, -0.00183714, 3034.74612775, 0.21252668, 0.20469106]],
+    [[9.53667594, 0.05386179, 2.48599187, 49.95424423, 92.59887831, 113.66242448],
+     [-0.00125060, -0.00050991, 0.00193609, 1222.49362201, -0.41897216, -0.28867794]],
+    [[1.00000261, 0.01671123, -0.00001531, 100.46457166, 102.93768193, 0.0],
+     [0.00000562, -0.00004392, -0.01294668, 35999.37244981, 0.32327364, 0.0]],
+])
+_OBLIQUITY_J2000 = math.radians(23.43928)
+_VSOP87_CHUNK = 4096  # JD na raz: macierz argumentów (wyrazy × JD) mieści się w pamięci
+_KEPLER_ITERATIONS = 6
+_C_AU_PER_DAY = 173.1446326846693
+_JPL_NAMES = {
+    "mercury": "mercury barycenter",
+    "venus": "venus barycenter",
+    "mars": "mars barycenter",
+    "jupiter": "jupiter barycenter",
+    "saturn": "saturn barycenter",
+}
+
+def _check_planet(planet, backend):
+    if planet not in PLANETS:
+        raise ValueError(f"Nieznana planeta: {planet!r} (dostępne: {', '.join(PLANETS)})")
+    if backend not in PLANET_BACKENDS:
+        raise ValueError(f"Nieznany backend planet: {backend!r} (dostępne: {', '.join(PLANET_BACKENDS)})")
+
+def _check_range(jd, backend):
+    if backend not in PLANET_BACKEND_RANGES or jd.size == 0:
+        return
+    lo, hi = PLANET_BACKEND_RANGES[backend]
+    outside = (jd < lo) | (jd > hi)
+    if np.any(outside):
+        raise ValueError(f"JD {jd[outside].flat[0]} poza zakresem backendu {backend!r} ({lo}…{hi})")
+
+def vsop87_heliocentric_array(jd, body):
+    """Heliocentryczny wektor (3, ...) [au] w ekliptyce i równonocy daty z VSOP87D.
+
+    `body`: jedna z PLANETS albo "earth".
+    """
+    from . import vsop87_terms
+
+    terms = getattr(vsop87_terms, f"VSOP87_{body.upper()}")
+    jd = np.asarray(jd, dtype=np.float64)
+    t = ((jd - J2000) / 365250.0).ravel()
+    # wiersze posortowane po (współrzędna, α): sumy grup jednym reduceat
+    groups = terms[:, 0] * 6 + terms[:, 1]
+    starts = np.flatnonzero(np.r_[True, np.diff(groups) != 0])
+    coord, power = terms[starts, 0].astype(np.int64), terms[starts, 1]
+    lbr = np.zeros((3, t.size))
+    for lo in range(0, t.size, _VSOP87_CHUNK):
+        tc = t[lo:lo + _VSOP87_CHUNK]
+        sums = np.add.reduceat(terms[:, 2, None] * np.cos(terms[:, 3, None] + terms[:, 4, None]*tc), starts)
+        np.add.at(lbr[:, lo:lo + _VSOP87_CHUNK], coord, sums * tc**power[:, None])
+    L, B, R = lbr.reshape((3,) + jd.shape)
+    return np.array([R*np.cos(B)*np.cos(L), R*np.cos(B)*np.sin(L), R*np.sin(B)])
+
+def _vsop87_earth(jd):
+    """Ziemia z VSOP87: położenie i prędkość [au/d] (różnica ±0.5 d)."""
+    return (
+        vsop87_heliocentric_array(jd, "earth"),
+        vsop87_heliocentric_array(jd + 0.5, "earth") - vsop87_heliocentric_array(jd - 0.5, "earth"),
+    )
+
+def _vsop87_geocentric_date(jd, planet, earth):
+    """Pozorny wektor geocentryczny w ekliptyce daty; `earth` z _vsop87_earth."""
+    from .ephemeris_spk import _deflection_by_sun
+
+    earth, earth_v = earth
+    geo = vsop87_heliocentric_array(jd, planet) - earth
+    tau = np.sqrt(np.sum(geo*geo, axis=0)) / _C_AU_PER_DAY
+    geo = vsop87_heliocentric_array(jd - tau, planet) - earth
+    # ugięcie przy Słońcu (do ~1.75″ na brzegu tarczy), potem aberracja roczna
+    geo = geo + _deflection_by_sun(geo, earth)
+    return geo + earth_v*np.sqrt(np.sum(geo*geo, axis=0)) / _C_AU_PER_DAY
+
+def kepler_heliocentric_array(jd, body):
+    """Heliocentryczny wektor (3, ...) [au] w ekliptyce J2000 z elementów JPL."""
+    T = (np.asarray(jd, dtype=np.float64) - J2000) / T_CENT
+    base, rate = _KEPLER_ELEMENTS[_KEPLER_BODIES.index(body)]
+    a, e, I, L, peri, node = (b + r*T for b, r in zip(base, rate))
+    M = np.radians((L - peri + 180) % 360 - 180)
+    w, I, node = np.radians(peri - node), np.radians(I), np.radians(node)
+    E = M + e*np.sin(M)
+    for _ in range(_KEPLER_ITERATIONS):
+        E = E - (E - e*np.sin(E) - M) / (1 - e*np.cos(E))
+    x_, y_ = a*(np.cos(E) - e), a*np.sqrt(1 - e*e)*np.sin(E)
+    cw, sw, cn, sn, ci, si = np.cos(w), np.sin(w), np.cos(node), np.sin(node), np.cos(I), np.sin(I)
+    return np.array([
+        (cw*cn - sw*sn*ci)*x_ + (-sw*cn - cw*sn*ci)*y_,
+        (cw*sn + sw*cn*ci)*x_ + (-sw*sn + cw*cn*ci)*y_,
+        sw*si*x_ + cw*si*y_,
+    ])
+
+def _kepler_geocentric_icrs(jd, planet):
+    jd = np.asarray(jd, dtype=np.float64)
+    earth = kepler_heliocentric_array(jd, "emb")
+    geo = kepler_heliocentric_array(jd, planet) - earth
+    # planeta w chwili wysłania światła (jedna iteracja wystarcza dla Merkurego)
+    tau = np.sqrt(np.sum(geo*geo, axis=0)) / _C_AU_PER_DAY
+    geo = kepler_heliocentric_array(jd - tau, planet) - earth
+    # aberracja roczna (pierwszy rząd): kierunek przesunięty o v_Ziemi·τ
+    earth_v = kepler_heliocentric_array(jd + 0.5, "emb") - kepler_heliocentric_array(jd - 0.5, "emb")
+    geo = geo + earth_v*np.sqrt(np.sum(geo*geo, axis=0)) / _C_AU_PER_DAY
+    c, s = math.cos(_OBLIQUITY_J2000), math.sin(_OBLIQUITY_J2000)
+    return np.array([geo[0], c*geo[1] - s*geo[2], s*geo[1] + c*geo[2]])
+
+def _jpl_geocentric_icrs(jd):
+    from .ephemeris_nasa import _kernel_paths, _load_kernel, _load_timescale
+
+    flat = np.asarray(jd, dtype=np.float64).ravel()
+    ts = _load_timescale()
+    out = {}
+    for path, idx in _kernel_paths(flat):
+        eph = _load_kernel(path)
+        earth = eph["earth"].at(ts.tt_jd(flat[idx]))
+        for planet, name in _JPL_NAMES.items():
+            xyz = out.setdefault(planet, np.empty((3, flat.size)))
+            xyz[:, idx] = earth.observe(eph[name]).apparent().position.au
+    return {planet: xyz.reshape((3,) + np.shape(jd)) for planet, xyz in out.items()}
+
+def _rotate_x(xyz, angle):
+    """Obrót wektora (3, ...) wokół osi x o `angle` [rad] (z równika na ekliptykę dla +ε)."""
+    x, y, z = xyz
+    c, s = np.cos(angle), np.sin(angle)
+    return np.array([x, c*y + s*z, -s*y + c*z])
+
+def _date_coordinates(equ, ecl):
+    """Wektory w równiku i ekliptyce daty -> słownik wyniku [deg], distance_au."""
+    dist = np.sqrt(np.sum(equ*equ, axis=0))
+    return {
+        "lon": np.degrees(np.arctan2(ecl[1], ecl[0])) % 360,
+        "lat": np.degrees(np.arcsin(ecl[2] / dist)),
+        "ra": np.degrees(np.arctan2(equ[1], equ[0])) % 360,
+        "dec": np.degrees(np.arcsin(equ[2] / dist)),
+        "distance_au": dist,
+    }
+
+def _icrs_to_date(xyz, jd):
+    """Wektor ICRS -> lon, lat (ekliptyka daty), ra, dec (równik daty) [deg], distance_au."""
+    from skyfield.nutationlib import mean_obliquity
+    from skyfield.precessionlib import compute_precession
+
+    equ = np.einsum("ij...,j...->i...", compute_precession(jd), xyz)
+    return _date_coordinates(equ, _rotate_x(equ, np.radians(mean_obliquity(jd) / 3600)))
+
+def _ecliptic_to_date(ecl, jd):
+    """Wektor w ekliptyce daty -> słownik jak _icrs_to_date."""
+    from skyfield.nutationlib import mean_obliquity
+
+    return _date_coordinates(_rotate_x(ecl, -np.radians(mean_obliquity(jd) / 3600)), ecl)
+
+def planet_positions_array(jd, planet, backend="vsop87"):
+    """Geocentryczne położenie planety dla tablicy JD (TT): słownik tablic
+    lon, lat, ra, dec [deg, średnia równonoc daty] i distance_au."""
+    _check_planet(planet, backend)
+    jd = np.asarray(jd, dtype=np.float64)
+    _check_range(jd, backend)
+    if backend == "vsop87":
+        return _ecliptic_to_date(_vsop87_geocentric_date(jd, planet, _vsop87_earth(jd)), jd)
+    if backend == "jpl":
+        xyz = _jpl_geocentric_icrs(jd)[planet]
+    else:
+        xyz = _kepler_geocentric_icrs(jd, planet)
+    return _icrs_to_date(xyz, jd)
+
+def planets_positions_array(jd, backend="vsop87"):
+    """Wszystkie PLANETS naraz: {planeta: słownik jak w planet_positions_array}.
+
+    Backendy "vsop87" i "jpl" liczą Ziemię raz dla wszystkich planet.
+    """
+    if backend not in PLANET_BACKENDS:
+        _check_planet(PLANETS[0], backend)
+    jd = np.asarray(jd, dtype=np.float64)
+    _check_range(jd, backend)
+    if backend == "vsop87":
+        earth = _vsop87_earth(jd)
+        return {planet: _ecliptic_to_date(_vsop87_geocentric_date(jd, planet, earth), jd) for planet in PLANETS}
+    if backend == "jpl":
+        return {planet: _icrs_to_date(xyz, jd) for planet, xyz in _jpl_geocentric_icrs(jd).items()}
+    return {planet: _icrs_to_date(_kepler_geocentric_icrs(jd, planet), jd) for planet in PLANETS}
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+# rejestr_kalendarzy.py — jedno źródło prawdy o systemach kalendarzowych.
+#
+# Każdy system rejestruje swoje kernele (skalarne i wektorowe, w obie strony),
+# tabelę nazw miesięcy i dopuszczalne zakresy. konwertuj / konwertuj_batch,
+# API i UI czytają wyłącznie stąd – dispatch to jedno wyszukanie w słowniku.
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class CalendarSystem:
+    """Opis systemu kalendarzowego w rejestrze."""
+
+    name: str
+    # (rok, miesiąc, dzień) -> JD
+    to_jd: Callable[..., float]
+    to_jd_array: Callable[..., object]
+    # JD -> (rok, miesiąc, dzień z ułamkiem); None = brak konwersji odwrotnej
+    from_jd: Optional[Callable[..., Tuple]] = None
+    from_jd_array: Optional[Callable[..., Tuple]] = None
+    label: str = ""
+    month_names: Mapping[str, int] = field(default_factory=dict)
+    month_range: Tuple[int, int] = (1, 12)
+    day_range: Tuple[int, int] = (1, 31)
+    year_range: Optional[Tuple[int, int]] = None
+    # False = `day` jest ciągły (AM), nie numer dnia w miesiącu
+    whole_days: bool = True
+
+
+CALENDARS: Dict[str, CalendarSystem] = {}
+
+
+def register_calendar(system: CalendarSystem, replace: bool = False) -> CalendarSystem:
+    """Dodaje system do rejestru (nazwa case-insensitive)."""
+    key = system.name.lower()
+    if key in CALENDARS and not replace:
+        raise ValueError(f"System kalendarzowy już zarejestrowany: {key}")
+    CALENDARS[key] = system
+    return system
+
+
+def get_calendar(name: str) -> CalendarSystem:
+    """Zwraca system z rejestru albo rzuca ValueError (jak dawny if/elif w konwertuj)."""
+    try:
+        return CALENDARS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Nieznany system kalendarzowy: {name}") from None
+
+
+def calendar_names() -> List[str]:
+    """Nazwy zarejestrowanych systemów w kolejności rejestracji."""
+    return list(CALENDARS)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+# solar_terms.py — równonoce, przesilenia i 24 wyrazy słoneczne z tablicy (mmap).
+#
+# Plik data/solar_terms/solar_terms.npy (float64, kształt (n, 2)):
+#   [JD (TT), k]  – pozorna długość Słońca = 15°·k (mod 360); k = 0 to
+#                   równonoc marcowa 2000, k rośnie bez przerw.
+# Budowa: astro_events.solar_longitude_times co 15° (zalążek z szeregu
+# analitycznego, dwa kroki Newtona na JPL) w pokryciu kernela z data/ephemeris
+# (scripts/amjd_build_solar_terms.py).
+#
+# solar_terms() ma interfejs solar_longitude_times: w zakresie tablicy i dla
+# kroku będącego wielokrotnością 15° to tylko searchsorted + wycinek; poza
+# nią (albo z własnym `eph`) – liczenie na efemerydach jak dotąd.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .delta_t import _check_scale, tt_to_ut
+
+SOLAR_TERMS_FILE = Path(__file__).resolve().parent / "data" / "solar_terms" / "solar_terms.npy"
+
+TERM_STEP_DEG = 15.0
+# nazwy (pinyin) wyrazów słonecznych od długości 0° co 15°
+SOLAR_TERM_NAMES = (
+    "chunfen", "qingming", "guyu", "lixia", "xiaoman", "mangzhong",
+    "xiazhi", "xiaoshu", "dashu", "liqiu", "chushu", "bailu",
+    "qiufen", "hanlu", "shuangjiang", "lidong", "xiaoxue", "daxue",
+    "dongzhi", "xiaohan", "dahan", "lichun", "yushui", "jingzhe",
+)
+SEASON_NAMES = {
+    0.0: "równonoc wiosenna",
+    90.0: "przesilenie letnie",
+    180.0: "równonoc jesienna",
+    270.0: "przesilenie zimowe",
+}
+
+_MARCH_EQUINOX_2000 = 2451623.8  # przybliżony JD (TT) dla k = 0
+_KERNEL_MARGIN = 40.0  # doby
+
+
+def build_solar_terms_table(jd_start: Optional[float] = None, jd_end: Optional[float] = None) -> np.ndarray:
+    """Tablica (n, 2) [JD TT, k]; bez zakresu – pokrycie kernela domyślnego."""
+    from .astro_events import TROPICAL_YEAR, solar_longitude_times
+    from .ephemeris_nasa import _find_ephemeris_file
+    from .ephemeris_kernels import scan_kernel
+
+    if jd_start is None or jd_end is None:
+        coverage = scan_kernel(_find_ephemeris_file())
+        if coverage is None:
+            raise RuntimeError("Kernel .bsp niedostępny (wskaźnik LFS?) – podaj zakres JD albo dodaj efemerydy")
+        # margines: solar_longitude_times zaczyna od wyrazu sprzed zakresu (do ~30 dób przed)
+        jd_start = coverage.start_jd + _KERNEL_MARGIN if jd_start is None else jd_start
+        jd_end = coverage.end_jd - _KERNEL_MARGIN if jd_end is None else jd_end
+    jd, lon = solar_longitude_times(jd_start, jd_end, TERM_STEP_DEG)
+    # numer k: ile wyrazów od równonocy 2000 (średnio TROPICAL_YEAR / 24 doby na wyraz)
+    approx = np.round((jd - _MARCH_EQUINOX_2000) / (TROPICAL_YEAR / 24.0))
+    k = approx + ((lon / TERM_STEP_DEG - approx + 12.0) % 24.0 - 12.0)
+    return np.column_stack([jd, k])
+
+
+def save_solar_terms_table(table: np.ndarray, path: Path = SOLAR_TERMS_FILE) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, table)
+    return path
+
+
+class SolarTermsTable:
+    """Czasy wyrazów słonecznych (tablica z build_solar_terms_table)."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        data = np.asarray(data).reshape(-1, 2)
+        self.jd = data[:, 0]
+        self.term = data[:, 1].astype(np.int64)
+        self.jd_start = float(self.jd[0]) if len(self.jd) else np.inf
+        self.jd_end = float(self.jd[-1]) if len(self.jd) else -np.inf
+
+    def covers(self, jd_start: float, jd_end: float) -> bool:
+        return self.jd_start <= jd_start and jd_end <= self.jd_end
+
+    def between(self, jd_start: float, jd_end: float, step_deg: float = TERM_STEP_DEG) -> Tuple[np.ndarray, np.ndarray]:
+        """(jd_tt, długość [deg]) w [jd_start, jd_end) dla długości = wielokrotność step_deg."""
+        lo, hi = np.searchsorted(self.jd, [jd_start, jd_end])
+        every = int(round(step_deg / TERM_STEP_DEG))
+        term = self.term[lo:hi]
+        keep = term % every == 0
+        return np.array(self.jd[lo:hi][keep]), (term[keep] * TERM_STEP_DEG) % 360.0
+
+
+@lru_cache(maxsize=1)
+def get_solar_terms_table(path: Optional[Path] = None) -> SolarTermsTable:
+    """Tablica z pliku (mmap); bez pliku – pusta (wszystko liczone na efemerydach)."""
+    path = Path(path) if path is not None else SOLAR_TERMS_FILE
+    if not path.exists():
+        return SolarTermsTable(np.empty((0, 2)))
+    return SolarTermsTable(np.load(path, mmap_mode="r"))
+
+
+def _from_table(step_deg: float) -> bool:
+    every = step_deg / TERM_STEP_DEG
+    return every >= 1.0 and float(every).is_integer() and 360.0 % step_deg == 0.0
+
+
+def solar_terms(
+    jd_start: float,
+    jd_end: float,
+    step_deg: float = TERM_STEP_DEG,
+    eph=None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Jak astro_events.solar_longitude_times, ale z tablicy, gdy ją pokrywa."""
+    table = get_solar_terms_table()
+    if eph is None and _from_table(step_deg) and table.covers(jd_start, jd_end):
+        return table.between(jd_start, jd_end, step_deg)
+    from .astro_events import solar_longitude_times
+
+    return solar_longitude_times(jd_start, jd_end, step_deg, eph)
+
+
+def equinoxes_solstices(year: int, scale: str = "TT") -> Dict[str, float]:
+    """Równonoce i przesilenia roku gregoriańskiego: {SEASON_NAMES: JD w skali `scale`}."""
+    from .konwersja_wielosystemowa import jd_from_gregorian
+
+    _check_scale(scale)
+    jd, lon = solar_terms(jd_from_gregorian(year, 1, 1) - 1.0, jd_from_gregorian(year + 1, 1, 1) - 1.0, 90.0)
+    if scale == "UT":
+        jd = np.asarray(tt_to_ut(jd), dtype=np.float64)
+    return {SEASON_NAMES[float(l)]: float(t) for t, l in zip(jd, lon)}
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+# tablice_kalendarzy.py — prekomputowane tablice początków lat dla kalendarzy
+# arytmetycznych (−5000…+5000), w których lookup wygrywa z arytmetyką.
+#
+# Dla każdego systemu jeden plik .npy (int64, kształt (2, n)): wiersz 0 = rok,
+# wiersz 1 = numer dnia N pierwszego dnia roku (kernel jd_from_* daje N + 0.5).
+# Ostatni wiersz to rok YEAR_MAX + 1 – zamyka długość ostatniego roku.
+# Długość roku = różnica sąsiednich początków, a offsety miesięcy to mała
+# stała tablica [rok zwykły / długi][miesiąc].
+#
+# Konwersja w przód: indeks roku wprost + odczyt offsetu. Odwrotna: indeks
+# z przybliżenia średnią długością roku + korekta ±1. Lata spoza tablicy idą
+# starą arytmetyką.
+#
+# Tablica opłaca się tylko przy kosztownej arytmetyce: perski (cykl 2820 lat)
+# jest przez nią ~5x szybszy w obie strony. Gregoriański, juliański, koptyjski,
+# etiopski, republikański i islamski mają tańsze wzory zamknięte – lookup był
+# dla nich 1.3–3x wolniejszy, więc zostają przy kernelach arytmetycznych.
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from .kalendarze_lunisolarne import (
+    _split_day_number,
+    jd_from_persian,
+    jd_from_persian_array,
+    persian_from_jd_array,
+)
+
+TABLES_DIR = Path(__file__).resolve().parent / "data" / "calendar_tables"
+
+YEAR_MIN = -5000
+YEAR_MAX = 5000
+
+_PERSIAN_OFFSETS = np.tile([0, 31, 62, 93, 124, 155, 186, 216, 246, 276, 306, 336], (2, 1))
+
+
+class YearTable:
+    """Tablica początków lat jednego systemu + kernele oparte na niej.
+
+    Indeks roku liczymy wprost (rok − pierwszy rok; Persian: bez roku 0),
+    a dla JD z przybliżenia średnią długością roku + korekta ±1 – bez
+    floor/ceil arytmetyki kalendarza. Miesiąc z tablicy dzień-roku -> miesiąc.
+    """
+
+    def __init__(
+        self,
+        system: str,
+        data: np.ndarray,
+        base_length: int,
+        month_offsets: np.ndarray,
+        fallback: Tuple[Callable, Callable, Callable],
+    ) -> None:
+        self.system = system
+        # np.asarray: zwykły widok na mmap (bez narzutu podklasy np.memmap)
+        self.years = np.asarray(data[0])
+        self.starts = np.asarray(data[1])
+        self.first_year = int(self.years[0])
+        self.n_years = len(self.starts) - 1
+        # Persian nie ma roku 0 – indeksy lat dodatnich przesunięte o 1
+        self.skips_zero = bool(self.years[0] < 0 and not np.any(self.years == 0))
+        self.base_length = base_length
+        self.month_offsets = np.asarray(month_offsets, dtype=np.int64)
+        self.n_months = self.month_offsets.shape[1]
+        self._to_jd, self._to_jd_array, self._from_jd_array = fallback
+
+        lengths = np.diff(self.starts)
+        self.long_year = (lengths > base_length).astype(np.int64)
+        self.mean_length = float(self.starts[-1] - self.starts[0]) / self.n_years
+        # [długi rok][dzień roku] -> miesiąc (1-based)
+        doy = np.arange(int(lengths.max()))
+        self.doy_to_month = np.stack(
+            [np.searchsorted(self.month_offsets[k], doy, side="right") for k in (0, 1)]
+        )
+        self._starts_list = self.starts.tolist()
+        self._long_list = self.long_year.tolist()
+        self._offsets_list = self.month_offsets.tolist()
+
+    def _index(self, year):
+        return year - self.first_year - (self.skips_zero & (year > 0))
+
+    # --- JD <- data ---
+
+    def to_jd(self, year: int, month: int, day: int) -> float:
+        i = year - self.first_year - (self.skips_zero and year > 0)
+        if not (0 <= i < self.n_years and 1 <= month <= self.n_months) or (self.skips_zero and year == 0):
+            return self._to_jd(year, month, day)
+        return self._starts_list[i] + self._offsets_list[self._long_list[i]][month - 1] + day - 0.5
+
+    def to_jd_array(self, year, month, day) -> np.ndarray:
+        year, month, day = np.broadcast_arrays(
+            *(np.asarray(a, dtype=np.int64) for a in (year, month, day))
+        )
+        i = self._index(year)
+        ok = (i >= 0) & (i < self.n_years) & (month >= 1) & (month <= self.n_months)
+        if self.skips_zero:
+            ok &= year != 0
+        i = np.where(ok, i, 0)
+        m = np.where(ok, month - 1, 0)
+        jd = self.starts[i] + self.month_offsets[self.long_year[i], m] + day - 0.5
+        if not ok.all():
+            bad = ~ok
+            jd[bad] = self._to_jd_array(year[bad], month[bad], day[bad])
+        return jd
+
+    # --- data <- JD ---
+
+    def from_jd(self, jd: float):
+        year, month, day = self.from_jd_array(jd)
+        return int(year), int(month), float(day)
+
+    def from_jd_array(self, jd):
+        jd = np.asarray(jd, dtype=np.float64)
+        shape, jd = jd.shape, np.atleast_1d(jd)
+        n, frac = _split_day_number(jd)
+        s0 = int(self.starts[0])
+        ok = (n >= s0) & (n < int(self.starts[-1]))
+        est = np.floor((np.where(ok, n, s0) - s0) / self.mean_length).astype(np.int64)
+        # początki lat odchylają się od średniej o < 1 rok -> jedna korekta ±1
+        i = np.clip(est, 1, self.n_years - 2)
+        i = i - (self.starts[i] > n) + (self.starts[i + 1] <= n)
+        doy = np.where(ok, n - self.starts[i], 0)
+        long_year = self.long_year[i]
+        month = self.doy_to_month[long_year, doy]
+        day = doy - self.month_offsets[long_year, month - 1] + 1 + frac
+        year = self.years[i].astype(np.int64)
+        if not ok.all():
+            bad = ~ok
+            year[bad], month[bad], day[bad] = self._from_jd_array(jd[bad])
+        return year.reshape(shape), month.reshape(shape), day.reshape(shape)
+
+
+# ===== DEFINICJE TABLIC =====
+# system -> (długość roku zwykłego, offsety miesięcy, (to_jd, to_jd_array, from_jd_array))
+
+def _arith_specs() -> Dict[str, tuple]:
+    return {
+        "persian": (365, _PERSIAN_OFFSETS,
+                    (jd_from_persian, jd_from_persian_array, persian_from_jd_array)),
+    }
+
+
+TABLE_SYSTEMS = ("persian",)
+
+
+def build_year_table(system: str) -> np.ndarray:
+    """Liczy tablicę (2, n) int64 arytmetyką systemu (lata YEAR_MIN…YEAR_MAX + 1)."""
+    _, _, (_, to_jd_array, _) = _arith_specs()[system]
+    years = np.arange(YEAR_MIN, YEAR_MAX + 2, dtype=np.int64)
+    if system == "persian":
+        years = years[years != 0]  # brak roku 0 – arytmetyka traktuje 0 jak -1
+    starts = to_jd_array(years, 1, 1) - 0.5
+    return np.stack([years, starts.astype(np.int64)])
+
+
+def build_calendar_tables(directory: Path = TABLES_DIR) -> Dict[str, Path]:
+    """Zapisuje tablice wszystkich systemów jako .npy (do mapowania mmap)."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    out: Dict[str, Path] = {}
+    for system in TABLE_SYSTEMS:
+        path = directory / f"{system}.npy"
+        np.save(path, build_year_table(system))
+        out[system] = path
+    return out
+
+
+@lru_cache(maxsize=None)
+def get_year_table(system: str) -> YearTable:
+    """Tablica systemu: mmap z pliku w pakiecie, a gdy go brak – liczona w pamięci."""
+    base_length, offsets, fallback = _arith_specs()[system]
+    path = TABLES_DIR / f"{system}.npy"
+    if path.exists():
+        data = np.load(path, mmap_mode="r")
+    else:
+        data = build_year_table(system)
+    return YearTable(system, data, base_length, offsets, fallback)
+
+
+def table_kernels(system: str) -> Tuple[Callable, Callable, Callable, Callable]:
+    """(to_jd, to_jd_array, from_jd, from_jd_array) dla rejestru kalendarzy.
+
+    Tablica ładuje się leniwie przy pierwszym wywołaniu, nie przy imporcie.
+    """
+    def to_jd(year: int, month: int, day: int) -> float:
+        return get_year_table(system).to_jd(year, month, day)
+
+    def to_jd_array(year, month, day) -> np.ndarray:
+        return get_year_table(system).to_jd_array(year, month, day)
+
+    def from_jd(jd: float):
+        return get_year_table(system).from_jd(jd)
+
+    def from_jd_array(jd):
+        return get_year_table(system).from_jd_array(jd)
+
+    return to_jd, to_jd_array, from_jd, from_jd_array
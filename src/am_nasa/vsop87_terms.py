@@ -0,0 +1,1865 @@
+from __future__ import annotations
+
+# vsop87_terms.py — obcięte szeregi VSOP87D (Bretagnon & Francou 1988)
+# dla Merkurego…Saturna i Ziemi.
+#
+# VSOP87D: heliocentryczne L, B [rad] i R [au] względem dynamicznej ekliptyki
+# i równonocy daty. Wiersz = wyraz A·cos(B + C·t) · t^α, t w tysiącleciach
+# juliańskich od J2000 (TDB); kolumny: współrzędna (0 = L, 1 = B, 2 = R), α, A, B, C.
+# Pełne szeregi: IMCCE, ftp://ftp.imcce.fr/pub/ephem/planets/vsop87 (VSOP87D.*).
+#
+# Obcięcie: zostają wyrazy z A ≥ 5e-7 rad / k (dla R: A / a), gdzie a – średnia
+# odległość od Słońca [au], a k – ile razy błąd heliocentryczny rośnie
+# w kierunku geocentrycznym (Merkury 1.6, Wenus 3.6, Ziemia 3.0, Mars 2.9,
+# Jowisz 1.25, Saturn 1.1). Dla |t| ≤ 1 próg ogranicza też wyrazy z t^α.
+# Zostaje 164–481 wyrazów na ciało; błąd względem DE421 –
+# planetary_positions.VSOP87_ERROR_ARCSEC.
+
+import numpy as np
+
+VSOP87_MERCURY = np.array([
+    [0, 0, 4.40250710144, 0.00000000000, 0.00000000000],
+    [0, 0, 0.40989414976, 1.48302034194, 26087.90314157420],
+    [0, 0, 0.05046294199, 4.47785489540, 52175.80628314840],
+    [0, 0, 0.00855346843, 1.16520322351, 78263.70942472259],
+    [0, 0, 0.00165590362, 4.11969163181, 104351.61256629678],
+    [0, 0, 0.00034561897, 0.77930765817, 130439.51570787099],
+    [0, 0, 0.00007583476, 3.71348400510, 156527.41884944518],
+    [0, 0, 0.00003559740, 1.51202669419, 1109.37855209340],
+    [0, 0, 0.00001803463, 4.10333178410, 5661.33204915220],
+    [0, 0, 0.00001726012, 0.35832239908, 182615.32199101939],
+    [0, 0, 0.00001589923, 2.99510417815, 25028.52121138500],
+    [0, 0, 0.00001364682, 4.59918318745, 27197.28169366760],
+    [0, 0, 0.00001017332, 0.88031439040, 31749.23519072640],
+    [0, 0, 0.00000714182, 1.54144865265, 24978.52458948080],
+    [0, 0, 0.00000643759, 5.30266110787, 21535.94964451540],
+    [0, 0, 0.00000451137, 6.04989275289, 51116.42435295920],
+    [0, 0, 0.00000404200, 3.28228847025, 208703.22513259359],
+    [0, 0, 0.00000352441, 5.24156297101, 20426.57109242200],
+    [0, 0, 0.00000345212, 2.79211901539, 15874.61759536320],
+    [0, 0, 0.00000343313, 5.76531885335, 955.59974160860],
+    [0, 0, 0.00000339214, 5.86327765000, 25558.21217647960],
+    [0, 0, 0.00000325335, 1.33674334780, 53285.18483524180],
+    [0, 0, 0.00000272947, 2.49451163975, 529.69096509460],
+    [0, 0, 0.00000264336, 3.91705094013, 57837.13833230060],
+    [0, 0, 0.00000259587, 0.98732428184, 4551.95349705880],
+    [0, 0, 0.00000238793, 0.11343953378, 1059.38193018920],
+    [0, 0, 0.00000234830, 0.26672118900, 11322.66409830440],
+    [0, 0, 0.00000216645, 0.65987207348, 13521.75144159140],
+    [0, 0, 0.00000208995, 2.09178234008, 47623.85278608960],
+    [0, 0, 0.00000183359, 2.62878670784, 27043.50288318280],
+    [0, 0, 0.00000181629, 2.43413502466, 25661.30495069820],
+    [0, 0, 0.00000175965, 4.53636829858, 51066.42773105500],
+    [0, 0, 0.00000172643, 2.45200164173, 24498.83024629040],
+    [0, 0, 0.00000142316, 3.36003948842, 37410.56723987860],
+    [0, 0, 0.00000137942, 0.29098447849, 10213.28554621100],
+    [0, 0, 0.00000125219, 3.72079804425, 39609.65458316560],
+    [0, 0, 0.00000118233, 2.78149786369, 77204.32749453338],
+    [0, 0, 0.00000106422, 4.20572116254, 19804.82729158280],
+    [0, 0, 0.00000096860, 6.20398202740, 234791.12827416777],
+    [0, 0, 0.00000089987, 5.85243631094, 41962.52073693740],
+    [0, 0, 0.00000088329, 5.41338795963, 26617.59410666880],
+    [0, 0, 0.00000086819, 2.64219349385, 51646.11531805379],
+    [0, 0, 0.00000086723, 1.95953042650, 46514.47423399620],
+    [0, 0, 0.00000084971, 4.33100364958, 79373.08797681599],
+    [0, 0, 0.00000069729, 3.57201709671, 25132.30339996560],
+    [0, 0, 0.00000069247, 4.19446437496, 19.66976089979],
+    [0, 0, 0.00000068493, 0.63424819267, 83925.04147387479],
+    [0, 0, 0.00000064830, 0.04762925810, 33326.57873317420],
+    [0, 0, 0.00000063463, 3.14700877722, 7238.67559160000],
+    [0, 0, 0.00000059481, 2.74692752000, 16983.99614745660],
+    [0, 0, 0.00000056531, 5.11920557675, 73711.75592766379],
+    [0, 0, 0.00000055376, 4.05312663019, 30639.85663863300],
+    [0, 0, 0.00000054442, 3.14331542453, 27147.28507176339],
+    [0, 0, 0.00000051458, 5.47786463494, 50586.73338786459],
+    [0, 0, 0.00000049567, 3.98985863874, 6770.71060124560],
+    [0, 0, 0.00000048007, 5.49260554912, 51749.20809227239],
+    [0, 0, 0.00000047560, 5.49722099211, 3.88133535800],
+    [0, 0, 0.00000044744, 1.22366857463, 77154.33087262919],
+    [0, 0, 0.00000041882, 5.19309298528, 6283.07584999140],
+    [0, 0, 0.00000041764, 5.64185159566, 53131.40602475700],
+    [0, 0, 0.00000038045, 2.43117327523, 12566.15169998280],
+    [0, 0, 0.00000035964, 1.42380838630, 2218.75710418680],
+    [0, 0, 0.00000035627, 0.81390126585, 32858.61374281979],
+    [0, 0, 0.00000035392, 3.36964859355, 36301.18868778519],
+    [0, 0, 0.00000034044, 0.47470299167, 65697.55772473979],
+    [0, 0, 0.00000033951, 2.78618091049, 14765.23904326980],
+    [0, 1, 26088.14706222746, 0.00000000000, 0.00000000000],
+    [0, 1, 0.01126007832, 6.21703970996, 26087.90314157420],
+    [0, 1, 0.00303471395, 3.05565472363, 52175.80628314840],
+    [0, 1, 0.00080538452, 6.10454743366, 78263.70942472259],
+    [0, 1, 0.00021245035, 2.83531934452, 104351.61256629678],
+    [0, 1, 0.00005592094, 5.82675673328, 130439.51570787099],
+    [0, 1, 0.00001472233, 2.51845458395, 156527.41884944518],
+    [0, 1, 0.00000388318, 5.48039225891, 182615.32199101939],
+    [0, 1, 0.00000352244, 3.05238094403, 1109.37855209340],
+    [0, 1, 0.00000102743, 2.14879173777, 208703.22513259359],
+    [0, 1, 0.00000093540, 6.11791163931, 27197.28169366760],
+    [0, 1, 0.00000090579, 0.00045481669, 24978.52458948080],
+    [0, 1, 0.00000051941, 5.62107554052, 5661.33204915220],
+    [0, 1, 0.00000044370, 4.57348500464, 25028.52121138500],
+    [0, 2, 0.00053049845, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00016903658, 4.69072300649, 26087.90314157420],
+    [0, 2, 0.00007396711, 1.34735624669, 52175.80628314840],
+    [0, 2, 0.00003018297, 4.45643539705, 78263.70942472259],
+    [0, 2, 0.00001107419, 1.26226537554, 104351.61256629678],
+    [0, 2, 0.00000378173, 4.31998055900, 130439.51570787099],
+    [0, 2, 0.00000122998, 1.06868541052, 156527.41884944518],
+    [0, 2, 0.00000038663, 4.08011610182, 182615.32199101939],
+    [0, 3, 0.00000188077, 0.03466830117, 52175.80628314840],
+    [0, 3, 0.00000142152, 3.12505452600, 26087.90314157420],
+    [0, 3, 0.00000096877, 3.00378171915, 78263.70942472259],
+    [0, 3, 0.00000043669, 6.01867965826, 104351.61256629678],
+    [0, 3, 0.00000035395, 0.00000000000, 0.00000000000],
+    [0, 4, 0.00000114078, 3.14159265359, 0.00000000000],
+    [1, 0, 0.11737528962, 1.98357498767, 26087.90314157420],
+    [1, 0, 0.02388076996, 5.03738959685, 52175.80628314840],
+    [1, 0, 0.01222839532, 3.14159265359, 0.00000000000],
+    [1, 0, 0.00543251810, 1.79644363963, 78263.70942472259],
+    [1, 0, 0.00129778770, 4.83232503961, 104351.61256629678],
+    [1, 0, 0.00031866927, 1.58088495667, 130439.51570787099],
+    [1, 0, 0.00007963301, 4.60972126348, 156527.41884944518],
+    [1, 0, 0.00002014189, 1.35324164694, 182615.32199101939],
+    [1, 0, 0.00000513953, 4.37835409309, 208703.22513259359],
+    [1, 0, 0.00000208584, 2.02020294153, 24978.52458948080],
+    [1, 0, 0.00000207674, 4.91772564073, 27197.28169366760],
+    [1, 0, 0.00000132013, 1.11908492283, 234791.12827416777],
+    [1, 0, 0.00000121395, 1.81271752059, 53285.18483524180],
+    [1, 0, 0.00000100454, 5.65684734206, 20426.57109242200],
+    [1, 0, 0.00000099214, 0.09391887097, 51116.42435295920],
+    [1, 0, 0.00000094574, 1.24184909234, 31749.23519072640],
+    [1, 0, 0.00000091566, 2.28163128692, 25028.52121138500],
+    [1, 0, 0.00000084264, 5.08510388314, 51066.42773105500],
+    [1, 0, 0.00000078785, 4.40725880000, 57837.13833230060],
+    [1, 0, 0.00000077747, 0.52557061749, 1059.38193018920],
+    [1, 0, 0.00000049948, 3.49752993688, 5661.33204915220],
+    [1, 0, 0.00000046454, 3.23739270829, 77204.32749453338],
+    [1, 0, 0.00000044767, 4.87849816734, 79373.08797681599],
+    [1, 0, 0.00000040766, 2.46558332165, 46514.47423399620],
+    [1, 0, 0.00000037378, 4.45768797944, 4551.95349705880],
+    [1, 0, 0.00000035911, 1.09057317869, 1109.37855209340],
+    [1, 0, 0.00000034082, 4.14209210575, 260879.03141574195],
+    [1, 0, 0.00000031953, 1.18516389747, 83925.04147387479],
+    [1, 0, 0.00000031808, 2.41474588439, 47623.85278608960],
+    [1, 1, 0.00429151362, 3.50169780393, 26087.90314157420],
+    [1, 1, 0.00146233668, 3.14159265359, 0.00000000000],
+    [1, 1, 0.00022675295, 0.01515366880, 52175.80628314840],
+    [1, 1, 0.00010894981, 0.48540174006, 78263.70942472259],
+    [1, 1, 0.00006353462, 3.42943919982, 104351.61256629678],
+    [1, 1, 0.00002495743, 0.16051210665, 130439.51570787099],
+    [1, 1, 0.00000859585, 3.18452433647, 156527.41884944518],
+    [1, 1, 0.00000277503, 6.21020774184, 182615.32199101939],
+    [1, 1, 0.00000086233, 2.95244391822, 208703.22513259359],
+    [1, 2, 0.00011830934, 4.79065585784, 26087.90314157420],
+    [1, 2, 0.00001913516, 0.00000000000, 0.00000000000],
+    [1, 2, 0.00001044801, 1.21216540536, 52175.80628314840],
+    [1, 2, 0.00000266213, 4.43418336532, 78263.70942472259],
+    [1, 2, 0.00000170280, 1.62255638714, 104351.61256629678],
+    [1, 2, 0.00000096300, 4.80023692017, 130439.51570787099],
+    [1, 2, 0.00000044692, 1.60758267772, 156527.41884944518],
+    [1, 3, 0.00000235423, 0.35387524604, 26087.90314157420],
+    [1, 3, 0.00000160537, 0.00000000000, 0.00000000000],
+    [2, 0, 0.39528271652, 0.00000000000, 0.00000000000],
+    [2, 0, 0.07834131817, 6.19233722599, 26087.90314157420],
+    [2, 0, 0.00795525557, 2.95989690096, 52175.80628314840],
+    [2, 0, 0.00121281763, 6.01064153805, 78263.70942472259],
+    [2, 0, 0.00021921969, 2.77820093975, 104351.61256629678],
+    [2, 0, 0.00004354065, 5.82894543257, 130439.51570787099],
+    [2, 0, 0.00000918228, 2.59650562598, 156527.41884944518],
+    [2, 0, 0.00000289955, 1.42441936951, 25028.52121138500],
+    [2, 0, 0.00000260033, 3.02817753482, 27197.28169366760],
+    [2, 0, 0.00000201855, 5.64725040350, 182615.32199101939],
+    [2, 0, 0.00000201499, 5.59227724202, 31749.23519072640],
+    [2, 0, 0.00000141980, 6.25264202645, 24978.52458948080],
+    [2, 0, 0.00000100144, 3.73435608689, 21535.94964451540],
+    [2, 0, 0.00000077561, 3.66972526976, 20426.57109242200],
+    [2, 0, 0.00000075500, 4.47428642962, 51116.42435295920],
+    [2, 0, 0.00000066754, 2.52520309182, 5661.33204915220],
+    [2, 0, 0.00000063277, 4.29905918105, 25558.21217647960],
+    [2, 0, 0.00000062951, 4.76588899933, 1059.38193018920],
+    [2, 0, 0.00000048266, 6.06824478778, 53285.18483524180],
+    [2, 0, 0.00000045748, 2.41480951648, 208703.22513259359],
+    [2, 0, 0.00000044234, 1.21957314874, 15874.61759536320],
+    [2, 0, 0.00000040815, 2.35882016415, 57837.13833230060],
+    [2, 0, 0.00000037203, 0.51733821470, 47623.85278608960],
+    [2, 0, 0.00000035224, 1.05917802674, 27043.50288318280],
+    [2, 0, 0.00000033873, 0.86381554651, 25661.30495069820],
+    [2, 0, 0.00000030903, 0.88366335532, 24498.83024629040],
+    [2, 0, 0.00000030092, 1.79500530627, 37410.56723987860],
+    [2, 0, 0.00000028417, 3.02063625668, 51066.42773105500],
+    [2, 0, 0.00000026105, 2.15021963174, 39609.65458316560],
+    [2, 0, 0.00000021270, 5.36857139841, 13521.75144159140],
+    [2, 0, 0.00000019422, 4.98378647655, 10213.28554621100],
+    [2, 0, 0.00000018699, 4.96496008403, 11322.66409830440],
+    [2, 0, 0.00000017087, 1.24077764194, 77204.32749453338],
+    [2, 0, 0.00000016941, 3.88765393402, 26617.59410666880],
+    [2, 0, 0.00000016297, 2.63293587817, 19804.82729158280],
+    [2, 0, 0.00000015109, 0.44510589948, 46514.47423399620],
+    [2, 0, 0.00000015012, 4.28173463507, 41962.52073693740],
+    [2, 0, 0.00000013977, 4.77056848793, 33326.57873317420],
+    [2, 0, 0.00000013940, 1.62573946865, 27147.28507176339],
+    [2, 0, 0.00000013938, 1.99984876578, 25132.30339996560],
+    [2, 0, 0.00000013382, 1.07657890477, 51646.11531805379],
+    [2, 0, 0.00000012794, 6.06437138766, 1109.37855209340],
+    [2, 0, 0.00000012754, 2.07613721222, 529.69096509460],
+    [2, 1, 0.00217347739, 4.65617158663, 26087.90314157420],
+    [2, 1, 0.00044141826, 1.42385543975, 52175.80628314840],
+    [2, 1, 0.00010094479, 4.47466326316, 78263.70942472259],
+    [2, 1, 0.00002432804, 1.24226083435, 104351.61256629678],
+    [2, 1, 0.00001624367, 0.00000000000, 0.00000000000],
+    [2, 1, 0.00000603996, 4.29303116561, 130439.51570787099],
+    [2, 1, 0.00000152851, 1.06060779810, 156527.41884944518],
+    [2, 1, 0.00000039202, 4.11136751416, 182615.32199101939],
+    [2, 1, 0.00000017999, 4.71193725810, 24978.52458948080],
+    [2, 1, 0.00000017760, 4.54424653085, 27197.28169366760],
+    [2, 2, 0.00003117867, 3.08231840296, 26087.90314157420],
+    [2, 2, 0.00001245396, 6.15183317423, 52175.80628314840],
+    [2, 2, 0.00000424822, 2.92583352960, 78263.70942472259],
+    [2, 2, 0.00000136130, 5.97983925842, 104351.61256629678],
+    [2, 2, 0.00000042175, 2.74936980629, 130439.51570787099],
+    [2, 2, 0.00000021759, 3.14159265359, 0.00000000000],
+    [2, 2, 0.00000012793, 5.80143162209, 156527.41884944518],
+    [2, 3, 0.00000032676, 1.67971635359, 26087.90314157420],
+    [2, 3, 0.00000024166, 4.63403168997, 52175.80628314840],
+    [2, 3, 0.00000012133, 1.38983781545, 78263.70942472259],
+])
+
+
+VSOP87_VENUS = np.array([
+    [0, 0, 3.17614666774, 0.00000000000, 0.00000000000],
+    [0, 0, 0.01353968419, 5.59313319619, 10213.28554621100],
+    [0, 0, 0.00089891645, 5.30650048468, 20426.57109242200],
+    [0, 0, 0.00005477201, 4.41630652531, 7860.41939243920],
+    [0, 0, 0.00003455732, 2.69964470778, 11790.62908865880],
+    [0, 0, 0.00002372061, 2.99377539568, 3930.20969621960],
+    [0, 0, 0.00001664069, 4.25018935030, 1577.34354244780],
+    [0, 0, 0.00001438322, 4.15745043958, 9683.59458111640],
+    [0, 0, 0.00001317108, 5.18668219093, 26.29831979980],
+    [0, 0, 0.00001200521, 6.15357115319, 30639.85663863300],
+    [0, 0, 0.00000769314, 0.81629615911, 9437.76293488700],
+    [0, 0, 0.00000761380, 1.95014702120, 529.69096509460],
+    [0, 0, 0.00000707676, 1.06466707214, 775.52261132400],
+    [0, 0, 0.00000584836, 3.99839884762, 191.44826611160],
+    [0, 0, 0.00000499915, 4.12340210074, 15720.83878487840],
+    [0, 0, 0.00000429498, 3.58642859752, 19367.18916223280],
+    [0, 0, 0.00000326967, 5.67736583705, 5507.55323866740],
+    [0, 0, 0.00000326221, 4.59056473097, 10404.73381232260],
+    [0, 0, 0.00000231937, 3.16251057072, 9153.90361602180],
+    [0, 0, 0.00000179695, 4.65337915578, 1109.37855209340],
+    [0, 0, 0.00000155464, 5.57043888948, 19651.04848109800],
+    [0, 0, 0.00000128263, 4.22604493736, 20.77539549240],
+    [0, 0, 0.00000127907, 0.96209822685, 5661.33204915220],
+    [0, 0, 0.00000105547, 1.53721191253, 801.82093112380],
+    [0, 0, 0.00000099121, 0.83288185132, 213.29909543800],
+    [0, 0, 0.00000098804, 5.39389655503, 13367.97263110660],
+    [0, 0, 0.00000088031, 3.88868860307, 9999.98645077300],
+    [0, 0, 0.00000085722, 0.35589249966, 3154.68708489560],
+    [0, 0, 0.00000082094, 3.21596990826, 18837.49819713819],
+    [0, 0, 0.00000071577, 0.11145739345, 11015.10647733480],
+    [0, 0, 0.00000070239, 0.67458813282, 23581.25817731760],
+    [0, 0, 0.00000056122, 4.24039855475, 7.11354700080],
+    [0, 0, 0.00000050796, 0.24531603049, 11322.66409830440],
+    [0, 0, 0.00000046111, 5.31576465717, 18073.70493865020],
+    [0, 0, 0.00000044574, 6.06282201966, 40853.14218484400],
+    [0, 0, 0.00000042635, 1.79955421680, 7084.89678111520],
+    [0, 0, 0.00000042594, 5.32873337210, 2352.86615377180],
+    [0, 0, 0.00000041177, 0.36240972161, 382.89653222320],
+    [0, 0, 0.00000035749, 2.70448479296, 10206.17199921020],
+    [0, 0, 0.00000033893, 2.02347322198, 6283.07584999140],
+    [0, 0, 0.00000033252, 2.10025596509, 27511.46787353720],
+    [0, 0, 0.00000030172, 4.94191919890, 13745.34623902240],
+    [0, 0, 0.00000029850, 4.02176977477, 10239.58386601080],
+    [0, 0, 0.00000029252, 3.51392387787, 283.85931886520],
+    [0, 0, 0.00000029138, 3.59230925768, 22003.91463486980],
+    [0, 0, 0.00000028479, 2.22375414002, 1059.38193018920],
+    [0, 0, 0.00000026260, 0.54067587552, 17298.18232732620],
+    [0, 0, 0.00000024424, 2.70177493852, 8624.21265092720],
+    [0, 0, 0.00000024322, 4.27814493315, 5.52292430740],
+    [0, 0, 0.00000023739, 4.82870797552, 6872.67311951120],
+    [0, 0, 0.00000020492, 0.58547075036, 38.02767263580],
+    [0, 0, 0.00000020274, 3.79493637509, 14143.49524243060],
+    [0, 0, 0.00000019069, 6.12025580313, 29050.78374334920],
+    [0, 0, 0.00000018988, 4.13811500642, 4551.95349705880],
+    [0, 0, 0.00000018269, 3.04740408477, 19999.97290154599],
+    [0, 0, 0.00000017094, 3.52161526430, 31441.67756975680],
+    [0, 0, 0.00000015885, 1.50067222283, 8635.94200376320],
+    [0, 1, 10213.52943052898, 0.00000000000, 0.00000000000],
+    [0, 1, 0.00095707712, 2.46424448979, 10213.28554621100],
+    [0, 1, 0.00014444977, 0.51624564679, 20426.57109242200],
+    [0, 1, 0.00000213374, 1.79547929368, 30639.85663863300],
+    [0, 1, 0.00000173904, 2.65535879443, 26.29831979980],
+    [0, 1, 0.00000151669, 6.10635282369, 1577.34354244780],
+    [0, 1, 0.00000082233, 5.70234133730, 191.44826611160],
+    [0, 1, 0.00000069734, 2.68136034979, 9437.76293488700],
+    [0, 1, 0.00000052408, 3.60013087656, 775.52261132400],
+    [0, 1, 0.00000038318, 1.03379038025, 529.69096509460],
+    [0, 1, 0.00000029633, 1.25056322354, 5507.55323866740],
+    [0, 1, 0.00000025056, 6.10664792855, 10404.73381232260],
+    [0, 1, 0.00000017772, 6.19369798901, 1109.37855209340],
+    [0, 1, 0.00000016510, 2.64330452640, 7.11354700080],
+    [0, 1, 0.00000014230, 5.45138233941, 9153.90361602180],
+    [0, 2, 0.00054127076, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00003891460, 0.34514360047, 10213.28554621100],
+    [0, 2, 0.00001337880, 2.02011286082, 20426.57109242200],
+    [0, 2, 0.00000023836, 2.04592119012, 26.29831979980],
+    [0, 2, 0.00000019331, 3.53527371458, 30639.85663863300],
+    [0, 3, 0.00000135742, 4.80389020993, 10213.28554621100],
+    [0, 3, 0.00000077846, 3.66876371591, 20426.57109242200],
+    [0, 3, 0.00000026023, 0.00000000000, 0.00000000000],
+    [0, 4, 0.00000114016, 3.14159265359, 0.00000000000],
+    [1, 0, 0.05923638472, 0.26702775813, 10213.28554621100],
+    [1, 0, 0.00040107978, 1.14737178106, 20426.57109242200],
+    [1, 0, 0.00032814918, 3.14159265359, 0.00000000000],
+    [1, 0, 0.00001011392, 1.08946123021, 30639.85663863300],
+    [1, 0, 0.00000149458, 6.25390296069, 18073.70493865020],
+    [1, 0, 0.00000137788, 0.86020146523, 1577.34354244780],
+    [1, 0, 0.00000129973, 3.67152483651, 9437.76293488700],
+    [1, 0, 0.00000119507, 3.70468812804, 2352.86615377180],
+    [1, 0, 0.00000107971, 4.53903677647, 22003.91463486980],
+    [1, 0, 0.00000092029, 1.53954562706, 9153.90361602180],
+    [1, 0, 0.00000052982, 2.28138172277, 5507.55323866740],
+    [1, 0, 0.00000045617, 0.72319641722, 10239.58386601080],
+    [1, 0, 0.00000043491, 6.14015776699, 11790.62908865880],
+    [1, 0, 0.00000041700, 5.99126845246, 19896.88012732740],
+    [1, 0, 0.00000039644, 3.86842095901, 8635.94200376320],
+    [1, 0, 0.00000039175, 3.94960351174, 529.69096509460],
+    [1, 0, 0.00000038855, 2.93437865147, 10186.98722641120],
+    [1, 0, 0.00000033320, 4.83194909595, 14143.49524243060],
+    [1, 0, 0.00000023711, 2.90646621218, 10988.80815753500],
+    [1, 0, 0.00000023500, 2.00770618322, 13367.97263110660],
+    [1, 0, 0.00000021809, 2.69701424951, 19651.04848109800],
+    [1, 0, 0.00000020653, 0.98666685459, 775.52261132400],
+    [1, 0, 0.00000018579, 1.80529277514, 40853.14218484400],
+    [1, 0, 0.00000017835, 5.96268643102, 25934.12433108940],
+    [1, 0, 0.00000016976, 4.13711782135, 10021.83728009940],
+    [1, 0, 0.00000015407, 3.29563855296, 11015.10647733480],
+    [1, 0, 0.00000014949, 5.61075168206, 10404.73381232260],
+    [1, 1, 0.00513347602, 1.80364310797, 10213.28554621100],
+    [1, 1, 0.00004380100, 3.38615711591, 20426.57109242200],
+    [1, 1, 0.00000199162, 0.00000000000, 0.00000000000],
+    [1, 1, 0.00000196586, 2.53001197486, 30639.85663863300],
+    [1, 1, 0.00000014031, 2.27087044687, 9437.76293488700],
+    [1, 2, 0.00022377665, 3.38509143877, 10213.28554621100],
+    [1, 2, 0.00000281739, 0.00000000000, 0.00000000000],
+    [1, 2, 0.00000173164, 5.25563766915, 20426.57109242200],
+    [1, 2, 0.00000026945, 3.87040891568, 30639.85663863300],
+    [1, 3, 0.00000646671, 4.99166565277, 10213.28554621100],
+    [1, 3, 0.00000019952, 3.14159265359, 0.00000000000],
+    [1, 4, 0.00000014102, 0.31537190181, 10213.28554621100],
+    [2, 0, 0.72334820905, 0.00000000000, 0.00000000000],
+    [2, 0, 0.00489824185, 4.02151832268, 10213.28554621100],
+    [2, 0, 0.00001658058, 4.90206728012, 20426.57109242200],
+    [2, 0, 0.00001632093, 2.84548851892, 7860.41939243920],
+    [2, 0, 0.00001378048, 1.12846590600, 11790.62908865880],
+    [2, 0, 0.00000498399, 2.58682187717, 9683.59458111640],
+    [2, 0, 0.00000373958, 1.42314837063, 3930.20969621960],
+    [2, 0, 0.00000263616, 5.52938185920, 9437.76293488700],
+    [2, 0, 0.00000237455, 2.55135903978, 15720.83878487840],
+    [2, 0, 0.00000221983, 2.01346776772, 19367.18916223280],
+    [2, 0, 0.00000125896, 2.72769833559, 1577.34354244780],
+    [2, 0, 0.00000119467, 3.01975365264, 10404.73381232260],
+    [2, 0, 0.00000085336, 3.98607953754, 19651.04848109800],
+    [2, 0, 0.00000076178, 1.59577224486, 9153.90361602180],
+    [2, 0, 0.00000074347, 4.11957854039, 5507.55323866740],
+    [2, 0, 0.00000042493, 3.81864530735, 13367.97263110660],
+    [2, 0, 0.00000041904, 1.64273363458, 18837.49819713819],
+    [2, 0, 0.00000039430, 5.39019422358, 23581.25817731760],
+    [2, 0, 0.00000031274, 2.31806719544, 9999.98645077300],
+    [2, 0, 0.00000029042, 5.67739528728, 5661.33204915220],
+    [2, 0, 0.00000027555, 5.72392407794, 775.52261132400],
+    [2, 0, 0.00000027283, 4.82151812709, 11015.10647733480],
+    [2, 0, 0.00000019809, 0.53189326492, 27511.46787353720],
+    [2, 0, 0.00000019700, 4.96157560245, 11322.66409830440],
+    [2, 0, 0.00000016215, 0.56453834290, 529.69096509460],
+    [2, 0, 0.00000013567, 3.75530870628, 18073.70493865020],
+    [2, 0, 0.00000013180, 3.37207825651, 13745.34623902240],
+    [2, 0, 0.00000013079, 5.24353197586, 17298.18232732620],
+    [2, 0, 0.00000012921, 1.13381083556, 10206.17199921020],
+    [2, 0, 0.00000011821, 5.09025877427, 3154.68708489560],
+    [2, 0, 0.00000011728, 0.23432298744, 7084.89678111520],
+    [2, 0, 0.00000011438, 4.56838894696, 29050.78374334920],
+    [2, 0, 0.00000010818, 2.45024712908, 10239.58386601080],
+    [2, 0, 0.00000010652, 1.95528396140, 31441.67756975680],
+    [2, 0, 0.00000010357, 1.20234990061, 15874.61759536320],
+    [2, 1, 0.00034551039, 0.89198710598, 10213.28554621100],
+    [2, 1, 0.00000234203, 1.77224942714, 20426.57109242200],
+    [2, 1, 0.00000233998, 3.14159265359, 0.00000000000],
+    [2, 1, 0.00000023864, 1.11274502648, 9437.76293488700],
+    [2, 1, 0.00000010568, 4.59168210921, 1577.34354244780],
+    [2, 2, 0.00001406587, 5.06366395190, 10213.28554621100],
+    [2, 2, 0.00000015529, 5.47321687981, 20426.57109242200],
+    [2, 2, 0.00000013059, 0.00000000000, 0.00000000000],
+    [2, 3, 0.00000049582, 3.22263554520, 10213.28554621100],
+])
+
+
+VSOP87_EARTH = np.array([
+    [0, 0, 1.75347045673, 0.00000000000, 0.00000000000],
+    [0, 0, 0.03341656456, 4.66925680417, 6283.07584999140],
+    [0, 0, 0.00034894275, 4.62610241759, 12566.15169998280],
+    [0, 0, 0.00003497056, 2.74411800971, 5753.38488489680],
+    [0, 0, 0.00003417571, 2.82886579606, 3.52311834900],
+    [0, 0, 0.00003135896, 3.62767041758, 77713.77146812050],
+    [0, 0, 0.00002676218, 4.41808351397, 7860.41939243920],
+    [0, 0, 0.00002342687, 6.13516237631, 3930.20969621960],
+    [0, 0, 0.00001324292, 0.74246356352, 11506.76976979360],
+    [0, 0, 0.00001273166, 2.03709655772, 529.69096509460],
+    [0, 0, 0.00001199167, 1.10962944315, 1577.34354244780],
+    [0, 0, 0.00000990250, 5.23268129594, 5884.92684658320],
+    [0, 0, 0.00000901855, 2.04505443513, 26.29831979980],
+    [0, 0, 0.00000857223, 3.50849156957, 398.14900340820],
+    [0, 0, 0.00000779786, 1.17882652114, 5223.69391980220],
+    [0, 0, 0.00000753141, 2.53339053818, 5507.55323866740],
+    [0, 0, 0.00000505264, 4.58292563052, 18849.22754997420],
+    [0, 0, 0.00000492379, 4.20506639861, 775.52261132400],
+    [0, 0, 0.00000356655, 2.91954116867, 0.06731030280],
+    [0, 0, 0.00000317087, 5.84901952218, 11790.62908865880],
+    [0, 0, 0.00000284125, 1.89869034186, 796.29800681640],
+    [0, 0, 0.00000271039, 0.31488607649, 10977.07880469900],
+    [0, 0, 0.00000242810, 0.34481140906, 5486.77784317500],
+    [0, 0, 0.00000206160, 4.80646606059, 2544.31441988340],
+    [0, 0, 0.00000205385, 1.86947813692, 5573.14280143310],
+    [0, 0, 0.00000202261, 2.45767795458, 6069.77675455340],
+    [0, 0, 0.00000155516, 0.83306073807, 213.29909543800],
+    [0, 0, 0.00000132212, 3.41118275555, 2942.46342329160],
+    [0, 0, 0.00000126184, 1.08302630210, 20.77539549240],
+    [0, 0, 0.00000115132, 0.64544911683, 0.98032106820],
+    [0, 0, 0.00000102851, 0.63599846727, 4694.00295470760],
+    [0, 0, 0.00000101895, 0.97569221824, 15720.83878487840],
+    [0, 0, 0.00000101724, 4.26679821365, 7.11354700080],
+    [0, 0, 0.00000099206, 6.20992940258, 2146.16541647520],
+    [0, 0, 0.00000097607, 0.68101272270, 155.42039943420],
+    [0, 0, 0.00000085803, 5.98322631256, 161000.68573767410],
+    [0, 0, 0.00000085128, 1.29870743025, 6275.96230299060],
+    [0, 0, 0.00000084711, 3.67080093025, 71430.69561812909],
+    [0, 0, 0.00000079637, 1.80791330700, 17260.15465469040],
+    [0, 0, 0.00000078756, 3.03698313141, 12036.46073488820],
+    [0, 0, 0.00000074651, 1.75508916159, 5088.62883976680],
+    [0, 0, 0.00000073874, 3.50319443167, 3154.68708489560],
+    [0, 0, 0.00000073547, 4.67926565481, 801.82093112380],
+    [0, 0, 0.00000069627, 0.83297596966, 9437.76293488700],
+    [0, 0, 0.00000062449, 3.97763880587, 8827.39026987480],
+    [0, 0, 0.00000061148, 1.81839811024, 7084.89678111520],
+    [0, 0, 0.00000056963, 2.78430398043, 6286.59896834040],
+    [0, 0, 0.00000056116, 4.38694880779, 14143.49524243060],
+    [0, 0, 0.00000055577, 3.47006009062, 6279.55273164240],
+    [0, 0, 0.00000051992, 0.18914945834, 12139.55350910680],
+    [0, 0, 0.00000051605, 1.33282746983, 1748.01641306700],
+    [0, 0, 0.00000051145, 0.28306864501, 5856.47765911540],
+    [0, 0, 0.00000049000, 0.48735065033, 1194.44701022460],
+    [0, 0, 0.00000041036, 5.36817351402, 8429.24126646660],
+    [0, 0, 0.00000040938, 2.39850881707, 19651.04848109800],
+    [0, 0, 0.00000039200, 6.16832995016, 10447.38783960440],
+    [0, 0, 0.00000036770, 6.04133859347, 10213.28554621100],
+    [0, 0, 0.00000036596, 2.56955238628, 1059.38193018920],
+    [0, 0, 0.00000035954, 1.70876111898, 2352.86615377180],
+    [0, 0, 0.00000035566, 1.77597314691, 6812.76681508600],
+    [0, 0, 0.00000033291, 0.59309499459, 17789.84561978500],
+    [0, 0, 0.00000030412, 0.44294464135, 83996.84731811189],
+    [0, 0, 0.00000030047, 2.73975123935, 1349.86740965880],
+    [0, 0, 0.00000025352, 3.16470953405, 4690.47983635860],
+    [0, 0, 0.00000024738, 0.21484762138, 3.59042865180],
+    [0, 0, 0.00000023663, 0.48473567763, 8031.09226305840],
+    [0, 0, 0.00000023574, 2.06527720049, 3340.61242669980],
+    [0, 0, 0.00000022820, 5.22197888032, 4705.73230754360],
+    [0, 0, 0.00000021891, 5.55594302562, 553.56940284240],
+    [0, 0, 0.00000021419, 1.42563735525, 16730.46368959580],
+    [0, 0, 0.00000021089, 4.14825464101, 951.71840625060],
+    [0, 0, 0.00000020300, 0.37133792946, 283.85931886520],
+    [0, 0, 0.00000019925, 5.22208471269, 12168.00269657460],
+    [0, 0, 0.00000019860, 5.77470167653, 6309.37416979120],
+    [0, 0, 0.00000019124, 3.82219996949, 23581.25817731760],
+    [0, 0, 0.00000018888, 5.38626880969, 149854.40013480789],
+    [0, 0, 0.00000017898, 2.21490735647, 13367.97263110660],
+    [0, 0, 0.00000017481, 4.56052900359, 135.06508003540],
+    [0, 1, 6283.31966747491, 0.00000000000, 0.00000000000],
+    [0, 1, 0.00206058863, 2.67823455584, 6283.07584999140],
+    [0, 1, 0.00004303430, 2.63512650414, 12566.15169998280],
+    [0, 1, 0.00000425264, 1.59046980729, 3.52311834900],
+    [0, 1, 0.00000119261, 5.79557487799, 26.29831979980],
+    [0, 1, 0.00000108977, 2.96618001993, 1577.34354244780],
+    [0, 1, 0.00000093478, 2.59212835365, 18849.22754997420],
+    [0, 1, 0.00000072122, 1.13846158196, 529.69096509460],
+    [0, 1, 0.00000067768, 1.87472304791, 398.14900340820],
+    [0, 1, 0.00000067327, 4.40918235168, 5507.55323866740],
+    [0, 1, 0.00000059027, 2.88797038460, 5223.69391980220],
+    [0, 1, 0.00000055976, 2.17471680261, 155.42039943420],
+    [0, 1, 0.00000045407, 0.39803079805, 796.29800681640],
+    [0, 1, 0.00000036369, 0.46624739835, 775.52261132400],
+    [0, 1, 0.00000028958, 2.64707383882, 7.11354700080],
+    [0, 1, 0.00000020844, 5.34138275149, 0.98032106820],
+    [0, 1, 0.00000019097, 1.84628332577, 5486.77784317500],
+    [0, 1, 0.00000018508, 4.96855124577, 213.29909543800],
+    [0, 1, 0.00000017293, 2.99116864949, 6275.96230299060],
+    [0, 2, 0.00052918870, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00008719837, 1.07209665242, 6283.07584999140],
+    [0, 2, 0.00000309125, 0.86728818832, 12566.15169998280],
+    [0, 2, 0.00000027339, 0.05297871691, 3.52311834900],
+    [0, 3, 0.00000289226, 5.84384198723, 6283.07584999140],
+    [0, 3, 0.00000034955, 0.00000000000, 0.00000000000],
+    [0, 3, 0.00000016819, 5.48766912348, 12566.15169998280],
+    [0, 4, 0.00000114084, 3.14159265359, 0.00000000000],
+    [1, 0, 0.00000279620, 3.19870156017, 84334.66158130829],
+    [1, 0, 0.00000101643, 5.42248619256, 5507.55323866740],
+    [1, 0, 0.00000080445, 3.88013204458, 5223.69391980220],
+    [1, 0, 0.00000043806, 3.70444689758, 2352.86615377180],
+    [1, 0, 0.00000031933, 4.00026369781, 1577.34354244780],
+    [1, 0, 0.00000022724, 3.98473831560, 1047.74731175470],
+    [1, 0, 0.00000018141, 4.98367470263, 6283.07584999140],
+    [2, 0, 1.00013988799, 0.00000000000, 0.00000000000],
+    [2, 0, 0.01670699626, 3.09846350771, 6283.07584999140],
+    [2, 0, 0.00013956023, 3.05524609620, 12566.15169998280],
+    [2, 0, 0.00003083720, 5.19846674381, 77713.77146812050],
+    [2, 0, 0.00001628461, 1.17387749012, 5753.38488489680],
+    [2, 0, 0.00001575568, 2.84685245825, 7860.41939243920],
+    [2, 0, 0.00000924799, 5.45292234084, 11506.76976979360],
+    [2, 0, 0.00000542444, 4.56409149777, 3930.20969621960],
+    [2, 0, 0.00000472110, 3.66100022149, 5884.92684658320],
+    [2, 0, 0.00000345983, 0.96368617687, 5507.55323866740],
+    [2, 0, 0.00000328780, 5.89983646482, 5223.69391980220],
+    [2, 0, 0.00000306784, 0.29867139512, 5573.14280143310],
+    [2, 0, 0.00000243189, 4.27349536153, 11790.62908865880],
+    [2, 0, 0.00000211829, 5.84714540314, 1577.34354244780],
+    [2, 0, 0.00000185752, 5.02194447178, 10977.07880469900],
+    [2, 0, 0.00000174844, 3.01193636534, 18849.22754997420],
+    [2, 0, 0.00000109835, 5.05510636285, 5486.77784317500],
+    [2, 0, 0.00000098316, 0.88681311277, 6069.77675455340],
+    [2, 0, 0.00000086499, 5.68959778254, 15720.83878487840],
+    [2, 0, 0.00000085825, 1.27083733351, 161000.68573767410],
+    [2, 0, 0.00000064903, 0.27250613787, 17260.15465469040],
+    [2, 0, 0.00000062916, 0.92177108832, 529.69096509460],
+    [2, 0, 0.00000057056, 2.01374292014, 83996.84731811189],
+    [2, 0, 0.00000055736, 5.24159798933, 71430.69561812909],
+    [2, 0, 0.00000049384, 3.24501240359, 2544.31441988340],
+    [2, 0, 0.00000046963, 2.57805070386, 775.52261132400],
+    [2, 0, 0.00000044661, 5.53715807302, 9437.76293488700],
+    [2, 0, 0.00000042515, 6.01110242003, 6275.96230299060],
+    [2, 0, 0.00000038968, 5.36071738169, 4694.00295470760],
+    [2, 0, 0.00000038245, 2.39255343974, 8827.39026987480],
+    [2, 0, 0.00000037490, 0.82952922332, 19651.04848109800],
+    [2, 0, 0.00000036957, 4.90107591914, 12139.55350910680],
+    [2, 0, 0.00000035660, 1.67468058995, 12036.46073488820],
+    [2, 0, 0.00000034537, 1.84270693282, 2942.46342329160],
+    [2, 0, 0.00000033193, 0.24370300098, 7084.89678111520],
+    [2, 0, 0.00000031921, 0.18368229781, 5088.62883976680],
+    [2, 0, 0.00000031846, 1.77775642085, 398.14900340820],
+    [2, 0, 0.00000028464, 1.21344868176, 6286.59896834040],
+    [2, 0, 0.00000027793, 1.89934330904, 6279.55273164240],
+    [2, 0, 0.00000026275, 4.58896850401, 10447.38783960440],
+    [2, 0, 0.00000024596, 3.78660875483, 8429.24126646660],
+    [2, 0, 0.00000023927, 4.99598548138, 5856.47765911540],
+    [2, 0, 0.00000023587, 0.26866117066, 796.29800681640],
+    [2, 0, 0.00000023287, 2.80783650928, 14143.49524243060],
+    [2, 0, 0.00000022103, 1.95004702988, 3154.68708489560],
+    [2, 0, 0.00000020349, 4.65267995431, 2146.16541647520],
+    [2, 0, 0.00000019506, 5.38227371393, 2352.86615377180],
+    [2, 0, 0.00000018833, 0.67306674027, 149854.40013480789],
+    [2, 0, 0.00000018331, 2.25348733734, 23581.25817731760],
+    [2, 0, 0.00000017958, 0.19871379385, 6812.76681508600],
+    [2, 0, 0.00000017314, 6.15200787916, 16730.46368959580],
+    [2, 0, 0.00000017174, 4.43315560735, 10213.28554621100],
+    [2, 1, 0.00103018608, 1.10748969588, 6283.07584999140],
+    [2, 1, 0.00001721238, 1.06442301418, 12566.15169998280],
+    [2, 1, 0.00000702215, 3.14159265359, 0.00000000000],
+    [2, 1, 0.00000032346, 1.02169059149, 18849.22754997420],
+    [2, 1, 0.00000030799, 2.84353804832, 5507.55323866740],
+    [2, 1, 0.00000024971, 1.31906709482, 5223.69391980220],
+    [2, 1, 0.00000018485, 1.42429748614, 1577.34354244780],
+    [2, 2, 0.00004359385, 5.78455133738, 6283.07584999140],
+    [2, 2, 0.00000123633, 5.57934722157, 12566.15169998280],
+    [2, 3, 0.00000144595, 4.27319435148, 6283.07584999140],
+])
+
+
+VSOP87_MARS = np.array([
+    [0, 0, 6.20347711583, 0.00000000000, 0.00000000000],
+    [0, 0, 0.18656368100, 5.05037100303, 3340.61242669980],
+    [0, 0, 0.01108216792, 5.40099836958, 6681.22485339960],
+    [0, 0, 0.00091798394, 5.75478745111, 10021.83728009940],
+    [0, 0, 0.00027744987, 5.97049512942, 3.52311834900],
+    [0, 0, 0.00012315897, 0.84956081238, 2810.92146160520],
+    [0, 0, 0.00010610230, 2.93958524973, 2281.23049651060],
+    [0, 0, 0.00008926772, 4.15697845939, 0.01725365220],
+    [0, 0, 0.00008715688, 6.11005159792, 13362.44970679920],
+    [0, 0, 0.00007774867, 3.33968655074, 5621.84292321040],
+    [0, 0, 0.00006797552, 0.36462243626, 398.14900340820],
+    [0, 0, 0.00004161101, 0.22814975330, 2942.46342329160],
+    [0, 0, 0.00003575079, 1.66186540141, 2544.31441988340],
+    [0, 0, 0.00003075250, 0.85696597082, 191.44826611160],
+    [0, 0, 0.00002937543, 6.07893711408, 0.06731030280],
+    [0, 0, 0.00002628122, 0.64806143570, 3337.08930835080],
+    [0, 0, 0.00002579842, 0.02996706197, 3344.13554504880],
+    [0, 0, 0.00002389420, 5.03896401349, 796.29800681640],
+    [0, 0, 0.00001798808, 0.65634026844, 529.69096509460],
+    [0, 0, 0.00001546408, 2.91579633392, 1751.53953141600],
+    [0, 0, 0.00001528140, 1.14979306228, 6151.53388830500],
+    [0, 0, 0.00001286232, 3.06795924626, 2146.16541647520],
+    [0, 0, 0.00001264356, 3.62275092231, 5092.15195811580],
+    [0, 0, 0.00001024907, 3.69334293555, 8962.45534991020],
+    [0, 0, 0.00000891567, 0.18293899090, 16703.06213349900],
+    [0, 0, 0.00000858760, 2.40093704204, 2914.01423582380],
+    [0, 0, 0.00000832724, 4.49495753458, 3340.62968035200],
+    [0, 0, 0.00000832718, 2.46418591282, 3340.59517304760],
+    [0, 0, 0.00000748724, 3.82248399468, 155.42039943420],
+    [0, 0, 0.00000723863, 0.67497565801, 3738.76143010800],
+    [0, 0, 0.00000712899, 3.66336014788, 1059.38193018920],
+    [0, 0, 0.00000655163, 0.48864075176, 3127.31333126180],
+    [0, 0, 0.00000635557, 2.92182704275, 8432.76438481560],
+    [0, 0, 0.00000552746, 4.47478863016, 1748.01641306700],
+    [0, 0, 0.00000550472, 3.81001205408, 0.98032106820],
+    [0, 0, 0.00000472164, 3.62547819410, 1194.44701022460],
+    [0, 0, 0.00000425972, 0.55365138172, 6283.07584999140],
+    [0, 0, 0.00000415132, 0.49662314774, 213.29909543800],
+    [0, 0, 0.00000312141, 0.99853322843, 6677.70173505060],
+    [0, 0, 0.00000306552, 0.38052862973, 6684.74797174860],
+    [0, 0, 0.00000302377, 4.48618150321, 3532.06069281140],
+    [0, 0, 0.00000299396, 2.78323705697, 6254.62666252360],
+    [0, 0, 0.00000293199, 4.22131277914, 20.77539549240],
+    [0, 0, 0.00000283600, 5.76885494123, 3149.16416058820],
+    [0, 0, 0.00000281073, 5.88163372945, 1349.86740965880],
+    [0, 0, 0.00000274035, 0.13372501211, 3340.67973700260],
+    [0, 0, 0.00000274028, 0.54222141841, 3340.54511639700],
+    [0, 0, 0.00000238857, 5.37155471672, 4136.91043351620],
+    [0, 0, 0.00000236114, 5.75504515576, 3333.49887969900],
+    [0, 0, 0.00000231185, 1.28240685294, 3870.30339179440],
+    [0, 0, 0.00000221225, 3.50466672203, 382.89653222320],
+    [0, 0, 0.00000204161, 2.82133266185, 1221.84856632140],
+    [0, 0, 0.00000193126, 3.35715137745, 3.59042865180],
+    [0, 0, 0.00000188639, 1.49103016486, 9492.14631500480],
+    [0, 0, 0.00000179196, 1.00561112574, 951.71840625060],
+    [0, 0, 0.00000174068, 2.41360332576, 553.56940284240],
+    [0, 0, 0.00000172110, 0.43943041719, 5486.77784317500],
+    [0, 0, 0.00000160011, 3.94854735192, 4562.46099302120],
+    [0, 0, 0.00000144305, 1.41874193418, 135.06508003540],
+    [0, 0, 0.00000139897, 3.32592516164, 2700.71514038580],
+    [0, 0, 0.00000138245, 4.30145176915, 7.11354700080],
+    [0, 0, 0.00000130993, 4.04491720264, 12303.06777661000],
+    [0, 0, 0.00000128102, 2.20806651008, 1592.59601363280],
+    [0, 0, 0.00000128062, 1.80665643332, 5088.62883976680],
+    [0, 0, 0.00000116945, 3.12805282207, 7903.07341972100],
+    [0, 0, 0.00000113486, 3.70070798123, 1589.07289528380],
+    [0, 0, 0.00000110375, 1.05195079687, 242.72860397400],
+    [0, 0, 0.00000104541, 0.78535382076, 8827.39026987480],
+    [0, 0, 0.00000100090, 3.24343740861, 11773.37681151540],
+    [0, 0, 0.00000098947, 4.84558294740, 6681.24210705180],
+    [0, 0, 0.00000098946, 2.81481140371, 6681.20759974740],
+    [0, 0, 0.00000095592, 0.53954181149, 20043.67456019880],
+    [0, 0, 0.00000086931, 2.20186740523, 11243.68584642080],
+    [0, 0, 0.00000086751, 1.02092221563, 7079.37385680780],
+    [0, 0, 0.00000084187, 3.98970720730, 4399.99435688900],
+    [0, 0, 0.00000083749, 3.20256130990, 4690.47983635860],
+    [0, 0, 0.00000075034, 0.76643418252, 6467.92575796160],
+    [0, 0, 0.00000073476, 2.18428012567, 8429.24126646660],
+    [0, 0, 0.00000072091, 5.84672102525, 5884.92684658320],
+    [0, 0, 0.00000071437, 2.80307550016, 3185.19202726560],
+    [0, 0, 0.00000068984, 3.76399731788, 6041.32756708560],
+    [0, 0, 0.00000068414, 2.73834914412, 2288.34404351140],
+    [0, 0, 0.00000066706, 0.73630620766, 3723.50895892300],
+    [0, 0, 0.00000065320, 2.68118597578, 28.44918746780],
+    [0, 0, 0.00000063376, 0.91296240798, 3553.91152213780],
+    [0, 0, 0.00000063314, 4.52771470470, 426.59819087600],
+    [0, 0, 0.00000061683, 6.16831509419, 2274.11694950980],
+    [0, 0, 0.00000056629, 5.06250410206, 15.25247118500],
+    [0, 0, 0.00000056396, 1.68727150304, 6872.67311951120],
+    [0, 0, 0.00000055909, 3.46260833495, 263.08392337280],
+    [0, 0, 0.00000055488, 4.60625467020, 4292.33083295040],
+    [0, 0, 0.00000052256, 0.89941531307, 9623.68827669120],
+    [0, 0, 0.00000051678, 2.81307492682, 3339.63210563160],
+    [0, 0, 0.00000051332, 4.14823636534, 3341.59274776800],
+    [0, 0, 0.00000048542, 3.95670418719, 4535.05943692440],
+    [0, 0, 0.00000045905, 0.28718981497, 5614.72937620960],
+    [0, 0, 0.00000045829, 0.78784235062, 1990.74501704100],
+    [0, 0, 0.00000044174, 3.19529736702, 5628.95647021120],
+    [0, 0, 0.00000041939, 3.58326425115, 8031.09226305840],
+    [0, 0, 0.00000041223, 6.02019329922, 3894.18182954220],
+    [0, 0, 0.00000040671, 3.13832621829, 9595.23908922340],
+    [0, 0, 0.00000039495, 5.63225392160, 3097.88382272579],
+    [0, 0, 0.00000038790, 1.35198498795, 10018.31416175040],
+    [0, 0, 0.00000038352, 5.82880707426, 3191.04922956520],
+    [0, 0, 0.00000038206, 2.34835984063, 162.46663613220],
+    [0, 0, 0.00000038107, 0.73401946320, 10025.36039844840],
+    [0, 0, 0.00000037752, 4.15482955299, 2803.80791460440],
+    [0, 0, 0.00000037135, 0.68508150774, 2818.03500860600],
+    [0, 0, 0.00000036716, 2.63720775102, 692.15760122680],
+    [0, 0, 0.00000034031, 2.59544082509, 11769.85369316640],
+    [0, 0, 0.00000033626, 6.11992401052, 6489.77658728800],
+    [0, 0, 0.00000033148, 1.14023770004, 5.52292430740],
+    [0, 0, 0.00000032562, 0.48400659333, 6681.29216370240],
+    [0, 0, 0.00000032561, 0.89250316888, 6681.15754309680],
+    [0, 0, 0.00000031168, 3.98160912982, 20.35531939880],
+    [0, 0, 0.00000029007, 2.42707385674, 3319.83703120740],
+    [0, 0, 0.00000028686, 5.72055456734, 7477.52286021600],
+    [0, 0, 0.00000027584, 1.59691203058, 7210.91581849420],
+    [0, 0, 0.00000027540, 6.08389942337, 6674.11130639880],
+    [0, 0, 0.00000027278, 4.55645328122, 3361.38782219220],
+    [0, 0, 0.00000026357, 1.34532646574, 3496.03282613400],
+    [0, 0, 0.00000025637, 0.24963523420, 522.57741809380],
+    [0, 0, 0.00000025512, 3.43242352804, 3443.70520091840],
+    [0, 0, 0.00000025380, 0.52093116112, 10.63666534980],
+    [0, 0, 0.00000024554, 4.00323183088, 11371.70468975820],
+    [0, 0, 0.00000024378, 0.96994696413, 632.78373931320],
+    [0, 0, 0.00000023764, 1.84058377256, 12832.75874170460],
+    [0, 0, 0.00000023079, 4.74990214223, 3347.72597370060],
+    [0, 0, 0.00000022816, 3.52628212106, 1648.44675719740],
+    [0, 0, 0.00000022737, 4.98520896596, 7632.94325965020],
+    [0, 0, 0.00000022662, 3.95446324417, 4989.05918389720],
+    [0, 0, 0.00000022604, 5.24082917494, 3205.54734666440],
+    [0, 0, 0.00000022542, 5.64861703438, 2388.89402044920],
+    [0, 0, 0.00000022274, 0.72106133721, 266.60704172180],
+    [0, 0, 0.00000021530, 6.15388757177, 3264.34635542420],
+    [0, 0, 0.00000021343, 4.28218757863, 4032.77002792660],
+    [0, 0, 0.00000021202, 3.11824472284, 2957.71589447660],
+    [0, 0, 0.00000020963, 4.27878216453, 5099.26550511660],
+    [0, 0, 0.00000020158, 3.67131504946, 1758.65307841680],
+    [0, 0, 0.00000020093, 1.08247416065, 7064.12138562280],
+    [0, 0, 0.00000019849, 2.37668920745, 10713.99488132620],
+    [0, 0, 0.00000019295, 3.23911854642, 7.04623669800],
+    [0, 0, 0.00000018422, 4.22535881468, 2787.04302385740],
+    [0, 0, 0.00000018113, 3.25756020453, 3337.02199804800],
+    [0, 0, 0.00000018038, 4.25391532000, 2487.41604494780],
+    [0, 0, 0.00000017709, 3.69742343974, 3344.20285535160],
+    [0, 0, 0.00000017555, 4.09197396097, 74.78159856730],
+    [0, 1, 3340.85627474342, 0.00000000000, 0.00000000000],
+    [0, 1, 0.01458227051, 3.60426053609, 3340.61242669980],
+    [0, 1, 0.00164901343, 3.92631250962, 6681.22485339960],
+    [0, 1, 0.00019963338, 4.26594061030, 10021.83728009940],
+    [0, 1, 0.00003452399, 4.73210386365, 3.52311834900],
+    [0, 1, 0.00002485480, 4.61277567318, 13362.44970679920],
+    [0, 1, 0.00000841551, 4.45858256765, 2281.23049651060],
+    [0, 1, 0.00000537566, 5.01589727492, 398.14900340820],
+    [0, 1, 0.00000521041, 4.99422678175, 3344.13554504880],
+    [0, 1, 0.00000432614, 2.56066402860, 191.44826611160],
+    [0, 1, 0.00000429656, 5.31646162367, 155.42039943420],
+    [0, 1, 0.00000381747, 3.53881289437, 796.29800681640],
+    [0, 1, 0.00000314129, 4.96335266049, 16703.06213349900],
+    [0, 1, 0.00000282804, 3.15967518204, 2544.31441988340],
+    [0, 1, 0.00000205664, 4.56891455660, 2146.16541647520],
+    [0, 1, 0.00000168805, 1.32894813366, 3337.08930835080],
+    [0, 1, 0.00000157587, 4.18501035954, 1751.53953141600],
+    [0, 1, 0.00000133686, 2.23325104196, 0.98032106820],
+    [0, 1, 0.00000133563, 5.97421903927, 1748.01641306700],
+    [0, 1, 0.00000117591, 6.02407213861, 6151.53388830500],
+    [0, 1, 0.00000116561, 2.21347652545, 1059.38193018920],
+    [0, 1, 0.00000113876, 2.12869455089, 1194.44701022460],
+    [0, 1, 0.00000113595, 5.42803224317, 3738.76143010800],
+    [0, 1, 0.00000091098, 1.09627836591, 1349.86740965880],
+    [0, 1, 0.00000085342, 3.90854841008, 553.56940284240],
+    [0, 1, 0.00000083301, 5.29636626272, 6684.74797174860],
+    [0, 1, 0.00000080776, 4.42813405865, 529.69096509460],
+    [0, 1, 0.00000079531, 2.24864266330, 8962.45534991020],
+    [0, 1, 0.00000072946, 2.50189460554, 951.71840625060],
+    [0, 1, 0.00000072505, 5.84208163240, 242.72860397400],
+    [0, 1, 0.00000071487, 3.85636094435, 2914.01423582380],
+    [0, 1, 0.00000067582, 5.02327686473, 382.89653222320],
+    [0, 1, 0.00000065089, 1.01802439311, 3340.59517304760],
+    [0, 1, 0.00000065089, 3.04879603978, 3340.62968035200],
+    [0, 1, 0.00000061508, 4.15183159800, 3149.16416058820],
+    [0, 1, 0.00000056520, 3.88813699320, 4136.91043351620],
+    [0, 1, 0.00000048477, 4.87362121538, 213.29909543800],
+    [0, 1, 0.00000047613, 1.18238046057, 3333.49887969900],
+    [0, 1, 0.00000046584, 1.31452419914, 3185.19202726560],
+    [0, 1, 0.00000041343, 0.71385375517, 1592.59601363280],
+    [0, 1, 0.00000040272, 2.72542480614, 7.11354700080],
+    [0, 1, 0.00000040055, 5.31611875491, 20043.67456019880],
+    [0, 1, 0.00000032886, 5.41067411968, 6283.07584999140],
+    [0, 1, 0.00000028244, 0.04534124888, 9492.14631500480],
+    [0, 1, 0.00000026579, 3.88960724782, 1221.84856632140],
+    [0, 1, 0.00000026554, 5.11271747607, 2700.71514038580],
+    [0, 1, 0.00000023335, 6.16762213077, 3532.06069281140],
+    [0, 1, 0.00000022797, 1.54504711003, 2274.11694950980],
+    [0, 1, 0.00000022612, 0.83775884934, 3097.88382272579],
+    [0, 1, 0.00000022431, 5.46592525433, 20.35531939880],
+    [0, 1, 0.00000022294, 5.88516997273, 3870.30339179440],
+    [0, 1, 0.00000021425, 4.97081508139, 3340.67973700260],
+    [0, 1, 0.00000021418, 5.37934044204, 3340.54511639700],
+    [0, 1, 0.00000021104, 3.52525428062, 15.25247118500],
+    [0, 1, 0.00000020431, 2.36353950189, 1589.07289528380],
+    [0, 1, 0.00000020186, 3.36375535766, 5088.62883976680],
+    [0, 1, 0.00000020029, 4.73119428749, 4690.47983635860],
+    [0, 1, 0.00000019964, 5.78652958398, 7079.37385680780],
+    [0, 1, 0.00000019675, 2.57805423988, 12303.06777661000],
+    [0, 1, 0.00000019468, 0.49216434489, 6677.70173505060],
+    [0, 1, 0.00000019455, 2.53112676345, 4399.99435688900],
+    [0, 1, 0.00000018505, 5.57863503922, 1990.74501704100],
+    [0, 1, 0.00000017811, 6.12537931996, 4292.33083295040],
+    [0, 2, 0.00058015791, 2.04979463279, 3340.61242669980],
+    [0, 2, 0.00054187645, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00013908426, 2.45742359888, 6681.22485339960],
+    [0, 2, 0.00002465104, 2.80000020929, 10021.83728009940],
+    [0, 2, 0.00000398379, 3.14118428289, 13362.44970679920],
+    [0, 2, 0.00000222022, 3.19436080019, 3.52311834900],
+    [0, 2, 0.00000120957, 0.54325292454, 155.42039943420],
+    [0, 2, 0.00000061517, 3.48529427371, 16703.06213349900],
+    [0, 2, 0.00000053638, 3.54191121461, 3344.13554504880],
+    [0, 2, 0.00000034268, 6.00188499119, 2281.23049651060],
+    [0, 2, 0.00000031665, 4.14015171788, 191.44826611160],
+    [0, 2, 0.00000029839, 1.99870679845, 796.29800681640],
+    [0, 2, 0.00000023168, 4.33403365928, 242.72860397400],
+    [0, 2, 0.00000021659, 3.44532466378, 398.14900340820],
+    [0, 2, 0.00000020370, 5.42191375400, 553.56940284240],
+    [0, 3, 0.00001482423, 0.44434694876, 3340.61242669980],
+    [0, 3, 0.00000662095, 0.88469178686, 6681.22485339960],
+    [0, 3, 0.00000188268, 1.28799982497, 10021.83728009940],
+    [0, 3, 0.00000041474, 1.64850786997, 13362.44970679920],
+    [0, 3, 0.00000025994, 0.00000000000, 0.00000000000],
+    [0, 3, 0.00000022661, 2.05267665262, 155.42039943420],
+    [0, 4, 0.00000113969, 3.14159265359, 0.00000000000],
+    [0, 4, 0.00000028725, 5.63662412043, 6681.22485339960],
+    [0, 4, 0.00000024447, 5.13868481454, 3340.61242669980],
+    [1, 0, 0.03197134986, 3.76832042432, 3340.61242669980],
+    [1, 0, 0.00298033234, 4.10616996243, 6681.22485339960],
+    [1, 0, 0.00289104742, 0.00000000000, 0.00000000000],
+    [1, 0, 0.00031365538, 4.44651052853, 10021.83728009940],
+    [1, 0, 0.00003484100, 4.78812547889, 13362.44970679920],
+    [1, 0, 0.00000443401, 5.02642620491, 3344.13554504880],
+    [1, 0, 0.00000442999, 5.65233015876, 3337.08930835080],
+    [1, 0, 0.00000399109, 5.13056814700, 16703.06213349900],
+    [1, 0, 0.00000292506, 3.79290644595, 2281.23049651060],
+    [1, 0, 0.00000181982, 6.13648011704, 6151.53388830500],
+    [1, 0, 0.00000163159, 4.26399626634, 529.69096509460],
+    [1, 0, 0.00000159678, 2.23194610246, 1059.38193018920],
+    [1, 0, 0.00000149297, 2.16501209917, 5621.84292321040],
+    [1, 0, 0.00000142686, 1.18215016110, 3340.59517304760],
+    [1, 0, 0.00000142685, 3.21292180820, 3340.62968035200],
+    [1, 0, 0.00000139323, 2.41796344238, 8962.45534991020],
+    [1, 0, 0.00000086377, 5.74429648412, 3738.76143010800],
+    [1, 0, 0.00000083276, 5.98866315739, 6677.70173505060],
+    [1, 0, 0.00000082544, 5.36667872319, 6684.74797174860],
+    [1, 0, 0.00000073640, 5.09187524843, 398.14900340820],
+    [1, 0, 0.00000072660, 5.53775710437, 6283.07584999140],
+    [1, 0, 0.00000063111, 0.73049113369, 5884.92684658320],
+    [1, 0, 0.00000062338, 4.85071999184, 2942.46342329160],
+    [1, 0, 0.00000060116, 3.67960808826, 796.29800681640],
+    [1, 0, 0.00000047199, 4.52184736343, 3149.16416058820],
+    [1, 0, 0.00000046953, 5.13486627234, 3340.67973700260],
+    [1, 0, 0.00000046951, 5.54339723804, 3340.54511639700],
+    [1, 0, 0.00000046630, 5.47361665459, 20043.67456019880],
+    [1, 0, 0.00000045588, 2.13262507507, 2810.92146160520],
+    [1, 0, 0.00000041269, 0.20003189001, 9492.14631500480],
+    [1, 0, 0.00000038540, 4.08008443274, 4136.91043351620],
+    [1, 0, 0.00000033069, 4.06581918329, 1751.53953141600],
+    [1, 0, 0.00000032736, 2.62071056958, 2914.01423582380],
+    [1, 0, 0.00000029694, 5.92218297386, 3532.06069281140],
+    [1, 0, 0.00000029521, 2.75342566734, 12303.06777661000],
+    [1, 0, 0.00000028618, 4.94710527914, 3870.30339179440],
+    [1, 0, 0.00000028169, 2.06282533993, 5486.77784317500],
+    [1, 0, 0.00000026603, 3.55085844020, 6681.24210705180],
+    [1, 0, 0.00000026603, 1.52008675291, 6681.20759974740],
+    [1, 0, 0.00000026052, 2.60064548916, 4399.99435688900],
+    [1, 0, 0.00000023336, 2.27624532707, 1589.07289528380],
+    [1, 0, 0.00000022637, 2.27507466406, 1194.44701022460],
+    [1, 0, 0.00000019947, 2.67365368471, 8432.76438481560],
+    [1, 0, 0.00000018887, 6.04416196149, 7079.37385680780],
+    [1, 1, 0.00350068845, 5.36847836211, 3340.61242669980],
+    [1, 1, 0.00014116030, 3.14159265359, 0.00000000000],
+    [1, 1, 0.00009670755, 5.47877786506, 6681.22485339960],
+    [1, 1, 0.00001471918, 3.20205766795, 10021.83728009940],
+    [1, 1, 0.00000425864, 3.40843812875, 13362.44970679920],
+    [1, 1, 0.00000102039, 0.77617286189, 3337.08930835080],
+    [1, 1, 0.00000078848, 3.71768293865, 16703.06213349900],
+    [1, 1, 0.00000032708, 3.45803723682, 5621.84292321040],
+    [1, 1, 0.00000026171, 2.48293558065, 2281.23049651060],
+    [1, 1, 0.00000020712, 1.44120802297, 6151.53388830500],
+    [1, 1, 0.00000018294, 6.03102943125, 529.69096509460],
+    [1, 2, 0.00016726690, 0.60221392419, 3340.61242669980],
+    [1, 2, 0.00004986799, 3.14159265359, 0.00000000000],
+    [1, 2, 0.00000302141, 5.55871276021, 6681.22485339960],
+    [1, 2, 0.00000025767, 1.89662673499, 13362.44970679920],
+    [1, 2, 0.00000021452, 0.91749968618, 10021.83728009940],
+    [1, 3, 0.00000606506, 1.98050633529, 3340.61242669980],
+    [1, 3, 0.00000042611, 0.00000000000, 0.00000000000],
+    [2, 0, 1.53033488276, 0.00000000000, 0.00000000000],
+    [2, 0, 0.14184953153, 3.47971283519, 3340.61242669980],
+    [2, 0, 0.00660776357, 3.81783442097, 6681.22485339960],
+    [2, 0, 0.00046179117, 4.15595316284, 10021.83728009940],
+    [2, 0, 0.00008109738, 5.55958460165, 2810.92146160520],
+    [2, 0, 0.00007485315, 1.77238998069, 5621.84292321040],
+    [2, 0, 0.00005523193, 1.36436318880, 2281.23049651060],
+    [2, 0, 0.00003825160, 4.49407182408, 13362.44970679920],
+    [2, 0, 0.00002484385, 4.92545577893, 2942.46342329160],
+    [2, 0, 0.00002306539, 0.09081742493, 2544.31441988340],
+    [2, 0, 0.00001999399, 5.36059605227, 3337.08930835080],
+    [2, 0, 0.00001960198, 4.74249386323, 3344.13554504880],
+    [2, 0, 0.00001167115, 2.11261501155, 5092.15195811580],
+    [2, 0, 0.00001102828, 5.00908264160, 398.14900340820],
+    [2, 0, 0.00000992252, 5.83862401067, 6151.53388830500],
+    [2, 0, 0.00000899077, 4.40790433994, 529.69096509460],
+    [2, 0, 0.00000807348, 2.10216647104, 1059.38193018920],
+    [2, 0, 0.00000797910, 3.44839026172, 796.29800681640],
+    [2, 0, 0.00000740980, 1.49906336892, 2146.16541647520],
+    [2, 0, 0.00000725583, 1.24516913473, 8432.76438481560],
+    [2, 0, 0.00000692340, 2.13378814785, 8962.45534991020],
+    [2, 0, 0.00000633144, 0.89353285018, 3340.59517304760],
+    [2, 0, 0.00000633140, 2.92430448169, 3340.62968035200],
+    [2, 0, 0.00000629976, 1.28738135858, 1751.53953141600],
+    [2, 0, 0.00000574352, 0.82896196337, 2914.01423582380],
+    [2, 0, 0.00000526187, 5.38292276228, 3738.76143010800],
+    [2, 0, 0.00000472776, 5.19850457873, 3127.31333126180],
+    [2, 0, 0.00000348095, 4.83219198908, 16703.06213349900],
+    [2, 0, 0.00000283702, 2.90692294913, 3532.06069281140],
+    [2, 0, 0.00000279552, 5.25749247548, 6283.07584999140],
+    [2, 0, 0.00000275501, 1.21767967781, 6254.62666252360],
+    [2, 0, 0.00000275224, 2.90818883832, 1748.01641306700],
+    [2, 0, 0.00000269891, 3.76394728622, 5884.92684658320],
+    [2, 0, 0.00000239133, 2.03669896238, 1194.44701022460],
+    [2, 0, 0.00000233827, 5.10546492529, 5486.77784317500],
+    [2, 0, 0.00000228128, 3.25529020620, 6872.67311951120],
+    [2, 0, 0.00000223190, 4.19861593779, 3149.16416058820],
+    [2, 0, 0.00000219428, 5.58340248784, 191.44826611160],
+    [2, 0, 0.00000208336, 4.84626442122, 3340.67973700260],
+    [2, 0, 0.00000208333, 5.25476080773, 3340.54511639700],
+    [2, 0, 0.00000186213, 5.69871555748, 6677.70173505060],
+    [2, 0, 0.00000182686, 5.08062683355, 6684.74797174860],
+    [2, 0, 0.00000178613, 4.18423025538, 3333.49887969900],
+    [2, 0, 0.00000175995, 5.95341786369, 3870.30339179440],
+    [2, 0, 0.00000163534, 3.79889068111, 4136.91043351620],
+    [2, 0, 0.00000144286, 0.21296012258, 5088.62883976680],
+    [2, 0, 0.00000141759, 2.47790321309, 4562.46099302120],
+    [2, 0, 0.00000133120, 1.53910106710, 7903.07341972100],
+    [2, 0, 0.00000128555, 5.49883294915, 8827.39026987480],
+    [2, 0, 0.00000118781, 2.12178071222, 1589.07289528380],
+    [2, 0, 0.00000114941, 4.31745088059, 1349.86740965880],
+    [2, 0, 0.00000111538, 0.55339169625, 11243.68584642080],
+    [2, 0, 0.00000102096, 6.18138550087, 9492.14631500480],
+    [2, 0, 0.00000086659, 1.74988330093, 2700.71514038580],
+    [2, 0, 0.00000085312, 1.61621097912, 4690.47983635860],
+    [2, 0, 0.00000084470, 0.62274593110, 1592.59601363280],
+    [2, 0, 0.00000083212, 0.61553380568, 8429.24126646660],
+    [2, 0, 0.00000082498, 1.62227044590, 11773.37681151540],
+    [2, 0, 0.00000071826, 2.47489899385, 12303.06777661000],
+    [2, 0, 0.00000068599, 2.40197828418, 4399.99435688900],
+    [2, 0, 0.00000066509, 2.21307705185, 6041.32756708560],
+    [2, 0, 0.00000063641, 2.67334126661, 426.59819087600],
+    [2, 0, 0.00000062015, 1.10065866221, 1221.84856632140],
+    [2, 0, 0.00000058959, 3.26242666052, 6681.24210705180],
+    [2, 0, 0.00000058959, 1.23165502899, 6681.20759974740],
+    [2, 0, 0.00000058559, 4.72052787516, 213.29909543800],
+    [2, 0, 0.00000055811, 1.23288325946, 3185.19202726560],
+    [2, 0, 0.00000055686, 5.44686699242, 3723.50895892300],
+    [2, 0, 0.00000054989, 5.72691385306, 951.71840625060],
+    [2, 0, 0.00000052418, 3.02366828926, 4292.33083295040],
+    [2, 0, 0.00000051561, 5.72326937712, 7079.37385680780],
+    [2, 0, 0.00000048939, 5.61614696751, 3553.91152213780],
+    [2, 0, 0.00000045414, 5.43290921705, 6467.92575796160],
+    [2, 0, 0.00000044629, 2.01473640390, 8031.09226305840],
+    [2, 0, 0.00000044292, 5.00341366850, 5614.72937620960],
+    [2, 0, 0.00000043256, 1.03732072925, 11769.85369316640],
+    [2, 0, 0.00000042444, 2.26551590902, 155.42039943420],
+    [2, 0, 0.00000042191, 1.63253742760, 5628.95647021120],
+    [2, 0, 0.00000039237, 1.24237122859, 3339.63210563160],
+    [2, 0, 0.00000038956, 2.57760416009, 3341.59274776800],
+    [2, 0, 0.00000036435, 4.43921812388, 3894.18182954220],
+    [2, 0, 0.00000035980, 1.15966567007, 2288.34404351140],
+    [2, 0, 0.00000035265, 5.49029710802, 1990.74501704100],
+    [2, 0, 0.00000033623, 5.17029029766, 20043.67456019880],
+    [2, 0, 0.00000033065, 0.85467740581, 553.56940284240],
+    [2, 0, 0.00000032259, 2.38215172582, 4535.05943692440],
+    [2, 0, 0.00000031972, 1.93970478412, 382.89653222320],
+    [2, 0, 0.00000031943, 4.59258406791, 2274.11694950980],
+    [2, 0, 0.00000031870, 4.37521442752, 3.52311834900],
+    [2, 0, 0.00000030345, 2.44177670130, 11371.70468975820],
+    [2, 0, 0.00000029350, 4.06034813442, 3097.88382272579],
+    [2, 0, 0.00000027904, 4.25805969214, 3191.04922956520],
+    [2, 0, 0.00000027543, 1.57668567401, 9595.23908922340],
+    [2, 1, 0.01107433340, 2.03250524950, 3340.61242669980],
+    [2, 1, 0.00103175886, 2.37071845682, 6681.22485339960],
+    [2, 1, 0.00012877200, 0.00000000000, 0.00000000000],
+    [2, 1, 0.00010815880, 2.70888093803, 10021.83728009940],
+    [2, 1, 0.00001194550, 3.04702182503, 13362.44970679920],
+    [2, 1, 0.00000438579, 2.88835072628, 2281.23049651060],
+    [2, 1, 0.00000395698, 3.42324611291, 3344.13554504880],
+    [2, 1, 0.00000182572, 1.58428644001, 2544.31441988340],
+    [2, 1, 0.00000135850, 3.38507017993, 16703.06213349900],
+    [2, 1, 0.00000128362, 6.04343360441, 3337.08930835080],
+    [2, 1, 0.00000128204, 0.62991220570, 1059.38193018920],
+    [2, 1, 0.00000127068, 1.95389775740, 796.29800681640],
+    [2, 1, 0.00000118443, 2.99761345074, 2146.16541647520],
+    [2, 1, 0.00000087537, 3.42052758979, 398.14900340820],
+    [2, 1, 0.00000083026, 3.85574986653, 3738.76143010800],
+    [2, 1, 0.00000075598, 4.45101839349, 6151.53388830500],
+    [2, 1, 0.00000071999, 2.76442180680, 529.69096509460],
+    [2, 1, 0.00000066542, 2.54892602695, 1751.53953141600],
+    [2, 1, 0.00000066430, 4.40597549957, 1748.01641306700],
+    [2, 1, 0.00000057518, 0.54354327916, 1194.44701022460],
+    [2, 1, 0.00000054314, 0.67750943459, 8962.45534991020],
+    [2, 1, 0.00000051035, 3.72585409207, 6684.74797174860],
+    [2, 1, 0.00000049428, 5.72959428364, 3340.59517304760],
+    [2, 1, 0.00000049424, 1.47717922226, 3340.62968035200],
+    [2, 1, 0.00000048318, 2.58061691301, 3149.16416058820],
+    [2, 1, 0.00000047863, 2.28527896843, 2914.01423582380],
+    [2, 1, 0.00000038953, 2.31900090554, 4136.91043351620],
+    [2, 1, 0.00000037176, 5.81439911546, 1349.86740965880],
+    [2, 1, 0.00000036384, 6.02728752344, 3185.19202726560],
+    [2, 1, 0.00000036036, 5.89508336048, 3333.49887969900],
+    [2, 1, 0.00000031115, 0.97832506960, 191.44826611160],
+    [2, 1, 0.00000027244, 5.41367977087, 1592.59601363280],
+    [2, 2, 0.00044242247, 0.47930603943, 3340.61242669980],
+    [2, 2, 0.00008138042, 0.86998398093, 6681.22485339960],
+    [2, 2, 0.00001274915, 1.22594050809, 10021.83728009940],
+    [2, 2, 0.00000187387, 1.57298991982, 13362.44970679920],
+    [2, 2, 0.00000052396, 3.14159265359, 0.00000000000],
+    [2, 2, 0.00000040744, 1.97080175060, 3344.13554504880],
+    [2, 2, 0.00000026616, 1.91665615762, 16703.06213349900],
+    [2, 3, 0.00001113107, 5.14987350142, 3340.61242669980],
+    [2, 3, 0.00000424446, 5.61343766478, 6681.22485339960],
+    [2, 3, 0.00000100044, 5.99726827028, 10021.83728009940],
+])
+
+
+VSOP87_JUPITER = np.array([
+    [0, 0, 0.59954691495, 0.00000000000, 0.00000000000],
+    [0, 0, 0.09695898711, 5.06191793105, 529.69096509460],
+    [0, 0, 0.00573610145, 1.44406205976, 7.11354700080],
+    [0, 0, 0.00306389180, 5.41734729976, 1059.38193018920],
+    [0, 0, 0.00097178280, 4.14264708819, 632.78373931320],
+    [0, 0, 0.00072903096, 3.64042909255, 522.57741809380],
+    [0, 0, 0.00064263986, 3.41145185203, 103.09277421860],
+    [0, 0, 0.00039806051, 2.29376744855, 419.48464387520],
+    [0, 0, 0.00038857780, 1.27231724860, 316.39186965660],
+    [0, 0, 0.00027964622, 1.78454589485, 536.80451209540],
+    [0, 0, 0.00013589738, 5.77481031590, 1589.07289528380],
+    [0, 0, 0.00008768686, 3.63000324417, 949.17560896980],
+    [0, 0, 0.00008246362, 3.58227961655, 206.18554843720],
+    [0, 0, 0.00007368057, 5.08101125612, 735.87651353180],
+    [0, 0, 0.00006263171, 0.02497643742, 213.29909543800],
+    [0, 0, 0.00006114050, 4.51319531666, 1162.47470440780],
+    [0, 0, 0.00005305457, 4.18625053495, 1052.26838318840],
+    [0, 0, 0.00005305283, 1.30671236848, 14.22709400160],
+    [0, 0, 0.00004905419, 1.32084631684, 110.20632121940],
+    [0, 0, 0.00004647249, 4.69958109497, 3.93215326310],
+    [0, 0, 0.00003045009, 4.31675960318, 426.59819087600],
+    [0, 0, 0.00002610001, 1.56667594850, 846.08283475120],
+    [0, 0, 0.00002028191, 1.06376547379, 3.18139373770],
+    [0, 0, 0.00001920959, 0.97168928755, 639.89728631400],
+    [0, 0, 0.00001764768, 2.14148077766, 1066.49547719000],
+    [0, 0, 0.00001722983, 3.88036008872, 1265.56747862640],
+    [0, 0, 0.00001633217, 3.58201089758, 515.46387109300],
+    [0, 0, 0.00001431997, 4.29683690269, 625.67019231240],
+    [0, 0, 0.00000973278, 4.09764957065, 95.97922721780],
+    [0, 0, 0.00000884439, 2.43701426123, 412.37109687440],
+    [0, 0, 0.00000732875, 6.08534113239, 838.96928775040],
+    [0, 0, 0.00000731072, 3.80591233956, 1581.95934828300],
+    [0, 0, 0.00000709190, 1.29272573658, 742.99006053260],
+    [0, 0, 0.00000691928, 6.13368222939, 2118.76386037840],
+    [0, 0, 0.00000614464, 4.10853496756, 1478.86657406440],
+    [0, 0, 0.00000581902, 4.53967717552, 309.27832265580],
+    [0, 0, 0.00000495224, 3.75567461379, 323.50541665740],
+    [0, 0, 0.00000440854, 2.95818460943, 454.90936652730],
+    [0, 0, 0.00000417266, 1.03554430161, 2.44768055480],
+    [0, 0, 0.00000389864, 4.89716105852, 1692.16566950240],
+    [0, 0, 0.00000375657, 4.70299124833, 1368.66025284500],
+    [0, 0, 0.00000341006, 5.71452525783, 533.62311835770],
+    [0, 0, 0.00000330458, 4.74049819491, 0.04818410980],
+    [0, 0, 0.00000261540, 1.87652461032, 0.96320784650],
+    [0, 0, 0.00000261009, 0.82047246448, 380.12776796000],
+    [0, 0, 0.00000256568, 3.72410724159, 199.07200143640],
+    [0, 0, 0.00000244170, 5.22020878900, 728.76296653100],
+    [0, 0, 0.00000235141, 1.22693908124, 909.81873305460],
+    [0, 0, 0.00000220382, 1.65115015995, 543.91805909620],
+    [0, 0, 0.00000207327, 1.85461666594, 525.75881183150],
+    [0, 0, 0.00000201996, 1.80684574186, 1375.77379984580],
+    [0, 0, 0.00000197046, 5.29252149016, 1155.36115740700],
+    [0, 0, 0.00000175191, 3.72966554761, 942.06206196900],
+    [0, 0, 0.00000175184, 3.22634903433, 1898.35121793960],
+    [0, 0, 0.00000174809, 5.90973505276, 956.28915597060],
+    [0, 0, 0.00000157909, 4.36483921766, 1795.25844372100],
+    [0, 0, 0.00000150502, 3.90625022622, 74.78159856730],
+    [0, 0, 0.00000149368, 4.37745104275, 1685.05212250160],
+    [0, 0, 0.00000141445, 3.13568357861, 491.55792945680],
+    [0, 0, 0.00000137871, 1.31797920785, 1169.58825140860],
+    [0, 0, 0.00000130531, 4.16867945489, 1045.15483618760],
+    [0, 0, 0.00000117495, 2.50022140890, 1596.18644228460],
+    [0, 0, 0.00000116757, 3.38920921041, 0.52126486180],
+    [0, 0, 0.00000105895, 4.55439798236, 526.50957135690],
+    [0, 0, 0.00000099511, 1.42117395747, 532.87235883230],
+    [0, 0, 0.00000096137, 1.18156870005, 117.31986822020],
+    [0, 0, 0.00000091758, 0.85756633461, 1272.68102562720],
+    [0, 0, 0.00000087695, 1.21738140813, 453.42489381900],
+    [0, 0, 0.00000077401, 4.42676337124, 39.35687591520],
+    [0, 0, 0.00000072006, 4.23834923691, 2111.65031337760],
+    [0, 0, 0.00000070297, 5.14180555282, 835.03713448730],
+    [0, 0, 0.00000068507, 2.35242959478, 2.92076130680],
+    [0, 0, 0.00000066532, 2.98864358135, 2214.74308759620],
+    [0, 0, 0.00000066098, 5.34386149468, 1471.75302706360],
+    [0, 0, 0.00000063406, 4.97665525033, 0.75075952540],
+    [0, 0, 0.00000062481, 0.51211384012, 220.41264243880],
+    [0, 0, 0.00000060194, 4.12628179571, 4.19278569400],
+    [0, 0, 0.00000059427, 4.11130498612, 2001.44399215820],
+    [0, 0, 0.00000058190, 5.86646380344, 5753.38488489680],
+    [0, 0, 0.00000056012, 1.15493222602, 21.34064100240],
+    [0, 0, 0.00000054459, 1.57072704127, 983.11585891360],
+    [0, 0, 0.00000052854, 0.91207215543, 10.29494073850],
+    [0, 0, 0.00000051916, 4.10048180020, 1258.45393162560],
+    [0, 0, 0.00000046800, 3.54640538283, 5.41662597140],
+    [0, 0, 0.00000046654, 4.79394835282, 305.34616939270],
+    [0, 0, 0.00000046442, 4.66531163524, 5.62907429250],
+    [0, 0, 0.00000046042, 5.10983515150, 4.66586644600],
+    [0, 0, 0.00000043402, 0.14992289081, 528.20649238630],
+    [0, 0, 0.00000041830, 4.67982493646, 302.16477565500],
+    [0, 0, 0.00000040103, 4.68801114087, 0.16005869440],
+    [0, 1, 529.93480757497, 0.00000000000, 0.00000000000],
+    [0, 1, 0.00489741194, 4.22066689928, 529.69096509460],
+    [0, 1, 0.00228918538, 6.02647464016, 7.11354700080],
+    [0, 1, 0.00027655380, 4.57265956824, 1059.38193018920],
+    [0, 1, 0.00020720943, 5.45938936295, 522.57741809380],
+    [0, 1, 0.00012105732, 0.16985765041, 536.80451209540],
+    [0, 1, 0.00006068051, 4.42419502005, 103.09277421860],
+    [0, 1, 0.00005433924, 3.98478382565, 419.48464387520],
+    [0, 1, 0.00004237795, 5.89009351271, 14.22709400160],
+    [0, 1, 0.00002211854, 5.26771446618, 206.18554843720],
+    [0, 1, 0.00001745919, 4.92669378486, 1589.07289528380],
+    [0, 1, 0.00001295769, 5.55132765087, 3.18139373770],
+    [0, 1, 0.00001173129, 5.85647304350, 1052.26838318840],
+    [0, 1, 0.00001163411, 0.51450895328, 3.93215326310],
+    [0, 1, 0.00001098735, 5.30704981594, 515.46387109300],
+    [0, 1, 0.00001007216, 0.46478398551, 735.87651353180],
+    [0, 1, 0.00001003574, 3.15040301822, 426.59819087600],
+    [0, 1, 0.00000847678, 5.75805850450, 110.20632121940],
+    [0, 1, 0.00000827329, 4.80312015734, 213.29909543800],
+    [0, 1, 0.00000816397, 0.58643054886, 1066.49547719000],
+    [0, 1, 0.00000725447, 5.51827471473, 639.89728631400],
+    [0, 1, 0.00000567845, 5.98867049451, 625.67019231240],
+    [0, 1, 0.00000474181, 4.13245269168, 412.37109687440],
+    [0, 1, 0.00000412930, 5.73652891261, 95.97922721780],
+    [0, 1, 0.00000345249, 4.24159565410, 632.78373931320],
+    [0, 1, 0.00000335817, 3.73248749046, 1162.47470440780],
+    [0, 1, 0.00000234340, 4.03469970332, 949.17560896980],
+    [0, 1, 0.00000234066, 6.24302226646, 309.27832265580],
+    [0, 1, 0.00000198525, 1.50458442825, 838.96928775040],
+    [0, 1, 0.00000194784, 2.21879010911, 323.50541665740],
+    [0, 1, 0.00000186899, 6.08620565908, 742.99006053260],
+    [0, 1, 0.00000183938, 6.27963588822, 543.91805909620],
+    [0, 1, 0.00000171380, 5.41655983845, 199.07200143640],
+    [0, 1, 0.00000130771, 0.62643377351, 728.76296653100],
+    [0, 1, 0.00000115393, 0.68019050174, 846.08283475120],
+    [0, 1, 0.00000115047, 5.28641699144, 2118.76386037840],
+    [0, 1, 0.00000107575, 4.49282760117, 956.28915597060],
+    [0, 1, 0.00000079686, 5.82412400273, 1045.15483618760],
+    [0, 1, 0.00000071643, 5.34162650321, 942.06206196900],
+    [0, 1, 0.00000069618, 5.97263450278, 532.87235883230],
+    [0, 1, 0.00000066824, 5.73365126533, 21.34064100240],
+    [0, 1, 0.00000065635, 0.12924191430, 526.50957135690],
+    [0, 1, 0.00000064850, 6.08803490288, 1581.95934828300],
+    [0, 1, 0.00000058509, 0.58626971028, 1155.36115740700],
+    [0, 1, 0.00000057939, 0.99453087342, 1596.18644228460],
+    [0, 1, 0.00000057368, 5.96851304799, 1169.58825140860],
+    [0, 1, 0.00000056600, 1.41198438841, 533.62311835770],
+    [0, 1, 0.00000054935, 5.42806383723, 10.29494073850],
+    [0, 1, 0.00000052309, 5.72661448388, 117.31986822020],
+    [0, 1, 0.00000052016, 0.22981299129, 1368.66025284500],
+    [0, 1, 0.00000050418, 6.08075147811, 525.75881183150],
+    [0, 1, 0.00000047418, 3.62611843241, 1478.86657406440],
+    [0, 1, 0.00000046678, 0.51144073175, 1265.56747862640],
+    [0, 2, 0.00047233598, 4.32148323554, 7.11354700080],
+    [0, 2, 0.00038965550, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00030629053, 2.93021440216, 529.69096509460],
+    [0, 2, 0.00003189317, 1.05504615595, 522.57741809380],
+    [0, 2, 0.00002729292, 4.84545481351, 536.80451209540],
+    [0, 2, 0.00002723358, 3.41411526638, 1059.38193018920],
+    [0, 2, 0.00001721069, 4.18734385158, 14.22709400160],
+    [0, 2, 0.00000383258, 5.76790714387, 419.48464387520],
+    [0, 2, 0.00000377524, 0.76048964872, 515.46387109300],
+    [0, 2, 0.00000367498, 6.05509120409, 103.09277421860],
+    [0, 2, 0.00000337386, 3.78644384244, 3.18139373770],
+    [0, 2, 0.00000308200, 0.69356654052, 206.18554843720],
+    [0, 2, 0.00000218408, 3.81389191353, 1589.07289528380],
+    [0, 2, 0.00000198883, 5.33996443444, 1066.49547719000],
+    [0, 2, 0.00000197445, 2.48356402053, 3.93215326310],
+    [0, 2, 0.00000155862, 1.40642426467, 1052.26838318840],
+    [0, 2, 0.00000146230, 3.81373196838, 639.89728631400],
+    [0, 2, 0.00000141932, 1.63435169016, 426.59819087600],
+    [0, 2, 0.00000129570, 5.83738872525, 412.37109687440],
+    [0, 2, 0.00000117327, 1.41435462588, 625.67019231240],
+    [0, 2, 0.00000096733, 4.03383427887, 110.20632121940],
+    [0, 2, 0.00000090823, 1.10630629042, 95.97922721780],
+    [0, 2, 0.00000087292, 2.52235174825, 632.78373931320],
+    [0, 2, 0.00000078769, 4.63726131329, 543.91805909620],
+    [0, 2, 0.00000072392, 2.21716670026, 735.87651353180],
+    [0, 2, 0.00000058475, 0.83216317444, 199.07200143640],
+    [0, 2, 0.00000056910, 3.12292059854, 213.29909543800],
+    [0, 2, 0.00000048622, 1.67283791618, 309.27832265580],
+    [0, 2, 0.00000040150, 4.02485444740, 21.34064100240],
+    [0, 3, 0.00006501665, 2.59862880482, 7.11354700080],
+    [0, 3, 0.00001356524, 1.34635886411, 529.69096509460],
+    [0, 3, 0.00000470716, 2.47503977883, 14.22709400160],
+    [0, 3, 0.00000416960, 3.24451243214, 536.80451209540],
+    [0, 3, 0.00000352851, 2.97360159003, 522.57741809380],
+    [0, 3, 0.00000154880, 2.07565585817, 1059.38193018920],
+    [0, 3, 0.00000086771, 2.51431584316, 515.46387109300],
+    [0, 3, 0.00000044378, 0.00000000000, 0.00000000000],
+    [0, 4, 0.00000669483, 0.85282421090, 7.11354700080],
+    [0, 4, 0.00000114019, 3.14159265359, 0.00000000000],
+    [0, 4, 0.00000099961, 0.74258947751, 14.22709400160],
+    [0, 4, 0.00000050024, 1.65346208248, 536.80451209540],
+    [0, 4, 0.00000043585, 5.82026386621, 529.69096509460],
+    [0, 5, 0.00000049577, 5.25658966184, 7.11354700080],
+    [1, 0, 0.02268615703, 3.55852606718, 529.69096509460],
+    [1, 0, 0.00110090358, 0.00000000000, 0.00000000000],
+    [1, 0, 0.00109971634, 3.90809347389, 1059.38193018920],
+    [1, 0, 0.00008101427, 3.60509573368, 522.57741809380],
+    [1, 0, 0.00006437782, 0.30627121409, 536.80451209540],
+    [1, 0, 0.00006043996, 4.25883108794, 1589.07289528380],
+    [1, 0, 0.00001106880, 2.98534421928, 1162.47470440780],
+    [1, 0, 0.00000944328, 1.67522288396, 426.59819087600],
+    [1, 0, 0.00000941651, 2.93619072405, 1052.26838318840],
+    [1, 0, 0.00000894088, 1.75447429921, 7.11354700080],
+    [1, 0, 0.00000835861, 5.17881973234, 103.09277421860],
+    [1, 0, 0.00000767280, 2.15473594060, 632.78373931320],
+    [1, 0, 0.00000684220, 3.67808770098, 213.29909543800],
+    [1, 0, 0.00000629223, 0.64343282328, 1066.49547719000],
+    [1, 0, 0.00000558524, 0.01354830508, 846.08283475120],
+    [1, 0, 0.00000531670, 2.70305954352, 110.20632121940],
+    [1, 0, 0.00000464449, 1.17337249185, 949.17560896980],
+    [1, 0, 0.00000431072, 2.60825000494, 419.48464387520],
+    [1, 0, 0.00000351433, 4.61062990714, 2118.76386037840],
+    [1, 0, 0.00000132160, 4.77816990670, 742.99006053260],
+    [1, 0, 0.00000123148, 3.34968181384, 1692.16566950240],
+    [1, 0, 0.00000116379, 1.38688232033, 323.50541665740],
+    [1, 0, 0.00000115038, 5.04892295442, 316.39186965660],
+    [1, 0, 0.00000103762, 3.70103838110, 515.46387109300],
+    [1, 0, 0.00000103402, 2.31878999565, 1478.86657406440],
+    [1, 0, 0.00000102420, 3.15293785436, 1581.95934828300],
+    [1, 0, 0.00000078650, 3.98318653238, 1265.56747862640],
+    [1, 0, 0.00000069935, 2.56006216424, 956.28915597060],
+    [1, 0, 0.00000063456, 4.50073574333, 735.87651353180],
+    [1, 0, 0.00000055597, 0.37500753017, 1375.77379984580],
+    [1, 0, 0.00000055194, 0.40176412035, 525.75881183150],
+    [1, 0, 0.00000051986, 0.99007119033, 1596.18644228460],
+    [1, 0, 0.00000049691, 0.18649893085, 543.91805909620],
+    [1, 0, 0.00000048831, 3.57260550671, 533.62311835770],
+    [1, 1, 0.00177351787, 5.70166488486, 529.69096509460],
+    [1, 1, 0.00003230171, 5.77941619340, 1059.38193018920],
+    [1, 1, 0.00003081364, 5.47464296527, 522.57741809380],
+    [1, 1, 0.00002211914, 4.73477480209, 536.80451209540],
+    [1, 1, 0.00001694232, 3.14159265359, 0.00000000000],
+    [1, 1, 0.00000346445, 4.74595174109, 1052.26838318840],
+    [1, 1, 0.00000234264, 5.18856099929, 1066.49547719000],
+    [1, 1, 0.00000196154, 6.18554286642, 7.11354700080],
+    [1, 1, 0.00000150468, 3.92721226087, 1589.07289528380],
+    [1, 1, 0.00000114128, 3.43897271830, 632.78373931320],
+    [1, 1, 0.00000096667, 2.91426304090, 949.17560896980],
+    [1, 1, 0.00000081671, 5.07666097497, 1162.47470440780],
+    [1, 1, 0.00000076599, 2.50522188662, 103.09277421860],
+    [1, 1, 0.00000076572, 0.61288981445, 419.48464387520],
+    [1, 1, 0.00000073875, 5.49958292155, 515.46387109300],
+    [1, 1, 0.00000060544, 5.44740084359, 213.29909543800],
+    [1, 1, 0.00000049915, 3.94799616572, 735.87651353180],
+    [1, 1, 0.00000046032, 0.53850360901, 110.20632121940],
+    [1, 1, 0.00000045123, 1.89516645239, 846.08283475120],
+    [1, 2, 0.00008094051, 1.46322843658, 529.69096509460],
+    [1, 2, 0.00000813244, 3.14159265359, 0.00000000000],
+    [1, 2, 0.00000742415, 0.95691639003, 522.57741809380],
+    [1, 2, 0.00000398951, 2.89888666447, 536.80451209540],
+    [1, 2, 0.00000342226, 1.44683789727, 1059.38193018920],
+    [1, 2, 0.00000073948, 0.40724675866, 1052.26838318840],
+    [1, 2, 0.00000046151, 3.48036895772, 1066.49547719000],
+    [1, 3, 0.00000251624, 3.38087923084, 529.69096509460],
+    [1, 3, 0.00000121738, 2.73311837200, 522.57741809380],
+    [1, 3, 0.00000048694, 1.03689996685, 536.80451209540],
+    [2, 0, 5.20887429471, 0.00000000000, 0.00000000000],
+    [2, 0, 0.25209327020, 3.49108640015, 529.69096509460],
+    [2, 0, 0.00610599902, 3.84115365602, 1059.38193018920],
+    [2, 0, 0.00282029465, 2.57419879933, 632.78373931320],
+    [2, 0, 0.00187647391, 2.07590380082, 522.57741809380],
+    [2, 0, 0.00086792941, 0.71001090609, 419.48464387520],
+    [2, 0, 0.00072062869, 0.21465694745, 536.80451209540],
+    [2, 0, 0.00065517227, 5.97995850843, 316.39186965660],
+    [2, 0, 0.00030135275, 2.16132058449, 949.17560896980],
+    [2, 0, 0.00029134620, 1.67759243710, 103.09277421860],
+    [2, 0, 0.00023947340, 0.27457854894, 7.11354700080],
+    [2, 0, 0.00023453209, 3.54023147303, 735.87651353180],
+    [2, 0, 0.00022283710, 4.19362773546, 1589.07289528380],
+    [2, 0, 0.00013032600, 2.96043055741, 1162.47470440780],
+    [2, 0, 0.00012749004, 2.71550102862, 1052.26838318840],
+    [2, 0, 0.00009703346, 1.90669572402, 206.18554843720],
+    [2, 0, 0.00009161431, 4.41352618935, 213.29909543800],
+    [2, 0, 0.00007894539, 2.47907551404, 426.59819087600],
+    [2, 0, 0.00007057978, 2.18184753111, 1265.56747862640],
+    [2, 0, 0.00006137755, 6.26417542514, 846.08283475120],
+    [2, 0, 0.00005477093, 5.65729325169, 639.89728631400],
+    [2, 0, 0.00004170012, 2.01605033912, 515.46387109300],
+    [2, 0, 0.00004136890, 2.72219979684, 625.67019231240],
+    [2, 0, 0.00003502519, 0.56531297394, 1066.49547719000],
+    [2, 0, 0.00002616955, 2.00993967129, 1581.95934828300],
+    [2, 0, 0.00002499966, 4.55182055941, 838.96928775040],
+    [2, 0, 0.00002127644, 6.12751461750, 742.99006053260],
+    [2, 0, 0.00001911876, 0.85621927419, 412.37109687440],
+    [2, 0, 0.00001610549, 3.08867789275, 1368.66025284500],
+    [2, 0, 0.00001479484, 2.68026191372, 1478.86657406440],
+    [2, 0, 0.00001230708, 1.89042979701, 323.50541665740],
+    [2, 0, 0.00001216810, 1.80171561024, 110.20632121940],
+    [2, 0, 0.00001014959, 1.38673237666, 454.90936652730],
+    [2, 0, 0.00000998579, 2.87208940110, 309.27832265580],
+    [2, 0, 0.00000961072, 4.54876989805, 2118.76386037840],
+    [2, 0, 0.00000885708, 4.14785948471, 533.62311835770],
+    [2, 0, 0.00000821465, 1.59342534396, 1898.35121793960],
+    [2, 0, 0.00000812036, 5.94091899141, 909.81873305460],
+    [2, 0, 0.00000776700, 3.67696954690, 728.76296653100],
+    [2, 0, 0.00000727162, 3.98824686402, 1155.36115740700],
+    [2, 0, 0.00000655289, 2.79065604219, 1685.05212250160],
+    [2, 0, 0.00000653981, 3.38150775269, 1692.16566950240],
+    [2, 0, 0.00000620798, 4.82284338962, 956.28915597060],
+    [2, 0, 0.00000614784, 2.27624915604, 942.06206196900],
+    [2, 0, 0.00000562120, 0.08095987241, 543.91805909620],
+    [2, 0, 0.00000542221, 0.28360266386, 525.75881183150],
+    [2, 0, 0.00000496066, 5.53005947761, 380.12776796000],
+    [2, 0, 0.00000469965, 2.81896276101, 1795.25844372100],
+    [2, 0, 0.00000457859, 0.12722694510, 1375.77379984580],
+    [2, 0, 0.00000445003, 0.14623567024, 14.22709400160],
+    [2, 0, 0.00000435805, 2.60272129748, 95.97922721780],
+    [2, 0, 0.00000345804, 1.56404293688, 491.55792945680],
+    [2, 0, 0.00000338342, 2.79873192583, 1045.15483618760],
+    [2, 0, 0.00000319013, 1.34803130803, 2214.74308759620],
+    [2, 0, 0.00000309352, 5.36855804945, 1272.68102562720],
+    [2, 0, 0.00000303364, 1.15407454372, 5753.38488489680],
+    [2, 0, 0.00000293875, 2.04938438861, 199.07200143640],
+    [2, 0, 0.00000290985, 6.03131226226, 1169.58825140860],
+    [2, 0, 0.00000290869, 3.89339143564, 1471.75302706360],
+    [2, 0, 0.00000276627, 2.52238450687, 2001.44399215820],
+    [2, 0, 0.00000275084, 2.98863518924, 526.50957135690],
+    [2, 0, 0.00000257482, 6.13395478303, 532.87235883230],
+    [2, 0, 0.00000239036, 3.57397189838, 835.03713448730],
+    [2, 0, 0.00000215398, 2.63572815848, 2111.65031337760],
+    [2, 1, 0.01271801596, 2.64937511122, 529.69096509460],
+    [2, 1, 0.00061661771, 3.00076251018, 1059.38193018920],
+    [2, 1, 0.00053443592, 3.89717644226, 522.57741809380],
+    [2, 1, 0.00041390257, 0.00000000000, 0.00000000000],
+    [2, 1, 0.00031185167, 4.88276663526, 536.80451209540],
+    [2, 1, 0.00011847190, 2.41329588176, 419.48464387520],
+    [2, 1, 0.00009166360, 4.75979408587, 7.11354700080],
+    [2, 1, 0.00003403605, 3.34688537997, 1589.07289528380],
+    [2, 1, 0.00003203446, 5.21083285476, 735.87651353180],
+    [2, 1, 0.00003175763, 2.79297987071, 103.09277421860],
+    [2, 1, 0.00002806064, 3.74223693580, 515.46387109300],
+    [2, 1, 0.00002676575, 4.33052878699, 1052.26838318840],
+    [2, 1, 0.00002600003, 3.63435101622, 206.18554843720],
+    [2, 1, 0.00002412207, 1.46947308304, 426.59819087600],
+    [2, 1, 0.00002100507, 3.92762682306, 639.89728631400],
+    [2, 1, 0.00001646182, 5.30953510947, 1066.49547719000],
+    [2, 1, 0.00001641257, 4.41628669824, 625.67019231240],
+    [2, 1, 0.00001049866, 3.16113622955, 213.29909543800],
+    [2, 1, 0.00001024802, 2.55432643018, 412.37109687440],
+    [2, 1, 0.00000806404, 2.67750801380, 632.78373931320],
+    [2, 1, 0.00000740996, 2.17094630558, 1162.47470440780],
+    [2, 1, 0.00000676928, 6.24953479790, 838.96928775040],
+    [2, 1, 0.00000567076, 4.57655414712, 742.99006053260],
+    [2, 1, 0.00000484689, 2.46882793186, 949.17560896980],
+    [2, 1, 0.00000468895, 4.70973463481, 543.91805909620],
+    [2, 1, 0.00000444683, 0.40281181402, 323.50541665740],
+    [2, 1, 0.00000415894, 5.36836018215, 728.76296653100],
+    [2, 1, 0.00000401738, 4.60528841541, 309.27832265580],
+    [2, 1, 0.00000347378, 4.68148808722, 14.22709400160],
+    [2, 1, 0.00000337555, 3.16781951120, 956.28915597060],
+    [2, 1, 0.00000260753, 5.34290306101, 846.08283475120],
+    [2, 1, 0.00000246603, 3.92313823537, 942.06206196900],
+    [2, 1, 0.00000220084, 4.84210964963, 1368.66025284500],
+    [2, 2, 0.00079644833, 1.35865896596, 529.69096509460],
+    [2, 2, 0.00008251618, 5.77773935444, 522.57741809380],
+    [2, 2, 0.00007029864, 3.27476965833, 536.80451209540],
+    [2, 2, 0.00005314006, 1.83835109712, 1059.38193018920],
+    [2, 2, 0.00001860833, 2.97682139367, 7.11354700080],
+    [2, 2, 0.00000964466, 5.48031822015, 515.46387109300],
+    [2, 2, 0.00000836267, 4.19889881718, 419.48464387520],
+    [2, 2, 0.00000497920, 3.14159265359, 0.00000000000],
+    [2, 2, 0.00000426570, 2.22753101795, 639.89728631400],
+    [2, 2, 0.00000406453, 3.78250730354, 1066.49547719000],
+    [2, 2, 0.00000377316, 2.24248352873, 1589.07289528380],
+    [2, 2, 0.00000362943, 5.36761847267, 206.18554843720],
+    [2, 2, 0.00000342048, 6.09922969324, 1052.26838318840],
+    [2, 2, 0.00000339043, 6.12690864038, 625.67019231240],
+    [2, 2, 0.00000332578, 0.00328961161, 426.59819087600],
+    [2, 2, 0.00000279920, 4.26162555827, 412.37109687440],
+    [2, 2, 0.00000257290, 0.96295364983, 632.78373931320],
+    [2, 2, 0.00000229777, 0.70530766213, 735.87651353180],
+    [2, 3, 0.00003519257, 6.05800633846, 529.69096509460],
+    [2, 3, 0.00001073239, 1.67321345760, 536.80451209540],
+    [2, 3, 0.00000915666, 1.41329676116, 522.57741809380],
+    [2, 3, 0.00000341593, 0.52296542656, 1059.38193018920],
+    [2, 3, 0.00000254893, 1.19625473533, 7.11354700080],
+    [2, 3, 0.00000221512, 0.95225226237, 515.46387109300],
+])
+
+
+VSOP87_SATURN = np.array([
+    [0, 0, 0.87401354029, 0.00000000000, 0.00000000000],
+    [0, 0, 0.11107659780, 3.96205090194, 213.29909543800],
+    [0, 0, 0.01414150958, 4.58581515873, 7.11354700080],
+    [0, 0, 0.00398379386, 0.52112025957, 206.18554843720],
+    [0, 0, 0.00350769223, 3.30329903015, 426.59819087600],
+    [0, 0, 0.00206816296, 0.24658366938, 103.09277421860],
+    [0, 0, 0.00079271288, 3.84007078530, 220.41264243880],
+    [0, 0, 0.00023990338, 4.66976934860, 110.20632121940],
+    [0, 0, 0.00016573583, 0.43719123541, 419.48464387520],
+    [0, 0, 0.00015820300, 0.93808953760, 632.78373931320],
+    [0, 0, 0.00015053509, 2.71670027883, 639.89728631400],
+    [0, 0, 0.00014906995, 5.76903283845, 316.39186965660],
+    [0, 0, 0.00014609562, 1.56518573691, 3.93215326310],
+    [0, 0, 0.00013160308, 4.44891180176, 14.22709400160],
+    [0, 0, 0.00013005305, 5.98119067061, 11.04570026390],
+    [0, 0, 0.00010725066, 3.12939596466, 202.25339517410],
+    [0, 0, 0.00006126308, 1.76328499656, 277.03499374140],
+    [0, 0, 0.00005863207, 0.23657028777, 529.69096509460],
+    [0, 0, 0.00005227771, 4.20783162380, 3.18139373770],
+    [0, 0, 0.00005019658, 3.17787919533, 433.71173787680],
+    [0, 0, 0.00004592541, 0.61976424374, 199.07200143640],
+    [0, 0, 0.00004005862, 2.24479893937, 63.73589830340],
+    [0, 0, 0.00003873696, 3.22282692566, 138.51749687070],
+    [0, 0, 0.00003269490, 0.77491895787, 949.17560896980],
+    [0, 0, 0.00002953815, 0.98280385206, 95.97922721780],
+    [0, 0, 0.00002461172, 2.03163631205, 735.87651353180],
+    [0, 0, 0.00001758143, 3.26580514774, 522.57741809380],
+    [0, 0, 0.00001640183, 5.50504966218, 846.08283475120],
+    [0, 0, 0.00001580641, 4.37266314120, 309.27832265580],
+    [0, 0, 0.00001391336, 4.02331978116, 323.50541665740],
+    [0, 0, 0.00001123515, 2.83726793572, 415.55249061210],
+    [0, 0, 0.00001087237, 4.18343232481, 2.44768055480],
+    [0, 0, 0.00001017258, 3.71698151814, 227.52618943960],
+    [0, 0, 0.00000956752, 0.50740889886, 1265.56747862640],
+    [0, 0, 0.00000852677, 3.42141350697, 175.16605980020],
+    [0, 0, 0.00000848643, 3.19149825839, 209.36694217490],
+    [0, 0, 0.00000789205, 5.00745123149, 0.96320784650],
+    [0, 0, 0.00000748811, 2.14398149298, 853.19638175200],
+    [0, 0, 0.00000743584, 5.25276954625, 224.34479570190],
+    [0, 0, 0.00000686965, 1.74714407827, 1052.26838318840],
+    [0, 0, 0.00000654470, 1.59889331515, 0.04818410980],
+    [0, 0, 0.00000633980, 2.29889903023, 412.37109687440],
+    [0, 0, 0.00000624904, 0.97046831256, 210.11770170030],
+    [0, 0, 0.00000579857, 3.09259007048, 74.78159856730],
+    [0, 0, 0.00000546358, 2.12678554211, 350.33211960040],
+    [0, 0, 0.00000542643, 1.51824320514, 9.56122755560],
+    [0, 0, 0.00000529861, 4.44938897119, 117.31986822020],
+    [0, 0, 0.00000478054, 2.96488054338, 137.03302416240],
+    [0, 0, 0.00000474279, 5.47527185987, 742.99006053260],
+    [0, 0, 0.00000451827, 1.04436664241, 490.33408917940],
+    [0, 0, 0.00000448542, 1.28990416161, 127.47179660680],
+    [0, 0, 0.00000372308, 2.27819108625, 217.23124870110],
+    [0, 0, 0.00000354944, 3.01286483030, 838.96928775040],
+    [0, 0, 0.00000347413, 1.53928227764, 340.77089204480],
+    [0, 0, 0.00000343475, 0.24604039134, 0.52126486180],
+    [0, 0, 0.00000330196, 0.24715617844, 1581.95934828300],
+    [0, 0, 0.00000322185, 0.96137456104, 203.73786788240],
+    [0, 0, 0.00000321543, 2.57182354537, 647.01083331480],
+    [0, 0, 0.00000309001, 3.49486734909, 216.48048917570],
+    [0, 0, 0.00000286688, 2.37043745859, 351.81659230870],
+    [0, 0, 0.00000277775, 0.40020408926, 211.81462272970],
+    [0, 0, 0.00000249116, 1.47010534421, 1368.66025284500],
+    [0, 0, 0.00000226609, 4.91003163138, 12.53017297220],
+    [0, 0, 0.00000220225, 4.20422424873, 200.76892246580],
+    [0, 0, 0.00000208655, 1.34516255304, 625.67019231240],
+    [0, 0, 0.00000207663, 0.48349820488, 1162.47470440780],
+    [0, 0, 0.00000207659, 1.28302218900, 39.35687591520],
+    [0, 0, 0.00000204500, 6.01082206600, 265.98929347750],
+    [0, 0, 0.00000184690, 3.50344404958, 149.56319713460],
+    [0, 0, 0.00000183511, 0.97254952728, 4.19278569400],
+    [0, 0, 0.00000182454, 5.49122292426, 2.92076130680],
+    [0, 0, 0.00000173914, 1.86305806814, 0.75075952540],
+    [0, 0, 0.00000164541, 0.44005517520, 5.41662597140],
+    [0, 0, 0.00000149299, 5.73594349789, 52.69019803950],
+    [0, 0, 0.00000147526, 1.53529320509, 5.62907429250],
+    [0, 0, 0.00000146068, 6.23102544071, 195.13984817330],
+    [0, 0, 0.00000139666, 4.29450260069, 21.34064100240],
+    [0, 0, 0.00000131283, 4.06828961903, 10.29494073850],
+    [0, 0, 0.00000124969, 6.27737805832, 1898.35121793960],
+    [0, 0, 0.00000122373, 1.97588777199, 4.66586644600],
+    [0, 0, 0.00000118156, 5.34072933900, 554.06998748280],
+    [0, 0, 0.00000117283, 2.67920400584, 1155.36115740700],
+    [0, 0, 0.00000113747, 5.59427544714, 1059.38193018920],
+    [0, 0, 0.00000112437, 1.10502663534, 191.20769491020],
+    [0, 0, 0.00000110399, 0.16604024090, 1.48447270830],
+    [0, 0, 0.00000109275, 3.43812715686, 536.80451209540],
+    [0, 0, 0.00000106570, 4.01156608514, 956.28915597060],
+    [0, 0, 0.00000103956, 2.19210363069, 88.86568021700],
+    [0, 0, 0.00000102702, 1.19748124058, 1685.05212250160],
+    [0, 0, 0.00000100631, 4.96513666539, 269.92144674060],
+    [0, 0, 0.00000096987, 4.53666595763, 302.16477565500],
+    [0, 0, 0.00000096330, 2.83319189210, 275.55052103310],
+    [0, 0, 0.00000091430, 1.87521577510, 38.13303563780],
+    [0, 0, 0.00000089949, 5.80392934702, 114.13847448250],
+    [0, 0, 0.00000088772, 3.86334563977, 278.51946644970],
+    [0, 0, 0.00000083791, 5.48810655641, 0.11187458460],
+    [0, 0, 0.00000083461, 2.28972767279, 628.85158605010],
+    [0, 0, 0.00000082363, 3.05469876064, 440.82528487760],
+    [0, 0, 0.00000079021, 4.45154941586, 35.42472265210],
+    [0, 0, 0.00000075765, 1.61410487792, 284.14854074220],
+    [0, 0, 0.00000075491, 2.18045274099, 728.76296653100],
+    [0, 0, 0.00000073888, 5.08914205084, 1375.77379984580],
+    [0, 0, 0.00000071633, 5.10940743430, 65.22037101170],
+    [0, 0, 0.00000070409, 4.86846451411, 0.21244832110],
+    [0, 0, 0.00000069760, 3.71029022489, 14.97785352700],
+    [0, 0, 0.00000069313, 3.43979731402, 515.46387109300],
+    [0, 0, 0.00000068090, 0.73415460990, 1478.86657406440],
+    [0, 0, 0.00000066501, 0.02677580336, 70.84944530420],
+    [0, 0, 0.00000065682, 2.02165559602, 142.44965013380],
+    [0, 0, 0.00000063664, 3.31749528708, 62.25142559510],
+    [0, 0, 0.00000063153, 3.49493353034, 479.28838891550],
+    [0, 0, 0.00000062539, 2.58713611532, 422.66603761290],
+    [0, 0, 0.00000061080, 1.50295092063, 210.85141488320],
+    [0, 0, 0.00000060556, 2.68715551585, 388.46515523820],
+    [0, 0, 0.00000055170, 0.96797446150, 942.06206196900],
+    [0, 0, 0.00000054492, 2.45674090515, 22.09140052780],
+    [0, 0, 0.00000054165, 0.78154835399, 191.95845443560],
+    [0, 0, 0.00000053011, 3.18480701697, 8.07675484730],
+    [0, 0, 0.00000052939, 5.51392725227, 0.26063243090],
+    [0, 0, 0.00000050514, 4.26749346978, 99.16062095550],
+    [0, 0, 0.00000050145, 6.03164759907, 2214.74308759620],
+    [0, 0, 0.00000049288, 2.38641424063, 1471.75302706360],
+    [0, 0, 0.00000047199, 2.02515248245, 312.19908396260],
+    [0, 0, 0.00000047016, 4.59934671151, 437.64389113990],
+    [0, 0, 0.00000045860, 0.54229721801, 212.33588759150],
+    [0, 1, 213.54295595986, 0.00000000000, 0.00000000000],
+    [0, 1, 0.01296855005, 1.82820544701, 213.29909543800],
+    [0, 1, 0.00564347566, 2.88500136429, 7.11354700080],
+    [0, 1, 0.00107678770, 2.27769911872, 206.18554843720],
+    [0, 1, 0.00098323030, 1.08070061328, 426.59819087600],
+    [0, 1, 0.00040254586, 2.04128257090, 220.41264243880],
+    [0, 1, 0.00019941734, 1.27954662736, 103.09277421860],
+    [0, 1, 0.00010511706, 2.74880392800, 14.22709400160],
+    [0, 1, 0.00006939233, 0.40493079985, 639.89728631400],
+    [0, 1, 0.00004803325, 2.44194097666, 419.48464387520],
+    [0, 1, 0.00004056325, 2.92166618776, 110.20632121940],
+    [0, 1, 0.00003768630, 3.64965631460, 3.93215326310],
+    [0, 1, 0.00003384684, 2.41694251653, 3.18139373770],
+    [0, 1, 0.00003302200, 1.26256486715, 433.71173787680],
+    [0, 1, 0.00003071382, 2.32739317750, 199.07200143640],
+    [0, 1, 0.00001953036, 3.56394683300, 11.04570026390],
+    [0, 1, 0.00001249348, 2.62803737519, 95.97922721780],
+    [0, 1, 0.00000921683, 1.96089834250, 227.52618943960],
+    [0, 1, 0.00000705587, 4.41689249330, 529.69096509460],
+    [0, 1, 0.00000649654, 6.17418093659, 202.25339517410],
+    [0, 1, 0.00000627603, 6.11088227167, 309.27832265580],
+    [0, 1, 0.00000486843, 6.03998200305, 853.19638175200],
+    [0, 1, 0.00000478501, 4.98776987984, 522.57741809380],
+    [0, 1, 0.00000468377, 4.61707843907, 63.73589830340],
+    [0, 1, 0.00000417010, 2.11708169277, 323.50541665740],
+    [0, 1, 0.00000407630, 1.29949556676, 209.36694217490],
+    [0, 1, 0.00000352489, 2.31707079463, 632.78373931320],
+    [0, 1, 0.00000343826, 3.95854178574, 412.37109687440],
+    [0, 1, 0.00000339724, 3.63396398752, 316.39186965660],
+    [0, 1, 0.00000335936, 3.77173072712, 735.87651353180],
+    [0, 1, 0.00000331933, 2.86077699882, 210.11770170030],
+    [0, 1, 0.00000289429, 2.73263080235, 117.31986822020],
+    [0, 1, 0.00000280911, 5.74398845416, 2.44768055480],
+    [0, 1, 0.00000265801, 0.54344631312, 647.01083331480],
+    [0, 1, 0.00000230493, 1.64428879621, 216.48048917570],
+    [0, 1, 0.00000191667, 2.96512946582, 224.34479570190],
+    [0, 1, 0.00000172891, 4.07695221044, 846.08283475120],
+    [0, 1, 0.00000167131, 2.59745202658, 21.34064100240],
+    [0, 1, 0.00000136328, 2.28580246629, 10.29494073850],
+    [0, 1, 0.00000131364, 3.44108355646, 742.99006053260],
+    [0, 1, 0.00000127838, 4.09533471247, 217.23124870110],
+    [0, 1, 0.00000108862, 6.16141072262, 415.55249061210],
+    [0, 1, 0.00000097584, 4.72845436677, 838.96928775040],
+    [0, 1, 0.00000093909, 3.48397279899, 1052.26838318840],
+    [0, 1, 0.00000092482, 3.94755499926, 88.86568021700],
+    [0, 1, 0.00000086600, 1.21951325061, 440.82528487760],
+    [0, 1, 0.00000083463, 3.11269504725, 625.67019231240],
+    [0, 1, 0.00000077588, 6.24408938835, 302.16477565500],
+    [0, 1, 0.00000067106, 0.28961738595, 4.66586644600],
+    [0, 1, 0.00000065843, 5.64757042732, 9.56122755560],
+    [0, 1, 0.00000061900, 4.29344363385, 127.47179660680],
+    [0, 1, 0.00000061557, 1.82789612597, 195.13984817330],
+    [0, 1, 0.00000057780, 2.47630552035, 191.95845443560],
+    [0, 1, 0.00000056919, 5.01889578112, 137.03302416240],
+    [0, 1, 0.00000054585, 0.28356341456, 74.78159856730],
+    [0, 1, 0.00000054160, 5.12628572382, 490.33408917940],
+    [0, 1, 0.00000051425, 1.45766406064, 536.80451209540],
+    [0, 1, 0.00000046799, 1.17721211050, 149.56319713460],
+    [0, 1, 0.00000046649, 5.14818326902, 515.46387109300],
+    [0, 1, 0.00000045891, 2.23198878761, 956.28915597060],
+    [0, 2, 0.00116441181, 1.17987850633, 7.11354700080],
+    [0, 2, 0.00091920844, 0.07425261094, 213.29909543800],
+    [0, 2, 0.00090592251, 0.00000000000, 0.00000000000],
+    [0, 2, 0.00015276909, 4.06492007503, 206.18554843720],
+    [0, 2, 0.00010631396, 0.25778277414, 220.41264243880],
+    [0, 2, 0.00010604979, 5.40963595885, 426.59819087600],
+    [0, 2, 0.00004265368, 1.04595556630, 14.22709400160],
+    [0, 2, 0.00001215527, 2.91860042123, 103.09277421860],
+    [0, 2, 0.00001164684, 4.60942128971, 639.89728631400],
+    [0, 2, 0.00001081967, 5.69130351670, 433.71173787680],
+    [0, 2, 0.00001044754, 4.04206453611, 199.07200143640],
+    [0, 2, 0.00001020079, 0.63369182642, 3.18139373770],
+    [0, 2, 0.00000633582, 4.38825410036, 419.48464387520],
+    [0, 2, 0.00000549329, 5.57303134242, 3.93215326310],
+    [0, 2, 0.00000456914, 1.26840971349, 110.20632121940],
+    [0, 2, 0.00000425100, 0.20935499279, 227.52618943960],
+    [0, 2, 0.00000273739, 4.28841011784, 95.97922721780],
+    [0, 2, 0.00000161571, 1.38139149420, 11.04570026390],
+    [0, 2, 0.00000129494, 1.56586884170, 309.27832265580],
+    [0, 2, 0.00000117008, 3.88120915956, 853.19638175200],
+    [0, 2, 0.00000105415, 4.90003203599, 647.01083331480],
+    [0, 2, 0.00000100967, 0.89270493100, 21.34064100240],
+    [0, 2, 0.00000095659, 2.91093561539, 316.39186965660],
+    [0, 2, 0.00000095227, 5.62561150598, 412.37109687440],
+    [0, 2, 0.00000084860, 5.73472777961, 209.36694217490],
+    [0, 2, 0.00000082727, 6.05030934786, 216.48048917570],
+    [0, 2, 0.00000081948, 1.02477558315, 117.31986822020],
+    [0, 2, 0.00000074857, 4.76178468163, 210.11770170030],
+    [0, 2, 0.00000067184, 0.45648612616, 522.57741809380],
+    [0, 2, 0.00000066459, 0.48297940601, 10.29494073850],
+    [0, 2, 0.00000063696, 0.35179804917, 323.50541665740],
+    [0, 2, 0.00000060647, 4.87517850190, 632.78373931320],
+    [0, 2, 0.00000053281, 2.74730541387, 529.69096509460],
+    [0, 2, 0.00000045827, 5.69296621745, 440.82528487760],
+    [0, 3, 0.00016038734, 5.73945377424, 7.11354700080],
+    [0, 3, 0.00004249793, 4.58539675603, 213.29909543800],
+    [0, 3, 0.00001906524, 4.76082050205, 220.41264243880],
+    [0, 3, 0.00001465687, 5.91326678323, 206.18554843720],
+    [0, 3, 0.00001162041, 5.61973132428, 14.22709400160],
+    [0, 3, 0.00001066581, 3.60816533142, 426.59819087600],
+    [0, 3, 0.00000239377, 3.86088273439, 433.71173787680],
+    [0, 3, 0.00000236975, 5.76826451465, 199.07200143640],
+    [0, 3, 0.00000165641, 5.11641150216, 3.18139373770],
+    [0, 3, 0.00000151352, 2.73594641861, 639.89728631400],
+    [0, 3, 0.00000131409, 4.74327544615, 227.52618943960],
+    [0, 3, 0.00000063365, 0.22850089497, 419.48464387520],
+    [0, 3, 0.00000061630, 4.74287052463, 103.09277421860],
+    [0, 4, 0.00001661894, 3.99826248978, 7.11354700080],
+    [0, 4, 0.00000257107, 2.98436499013, 220.41264243880],
+    [0, 4, 0.00000236344, 3.90241428075, 14.22709400160],
+    [0, 4, 0.00000149418, 2.74110824208, 213.29909543800],
+    [0, 4, 0.00000113953, 3.14159265359, 0.00000000000],
+    [0, 4, 0.00000109598, 1.51515739251, 206.18554843720],
+    [0, 4, 0.00000068390, 1.72120953337, 426.59819087600],
+    [0, 5, 0.00000123615, 2.25923345732, 7.11354700080],
+    [1, 0, 0.04330678040, 3.60284428399, 213.29909543800],
+    [1, 0, 0.00240348303, 2.85238489390, 426.59819087600],
+    [1, 0, 0.00084745939, 0.00000000000, 0.00000000000],
+    [1, 0, 0.00034116063, 0.57297307844, 206.18554843720],
+    [1, 0, 0.00030863357, 3.48441504465, 220.41264243880],
+    [1, 0, 0.00014734070, 2.11846597870, 639.89728631400],
+    [1, 0, 0.00009916668, 5.79003189405, 419.48464387520],
+    [1, 0, 0.00006993564, 4.73604689179, 7.11354700080],
+    [1, 0, 0.00004807587, 5.43305315602, 316.39186965660],
+    [1, 0, 0.00004788392, 4.96512927420, 110.20632121940],
+    [1, 0, 0.00003432125, 2.73255752123, 433.71173787680],
+    [1, 0, 0.00001506129, 6.01304536144, 103.09277421860],
+    [1, 0, 0.00001060298, 5.63099292414, 529.69096509460],
+    [1, 0, 0.00000969071, 5.20434966103, 632.78373931320],
+    [1, 0, 0.00000942050, 1.39646678088, 853.19638175200],
+    [1, 0, 0.00000707645, 3.80302329547, 323.50541665740],
+    [1, 0, 0.00000552313, 5.13149109045, 202.25339517410],
+    [1, 0, 0.00000399675, 3.35891413961, 227.52618943960],
+    [1, 0, 0.00000319380, 3.62571550980, 209.36694217490],
+    [1, 0, 0.00000316063, 1.99716764199, 647.01083331480],
+    [1, 0, 0.00000314225, 0.46510272410, 217.23124870110],
+    [1, 0, 0.00000284494, 4.88648481625, 224.34479570190],
+    [1, 0, 0.00000236442, 2.13887472281, 11.04570026390],
+    [1, 0, 0.00000215354, 5.94982610103, 846.08283475120],
+    [1, 0, 0.00000208522, 2.12003893769, 415.55249061210],
+    [1, 0, 0.00000207213, 0.73021462851, 199.07200143640],
+    [1, 0, 0.00000178958, 2.95361514672, 63.73589830340],
+    [1, 0, 0.00000140585, 0.64417620299, 490.33408917940],
+    [1, 0, 0.00000139240, 4.59535168021, 14.22709400160],
+    [1, 0, 0.00000139140, 1.99821990940, 735.87651353180],
+    [1, 0, 0.00000134884, 5.24500819605, 742.99006053260],
+    [1, 0, 0.00000121669, 3.11537140876, 522.57741809380],
+    [1, 0, 0.00000115524, 3.10891547171, 216.48048917570],
+    [1, 0, 0.00000114218, 0.96261442133, 210.11770170030],
+    [1, 0, 0.00000096376, 4.48164339766, 117.31986822020],
+    [1, 0, 0.00000080593, 1.31692750150, 277.03499374140],
+    [1, 0, 0.00000074302, 2.89376539620, 149.56319713460],
+    [1, 0, 0.00000072952, 3.05988482370, 536.80451209540],
+    [1, 0, 0.00000069261, 4.92378633635, 309.27832265580],
+    [1, 0, 0.00000068040, 2.18002263974, 351.81659230870],
+    [1, 0, 0.00000061734, 0.67728106562, 1066.49547719000],
+    [1, 0, 0.00000056598, 2.60963391288, 440.82528487760],
+    [1, 0, 0.00000048864, 5.78725874107, 95.97922721780],
+    [1, 0, 0.00000048243, 2.18211837430, 74.78159856730],
+    [1, 1, 0.00397554998, 5.33289992556, 213.29909543800],
+    [1, 1, 0.00049478641, 3.14159265359, 0.00000000000],
+    [1, 1, 0.00018571607, 6.09919206378, 426.59819087600],
+    [1, 1, 0.00014800587, 2.30586060520, 206.18554843720],
+    [1, 1, 0.00009643981, 1.69674660120, 220.41264243880],
+    [1, 1, 0.00003757161, 1.25429514018, 419.48464387520],
+    [1, 1, 0.00002716647, 5.91166664787, 639.89728631400],
+    [1, 1, 0.00001455309, 0.85161616532, 433.71173787680],
+    [1, 1, 0.00001290595, 2.91770857090, 7.11354700080],
+    [1, 1, 0.00000852630, 0.43572078997, 316.39186965660],
+    [1, 1, 0.00000297726, 0.91909206723, 632.78373931320],
+    [1, 1, 0.00000292185, 5.31574251270, 853.19638175200],
+    [1, 1, 0.00000284386, 1.61881754773, 227.52618943960],
+    [1, 1, 0.00000275090, 3.88864137336, 103.09277421860],
+    [1, 1, 0.00000172359, 0.05215146556, 647.01083331480],
+    [1, 1, 0.00000166237, 2.44351613165, 199.07200143640],
+    [1, 1, 0.00000158220, 5.20850125766, 110.20632121940],
+    [1, 1, 0.00000127731, 1.20711452525, 529.69096509460],
+    [1, 1, 0.00000109839, 2.45695551627, 217.23124870110],
+    [1, 1, 0.00000081759, 2.75839171353, 210.11770170030],
+    [1, 1, 0.00000081010, 2.86038377187, 14.22709400160],
+    [1, 1, 0.00000068658, 1.65537623146, 202.25339517410],
+    [1, 1, 0.00000065161, 1.25527521313, 216.48048917570],
+    [1, 1, 0.00000061024, 1.25273412095, 209.36694217490],
+    [1, 1, 0.00000059281, 1.82410768234, 323.50541665740],
+    [1, 1, 0.00000046386, 0.81534705304, 440.82528487760],
+    [1, 2, 0.00020629977, 0.50482422817, 213.29909543800],
+    [1, 2, 0.00003719555, 3.99833475829, 206.18554843720],
+    [1, 2, 0.00001627158, 6.18189939500, 220.41264243880],
+    [1, 2, 0.00001346067, 0.00000000000, 0.00000000000],
+    [1, 2, 0.00000705842, 3.03914308836, 419.48464387520],
+    [1, 2, 0.00000365042, 5.09928680706, 426.59819087600],
+    [1, 2, 0.00000329632, 5.27899210039, 433.71173787680],
+    [1, 2, 0.00000219335, 3.82841533795, 639.89728631400],
+    [1, 2, 0.00000139393, 1.04272623499, 7.11354700080],
+    [1, 2, 0.00000103980, 6.15730992966, 227.52618943960],
+    [1, 2, 0.00000092961, 1.97994412845, 316.39186965660],
+    [1, 2, 0.00000071242, 4.14754353431, 199.07200143640],
+    [1, 2, 0.00000051927, 2.88364833898, 632.78373931320],
+    [1, 2, 0.00000048961, 4.43390206741, 647.01083331480],
+    [1, 3, 0.00000666252, 1.99006340181, 213.29909543800],
+    [1, 3, 0.00000632350, 5.69778316807, 206.18554843720],
+    [1, 3, 0.00000398051, 0.00000000000, 0.00000000000],
+    [1, 3, 0.00000187838, 4.33779804809, 220.41264243880],
+    [1, 3, 0.00000091884, 4.84104208217, 419.48464387520],
+    [1, 3, 0.00000051548, 3.42149490328, 433.71173787680],
+    [1, 4, 0.00000080384, 1.11918414679, 206.18554843720],
+    [2, 0, 9.55758135801, 0.00000000000, 0.00000000000],
+    [2, 0, 0.52921382465, 2.39226219733, 213.29909543800],
+    [2, 0, 0.01873679934, 5.23549605091, 206.18554843720],
+    [2, 0, 0.01464663959, 1.64763045468, 426.59819087600],
+    [2, 0, 0.00821891059, 5.93520025371, 316.39186965660],
+    [2, 0, 0.00547506899, 5.01532628454, 103.09277421860],
+    [2, 0, 0.00371684449, 2.27114833428, 220.41264243880],
+    [2, 0, 0.00361778433, 3.13904303264, 7.11354700080],
+    [2, 0, 0.00140617548, 5.70406652991, 632.78373931320],
+    [2, 0, 0.00108974737, 3.29313595577, 110.20632121940],
+    [2, 0, 0.00069007015, 5.94099622447, 419.48464387520],
+    [2, 0, 0.00061053350, 0.94037761156, 639.89728631400],
+    [2, 0, 0.00048913044, 1.55733388472, 202.25339517410],
+    [2, 0, 0.00034143794, 0.19518550682, 277.03499374140],
+    [2, 0, 0.00032401718, 5.47084606947, 949.17560896980],
+    [2, 0, 0.00020936573, 0.46349163993, 735.87651353180],
+    [2, 0, 0.00020839118, 1.52102590640, 433.71173787680],
+    [2, 0, 0.00020746678, 5.33255667599, 199.07200143640],
+    [2, 0, 0.00015298457, 3.05943652881, 529.69096509460],
+    [2, 0, 0.00014296479, 2.60433537909, 323.50541665740],
+    [2, 0, 0.00012884128, 1.64892310393, 138.51749687070],
+    [2, 0, 0.00011993314, 5.98051421881, 846.08283475120],
+    [2, 0, 0.00011380261, 1.73105746566, 522.57741809380],
+    [2, 0, 0.00009796061, 5.20475863996, 1265.56747862640],
+    [2, 0, 0.00007752769, 5.85191318903, 95.97922721780],
+    [2, 0, 0.00006770621, 3.00433479284, 14.22709400160],
+    [2, 0, 0.00006465967, 0.17733160145, 1052.26838318840],
+    [2, 0, 0.00005850443, 1.45519636076, 415.55249061210],
+    [2, 0, 0.00005307481, 0.59737534050, 63.73589830340],
+    [2, 0, 0.00004695746, 2.14919036956, 227.52618943960],
+    [2, 0, 0.00004043988, 1.64010323863, 209.36694217490],
+    [2, 0, 0.00003688132, 0.78016133170, 412.37109687440],
+    [2, 0, 0.00003460943, 1.85088802878, 175.16605980020],
+    [2, 0, 0.00003419551, 4.94549148887, 1581.95934828300],
+    [2, 0, 0.00003400616, 0.55386747515, 350.33211960040],
+    [2, 0, 0.00003376457, 3.69528478828, 224.34479570190],
+    [2, 0, 0.00002976033, 5.68467931117, 210.11770170030],
+    [2, 0, 0.00002885348, 1.38764077631, 838.96928775040],
+    [2, 0, 0.00002881181, 0.17960757891, 853.19638175200],
+    [2, 0, 0.00002507630, 3.53851863255, 742.99006053260],
+    [2, 0, 0.00002448325, 6.18412386316, 1368.66025284500],
+    [2, 0, 0.00002406138, 2.96559220267, 117.31986822020],
+    [2, 0, 0.00002173959, 0.01508587396, 340.77089204480],
+    [2, 0, 0.00002024483, 5.05411271271, 11.04570026390],
+    [2, 0, 0.00001888436, 0.02968443389, 3.93215326310],
+    [2, 0, 0.00001861397, 5.93361638244, 625.67019231240],
+    [2, 0, 0.00001817186, 5.77713225779, 490.33408917940],
+    [2, 0, 0.00001781165, 0.76314388077, 217.23124870110],
+    [2, 0, 0.00001740254, 2.34657043464, 309.27832265580],
+    [2, 0, 0.00001610859, 1.17302463549, 74.78159856730],
+    [2, 0, 0.00001474547, 5.67670461130, 203.73786788240],
+    [2, 0, 0.00001472392, 1.40064915651, 137.03302416240],
+    [2, 0, 0.00001462631, 1.92588134017, 216.48048917570],
+    [2, 0, 0.00001395109, 5.93669404929, 127.47179660680],
+    [2, 0, 0.00001315042, 5.11202572637, 211.81462272970],
+    [2, 0, 0.00001304089, 0.77235613966, 647.01083331480],
+    [2, 0, 0.00001295553, 4.69184139933, 1898.35121793960],
+    [2, 0, 0.00001277489, 2.98412586423, 1059.38193018920],
+    [2, 0, 0.00001207053, 0.75285933160, 351.81659230870],
+    [2, 0, 0.00001149773, 5.74021249703, 1162.47470440780],
+    [2, 0, 0.00001126667, 4.46707803791, 265.98929347750],
+    [2, 0, 0.00001099037, 1.81765118601, 149.56319713460],
+    [2, 0, 0.00001071399, 1.13567265104, 1155.36115740700],
+    [2, 0, 0.00001020922, 5.91233512844, 1685.05212250160],
+    [2, 0, 0.00000998462, 2.63131596867, 200.76892246580],
+    [2, 0, 0.00000985869, 2.25992849742, 956.28915597060],
+    [2, 0, 0.00000932434, 3.66980793184, 554.06998748280],
+    [2, 0, 0.00000664481, 0.60297724821, 728.76296653100],
+    [2, 0, 0.00000659850, 4.66635439533, 195.13984817330],
+    [2, 0, 0.00000626382, 5.94208232590, 1478.86657406440],
+    [2, 0, 0.00000617740, 5.62092000007, 942.06206196900],
+    [2, 0, 0.00000553128, 3.41088600844, 269.92144674060],
+    [2, 0, 0.00000534397, 1.26443331367, 275.55052103310],
+    [2, 0, 0.00000517196, 4.44310450526, 2214.74308759620],
+    [2, 0, 0.00000494340, 2.28626675074, 278.51946644970],
+    [2, 0, 0.00000489825, 5.80631420383, 191.20769491020],
+    [2, 0, 0.00000487689, 2.79373616806, 3.18139373770],
+    [2, 0, 0.00000482230, 1.84070179496, 479.28838891550],
+    [2, 0, 0.00000472572, 1.88198584660, 515.46387109300],
+    [2, 0, 0.00000470086, 0.83847755040, 1471.75302706360],
+    [2, 0, 0.00000452848, 3.00349117198, 302.16477565500],
+    [2, 0, 0.00000451817, 5.64468459871, 2001.44399215820],
+    [2, 1, 0.06182981282, 0.25843515034, 213.29909543800],
+    [2, 1, 0.00506577574, 0.71114650941, 206.18554843720],
+    [2, 1, 0.00341394136, 5.79635773960, 426.59819087600],
+    [2, 1, 0.00188491375, 0.47215719444, 220.41264243880],
+    [2, 1, 0.00186261540, 3.14159265359, 0.00000000000],
+    [2, 1, 0.00143891176, 1.40744864239, 7.11354700080],
+    [2, 1, 0.00049621111, 6.01744469580, 103.09277421860],
+    [2, 1, 0.00020928189, 5.09245654470, 639.89728631400],
+    [2, 1, 0.00019952612, 1.17560125007, 419.48464387520],
+    [2, 1, 0.00018839639, 1.60819563173, 110.20632121940],
+    [2, 1, 0.00013876565, 0.75886204364, 199.07200143640],
+    [2, 1, 0.00012892827, 5.94330258435, 433.71173787680],
+    [2, 1, 0.00005396699, 1.28852405908, 14.22709400160],
+    [2, 1, 0.00004869308, 0.86793894213, 323.50541665740],
+    [2, 1, 0.00004247455, 0.39299384543, 227.52618943960],
+    [2, 1, 0.00003252084, 1.25853470491, 95.97922721780],
+    [2, 1, 0.00003081408, 3.43662557418, 522.57741809380],
+    [2, 1, 0.00002909411, 4.60679154788, 202.25339517410],
+    [2, 1, 0.00002856006, 2.16731405366, 735.87651353180],
+    [2, 1, 0.00001987689, 2.45054204795, 412.37109687440],
+    [2, 1, 0.00001941309, 6.02393385142, 209.36694217490],
+    [2, 1, 0.00001581446, 1.29191789712, 210.11770170030],
+    [2, 1, 0.00001339511, 4.30801821806, 853.19638175200],
+    [2, 1, 0.00001315590, 1.25296446023, 117.31986822020],
+    [2, 1, 0.00001203085, 1.86654673794, 316.39186965660],
+    [2, 1, 0.00001091088, 0.07527246854, 216.48048917570],
+    [2, 1, 0.00000966012, 0.47991379141, 632.78373931320],
+    [2, 1, 0.00000954403, 5.15173410519, 647.01083331480],
+    [2, 1, 0.00000897512, 0.98343776092, 529.69096509460],
+    [2, 1, 0.00000881827, 1.88471724478, 1052.26838318840],
+    [2, 1, 0.00000874215, 1.40224683864, 224.34479570190],
+    [2, 1, 0.00000784866, 3.06377517461, 838.96928775040],
+    [2, 1, 0.00000739892, 1.38225356694, 625.67019231240],
+    [2, 1, 0.00000658210, 4.14362930980, 309.27832265580],
+    [2, 1, 0.00000649600, 1.72489486160, 742.99006053260],
+    [2, 1, 0.00000612961, 3.03307306767, 63.73589830340],
+    [2, 1, 0.00000599236, 2.54924174765, 217.23124870110],
+    [2, 1, 0.00000502886, 2.12958819475, 3.93215326310],
+    [2, 2, 0.00436902464, 4.78671673044, 213.29909543800],
+    [2, 2, 0.00071922760, 2.50069994874, 206.18554843720],
+    [2, 2, 0.00049766792, 4.97168150870, 220.41264243880],
+    [2, 2, 0.00043220894, 3.86940443794, 426.59819087600],
+    [2, 2, 0.00029645554, 5.96310264282, 7.11354700080],
+    [2, 2, 0.00004720909, 2.47527992423, 199.07200143640],
+    [2, 2, 0.00004141650, 4.10670940823, 433.71173787680],
+    [2, 2, 0.00003789370, 3.09771025067, 639.89728631400],
+    [2, 2, 0.00002963990, 1.37206248846, 103.09277421860],
+    [2, 2, 0.00002556363, 2.85065721526, 419.48464387520],
+    [2, 2, 0.00002326801, 0.00000000000, 0.00000000000],
+    [2, 2, 0.00002208457, 6.27588858707, 110.20632121940],
+    [2, 2, 0.00002187621, 5.85545832218, 14.22709400160],
+    [2, 2, 0.00001956896, 4.92448618045, 227.52618943960],
+    [2, 2, 0.00000923840, 5.46392422737, 323.50541665740],
+    [2, 2, 0.00000705936, 2.97081280098, 95.97922721780],
+    [2, 2, 0.00000546115, 4.12854181522, 412.37109687440],
+    [2, 3, 0.00020315005, 3.02186626038, 213.29909543800],
+    [2, 3, 0.00008923581, 3.19144205755, 220.41264243880],
+    [2, 3, 0.00006908677, 4.35174889353, 206.18554843720],
+    [2, 3, 0.00004087129, 4.22406927376, 7.11354700080],
+    [2, 3, 0.00003879041, 2.01056445995, 426.59819087600],
+    [2, 3, 0.00001070788, 4.20360341236, 199.07200143640],
+    [2, 3, 0.00000907332, 2.28344368029, 433.71173787680],
+    [2, 3, 0.00000606121, 3.17458570534, 227.52618943960],
+    [2, 3, 0.00000596639, 4.13455753351, 14.22709400160],
+    [2, 3, 0.00000483181, 1.17345973258, 639.89728631400],
+    [2, 4, 0.00001202050, 1.41499446465, 220.41264243880],
+    [2, 4, 0.00000707796, 1.16153570102, 213.29909543800],
+    [2, 4, 0.00000516121, 6.23973568330, 206.18554843720],
+])
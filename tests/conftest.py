@@ -1,13 +1,57 @@
 # tests/conftest.py
 #
 # Dzięki temu Python widzi pakiet am_nasa w katalogu src/
-# bez ruszania struktury repo.
+# (i aplikacje FastAPI z app/) bez ruszania struktury repo. Do tego wspólne pomoce testów:
+# znacznik requires_jpl (pomija test bez prawdziwego kernela .bsp)
+# i fixture toy_positions (gładkie Słońce/Księżyc bez JPL).
 
 import sys
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+if str(ROOT) not in sys.path:
+    sys.path.append(str(ROOT))
+
+
+def jpl_kernel_available() -> bool:
+    """Czy pierwszy kernel z data/ephemeris to prawdziwy plik, nie wskaźnik LFS."""
+    from am_nasa.ephemeris_kernels import is_lfs_pointer
+    from am_nasa.ephemeris_nasa import _find_ephemeris_file
+
+    try:
+        path = _find_ephemeris_file()
+    except RuntimeError:
+        return False
+    return not is_lfs_pointer(path)
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "requires_jpl: test potrzebuje prawdziwego kernela .bsp w data/ephemeris")
+
+
+def pytest_collection_modifyitems(config, items):
+    if jpl_kernel_available():
+        return
+    skip = pytest.mark.skip(reason="brak pliku efemeryd JPL (tylko wskaźnik LFS)")
+    for item in items:
+        if "requires_jpl" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def toy_positions():
+    """„Słońce” i „Księżyc” na okręgach – gładkie jak prawdziwe, ale bez JPL."""
+    def positions(jd):
+        t = np.asarray(jd) - 2451545.0
+        sun = np.stack([np.cos(t / 58.1), np.sin(t / 58.1), 0.4 * np.sin(t / 58.1)])
+        moon = 0.00257 * np.stack([np.cos(t / 4.35), np.sin(t / 4.35), 0.09 * np.sin(t / 4.4)])
+        return sun, moon
+
+    return positions
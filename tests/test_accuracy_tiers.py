@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from am_nasa.api import info_from_jd
+from am_nasa.eclipses import lunar_eclipse_visibility
+from am_nasa.ephemeris_chebyshev import _angle_arcsec
+from am_nasa.ephemeris_nasa import (
+    TIER_ERROR_BUDGET,
+    TIERS,
+    _apparent_sun_moon_xyz,
+    _vector_engine,
+    engine_for_tier,
+    sun_moon_state_from_jd,
+)
+from am_nasa.epoch_report import generate_report
+from am_nasa.planetary_positions import sun_ecliptic_longitude
+
+
+def test_tiers_map_to_engines_with_budget():
+    assert set(TIERS) == set(TIER_ERROR_BUDGET) == {"fast", "cached", "jpl", "jpl-geometric"}
+    assert engine_for_tier("fast") == "meeus" and engine_for_tier("jpl") == "skyfield"
+    with pytest.raises(ValueError, match="tier"):
+        engine_for_tier("precise")
+
+
+def test_fast_tier_needs_no_files():
+    jd = 2460000.25
+    state = sun_moon_state_from_jd(jd, engine_for_tier("fast"))
+    # długość z planetary_positions z aberracją, cofnięta precesją do równonocy J2000
+    expected = sun_ecliptic_longitude(jd) - 20.4898 / 3600.0 - 5029.0966 / 3600.0 * (jd - 2451545.0) / 36525.0
+    assert state["sun"]["ecliptic_lon_deg"] == pytest.approx(expected % 360.0, abs=1e-4)
+    assert 0.0 <= state["illumination"] <= 1.0
+
+    info = info_from_jd(jd, 2023, tier="fast")
+    assert info["input"]["engine"] == "meeus" and info["input"]["tier"] == "fast"
+
+
+def test_cheap_tier_skips_local_geometry_for_non_candidates():
+    new_moon = 2460024.3  # 21.03.2023, daleko od pełni
+    result = lunar_eclipse_visibility(new_moon, 50.0, 20.0, tier="fast")
+    assert result["tier"] == "fast" and not result["visible"]
+    assert result["moon_alt_deg"] is None
+
+
+def test_epoch_report_tier(tmp_path):
+    dataset = [("J2000", 2451545.0, 2000), ("2025", 2460958.5, 2025)]
+    default = generate_report(dataset, filename=str(tmp_path / "a.csv"))
+    fast = generate_report(dataset, filename=str(tmp_path / "b.csv"), tier="fast")
+    assert open(default, encoding="utf-8").read() == open(fast, encoding="utf-8").read()
+
+
+@pytest.mark.requires_jpl
+@pytest.mark.parametrize("tier", ["fast", "jpl-geometric"])
+def test_tier_within_error_budget(tier):
+    jd = np.linspace(2415021.0, 2469807.0, 3000)
+    ref_sun, ref_moon = _apparent_sun_moon_xyz(jd)
+    sun, moon = _vector_engine(engine_for_tier(tier)).sun_moon_xyz(jd)
+    budget = TIER_ERROR_BUDGET[tier]
+    assert _angle_arcsec(sun, ref_sun).max() < budget["sun_arcsec"]
+    assert _angle_arcsec(moon, ref_moon).max() < budget["moon_arcsec"]
+
+
+@pytest.mark.requires_jpl
+def test_epoch_report_jpl_tier(tmp_path):
+    path = generate_report([("J2000", 2451545.0, 2000)], filename=str(tmp_path / "r.csv"), tier="jpl")
+    row = open(path, encoding="utf-8").read().splitlines()[1].split(",")
+    state = sun_moon_state_from_jd(2451545.0)
+    assert float(row[-1]) == pytest.approx(state["illumination"], abs=1e-4)
@@ -32,3 +32,70 @@ def test_epoch_constant_difference():
     diffs = [jd - jd_from_am(am_from_jd(jd)) for jd in jd_values]
     mean_diff = sum(diffs) / len(diffs)
     assert math.isclose(mean_diff, 0.0, abs_tol=1e-5)
+
+
+def test_array_matches_scalar():
+    """Wersja tablicowa daje dokładnie te same wartości co skalarna."""
+    import numpy as np
+
+    from am_nasa.am_core import am_from_jd_array, jd_from_am_array
+
+    jd = np.array([[1439595.5, 1507920.5], [2440423.5, 2460958.123456789]])
+    am = am_from_jd_array(jd)
+    assert am.shape == jd.shape and am.dtype == jd.dtype
+    assert all(a == am_from_jd(j) for a, j in zip(am.ravel(), jd.ravel()))
+    assert np.array_equal(jd_from_am_array(am), [[jd_from_am(a) for a in row] for row in am])
+
+
+def test_array_out_buffer_and_series():
+    """Bufor `out` liczy w miejscu, Series wraca jako Series z indeksem."""
+    import numpy as np
+    import pandas as pd
+
+    from am_nasa.am_core import am_from_jd_array
+
+    buf = np.array([2460958.5, 2440423.5], dtype=np.float32)
+    res = am_from_jd_array(buf, out=buf)
+    assert res is buf and buf.dtype == np.float32
+
+    s = pd.Series([2460958.5, 1721670.0], index=["a", "b"], name="jd")
+    am = am_from_jd_array(s)
+    assert isinstance(am, pd.Series)
+    assert list(am.index) == ["a", "b"] and am.name == "jd"
+    assert am["b"] == 0.0
+
+
+def test_julian_day_split_precision():
+    """JulianDay trzyma ułamek dnia, którego float64 przy JD≈2.4e6 już nie widzi."""
+    from am_nasa.am_core import JulianDay
+
+    jd = JulianDay.from_float(2460958.5) + 1e-11
+    assert jd.day == 2460958
+    assert math.isclose(jd.frac, 0.5 + 1e-11, rel_tol=0, abs_tol=1e-16)
+    assert float(jd) == 2460958.5  # w jednym floacie ta różnica znika
+
+    am = am_from_jd(jd)
+    assert isinstance(am, JulianDay) and am.day == 739288
+    assert jd_from_am(am) == jd
+    assert math.isclose(jd - JulianDay(2460958, 0.5), 1e-11, rel_tol=1e-6)
+
+
+def test_julian_day_ordering_and_hash():
+    from am_nasa.am_core import JulianDay
+
+    a, b = JulianDay(2460958, 0.25), JulianDay(2460958, 0.5)
+    assert a < b and a <= b and b > a and b >= a and a <= JulianDay(2460958, 0.25)
+    assert a < 2460958.3 and a >= 2460958.25
+    assert a == 2460958.25 and hash(a) == hash(2460958.25)
+    assert {2460958.25: "x"}[a] == "x" and len({a, JulianDay(2460957, 1.25)}) == 1
+
+
+def test_julian_day_array_normalizes():
+    import numpy as np
+
+    from am_nasa.am_core import JulianDayArray
+
+    arr = JulianDayArray.from_float([2460958.25, -0.5]) + np.array([0.75, -0.25])
+    assert list(arr.day) == [2460959, -1]
+    assert list(arr.frac) == [0.0, 0.25]
+    assert arr[1].day == -1
@@ -0,0 +1,23 @@
+import importlib
+
+import pytest
+
+from am_nasa.api import info_from_jd
+
+JD_2025_10_09 = 2460958.5
+
+
+def test_info_from_jd_derives_year():
+    info = info_from_jd(JD_2025_10_09, tier="fast")
+    assert info["input"]["year"] == 2025
+    assert info_from_jd(JD_2025_10_09, 2024, tier="fast")["input"]["year"] == 2024
+
+
+@pytest.mark.parametrize("module", ["app.main", "app.user_api"])
+def test_from_jd_endpoint(module):
+    # TestClient potrzebuje httpx (spoza zależności pakietu)
+    TestClient = pytest.importorskip("fastapi.testclient").TestClient
+    app = importlib.import_module(module).app
+    response = TestClient(app).get("/from-jd", params={"jd": JD_2025_10_09, "tier": "fast"})
+    assert response.status_code == 200
+    assert response.json()["input"]["year"] == 2025
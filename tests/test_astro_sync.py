@@ -11,3 +11,14 @@ def test_sync_am_to_jd():
 def test_sync_jd_to_am():
     am = sync_jd_to_am_physical(2460958.5, 2025)
     assert math.isclose(am, 739288.5, abs_tol=0.5)
+
+
+def test_sync_arrays_match_scalar():
+    import numpy as np
+
+    from am_nasa.astro_sync import sync_am_to_jd_physical_array, sync_jd_to_am_physical_array
+
+    jd = np.linspace(1000000.5, 2460958.5, 7)
+    am = sync_jd_to_am_physical_array(jd)
+    assert np.array_equal(am, [sync_jd_to_am_physical(x) for x in jd])
+    assert np.array_equal(sync_am_to_jd_physical_array(am), [sync_am_to_jd_physical(a) for a in am])
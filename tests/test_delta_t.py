@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+import am_nasa.ephemeris_chebyshev as cheb
+from am_nasa.am_core import JulianDay, JulianDayArray
+from am_nasa.delta_t import (
+    DELTA_T_FILE,
+    DeltaTSpline,
+    _iers_daily,
+    build_delta_t_table,
+    delta_t,
+    delta_t_model,
+    espenak_meeus,
+    get_delta_t_spline,
+    to_tt,
+    tt_to_ut,
+    ut_to_tt,
+)
+from am_nasa.ephemeris_nasa import sun_moon_state_batch, sun_moon_state_from_jd
+
+
+def test_bundled_table_matches_model():
+    assert DELTA_T_FILE.exists()
+    spline = get_delta_t_spline()
+    assert np.allclose(spline.knots, build_delta_t_table()[:, 0])
+
+    # w węzłach splajn = model; Espenak–Meeus na początkach przedziałów
+    for year, expected in ((1000, 1574.2), (1700, 8.83), (1900, -2.79), (1950, 29.07)):
+        assert float(spline.at_year(year)) == pytest.approx(expected, abs=1e-9)
+        assert float(espenak_meeus(year)) == pytest.approx(expected, abs=1e-9)
+
+    years = np.linspace(-1999.5, 2999.5, 20000)
+    assert np.abs(spline.at_year(years) - delta_t_model(years)).max() < 0.5
+
+
+def test_modern_section_follows_iers():
+    tt, daily = _iers_daily()
+    assert np.abs(get_delta_t_spline()(tt) - daily).max() < 0.15
+
+
+def test_outside_table_uses_long_term_parabola():
+    spline = DeltaTSpline(build_delta_t_table(1800, 1900))
+    assert float(spline.at_year(1500)) == pytest.approx(-20 + 32 * 3.2**2)
+    assert float(spline.at_year(2500)) == pytest.approx(-20 + 32 * 6.8**2)
+
+
+def test_ut_tt_roundtrip_scalar_array_and_two_part():
+    jd = np.linspace(1000000.5, 2600000.5, 1001)
+    tt = ut_to_tt(jd)
+    assert np.allclose((tt - jd) * 86400.0, delta_t(jd), rtol=0, atol=1e-4)
+    assert np.abs(tt_to_ut(tt) - jd).max() < 1e-9
+
+    assert isinstance(delta_t(2451545.0), float)
+    assert isinstance(ut_to_tt(2451545.0), float)
+
+    day = JulianDay(2460000, 0.25)
+    shifted = ut_to_tt(day)
+    assert isinstance(shifted, JulianDay) and shifted.day == 2460000
+    assert (shifted - day) * 86400.0 == pytest.approx(delta_t(2460000.25), abs=1e-6)
+    assert isinstance(tt_to_ut(JulianDayArray.from_float(jd)), JulianDayArray)
+
+    assert to_tt(day, "TT") is day
+    with pytest.raises(ValueError, match="skala"):
+        to_tt(2451545.0, "UTC")
+
+
+def test_state_in_ut_is_state_at_tt(monkeypatch, tmp_path, toy_positions):
+    table = cheb.fit_sun_moon_blocks(2460000.5, 2460040.5, positions=toy_positions)
+    monkeypatch.setattr(cheb, "CHEBYSHEV_CACHE_FILE", cheb.save_chebyshev_cache(table, tmp_path / "c.npy"))
+    cheb.get_chebyshev_ephemeris.cache_clear()
+    try:
+        jd_ut = 2460010.3
+        via_ut = sun_moon_state_from_jd(jd_ut, "chebyshev", scale="UT")
+        via_tt = sun_moon_state_from_jd(ut_to_tt(jd_ut), "chebyshev")
+        assert via_ut["moon"]["ra_deg"] == pytest.approx(via_tt["moon"]["ra_deg"], abs=1e-12)
+
+        jd = np.linspace(2460001.0, 2460039.0, 100)
+        batch = sun_moon_state_batch(jd, "chebyshev", scale="UT")
+        assert np.array_equal(batch.JD, jd) and np.allclose(batch.JD_TT, ut_to_tt(jd), rtol=0, atol=1e-12)
+        assert "JD_TT" not in sun_moon_state_batch(jd, "chebyshev").dtype.names
+    finally:
+        cheb.get_chebyshev_ephemeris.cache_clear()
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from am_nasa.ephemeris_chebyshev import (
+    ChebyshevEphemeris,
+    apparent_sun_moon_xyz,
+    fit_sun_moon_blocks,
+    get_chebyshev_ephemeris,
+    save_chebyshev_cache,
+)
+from am_nasa.am_core import JulianDay
+
+
+def test_fit_eval_and_cache_file(tmp_path, toy_positions):
+    table = fit_sun_moon_blocks(2460000.5, 2460100.5, positions=toy_positions)
+    path = save_chebyshev_cache(table, tmp_path / "cheb.npy")
+    cache = get_chebyshev_ephemeris(path)
+
+    jd = np.linspace(2460000.5, 2460100.4, 777)
+    sun, moon = cache.sun_moon_xyz(jd)
+    true_sun, true_moon = toy_positions(jd)
+    assert np.abs(sun - true_sun).max() < 1e-10
+    assert np.abs(moon - true_moon).max() < 1e-10
+
+    # JulianDay (dzień + ułamek) daje to samo co float
+    one = cache.sun_moon_xyz(JulianDay(2460050, 0.25))[1]
+    assert np.allclose(one, toy_positions(2460050.25)[1], rtol=0, atol=1e-12)
+
+    report = cache.accuracy_report()
+    assert report["blocks"] == 25 and report["jd_end"] == 2460100.5
+    assert report["moon"]["max_arcsec"] < 1e-3
+
+    with pytest.raises(ValueError):
+        cache.sun_moon_xyz(2460100.5)
+
+
+def test_engine_switch_rejects_unknown():
+    from am_nasa.ephemeris_nasa import sun_moon_state_from_jd
+
+    with pytest.raises(ValueError):
+        sun_moon_state_from_jd(2460000.5, engine="vsop87")
+
+
+@pytest.mark.requires_jpl
+def test_chebyshev_engine_matches_skyfield(monkeypatch, tmp_path):
+    import am_nasa.ephemeris_chebyshev as cheb
+    from am_nasa.ephemeris_nasa import sun_moon_state_from_jd
+
+    table = fit_sun_moon_blocks(2460950.5, 2460970.5, positions=apparent_sun_moon_xyz)
+    monkeypatch.setattr(cheb, "CHEBYSHEV_CACHE_FILE", save_chebyshev_cache(table, tmp_path / "cheb.npy"))
+    cheb.get_chebyshev_ephemeris.cache_clear()
+    try:
+        for jd in (2460958.5, 2460961.137):
+            fast = sun_moon_state_from_jd(jd, engine="chebyshev")
+            full = sun_moon_state_from_jd(jd)
+            for body in ("sun", "moon"):
+                for key, value in full[body].items():
+                    assert fast[body][key] == pytest.approx(value, abs=1e-7)
+            assert fast["phase_angle_deg"] == pytest.approx(full["phase_angle_deg"], abs=1e-7)
+        assert ChebyshevEphemeris(table).accuracy_report()["moon"]["max_arcsec"] < 1e-3
+    finally:
+        cheb.get_chebyshev_ephemeris.cache_clear()
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from am_nasa.ephemeris_kernels import EphemerisIndex, KernelCoverage, build_ephemeris_index
+
+
+def _index():
+    # DE442-podobny (1550–2650, priorytet) i DE430-podobny dłuższy zakres
+    return EphemerisIndex([
+        KernelCoverage(Path("de442.bsp"), 2287184.5, 2688976.5, ()),
+        KernelCoverage(Path("de430.bsp"), 2287184.5 - 400000, 2688976.5 + 100000, ()),
+    ])
+
+
+def test_routing_prefers_first_covering_kernel():
+    index = _index()
+    assert index.kernel_for(2460000.5).path.name == "de442.bsp"
+    assert index.kernel_for(2000000.5).path.name == "de430.bsp"
+
+    jd = np.array([2000000.5, 2460000.5, 2700000.5, 2451545.0])
+    groups = {kernel.path.name: idx.tolist() for kernel, idx in index.route(jd)}
+    assert groups == {"de442.bsp": [1, 3], "de430.bsp": [0, 2]}
+
+    with pytest.raises(ValueError):
+        index.route(np.array([2460000.5, 1000000.5]))
+
+
+def test_index_skips_lfs_pointers(tmp_path):
+    for name in ("de442.bsp", "de430.bsp"):
+        (tmp_path / name).write_text("version https://git-lfs.github.com/spec/v1\noid sha256:0\nsize 1\n")
+    assert build_ephemeris_index(tmp_path, ["de442.bsp"]).kernels == []
+
+
+@pytest.mark.requires_jpl
+def test_real_kernel_indexed_with_required_segments():
+    from am_nasa.ephemeris_nasa import get_ephemeris_index
+
+    kernel = get_ephemeris_index().kernel_for(2460000.5)
+    assert kernel.start_jd < 2451545.0 < kernel.end_jd
+    assert {(0, 3), (3, 399), (3, 301), (0, 10)} <= set(kernel.segments)
+
+
+@pytest.mark.requires_jpl
+def test_subset_kernels_are_routed_transparently(tmp_path):
+    from am_nasa.ephemeris_kernels import subset_kernel
+    from am_nasa.ephemeris_nasa import _find_ephemeris_file
+    from am_nasa.ephemeris_spk import SpkSunMoon
+
+    full = _find_ephemeris_file()
+    early = subset_kernel(full, tmp_path / "a_early.bsp", 2451544.5, 2455000.5)
+    late = subset_kernel(full, tmp_path / "b_late.bsp", 2455000.5, 2460000.5)
+    assert (early.start_jd, early.end_jd) == (2451544.5, 2455000.5)
+    assert early.path.stat().st_size < full.stat().st_size / 5
+
+    index = build_ephemeris_index(tmp_path)
+    jd = np.array([2452000.25, 2458000.75, 2454000.5])
+    assert [(k.path.name, idx.tolist()) for k, idx in index.route(jd)] == [("a_early.bsp", [0, 2]), ("b_late.bsp", [1])]
+
+    # te same współczynniki -> te same pozycje co z pełnego pliku (do zaokrągleń)
+    for kernel, idx in index.route(jd):
+        sub = SpkSunMoon(kernel.path).sun_moon_xyz(jd[idx])
+        ref = SpkSunMoon(full).sun_moon_xyz(jd[idx])
+        assert np.abs(np.concatenate(sub) - np.concatenate(ref)).max() < 1e-12
+
+    with pytest.raises(ValueError):
+        subset_kernel(full, tmp_path / "x.bsp", 2300000.5, 2300010.5)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from am_nasa.ephemeris_chebyshev import _angle_arcsec, apparent_sun_moon_xyz
+from am_nasa.ephemeris_nasa import sun_moon_state_batch, sun_moon_state_from_jd
+
+
+class _FakeSegment:
+    """Segment typu 2 o stałej pozycji `value` w [start_jd, end_jd]."""
+
+    def __init__(self, start_jd, end_jd, value):
+        self.start_jd, self.end_jd = start_jd, end_jd
+        coef = np.zeros((3, 1, 3))
+        coef[:, 0, 0] = value
+        self._array = (start_jd, end_jd - start_jd, coef)
+
+    def load_array(self):
+        return self._array
+
+
+def test_each_jd_uses_covering_segment():
+    from am_nasa.ephemeris_spk import _SegmentChain
+
+    chain = _SegmentChain([_FakeSegment(0.0, 10.0, 1.0), _FakeSegment(10.0, 20.0, 2.0), _FakeSegment(15.0, 17.0, 3.0)])
+    jd = np.array([1.0, 9.5, 12.0, 16.0, 19.0])
+    position, velocity = chain.position_velocity(jd, np.zeros_like(jd))
+    # nakładanie: późniejszy segment (15…17) wygrywa
+    np.testing.assert_array_equal(position[0], [1.0, 1.0, 2.0, 3.0, 2.0])
+    assert not velocity.any()
+    with pytest.raises(ValueError, match="segmentami SPK"):
+        chain.position_velocity(np.array([25.0]), np.zeros(1))
+
+
+@pytest.mark.requires_jpl
+def test_segment_evaluation_matches_jplephem():
+    from am_nasa.ephemeris_nasa import _find_ephemeris_file
+    from am_nasa.ephemeris_spk import get_spk_sun_moon
+
+    engine = get_spk_sun_moon(_find_ephemeris_file())
+    jd = np.linspace(2451545.0, 2462000.0, 997)
+    for ours, segment in ((engine._moon, engine.kernel[3, 301]), (engine._sun, engine.kernel[0, 10])):
+        position, velocity = ours.position_velocity(jd, np.zeros_like(jd))
+        ref_position, ref_velocity = segment.compute_and_differentiate(jd)
+        assert np.abs(position - ref_position).max() < 1e-6  # km
+        assert np.abs(velocity - ref_velocity).max() < 1e-6  # km/d
+
+
+@pytest.mark.requires_jpl
+def test_apparent_vectors_sub_arcsecond_vs_skyfield():
+    from am_nasa.ephemeris_spk import get_spk_sun_moon
+
+    jd = np.linspace(2451545.0, 2462000.0, 2003)
+    sun, moon = get_spk_sun_moon().sun_moon_xyz(jd)
+    ref_sun, ref_moon = apparent_sun_moon_xyz(jd)
+    assert _angle_arcsec(sun, ref_sun).max() < 1e-3
+    assert _angle_arcsec(moon, ref_moon).max() < 1e-3
+
+
+@pytest.mark.requires_jpl
+def test_jplephem_engine_state_parity():
+    jd = np.linspace(2460000.5, 2460030.5, 301)
+    fast, full = sun_moon_state_batch(jd, engine="jplephem"), sun_moon_state_batch(jd)
+    arcsec = 1.0 / 3600.0
+    for name in fast.dtype.names[1:]:
+        assert np.abs(fast[name] - full[name]).max() < arcsec, name
+
+    state = sun_moon_state_from_jd(2460958.5, engine="jplephem")
+    ref = sun_moon_state_from_jd(2460958.5)
+    assert state["moon"]["ecliptic_lon_deg"] == pytest.approx(ref["moon"]["ecliptic_lon_deg"], abs=arcsec)
+    assert state["phase_angle_deg"] == pytest.approx(ref["phase_angle_deg"], abs=arcsec)
@@ -19,6 +19,7 @@ def test_all_systems_basic():
     systems = [
         "gregorian",
         "julian",
+        "hebrew",
         "islamic",
         "persian",
         "chinese",
@@ -62,3 +63,67 @@ def test_full_pipeline_validation_and_reports(tmp_path):
     assert result["max"] < 0.6  # max różnica < 0.6 dnia
     assert csv_path.exists()
     assert html_path.exists()
+
+
+def test_konwertuj_keeps_day_fraction():
+    from am_nasa.am_core import JulianDay
+
+    # zmiana zachowania: ułamek nie jest już obcinany (dawniej int(day) -> 2460958.5)
+    data = {"system": "gregorian", "year": 2025, "month": 10, "day": 9.25}
+    assert konwertuj(data)["JD"] == 2460958.75
+    assert konwertuj(dict(data, day="9.25"))["JD"] == 2460958.75
+    assert konwertuj(dict(data, day="9"))["JD"] == 2460958.5
+
+    precise = konwertuj(data, precise=True)
+    assert isinstance(precise["JD"], JulianDay)
+    assert precise["JD"].day == 2460958 and precise["JD"].frac == 0.75
+    assert float(precise["AM"]) == 739288.75
+
+
+def test_konwertuj_batch_matches_scalar():
+    from am_nasa.konwersja_wielosystemowa import BATCH_INVALID_DATE, BATCH_OK, BATCH_UNKNOWN_SYSTEM, konwertuj_batch
+
+    systems = ["gregorian", "julian", "islamic", "persian", "coptic", "maya", "am", "gregorian"]
+    years = [2025, -500, 1447, 1404, 1742, 12, 2025, -4712]
+    months = [10, 3, 7, 1, 13, 4, 1, 1]
+    days = [9.25, 15, 5, 1, 3, 7, 739288.5, 1]
+
+    res = konwertuj_batch(systems, years, months, days)
+    assert list(res["error"]) == [BATCH_OK] * len(systems)
+    for i, system in enumerate(systems):
+        ref = konwertuj({"system": system, "year": years[i], "month": months[i], "day": days[i]})
+        assert res["JD"][i] == ref["JD"]
+        assert res["AM"][i] == ref["AM"]
+
+    bad = konwertuj_batch(["gregorian", "klingon", "julian"], [2025, 1, 2025], [13, 1, 2], [1, 1, 0])
+    assert list(bad["error"]) == [BATCH_INVALID_DATE, BATCH_UNKNOWN_SYSTEM, BATCH_INVALID_DATE]
+    assert all(math.isnan(x) for x in bad["JD"])
+
+    # dzień poza długością miesiąca w tym roku: 30 Pagume, Adar II roku zwykłego, 19 Uayeb, 29.02.2025
+    short = konwertuj_batch(["coptic", "hebrew", "maya", "gregorian", "gregorian"],
+                            [1741, 5785, 0, 2025, 2024], [13, 13, 18, 2, 2], [30, 1, 19, 29, 29.5])
+    assert list(short["error"]) == [BATCH_INVALID_DATE] * 4 + [BATCH_OK]
+    assert short["JD"][4] == konwertuj({"system": "gregorian", "year": 2024, "month": 2, "day": 29.5})["JD"]
+
+
+def test_inverse_roundtrip_all_systems():
+    """X_from_jd(jd_from_X(...)) wraca do tej samej daty – także dla lat ujemnych."""
+    import numpy as np
+
+    from am_nasa.konwersja_wielosystemowa import kalendarz_z_jd, kalendarz_z_jd_batch, konwertuj_batch
+    from am_nasa.rejestr_kalendarzy import CALENDARS
+
+    years = np.array([-4800, -753, -1, 1, 622, 1582, 2025, 4999])
+    for name, cal in CALENDARS.items():
+        if cal.from_jd_array is None:
+            continue
+        month = np.full(years.shape, max(cal.month_range[0], 2))
+        day = np.full(years.shape, max(cal.day_range[0], 3) + 0.25)
+        y = np.where(years == 0, 1, years)
+        jd = konwertuj_batch(name, y, month, day)["JD"]
+        back = kalendarz_z_jd_batch(name, jd)
+        assert list(back["year"]) == list(y), name
+        assert list(back["month"]) == list(month), name
+        assert np.allclose(back["day"], day, atol=1e-6), name
+
+    assert kalendarz_z_jd("gregorian", 2460958.5) == {"system": "gregorian", "year": 2025, "month": 10, "day": 9.0}
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from am_nasa.kalendarz_chinski import chinese_range, get_chinese_table
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian, kalendarz_z_jd_batch, konwertuj
+
+
+def test_chinese_new_year_and_leap_months():
+    # Nowy Rok: 29.01.2025 (rok 4662), 10.02.2024, 31.01.2033
+    for year, greg in ((4662, (2025, 1, 29)), (4661, (2024, 2, 10)), (4670, (2033, 1, 31))):
+        assert konwertuj({"system": "chinese", "year": year, "month": 1, "day": 1})["JD"] == jd_from_gregorian(*greg)
+
+    # 2025: przestępny 6. miesiąc, więc Święto Środka Jesieni (8/15) to 9. miesiąc roku
+    day = chinese_range(jd_from_gregorian(2025, 10, 6), jd_from_gregorian(2025, 10, 7))
+    assert (day["month"][0], day["month_number"][0], day["leap"][0], day["day"][0]) == (9, 8, 0, 15.0)
+
+    # „problem 2033”: przestępny jest 11. miesiąc
+    leap = chinese_range(jd_from_gregorian(2033, 12, 22), jd_from_gregorian(2033, 12, 23))
+    assert (leap["month_number"][0], leap["leap"][0]) == (11, 1)
+
+
+def test_chinese_table_roundtrip_and_fallback():
+    table = get_chinese_table()
+    jd = np.arange(table.starts[0], table.starts[-1]) + 0.5
+    back = kalendarz_z_jd_batch("chinese", jd)
+    res = konwertuj({"system": "chinese", "year": int(back["year"][777]), "month": int(back["month"][777]),
+                     "day": back["day"][777]})
+    assert res["JD"] == jd[777]
+    assert set(np.diff(table.starts)) == {29, 30}
+
+    # poza tablicą – dawne przybliżenie liniowe
+    assert konwertuj({"system": "chinese", "year": 2025, "month": 10, "day": 9})["JD"] == 758325.5 + 2024 * 365.2422 + 9 * 29.5306 + 8
+
+
+@pytest.mark.requires_jpl
+def test_new_moons_and_solar_terms_from_jpl():
+    from am_nasa.astro_events import new_moons, solar_longitude_times
+
+    # nów 6.01.2000 18:14 UT, przesilenie zimowe 21.12.2000 13:37 UT
+    assert abs(new_moons(2451545.0, 2451560.0)[0] - 2451550.2600) < 1e-3
+    times, lon = solar_longitude_times(2451900.0, 2451910.0, 90.0)
+    assert lon[0] == 270.0 and abs(times[0] - 2451900.0687) < 1e-3
@@ -0,0 +1,45 @@
+import numpy as np
+
+from am_nasa.kalendarz_hinduski import (
+    get_hindu_table,
+    hindu_lunar_from_jd,
+    hindu_range,
+    jd_from_hindu_lunar_array,
+)
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian, kalendarz_z_jd, konwertuj
+
+
+def test_hindu_solar_year_start():
+    # Mesha sankranti 14.04.2025 -> 1 Mesha 5126 (lata Kali)
+    mesha = jd_from_gregorian(2025, 4, 14)
+    assert kalendarz_z_jd("hindu", mesha) == {"system": "hindu", "year": 5126, "month": 1, "day": 1.0}
+    assert konwertuj({"system": "hindu", "year": 5126, "month": 1, "day": 1})["JD"] == mesha
+
+
+def test_hindu_lunar_months():
+    # Ugadi / Gudi Padwa 2025: Chaitra shukla pratipada = 30.03.2025
+    assert hindu_lunar_from_jd(jd_from_gregorian(2025, 3, 30)) == {
+        "year": 5126, "month": 1, "leap_month": 0, "tithi": 1, "leap_day": False,
+    }
+    # 2023: adhika Shravana (18.07–16.08)
+    assert hindu_lunar_from_jd(jd_from_gregorian(2023, 7, 20))["leap_month"] == 1
+    assert hindu_lunar_from_jd(jd_from_gregorian(2023, 8, 20))["leap_month"] == 0
+    # amavasya 21.10.2025: koniec Ashviny (amanta) = już Kartika (purnimanta)
+    diwali = jd_from_gregorian(2025, 10, 21)
+    assert (hindu_lunar_from_jd(diwali)["month"], hindu_lunar_from_jd(diwali)["tithi"]) == (7, 30)
+    assert hindu_lunar_from_jd(diwali, "purnimanta")["month"] == 8
+
+
+def test_hindu_range_roundtrip():
+    table = get_hindu_table()
+    start, end = table.tithi_days[table.lunar_nm[[0, -1]]]
+    for scheme in ("amanta", "purnimanta"):
+        r = hindu_range(start + 0.5, end + 0.5, scheme)
+        back = jd_from_hindu_lunar_array(r["lunar_year"], r["lunar_month"], r["lunar_tithi"],
+                                         r["lunar_leap_month"], scheme)
+        # powtórzone tithi (adhika) wraca na pierwszy z dwóch dni
+        assert np.all((back == r["JD"]) | r["lunar_leap_day"])
+
+    solar = hindu_range(table.solar_starts[0] + 0.5, table.solar_starts[-1] + 0.5)["solar_day"]
+    days = set(np.unique(solar))
+    assert days <= set(range(1, 33)) and {1, 29, 30, 31} <= days
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from am_nasa.kalendarz_majow import (
+    CALENDAR_ROUND,
+    calendar_round_from_jd,
+    calendar_round_on_or_after,
+    calendar_round_on_or_before,
+    calendar_round_residue,
+    haab_from_jd_array,
+    jd_from_long_count,
+    long_count_from_jd,
+    tzolkin_from_jd_array,
+)
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian, kalendarz_z_jd, konwertuj, konwertuj_batch
+
+
+def test_long_count_anchor_dates():
+    # koniec 13. baktuna: 21.12.2012 = 13.0.0.0.0 4 Ahau 3 Kankin (GMT)
+    end = jd_from_gregorian(2012, 12, 21)
+    assert jd_from_long_count(13, 0, 0, 0, 0) == end
+    assert long_count_from_jd(end) == (13, 0, 0, 0, 0.0)
+    assert calendar_round_from_jd(end) == "4 ahau 3 kankin"
+    assert jd_from_long_count(13, 0, 0, 0, 0, correlation="lounsbury") == end + 2
+
+    # dzień zero = 4 Ahau 8 Cumku = rok 0, miesiąc 17, dzień 8 rachuby Haab'
+    assert calendar_round_from_jd(584283.5) == "4 ahau 8 cumku"
+    assert kalendarz_z_jd("maya", 584283.5) == {"system": "maya", "year": 0, "month": 17, "day": 8.0}
+
+
+def test_calendar_round_residue_matches_cycles():
+    jd = 584283.5 + np.arange(CALENDAR_ROUND)
+    number, name = tzolkin_from_jd_array(jd)
+    month, day = haab_from_jd_array(jd)
+    assert np.array_equal(calendar_round_residue(number, name, month, day), np.arange(CALENDAR_ROUND))
+    # 1 Imix nie wypada nigdy w dniu 1 Pop (reszty niezgodne mod 5)
+    assert calendar_round_residue(1, 1, 0, 1) == -1
+
+
+def test_calendar_round_search():
+    end = jd_from_gregorian(2012, 12, 21)
+    jd = end + np.arange(-40000, 40000, 37)
+    after = calendar_round_on_or_after(jd, 4, 20, 13, 3)
+    before = calendar_round_on_or_before(jd, 4, 20, 13, 3)
+    assert np.all((after >= jd) & (after - jd < CALENDAR_ROUND) & ((after - end) % CALENDAR_ROUND == 0))
+    assert np.all((before <= jd) & (jd - before < CALENDAR_ROUND) & ((before - end) % CALENDAR_ROUND == 0))
+    assert calendar_round_on_or_after(end, 4, 20, 13, 3) == end
+    assert np.isnan(calendar_round_on_or_after(end, 1, 1, 0, 1))
+
+
+def test_uayeb_has_five_days():
+    assert konwertuj({"system": "maya", "year": 0, "month": 18, "day": 4})["JD"] == 584283.5 + 20 * 18 + 4 - 348
+    with pytest.raises(ValueError, match="Uayeb"):
+        konwertuj({"system": "maya", "year": 0, "month": 18, "day": 5})
+    assert list(konwertuj_batch("maya", 0, 18, [4, 5, 19])["error"]) == [0, 2, 2]
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from am_nasa.kalendarze_lunisolarne import (
+    hebrew_from_jd,
+    hebrew_from_jd_array,
+    hebrew_year_bounds,
+    jd_from_hebrew,
+    jd_from_hebrew_array,
+)
+from am_nasa.konwersja_wielosystemowa import jd_from_gregorian, konwertuj
+
+
+def test_hebrew_known_dates():
+    # 1 Tishri 5786 (Rosz ha-Szana) = 23.09.2025, 14 Nisan 5785 = 12.04.2025
+    assert jd_from_hebrew(5786, 7, 1) == jd_from_gregorian(2025, 9, 23)
+    assert jd_from_hebrew(5785, 1, 14) == jd_from_gregorian(2025, 4, 12)
+    # Purim 5784 (rok przestępny) = 14 adar II = 24.03.2024
+    assert jd_from_hebrew(5784, 13, 14) == jd_from_gregorian(2024, 3, 24)
+    assert hebrew_year_bounds(5784)[1] == 383
+
+    res = konwertuj({"system": "hebrew", "year": 3790, "month": 1, "day": 14})
+    assert hebrew_from_jd(res["JD"]) == (3790, 1, 14.0)
+
+
+def test_hebrew_adar_ii_only_in_leap_years():
+    from am_nasa.konwersja_wielosystemowa import BATCH_INVALID_DATE, BATCH_OK, konwertuj_batch
+
+    with pytest.raises(ValueError, match="adar II"):
+        konwertuj({"system": "hebrew", "year": 5785, "month": 13, "day": 1})
+    res = konwertuj_batch("hebrew", [5785, 5784], [13, 13], [1, 1])
+    assert list(res["error"]) == [BATCH_INVALID_DATE, BATCH_OK]
+
+
+def test_hebrew_array_matches_scalar_and_inverts():
+    years = np.arange(-3000, 9000, 7)
+    jd = jd_from_hebrew_array(years, 1, 14)
+    assert jd[100] == jd_from_hebrew(int(years[100]), 1, 14)
+
+    days = np.arange(jd_from_hebrew(5700, 7, 1), jd_from_hebrew(5720, 7, 1)) + 0.25
+    y, m, d = hebrew_from_jd_array(days)
+    assert np.array_equal(jd_from_hebrew_array(y, m, np.floor(d)) + 0.25, days)
+    assert set(np.diff(jd_from_hebrew_array(np.arange(5000, 6000), 7, 1))) <= {353, 354, 355, 383, 384, 385}
+
+
+def test_hebrew_year_cache_is_consistent_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from am_nasa.kalendarze_lunisolarne import _HebrewYearCache, _hebrew_new_year_array
+
+    cache = _HebrewYearCache()
+
+    def check(k):
+        years = np.array([1 - 50 * k, 6000 + 50 * k])
+        start, _ = cache.bounds(years)
+        return np.array_equal(start, _hebrew_new_year_array(years))
+
+    with ThreadPoolExecutor(8) as pool:
+        assert all(pool.map(check, range(1, 200)))
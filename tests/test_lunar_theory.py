@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from am_nasa import lunar_theory
+from am_nasa.lunar_theory import MOON_B_TERMS, MOON_LR_TERMS, moon_position_array
+from am_nasa.planetary_positions import moon_ecliptic_longitude
+
+
+def test_meeus_example_47a():
+    # Meeus, Astronomical Algorithms, przykład 47.a: 1992-04-12 0h TD
+    pos = moon_position_array(2448724.5)
+    assert float(pos["lon"]) == pytest.approx(133.162655, abs=1e-6)
+    assert float(pos["lat"]) == pytest.approx(-3.229126, abs=1e-6)
+    assert float(pos["distance_km"]) == pytest.approx(368409.7, abs=0.1)
+
+
+def test_tables_complete():
+    assert MOON_LR_TERMS.shape == (60, 6) and MOON_B_TERMS.shape == (60, 5)
+    assert np.abs(MOON_LR_TERMS[:, 1]).max() == 2 and np.abs(MOON_B_TERMS[:, 1]).max() == 2
+
+
+def test_batch_across_chunks_matches_single_epochs(monkeypatch):
+    monkeypatch.setattr(lunar_theory, "_CHUNK", 7)
+    jd = np.linspace(2415021.0, 2469807.0, 30).reshape(5, 6)
+    batch = moon_position_array(jd)
+    assert batch["lon"].shape == (5, 6)
+    for key in ("lon", "lat", "distance_km"):
+        single = np.array([float(moon_position_array(j)[key]) for j in jd.ravel()]).reshape(5, 6)
+        np.testing.assert_allclose(batch[key], single, rtol=1e-12, atol=1e-9)
+
+
+def test_close_to_short_series():
+    # 5 wyrazów moon_ecliptic_longitude mylą się o ≤ ~0.5°
+    jd = np.linspace(2415021.0, 2469807.0, 200)
+    full = moon_position_array(jd)["lon"]
+    short = np.array([moon_ecliptic_longitude(j) for j in jd])
+    assert np.abs((full - short + 180.0) % 360.0 - 180.0).max() < 0.5
+
+
+@pytest.mark.requires_jpl
+def test_distance_close_to_jpl():
+    from skyfield.constants import AU_KM
+
+    from am_nasa.ephemeris_spk import get_spk_sun_moon
+
+    jd = np.linspace(2415021.0, 2469807.0, 2000)
+    _, moon = get_spk_sun_moon(apparent=False).sun_moon_xyz(jd)
+    reference = np.linalg.norm(moon, axis=0) * AU_KM
+    assert np.abs(moon_position_array(jd)["distance_km"] - reference).max() < 20.0
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from am_nasa.lunation_index import (
+    LUNATION_PHASE_NAMES,
+    LunationIndex,
+    get_lunation_index,
+    lunation_state,
+)
+from am_nasa.lunations import find_lunations
+
+# nów 2000-01-06 18:14 UT, pełnia 2000-01-21 04:40 UT (TT = UT + 64 s)
+NEW_MOON_2000 = 2451550.2597 + 64.0 / 86400.0
+FULL_MOON_2000 = 2451564.6944 + 64.0 / 86400.0
+
+
+def test_shipped_index_covers_jpl_span():
+    index = get_lunation_index()
+    assert index.jd_start < 2415100.0 and index.jd_end > 2469000.0
+    assert index.quarter[0] % 4 == 0
+    assert np.all(np.diff(index.quarter) == 1)
+    gaps = np.diff(index.jd)
+    assert gaps.min() > 6.0 and gaps.max() < 8.5
+
+
+def test_known_phases_2000():
+    state = lunation_state(NEW_MOON_2000 + 0.1)
+    assert state["lunation"] == 0 and state["phase_name"] == "nów" and state["source"] == "index"
+    assert state["age_days"] == pytest.approx(0.1, abs=0.002)
+    assert lunation_state(FULL_MOON_2000)["phase_name"] == "pełnia"
+    assert lunation_state(NEW_MOON_2000 + 3.0)["phase_name"] == "wzrastający sierp"
+    assert lunation_state(FULL_MOON_2000 + 3.0)["phase_name"] == "malejący garb"
+    ut = lunation_state(NEW_MOON_2000 - 64.0 / 86400.0 + 0.1, scale="UT")
+    assert ut["age_days"] == pytest.approx(0.1, abs=0.002)
+
+
+def test_index_agrees_with_analytic_finder():
+    events = find_lunations(2451545.0, 2451545.0 + 3650.0, phases=[0])
+    state = lunation_state(events.JD + 1e-3)
+    np.testing.assert_array_equal(state["lunation"], events.lunation)
+    assert np.abs(state["age_days"] - 1e-3).max() < 2.0 / 1440
+
+
+def test_outside_index_falls_back_to_meeus():
+    jd = np.array([1721424.5, NEW_MOON_2000 + 5.0, 2500000.0])
+    state = lunation_state(jd)
+    assert list(state["source"]) == ["meeus", "index", "meeus"]
+    assert np.all((state["age_days"] >= 0.0) & (state["age_days"] < 29.9))
+    scalar = lunation_state(float(jd[0]))
+    assert scalar["phase_name"] == state["phase_name"][0] and scalar["lunation"] == state["lunation"][0]
+
+
+def test_lookup_trims_to_first_new_moon_and_checks_range():
+    index = LunationIndex(np.array([[10.0, 3.0], [17.0, 4.0], [24.0, 5.0], [31.0, 6.0]]))
+    assert index.jd_start == 17.0
+    result = index.lookup(np.array([20.0, 28.0]))
+    np.testing.assert_allclose(result["age_days"], [3.0, 11.0])
+    assert list(result["phase_name"]) == [LUNATION_PHASE_NAMES[1], LUNATION_PHASE_NAMES[3]]
+    with pytest.raises(ValueError, match="poza indeksem"):
+        index.lookup(12.0)
+
+
+def test_api_reports_lunation():
+    from am_nasa.api import info_from_jd
+
+    info = info_from_jd(FULL_MOON_2000, 2000, tier="fast")
+    assert info["moon"]["phase_name"] == "pełnia" and info["moon"]["lunation"] == 0
+    assert info["moon"]["age_days"] == pytest.approx(14.43, abs=0.01)
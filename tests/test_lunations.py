@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from am_nasa.lunations import LUNATION_PHASES, find_lunations, lunar_phase_longitude, mean_phase_jd
+
+
+def test_meeus_example_49a():
+    # Meeus, przykład 49.a: nów 1977-02-18 3h37m42s TD = JDE 2443192.65118
+    events = find_lunations(2443180.0, 2443200.0, phases=[0])
+    assert len(events) == 1 and events.lunation[0] == -283
+    assert events.JD[0] == pytest.approx(2443192.65118, abs=2.0 / 1440)
+
+
+def test_phases_cycle_over_a_century():
+    events = find_lunations(2451545.0, 2451545.0 + 36525.0)
+    assert 4 * 1236 <= len(events) <= 4 * 1238
+    assert np.all(np.diff(events.phase.astype(int)) % 4 == 1)
+    gaps = np.diff(events.JD)
+    assert gaps.min() > 6.0 and gaps.max() < 8.5
+    targets = 90.0 * events.phase
+    residual = (lunar_phase_longitude(events.JD) - targets + 180.0) % 360.0 - 180.0
+    assert np.abs(residual).max() < 1e-4
+    # prawdziwe fazy leżą blisko średnich (zalążków)
+    assert np.abs(events.JD - mean_phase_jd(events.lunation + events.phase / 4.0)).max() < 1.0
+
+
+def test_phase_filter_and_scale():
+    tt = find_lunations(2460000.0, 2460400.0, phases=[2])
+    assert set(tt.phase) == {2} and LUNATION_PHASES[2] == "pełnia"
+    ut = find_lunations(2460000.0, 2460400.0, phases=[2], scale="UT")
+    assert list(ut.dtype.names) == ["JD", "JD_TT", "phase", "lunation"]
+    np.testing.assert_allclose(ut.JD_TT, tt.JD, atol=1e-5)
+    assert np.all((ut.JD_TT - ut.JD) * 86400.0 == pytest.approx(69.2, abs=1.0))
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError, match="Fazy"):
+        find_lunations(2460000.0, 2460100.0, phases=[4])
+    with pytest.raises(ValueError, match="Pusty zakres"):
+        find_lunations(2460100.0, 2460000.0)
+    with pytest.raises(ValueError, match="Nieznany silnik"):
+        find_lunations(2460000.0, 2460100.0, engine="vsop87")
+
+
+@pytest.mark.requires_jpl
+def test_meeus_close_to_jpl():
+    fast = find_lunations(2415100.0, 2469700.0)
+    jpl = find_lunations(2415100.0, 2469700.0, engine="jplephem")
+    assert len(fast) == len(jpl)
+    assert np.all(fast.phase == jpl.phase)
+    assert np.abs(fast.JD - jpl.JD).max() * 1440.0 < 2.0
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from am_nasa.faza_ksiezyca import (
+    PHASE_NAMES,
+    moon_phase,
+    moon_phase_array,
+    moon_phase_state_array,
+    moon_phase_value,
+    moon_phase_value_array,
+)
+from am_nasa.planetary_positions import (
+    elongacja_slonca_ksiezyca,
+    fundamental_arguments_array,
+    jasnosc_ksiezyca,
+    moon_ecliptic_latitude,
+    moon_ecliptic_longitude,
+    sun_ecliptic_longitude,
+    sun_moon_positions_array,
+)
+
+JD = np.linspace(2451545.0 - 500 * 365.25, 2451545.0 + 500 * 365.25, 401)
+
+
+def _wrap(diff):
+    return np.abs((np.asarray(diff) + 180.0) % 360.0 - 180.0)
+
+
+def test_positions_array_matches_scalar():
+    pos = sun_moon_positions_array(JD)
+    for i, jd in enumerate(JD):
+        # tablice mają wyrazy T³/T⁴ w argumentach – ułamki sekundy łuku na ±10 wieków
+        assert _wrap(pos["sun_lon"][i] - sun_ecliptic_longitude(jd)) < 1e-5
+        assert _wrap(pos["moon_lon"][i] - moon_ecliptic_longitude(jd)) < 1e-3
+        assert pos["moon_lat"][i] == pytest.approx(moon_ecliptic_latitude(jd), abs=1e-4)
+        assert pos["elongation"][i] == pytest.approx(elongacja_slonca_ksiezyca(jd), abs=1e-3)
+        assert pos["illumination"][i] == pytest.approx(jasnosc_ksiezyca(jd), abs=1e-5)
+
+
+def test_phase_array_matches_scalar_and_shares_arguments():
+    args = fundamental_arguments_array(JD)
+    state = moon_phase_state_array(JD, args)
+    pos = sun_moon_positions_array(JD, args)
+    assert {"sin_D", "sin_M", "sin_M_"} <= set(args)  # policzone raz, wspólne
+    assert np.array_equal(state["phase_value"], moon_phase_value_array(JD))
+    assert list(moon_phase_array(JD)) == [moon_phase(jd) for jd in JD]
+    assert np.allclose(state["phase_value"], [moon_phase_value(jd) for jd in JD], rtol=0, atol=1e-10)
+    assert set(np.unique(state["phase_index"])) <= set(range(len(PHASE_NAMES)))
+    assert pos["sun_lon"].shape == JD.shape
+
+
+def test_arrays_keep_shape_and_scalars():
+    grid = JD[:12].reshape(3, 4)
+    assert moon_phase_array(grid).shape == (3, 4)
+    assert sun_moon_positions_array(grid)["moon_lat"].shape == (3, 4)
+    assert str(moon_phase_array(2451545.0)) == moon_phase(2451545.0)
+
+
+def test_millennium_of_daily_phases():
+    days = np.arange(2451545.0 - 500 * 365.25, 2451545.0 + 500 * 365.25)
+    state = moon_phase_state_array(days)
+    # ~12.37 lunacji rocznie: wejście w ostatni przedział (przed nowiem) raz na miesiąc
+    index = state["phase_index"]
+    new_moons = np.count_nonzero((index[1:] == len(PHASE_NAMES) - 1) & (index[:-1] < len(PHASE_NAMES) - 1))
+    assert 12300 < new_moons < 12400
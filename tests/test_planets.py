@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from am_nasa.ephemeris_chebyshev import _angle_arcsec
+from am_nasa.planetary_positions import (
+    KEPLER_ERROR_ARCSEC,
+    PLANET_BACKEND_RANGES,
+    PLANETS,
+    VSOP87_ERROR_ARCSEC,
+    kepler_heliocentric_array,
+    planet_positions_array,
+    planets_positions_array,
+    vsop87_heliocentric_array,
+)
+
+JD = np.linspace(2415021.0, 2469807.0, 1500)
+
+
+def _direction(pos, lon="lon", lat="lat"):
+    lon, lat = np.radians(pos[lon]), np.radians(pos[lat])
+    return np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def test_kepler_orbits_keep_semi_major_axis_scale():
+    r = np.linalg.norm(kepler_heliocentric_array(JD, "jupiter"), axis=0)
+    assert 4.9 < r.min() and r.max() < 5.5
+    r = np.linalg.norm(kepler_heliocentric_array(JD, "emb"), axis=0)
+    assert 0.98 < r.min() and r.max() < 1.02
+    r = np.linalg.norm(vsop87_heliocentric_array(JD, "earth"), axis=0)
+    assert 0.983 < r.min() and r.max() < 1.017
+
+
+def test_vsop87_agrees_with_kepler():
+    # bez kernela: VSOP87 mieści się w budżecie elementów keplerowskich
+    vsop = planets_positions_array(JD)
+    kepler = planets_positions_array(JD, backend="kepler")
+    for planet in PLANETS:
+        err = _angle_arcsec(_direction(vsop[planet]), _direction(kepler[planet]))
+        assert err.max() < KEPLER_ERROR_ARCSEC[planet], planet
+
+
+def test_mars_at_j2000():
+    # Mars 2000-01-01 12h TT: RA ≈ 22h02m, Dec ≈ −13.2°, Δ ≈ 1.85 au
+    pos = planet_positions_array(2451545.0, "mars")
+    assert float(pos["ra"]) == pytest.approx(330.5, abs=0.1)
+    assert float(pos["dec"]) == pytest.approx(-13.18, abs=0.05)
+    assert float(pos["distance_au"]) == pytest.approx(1.85, abs=0.01)
+
+
+def test_struct_of_arrays_shapes():
+    jd = JD[:12].reshape(3, 4)
+    pos = planets_positions_array(jd)
+    assert set(pos) == set(PLANETS)
+    for planet in PLANETS:
+        assert set(pos[planet]) == {"lon", "lat", "ra", "dec", "distance_au"}
+        assert pos[planet]["lon"].shape == (3, 4)
+        np.testing.assert_allclose(pos[planet]["ra"], planet_positions_array(jd, planet)["ra"])
+
+
+def test_inner_planets_stay_near_sun():
+    from am_nasa.planetary_positions import sun_moon_positions_array
+
+    sun = sun_moon_positions_array(JD)["sun_lon"]
+    for planet, max_elongation in (("mercury", 28.5), ("venus", 47.5)):
+        elong = np.abs((planet_positions_array(JD, planet)["lon"] - sun + 180.0) % 360.0 - 180.0)
+        assert elong.max() < max_elongation
+
+
+def test_unknown_planet_or_backend():
+    with pytest.raises(ValueError, match="Nieznana planeta"):
+        planet_positions_array(JD, "uranus")
+    with pytest.raises(ValueError, match="Nieznany backend"):
+        planets_positions_array(JD, backend="elp2000")
+
+
+def test_backend_ranges():
+    # JD 1e7 to ~22 000 lat po końcu tab. 1 – dawniej wiarygodnie wyglądający wynik
+    with pytest.raises(ValueError, match="poza zakresem backendu 'kepler'"):
+        planet_positions_array([2451545.0, 1e7], "mars", backend="kepler")
+    with pytest.raises(ValueError, match="poza zakresem backendu 'vsop87'"):
+        planets_positions_array(np.array([2451545.0, 1e7]))
+    lo, hi = PLANET_BACKEND_RANGES["kepler"]
+    planet_positions_array([lo, hi], "saturn", backend="kepler")
+    with pytest.raises(ValueError, match="kepler"):
+        planet_positions_array(lo - 1.0, "saturn", backend="kepler")
+    # 1200 r. – poza tab. 1, ale w zakresie VSOP87
+    assert np.isfinite(planet_positions_array(2159358.0, "jupiter")["lon"])
+
+
+@pytest.mark.requires_jpl
+@pytest.mark.parametrize("backend, budget", [("vsop87", VSOP87_ERROR_ARCSEC), ("kepler", KEPLER_ERROR_ARCSEC)])
+def test_within_budget_of_jpl(backend, budget):
+    ours = planets_positions_array(JD, backend=backend)
+    jpl = planets_positions_array(JD, backend="jpl")
+    for planet in PLANETS:
+        for lon, lat in (("lon", "lat"), ("ra", "dec")):
+            err = _angle_arcsec(_direction(ours[planet], lon, lat), _direction(jpl[planet], lon, lat))
+            assert err.max() < budget[planet], planet
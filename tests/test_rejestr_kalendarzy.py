@@ -0,0 +1,34 @@
+import math
+
+import pytest
+
+from am_nasa.konwersja_wielosystemowa import konwertuj, konwertuj_batch
+from am_nasa.rejestr_kalendarzy import CALENDARS, CalendarSystem, get_calendar, register_calendar
+
+
+def test_builtin_systems_registered():
+    for name in ("gregorian", "julian", "auc", "am", "islamic", "coptic", "maya"):
+        assert get_calendar(name).name == name
+    with pytest.raises(ValueError):
+        get_calendar("klingon")
+
+
+def test_auc_is_julian_shifted():
+    auc = konwertuj({"system": "auc", "year": 753 + 33, "month": 4, "day": 3})
+    julian = konwertuj({"system": "julian", "year": 33, "month": 4, "day": 3})
+    assert auc["JD"] == julian["JD"]
+
+
+def test_registered_system_reaches_konwertuj_and_batch():
+    """Nowy system wystarczy zarejestrować – bez zmian w konwertuj."""
+    def to_jd(year, month, day):
+        return 2400000.5 + year + month + day
+
+    register_calendar(CalendarSystem("test_mjd", to_jd, to_jd, month_range=(0, 0), day_range=(0, 10**9)))
+    try:
+        assert konwertuj({"system": "TEST_MJD", "year": 60000, "month": 0, "day": 0.5})["JD"] == 2460000.5 + 0.5
+        res = konwertuj_batch("test_mjd", [60000, 0], [0, 0], [0.25, 1])
+        assert list(res["JD"]) == [2460000.75, 2400001.5]
+        assert math.isclose(res["AM"][0], 2460000.75 - 1721670.0)
+    finally:
+        CALENDARS.pop("test_mjd")
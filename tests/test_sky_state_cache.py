@@ -0,0 +1,69 @@
+import pytest
+
+from am_nasa.am_core import JulianDay
+from am_nasa.ephemeris_nasa import SkyStateCache
+
+
+def test_lru_quantization_and_counters():
+    cache = SkyStateCache(maxsize=2, resolution_days=1e-6)
+    calls = []
+
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert cache.get_or_compute(("state",), 2460000.25, lambda: compute("a")) == "a"
+    # ten sam przedział kwantyzacji (także jako JulianDay) -> trafienie
+    assert cache.get_or_compute(("state",), 2460000.2500000002, lambda: compute("x")) == "a"
+    assert cache.get_or_compute(("state",), JulianDay(2460000, 0.25), lambda: compute("x")) == "a"
+    # inny rodzaj klucza i inny moment -> chybienia; "a" wypada z LRU
+    cache.get_or_compute(("topo",), 2460000.25, lambda: compute("b"))
+    cache.get_or_compute(("state",), 2460000.26, lambda: compute("c"))
+    cache.get_or_compute(("state",), 2460000.25, lambda: compute("d"))
+
+    assert calls == ["a", "b", "c", "d"]
+    assert cache.info()["hits"] == 2 and cache.info()["misses"] == 4 and cache.info()["size"] == 2
+    cache.clear()
+    assert cache.info()["hits"] == 0 and cache.info()["size"] == 0
+
+
+def test_returns_copies_and_carries_day():
+    cache = SkyStateCache(resolution_days=1e-6)
+    state = cache.get_or_compute(("state",), 2460000.25, lambda: {"sun": {"ra_deg": 1.0}})
+    state["sun"]["ra_deg"] = 99.0
+    assert cache.get_or_compute(("state",), 2460000.25, lambda: None) == {"sun": {"ra_deg": 1.0}}
+    # ułamek tuż pod 1 -> przedział 0 następnego dnia, nie 1/res
+    assert cache.quantize(JulianDay(2460000, 1.0 - 1e-12)) == (2460001, 0)
+    assert cache.quantize(2460000.9999999999) == cache.quantize(2460001.0)
+
+
+def test_rebinding_source_clears_entries():
+    cache = SkyStateCache()
+    old, new = object(), object()
+    cache.bind("chebyshev", old)
+    cache.get_or_compute(("state", "chebyshev"), 2460000.25, lambda: "old")
+    cache.bind("skyfield", new)
+    cache.bind("chebyshev", old)
+    assert cache.get_or_compute(("state", "chebyshev"), 2460000.25, lambda: "x") == "old"
+    # przebudowany cache Czebyszewa = nowy obiekt -> stare stany nieważne
+    cache.bind("chebyshev", new)
+    assert cache.get_or_compute(("state", "chebyshev"), 2460000.25, lambda: "new") == "new"
+
+
+@pytest.mark.requires_jpl
+def test_api_and_eclipse_helpers_share_cache():
+    from am_nasa.api import convert_calendar_date
+    from am_nasa.ephemeris_nasa import configure_sky_state_cache, sky_state_cache_info
+
+    configure_sky_state_cache()
+    convert_calendar_date("gregorian", 2025, 10, 9)
+    # nazwa fazy idzie z indeksu lunacji – jeden stan, bez drugiego zapytania
+    assert (sky_state_cache_info()["misses"], sky_state_cache_info()["hits"]) == (1, 0)
+
+    # 8.04.2024, Dallas: wysokości i zakrycie tarczy z jednej obserwacji
+    from am_nasa.eclipses import _solar_disk_coverage_fraction, _sun_moon_altaz
+
+    altaz = _sun_moon_altaz(2460409.28, 32.78, -96.8)
+    assert altaz["sun_alt_deg"] > 0 and altaz["moon_alt_deg"] > 0
+    assert _solar_disk_coverage_fraction(2460409.28, 32.78, -96.8) > 0.99
+    assert (sky_state_cache_info()["misses"], sky_state_cache_info()["hits"]) == (2, 1)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from am_nasa.astro_events import apparent_sun_longitude_analytic, solar_longitude_times
+from am_nasa.solar_terms import (
+    SEASON_NAMES,
+    SOLAR_TERM_NAMES,
+    SolarTermsTable,
+    equinoxes_solstices,
+    get_solar_terms_table,
+    solar_terms,
+)
+
+# 2000: 20.03 07:35, 21.06 01:48, 22.09 17:27, 21.12 13:37 UT
+SEASONS_2000_UT = (2451623.8160, 2451716.5750, 2451810.2271, 2451900.0674)
+
+
+def test_shipped_table_covers_jpl_span():
+    table = get_solar_terms_table()
+    assert table.jd_start < 2415100.0 and table.jd_end > 2469000.0
+    assert np.all(np.diff(table.term) == 1)
+    gaps = np.diff(table.jd)
+    assert gaps.min() > 14.5 and gaps.max() < 16.0
+    k0 = int(np.searchsorted(table.jd, 2451620.0))
+    assert table.term[k0] == 0 and table.jd[k0] == pytest.approx(2451623.8169, abs=1e-3)
+
+
+def test_equinoxes_solstices_2000():
+    seasons = equinoxes_solstices(2000, scale="UT")
+    assert list(seasons) == list(SEASON_NAMES.values())
+    np.testing.assert_allclose(list(seasons.values()), SEASONS_2000_UT, atol=1.0 / 1440)
+    tt = equinoxes_solstices(2000)
+    assert tt["przesilenie zimowe"] - seasons["przesilenie zimowe"] == pytest.approx(64.0 / 86400.0, abs=1e-5)
+
+
+def test_table_slices_like_finder():
+    jd, lon = solar_terms(2451545.0, 2451545.0 + 365.0, 30.0)
+    assert len(jd) == 12 and set(lon) == set(np.arange(0.0, 360.0, 30.0))
+    jd15, lon15 = solar_terms(2451545.0, 2451545.0 + 365.0)
+    assert len(jd15) == 24 and SOLAR_TERM_NAMES[int(lon15[0] // 15)] == "xiaohan"
+
+
+def test_analytic_seed_accuracy():
+    jd, lon = solar_terms(2415100.0, 2469000.0)
+    error = (apparent_sun_longitude_analytic(jd) - lon + 180.0) % 360.0 - 180.0
+    assert np.abs(error).max() * 3600.0 < 40.0
+
+
+@pytest.mark.requires_jpl
+def test_table_matches_jpl_finder():
+    span = (2451545.0, 2451545.0 + 3 * 365.25)
+    jd, lon = solar_terms(*span)
+    jd_jpl, lon_jpl = solar_longitude_times(*span, 15.0)
+    np.testing.assert_array_equal(lon, lon_jpl)
+    np.testing.assert_allclose(jd, jd_jpl, atol=1.0 / 86400)
+
+
+def test_outside_table_and_custom_step_fall_back(monkeypatch):
+    import am_nasa.astro_events as astro_events
+
+    calls = []
+    monkeypatch.setattr(astro_events, "solar_longitude_times", lambda *args: calls.append(args) or (None, None))
+    table = get_solar_terms_table()
+    solar_terms(table.jd_start - 400.0, table.jd_start + 10.0)
+    solar_terms(2451545.0, 2451645.0, 10.0)
+    solar_terms(2451545.0, 2451645.0, 15.0, eph="eph")
+    solar_terms(2451545.0, 2451645.0, 90.0)
+    assert [args[2:] for args in calls] == [(15.0, None), (10.0, None), (15.0, "eph")]
+    assert not SolarTermsTable(np.empty((0, 2))).covers(2451545.0, 2451546.0)
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+import am_nasa.ephemeris_chebyshev as cheb
+from am_nasa.am_core import JulianDayArray
+from am_nasa.ephemeris_nasa import sun_moon_state_batch, sun_moon_state_from_jd
+
+
+def _assert_rows_match_scalar(batch, jd, engine):
+    for i in (0, len(jd) // 2, len(jd) - 1):
+        state = sun_moon_state_from_jd(float(jd[i]), engine)
+        for body in ("sun", "moon"):
+            for key, value in state[body].items():
+                assert batch[f"{body}_{key}"][i] == pytest.approx(value, abs=1e-9)
+        for key in ("phase_angle_deg", "elongation_deg", "illumination"):
+            assert batch[key][i] == pytest.approx(state[key], abs=1e-9)
+
+
+def test_batch_chebyshev_matches_scalar(monkeypatch, tmp_path, toy_positions):
+    table = cheb.fit_sun_moon_blocks(2460000.5, 2460040.5, positions=toy_positions)
+    monkeypatch.setattr(cheb, "CHEBYSHEV_CACHE_FILE", cheb.save_chebyshev_cache(table, tmp_path / "c.npy"))
+    cheb.get_chebyshev_ephemeris.cache_clear()
+    try:
+        jd = np.linspace(2460000.5, 2460040.4, 5000)
+        batch = sun_moon_state_batch(jd, engine="chebyshev")
+        assert batch.shape == (5000,) and np.array_equal(batch.JD, jd)
+        _assert_rows_match_scalar(batch, jd, "chebyshev")
+
+        frame = sun_moon_state_batch(JulianDayArray.from_float(jd[:10]), engine="chebyshev", as_frame=True)
+        assert list(frame.columns) == list(batch.dtype.names)
+        assert np.allclose(frame["moon_ra_deg"].to_numpy(), batch.moon_ra_deg[:10], rtol=0, atol=1e-9)
+    finally:
+        cheb.get_chebyshev_ephemeris.cache_clear()
+
+
+@pytest.mark.requires_jpl
+def test_batch_skyfield_matches_scalar():
+    jd = np.linspace(2460000.5, 2460400.5, 2000)
+    _assert_rows_match_scalar(sun_moon_state_batch(jd), jd, "skyfield")
@@ -0,0 +1,46 @@
+import numpy as np
+
+from am_nasa.tablice_kalendarzy import (
+    TABLE_SYSTEMS,
+    YEAR_MAX,
+    YEAR_MIN,
+    _arith_specs,
+    build_year_table,
+    get_year_table,
+)
+
+
+def test_table_kernels_match_arithmetic():
+    """Kernele tablicowe == arytmetyka, także poza zakresem tablicy."""
+    rng = np.random.default_rng(6)
+    years = rng.integers(YEAR_MIN - 200, YEAR_MAX + 200, 5000)
+    years[years == 0] = 1
+    months = rng.integers(1, 13, 5000)
+    days = rng.integers(1, 29, 5000)
+    for name in TABLE_SYSTEMS:
+        table = get_year_table(name)
+        scalar, forward, inverse = _arith_specs()[name][2]
+        assert np.array_equal(table.to_jd_array(years, months, days), forward(years, months, days))
+        assert table.to_jd(2025, 3, 7) == scalar(2025, 3, 7)
+
+        jd = np.arange(table.starts[0] - 800, table.starts[-1] + 800, 37) + 0.75
+        for got, want in zip(table.from_jd_array(jd), inverse(jd)):
+            assert np.allclose(got, want)
+
+
+def test_shipped_tables_are_current():
+    for name in TABLE_SYSTEMS:
+        assert np.array_equal(get_year_table(name).years, build_year_table(name)[0])
+        assert np.array_equal(get_year_table(name).starts, build_year_table(name)[1])
+
+
+def test_only_faster_systems_use_tables():
+    from am_nasa.konwersja_wielosystemowa import gregorian_from_jd_array, jd_from_gregorian_array
+    from am_nasa.kalendarze_lunisolarne import coptic_from_jd_array, islamic_from_jd_array
+    from am_nasa.rejestr_kalendarzy import CALENDARS
+
+    assert CALENDARS["gregorian"].to_jd_array is jd_from_gregorian_array
+    assert CALENDARS["gregorian"].from_jd_array is gregorian_from_jd_array
+    assert CALENDARS["coptic"].from_jd_array is coptic_from_jd_array
+    assert CALENDARS["islamic"].from_jd_array is islamic_from_jd_array
+    assert CALENDARS["persian"].from_jd_array(2460000.5)[0] == 1401
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from am_nasa.ephemeris_nasa import TIMESCALE_FILE, _load_timescale, startup_check
+
+
+def test_bundled_timescale_loads_without_network(monkeypatch):
+    import urllib.request
+
+    from skyfield.api import load
+    from skyfield.iokit import Loader
+
+    def offline(*args, **kwargs):
+        raise AssertionError("próba pobrania danych skali czasu")
+
+    monkeypatch.setattr(Loader, "open", offline)
+    monkeypatch.setattr(urllib.request, "urlopen", offline)
+    assert TIMESCALE_FILE.exists()
+
+    _load_timescale.cache_clear()
+    try:
+        ts = _load_timescale()
+        ref = load.timescale(builtin=True)
+        jd = np.linspace(2400000.5, 2470000.5, 500)
+        assert np.abs(ts.tt_jd(jd).delta_t - ref.tt_jd(jd).delta_t).max() < 1e-6
+        # sekunda przestępna 31.12.2016
+        assert ts.utc(2017, 1, 1).tt - ts.utc(2016, 12, 31, 23, 59, 59).tt == pytest.approx(2 / 86400, abs=1e-9)
+    finally:
+        _load_timescale.cache_clear()
+
+
+def test_startup_check_reports_timings_and_never_raises():
+    report = startup_check()
+    assert {"cold", "timescale_ms", "index_ms", "ok", "total_ms"} <= set(report)
+    assert report["timescale_source"] == str(TIMESCALE_FILE)
+    if report["ok"]:
+        assert report["first_query_ms"] >= 0 and report["kernels"]
+    else:
+        assert report["error"]